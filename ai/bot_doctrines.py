@@ -15,9 +15,9 @@ CE QUE CE MODULE REMPLACE, ET POURQUOI
 
 LE PRINCIPE — le PLANCHER est commun, le STYLE differencie
     Tous les bots d'ici partagent le meme socle de competence : ils estiment les degats par
-    `engine.weapon_damage_cache.squad_expected_damage`, la MEME table pre-calculee que lit
-    l'observation de l'agent (`ObservationBuilder._score_weapon_vs_target`). Aucun ne peut plus
-    « ne pas savoir » viser. Ce qui les separe est le CRITERE : quoi maximiser, et quand.
+    `engine.weapon_damage_cache.squad_expected_damage`, l'esperance de `damage_distribution`
+    (regles d'arme, 1 qui rate toujours, Feel No Pain de la cible), memoisee par profil canonique
+    et partagee avec `benchmark_bots`. Aucun ne peut plus « ne pas savoir » viser. Ce qui les separe est le CRITERE : quoi maximiser, et quand.
 
 LES SIX AXES — chacun punit une erreur DIFFERENTE de l'agent
     | style        | doctrine                                          | erreur punie                         |
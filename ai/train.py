@@ -1660,6 +1660,7 @@ from ai.training_utils import (
     benchmark_device_speed,
     setup_imports,
     make_training_env,
+    build_shared_board_assets,
     get_agent_scenario_file,
     get_scenario_list_for_phase,
     describe_expected_bot_self_scenario_files,
@@ -2564,6 +2565,9 @@ def create_multi_agent_model(config, training_config_name, rewards_config_name,
     if n_envs > 1:
         # ✓ CHANGE 8: Create vectorized environments for parallel training
         print(f"🚀 Creating {n_envs} parallel environments for accelerated training...")
+        # Rasters de terrain et cartes d'objectifs : calcules ici une fois, lus par tous les
+        # workers en memoire partagee (engine/board_assets.py).
+        board_assets_manifest = build_shared_board_assets([scenario_file], unit_registry)
 
         vec_envs = register_vec_env(SubprocVecEnv([
             make_training_env(
@@ -2582,6 +2586,7 @@ def create_multi_agent_model(config, training_config_name, rewards_config_name,
                 opponent_mix_config=opponents["opponent_mix_config"],
                 n_envs=n_envs,
                 episode_start_index=episode_start_index,
+                board_assets_manifest=board_assets_manifest,
             )
             for i in range(n_envs)
         ]))
@@ -3226,6 +3231,7 @@ def train_with_scenario_rotation(config, agent_key, training_config_name, reward
     # Branch: n_envs > 1 uses SubprocVecEnv for parallel training
     if n_envs > 1:
         chunk_log(f"🚀 Creating {n_envs} parallel environments for accelerated training...")
+        board_assets_manifest = build_shared_board_assets(scenario_list, unit_registry)
         vec_envs = register_vec_env(SubprocVecEnv([
             make_training_env(
                 rank=i,
@@ -3244,6 +3250,7 @@ def train_with_scenario_rotation(config, agent_key, training_config_name, reward
                 opponent_mix_config=opponent_mix_config,
                 n_envs=n_envs,
                 episode_start_index=episode_start_index,
+                board_assets_manifest=board_assets_manifest,
             )
             for i in range(n_envs)
         ]))
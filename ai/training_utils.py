@@ -199,11 +199,51 @@ def build_self_play_kwargs(opponent_mix_config, env_rank: int = 0) -> dict:
     return kwargs
 
 
+# Manifestes deja publies par ce processus, par liste de scenarios ET plateau actif. Le chemin
+# rotation remplace l'environnement vectorise a chaque chunk : sans ce registre, chaque
+# remplacement publierait un nouveau segment identique, garde vivant jusqu'a la sortie.
+_BOARD_ASSET_MANIFESTS: dict = {}
+
+
+def build_shared_board_assets(scenario_files, unit_registry):
+    """Charge chaque scenario UNE fois dans le parent et publie ses actifs statiques de plateau.
+
+    Rend le manifeste a passer a `make_training_env(board_assets_manifest=...)` : les workers
+    `SubprocVecEnv` lisent alors les rasters de terrain et les cartes de distance aux objectifs
+    en memoire partagee au lieu de les recalculer chacun (cf. `engine.board_assets`).
+    """
+    from config_loader import get_config_loader
+    from engine.board_assets import collect_board_assets, publish_board_assets
+    from engine.game_state import GameStateManager
+    from engine.objective_distance import objective_distance_maps
+
+    scenario_files = list(dict.fromkeys(scenario_files))
+    if not scenario_files:
+        raise ValueError("build_shared_board_assets requiert au moins un scenario")
+    board_config = get_config_loader().get_board_config()
+    cache_key = (tuple(scenario_files), repr(board_config))
+    if cache_key in _BOARD_ASSET_MANIFESTS:
+        return _BOARD_ASSET_MANIFESTS[cache_key]
+    with collect_board_assets() as assets:
+        for scenario_file in scenario_files:
+            manager = GameStateManager(
+                {"board": board_config, "controlled_player": 1, "_training_episode_index": 0},
+                unit_registry,
+            )
+            scenario_result = manager.load_units_from_scenario(scenario_file, unit_registry)
+            objectives = require_key(scenario_result, "objectives")
+            if objectives:
+                objective_distance_maps({"objectives": objectives})
+    manifest = publish_board_assets(assets)
+    _BOARD_ASSET_MANIFESTS[cache_key] = manifest
+    return manifest
+
+
 def make_training_env(rank, scenario_file, rewards_config_name, training_config_name,
                      controlled_agent_key, unit_registry, step_logger_enabled=False,
                      scenario_files=None, debug_mode=False, use_bots=False, training_bots=None,
                      agent_seat_mode=None, global_seed=None, opponent_mix_config=None,
-                     n_envs=None, episode_start_index=0):
+                     n_envs=None, episode_start_index=0, board_assets_manifest=None):
     """
     Factory function to create a single W40KEngine instance for vectorization.
 
@@ -227,6 +267,8 @@ def make_training_env(rank, scenario_file, rewards_config_name, training_config_
             ACQUISE, elle reprend ou elle en etait. Le wrapper, lui, part de zero — la rampe de
             self-play appartient au REGIME du run qu'on lance, et son introduction progressive
             n'a de sens que depuis le debut de ce run. Cf. ai/run_state.py.
+        board_assets_manifest: Manifeste de `build_shared_board_assets` (None = chaque worker
+            calcule ses actifs de plateau lui-meme, comme avant).
 
     Returns:
         Callable that creates and returns a wrapped environment instance
@@ -251,6 +293,10 @@ def make_training_env(rank, scenario_file, rewards_config_name, training_config_
     def _init():
         # Import environment (inside function to avoid import issues)
         from engine.w40k_core import W40KEngine
+        if board_assets_manifest is not None:
+            # AVANT le moteur : son premier chargement de scenario lit deja les rasters partages.
+            from engine.board_assets import attach_board_assets
+            attach_board_assets(board_assets_manifest)
         if debug_mode:
             try:
                 debug_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "debug.log")
@@ -165,7 +165,7 @@ class ActionDecoder:
             Dict[tuple[int, int], int],
         ] = {}
         self._wall_hexes_cache: tuple[frozenset, int] | None = None
-        self._deployment_pool_cache: Dict[int, Tuple[set, List[Tuple[int, int]], np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._deployment_pool_cache: Dict[int, Tuple[set, List[Tuple[int, int]]]] = {}
         self._deployment_cache_counts: Dict[str, int] = self.empty_deployment_cache_counts()
         self._deployment_scoring_hexes_cache: Dict[int, List[tuple[int, int]]] = {}
         # Pool d'ancres valides : UNE seule entrée `(fingerprint, pool)`, cf.
@@ -425,8 +425,7 @@ class ActionDecoder:
                         f"Deployment deadlock: no valid hex for player {current_deployer}, "
                         f"unit {active_unit.get('id')}"
                     )
-                for i in range(open_deploy_slot_count(num_hexes)):
-                    mask[DEPLOY_SLOT_BASE + i] = True
+                mask[DEPLOY_SLOT_BASE:DEPLOY_SLOT_BASE + open_deploy_slot_count(num_hexes)] = True
                 # 20.01 — « you can select one or more friendly units to place in strategic
                 # reserves » : la mise en réserve est une DÉCISION DE JOUEUR, prise à la place
                 # du déploiement de cette unité. Elle emprunte `SQUAD_ACTION_WAIT`, id inutilisé
@@ -452,11 +451,9 @@ class ActionDecoder:
             if free_steps > 0:
                 objectives = game_state["objectives"]
                 num_zones = min(len(objectives), MAX_OBJECTIVES)
-                for zone_idx in range(num_zones):
-                    for intent_val in range(3):
-                        action_idx = BASE_ZONE_INTENT + zone_idx * 3 + intent_val
-                        if action_idx < self.total_action_size:
-                            mask[action_idx] = True
+                # 3 intents par zone, contigus depuis BASE_ZONE_INTENT ; la tranche s'arrete
+                # d'elle-meme a `total_action_size`.
+                mask[BASE_ZONE_INTENT:BASE_ZONE_INTENT + num_zones * 3] = True
             return mask, eligible_units
 
         if not eligible_units:
@@ -579,9 +576,7 @@ class ActionDecoder:
         squad_mask = build_squad_action_mask(
             game_state, squad_id, enemy_slot_ids, advance_roll, move_cell_map=move_cell_map
         )
-        for i, v in enumerate(squad_mask):
-            if v:
-                mask[i] = True
+        mask[: squad_mask.size] |= squad_mask
 
         return mask, eligible_units
 
@@ -1363,7 +1358,7 @@ class ActionDecoder:
         return wall_hexes
 
     def _deployment_pool_entry(self, game_state: Dict[str, Any], current_deployer: int):
-        """Pool du joueur, normalisé et mémoïsé : `(set, liste, np, grille, masque_pair)`."""
+        """Pool du joueur, normalisé et mémoïsé : `(set, liste)`."""
         if current_deployer in self._deployment_pool_cache:
             return self._deployment_pool_cache[current_deployer]
 
@@ -1371,8 +1366,6 @@ class ActionDecoder:
         pool = deployment_pools.get(current_deployer, deployment_pools.get(str(current_deployer)))
         if pool is None:
             raise KeyError(f"deployment_pools missing player {current_deployer}")
-        board_cols = int(require_key(game_state, "board_cols"))
-        board_rows = int(require_key(game_state, "board_rows"))
 
         pool_set = set()
         normalized_pool_list: List[tuple[int, int]] = []
@@ -1388,11 +1381,7 @@ class ActionDecoder:
                 raise TypeError(f"Invalid deployment hex format: {raw_hex}")
             normalized_pool_list.append(normalized)
             pool_set.add(normalized)
-        pool_np = np.array(normalized_pool_list, dtype=np.int32)
-        pool_grid = np.zeros((board_cols + 10, board_rows + 10), dtype=bool)
-        pool_grid[pool_np[:, 0], pool_np[:, 1]] = True
-        even_mask_np = pool_np[:, 0] % 2 == 0
-        entry = (pool_set, normalized_pool_list, pool_np, pool_grid, even_mask_np)
+        entry = (pool_set, normalized_pool_list)
         self._deployment_pool_cache[current_deployer] = entry
         return entry
 
@@ -1419,7 +1408,7 @@ class ActionDecoder:
         cached = self._deployment_scoring_hexes_cache.get(int(current_deployer))
         if cached is not None:
             return cached
-        _pool_set, normalized_pool, _pool_np, _pool_grid, _even = self._deployment_pool_entry(
+        _pool_set, normalized_pool = self._deployment_pool_entry(
             game_state, current_deployer
         )
         wall_hexes = self._wall_hex_set(game_state)
@@ -1549,9 +1538,7 @@ class ActionDecoder:
         """
         board_cols = int(require_key(game_state, "board_cols"))
         board_rows = int(require_key(game_state, "board_rows"))
-        pool_set, normalized_pool, pool_np, pool_grid, even_mask_np = self._deployment_pool_entry(
-            game_state, current_deployer
-        )
+        pool_set, normalized_pool = self._deployment_pool_entry(game_state, current_deployer)
 
         base_size = unit["BASE_SIZE"]
 
@@ -1581,54 +1568,41 @@ class ActionDecoder:
             ]
             return self._deployment_clearance_filter(game_state, str(unit_id), unit, cell_valid)
 
-        # Multi-hex units: vectorized numpy footprint check (bornes + murs + pool)
-        from engine.hex_utils import erode_by_kernel, precompute_footprint_offsets
+        # Multi-hex units : érosion du pool par le noyau d'empreinte (bornes + pool), murs
+        # retranchés ensuite. Le résultat ne dépend QUE du pool et du socle — pas des unités
+        # posées, qui passent par le clearance ci-dessous — donc il vit dans le cache d'érosion
+        # partagé (`engine.deployment_erosion`) au lieu d'être refait à chaque pose.
+        from engine.deployment_erosion import deployment_erosion_cache, erode_anchors
+        from engine.hex_utils import base_size_cache_key, precompute_footprint_offsets
         base_shape = unit["BASE_SHAPE"]
         orientation = int(unit["orientation"])
-        off_e, off_o = precompute_footprint_offsets(base_shape, base_size, orientation)
-        off_e_np = np.array(off_e, dtype=np.int32)
-        off_o_np = np.array(off_o, dtype=np.int32)
-
-        grid_cols = board_cols + 10
-        grid_rows = board_rows + 10
-        # Murs : PLUS dans la grille érodée. Le volet mur est désormais un ensemble d'ANCRES
-        # interdites (socle vs hexagone, `wall_blocked_anchors`), donc DÉJÀ socle-conscient —
-        # l'éroder une seconde fois par l'empreinte mesurerait le socle deux fois. Il est
-        # retranché APRÈS l'érosion, exactement comme le pool de déploiement PvP le fait. La
-        # grille n'érode plus que l'appartenance au pool et les bornes, qui sont bien des
-        # propriétés de CELLULE.
-        #
-        # Erosion morphologique. Le calcul direct materialisait un tableau (Nk, M, 2) par unite :
-        # sur le board x5 le pool de deploiement fait ~16 000 hexes et un socle 18 pese 211
-        # offsets, soit 3,4 M positions construites puis indexees a chaque appel. On erode plutot
-        # UNE fois la grille des cellules acceptables par l'empreinte, puis on lit le resultat a
-        # l'ancre : cout M x grille au lieu de Nk x M, et ici Nk >> grille/M (mesure : x31 a x62).
-        #
-        # Equivalence stricte avec le calcul direct : `acc[p] = ET sur les offsets de
-        # ok_grid[p + off]` est exactement `np.all(in_pool & no_obstacle)` pour l'ancre p.
-        # `ok_grid` porte deja la contrainte de bornes, donc une empreinte qui deborde du plateau
-        # lit False — meme rejet que `in_bounds` cote calcul direct — et un decalage qui sort de
-        # la grille etendue laisse la case a False (`shifted` initialise a zero).
-        in_board = np.zeros_like(pool_grid)
-        in_board[:board_cols, :board_rows] = True
-        ok_grid = pool_grid & in_board
-
-        valid_mask = np.zeros(len(pool_np), dtype=bool)
-        for mask, off_arr in ((even_mask_np, off_e_np), (~even_mask_np, off_o_np)):
-            if not np.any(mask):
-                continue
-            # Même géométrie de décalage que les dilatations du move (`src = dst + offset`), avec
-            # l'opérateur inverse : `erode_by_kernel` est la source unique des deux. Le plateau de
-            # CE calcul est la grille ÉTENDUE (`grid_cols/grid_rows`), pas `board_cols/rows`.
-            acc = erode_by_kernel(ok_grid, off_arr, grid_cols, grid_rows)
-            anchors = pool_np[mask]  # (Nk, 2)
-            valid_mask[mask] = acc[anchors[:, 0], anchors[:, 1]]
-
-        # `.tolist()` convertit le tableau en entiers Python en une passe C ; l'ancien
-        # `(int(c), int(r))` par element payait deux appels `int()` par hex retenu.
-        cell_valid = [
-            (c, r) for c, r in pool_np[valid_mask].tolist() if (c, r) not in _wall_anchors
-        ]
+
+        def _build() -> List[tuple]:
+            off_e, off_o = precompute_footprint_offsets(base_shape, base_size, orientation)
+            kernels = (
+                np.array(off_e, dtype=np.int32).reshape(-1, 2),
+                np.array(off_o, dtype=np.int32).reshape(-1, 2),
+            )
+            # Murs : PAS dans la grille érodée. Le volet mur est un ensemble d'ANCRES interdites
+            # (socle vs hexagone, `wall_blocked_anchors`), donc DÉJÀ socle-conscient — l'éroder
+            # une seconde fois par l'empreinte mesurerait le socle deux fois. Il est retranché
+            # APRÈS l'érosion, exactement comme le pool de déploiement PvP le fait. La grille
+            # n'érode que l'appartenance au pool et les bornes, qui sont des propriétés de CELLULE.
+            #
+            # Érosion morphologique plutôt que le calcul direct par ancre : sur le board x5 le
+            # pool fait ~16 000 hexes et un socle 18 pèse 211 offsets, soit 3,4 M positions par
+            # appel ; la grille coûte |noyau| x plateau (mesuré x31 à x62). Une empreinte qui
+            # déborde du plateau lit False — même rejet que le test de bornes direct.
+            kept = erode_anchors(pool_set, pool_set, kernels, board_cols, board_rows)
+            return [hx for hx in normalized_pool if hx in kept and hx not in _wall_anchors]
+
+        cell_valid = deployment_erosion_cache(game_state).eroded(
+            (
+                "decoder", int(current_deployer), str(base_shape),
+                base_size_cache_key(base_size), orientation,
+            ),
+            _build,
+        )
         return self._deployment_clearance_filter(game_state, str(unit_id), unit, cell_valid)
 
     def _deployment_clearance_filter(
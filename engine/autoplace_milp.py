@@ -0,0 +1,84 @@
+"""
+autoplace_milp.py - Résolution budgétée des ILP d'auto-placement (charge, pile-in, consolidation).
+
+Les trois auto-placements (`charge_autoplace_plan`, `pile_in_autoplace_plan` et, par routage,
+`consolidate_autoplace_plan`) résolvent la même affectation figurines → slots par
+`scipy.optimize.milp` (HiGHS : branch-and-bound sur la relaxation LP, dont la borne est admissible
+par construction). Chacun codait en dur `time_limit=2.0` et jetait le diagnostic du solveur : une
+grosse escouade qui épuisait le budget (pic de plusieurs secondes dans `perf_timing.log`) était
+indiscernable d'une qui prouvait l'optimum en 5 ms.
+
+Ici, un seul point d'appel :
+
+- budget CONFIGURABLE en temps ET en nœuds (`game_rules.autoplace_time_limit_s`,
+  `game_rules.autoplace_node_limit`, défauts module) ;
+- à budget épuisé, la MEILLEURE affectation trouvée est rendue (HiGHS garde son incumbent ; `milp`
+  le rend dans `res.x`) — `None` seulement si aucune solution entière n'existe encore ;
+- une ligne `AUTOPLACE_MILP` par résolution (perf activée) : nœuds explorés, écart d'optimalité,
+  statut, budget épuisé ou non.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from engine.perf_timing import append_perf_timing_line, perf_timing_enabled
+from shared.data_validation import require_key
+
+#: Budget temps par résolution (secondes) : la valeur historique, codée en dur à chaque appel.
+AUTOPLACE_TIME_LIMIT_S = 2.0
+#: Budget nœuds de branch-and-bound par résolution. Large devant les arbres d'une affectation
+#: ordinaire (la relaxation LP y est presque toujours entière) : ne mord que sur les cas pathologiques.
+AUTOPLACE_NODE_LIMIT = 5000
+
+# Statuts `milp` d'un budget épuisé : 1 = limite de temps ; 4 = limite de nœuds (HiGHS la signale
+# en « solution limit reached », code que scipy ne traduit pas et range en « autre »).
+_MILP_STATUS_BUDGET = (1, 4)
+
+
+def autoplace_milp_budget(game_state: Dict[str, Any]) -> Dict[str, float]:
+    """Options HiGHS du budget d'auto-placement : config si fournie, sinon défauts module."""
+    game_rules = require_key(require_key(game_state, "config"), "game_rules")
+    time_limit = game_rules.get("autoplace_time_limit_s", AUTOPLACE_TIME_LIMIT_S)  # get allowed (optionnel)
+    node_limit = game_rules.get("autoplace_node_limit", AUTOPLACE_NODE_LIMIT)  # get allowed (optionnel)
+    if float(time_limit) <= 0 or int(node_limit) <= 0:
+        raise ValueError(
+            f"autoplace budget must be > 0, got time_limit_s={time_limit} node_limit={node_limit}"
+        )
+    return {"time_limit": float(time_limit), "node_limit": int(node_limit)}
+
+
+def solve_autoplace_milp(
+    game_state: Dict[str, Any],
+    label: str,
+    cost: "np.ndarray",
+    constraints: List[LinearConstraint],
+    *,
+    squad_id: str,
+) -> Optional["np.ndarray"]:
+    """Résout l'ILP binaire `min cost·x` sous `constraints` dans le budget d'auto-placement.
+
+    Retourne le vecteur `x` (meilleure solution entière trouvée, optimale ou non), ou None si le
+    problème est infaisable ou si le budget s'épuise avant la première solution entière.
+    """
+    options = autoplace_milp_budget(game_state)
+    nvar = int(cost.shape[0])
+    _t0 = time.perf_counter()
+    res = milp(
+        c=cost, constraints=constraints, integrality=np.ones(nvar),
+        bounds=Bounds(0, 1), options=options,
+    )
+    if perf_timing_enabled(game_state):
+        # `mip_gap` vaut None quand aucune solution entière n'a été trouvée.
+        gap = -1.0 if res.mip_gap is None else float(res.mip_gap)
+        append_perf_timing_line(
+            f"AUTOPLACE_MILP episode={game_state.get('episode_number', '?')} "
+            f"turn={game_state.get('turn', '?')} label={label} squad_id={squad_id} "
+            f"nvar={nvar} constraints={len(constraints)} "
+            f"nodes={res.mip_node_count} gap={gap:.6f} status={res.status} "
+            f"budget_exhausted={int(res.status in _MILP_STATUS_BUDGET)} "
+            f"found={int(res.x is not None)} solve_s={time.perf_counter() - _t0:.6f}"
+        )
+    return res.x
@@ -0,0 +1,163 @@
+"""Actifs STATIQUES du plateau, construits une fois par le parent, lus par tous les workers.
+
+POURQUOI CE MODULE EXISTE
+=========================
+Un entraînement vectorisé ouvre 48 à 64 workers ``SubprocVecEnv`` (cf.
+``scripts/ab_sweep_nenvs.py``). Chacun rasterisait À NOUVEAU les mêmes polygones de terrain
+(aires, étages, zones de déploiement — ``polygon_to_hex_list``, 70 à 150 ms par rechargement de
+scénario sur le plateau 220×300, donc à CHAQUE ``reset`` en rotation de scénarios) et reconstruisait
+les mêmes cartes de distance aux objectifs (``objective_distance_maps``, 345 ms et ~645 Ko par
+plateau et par worker). Même donnée, même résultat, payé ``n_envs`` fois.
+
+Le parent les calcule UNE fois (``collect_board_assets`` autour d'un chargement de chaque
+scénario), les range dans UN segment ``multiprocessing.shared_memory`` (``publish_board_assets``)
+et passe aux workers un MANIFESTE — un petit dict picklable : nom du segment, puis
+``{clé: (dtype, forme, offset)}``. Chaque worker s'y attache (``attach_board_assets``) et lit des
+vues NumPy en LECTURE SEULE : les pages sont celles du parent, pas une copie par processus.
+
+CE QUI N'Y EST PAS
+==================
+Uniquement des TABLEAUX. Les ensembles Python (``wall_set``, index d'étages
+``terrain_utils._FloorIndex``, zones d'objectif) ne vivent pas en mémoire partagée ; ils restent
+construits par worker, mais À PARTIR des rasters partagés — c'est la rasterisation, pas la
+construction du ``set``, qui coûtait.
+
+CLÉS PAR CONTENU
+================
+La clé d'un actif est le digest de ce qui le DÉTERMINE (sommets du polygone et taille du plateau ;
+aires des objectifs). Jamais le nom d'un fichier : un terrain réduit (x5 → x1) partage son fichier
+avec l'original, pas ses rasters. Un actif absent du manifeste n'est pas une erreur — le worker le
+calcule comme avant (scénario hors liste, ``wall_ref`` tiré au hasard…).
+"""
+
+import atexit
+import hashlib
+import sys
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from shared.data_validation import require_key
+
+#: Alignement des tableaux dans le segment (octets) — le plus large dtype rangé est 8 octets.
+_ALIGN = 8
+
+#: Actifs servis à ce processus : ``{clé: vue lecture seule}`` (parent comme worker).
+_SHARED: Dict[str, np.ndarray] = {}
+
+#: Segments ouverts par ce processus. Gardés vivants : fermer le segment invaliderait les vues.
+_SEGMENTS: Dict[str, shared_memory.SharedMemory] = {}
+
+#: Segments CRÉÉS par ce processus — lui seul les détruit (``release_board_assets``).
+_OWNED: List[str] = []
+
+#: Actifs calculés pendant ``collect_board_assets`` (parent), en attente de publication.
+_COLLECTING: Optional[Dict[str, np.ndarray]] = None
+
+
+def asset_key(kind: str, payload: Any) -> str:
+    """Clé de contenu d'un actif : digest stable ENTRE processus (pas de ``hash()`` de chaîne).
+
+    ``payload`` doit avoir une ``repr`` déterministe — tuples et entiers triés, jamais un ``set``.
+    """
+    return f"{kind}:{hashlib.sha256(repr(payload).encode('utf-8')).hexdigest()}"
+
+
+def shared_asset(key: str) -> Optional[np.ndarray]:
+    """Vue lecture seule de l'actif ``key``, ou None s'il n'a pas été publié à ce processus."""
+    return _SHARED.get(key)  # get allowed (actif absent = calcul local, cf. docstring du module)
+
+
+def record_asset(key: str, array: np.ndarray) -> None:
+    """Mémorise un actif calculé localement SI une collecte est en cours (parent), sinon rien."""
+    if _COLLECTING is not None and key not in _COLLECTING:
+        _COLLECTING[key] = np.ascontiguousarray(array)
+
+
+@contextmanager
+def collect_board_assets() -> Iterator[Dict[str, np.ndarray]]:
+    """Collecte tout actif calculé dans le bloc ; le dict rendu est à passer à ``publish_board_assets``."""
+    global _COLLECTING
+    if _COLLECTING is not None:
+        raise RuntimeError("collect_board_assets: collecte déjà en cours (imbrication non supportée)")
+    collected: Dict[str, np.ndarray] = {}
+    _COLLECTING = collected
+    try:
+        yield collected
+    finally:
+        _COLLECTING = None
+
+
+def publish_board_assets(assets: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Range ``assets`` dans un segment de mémoire partagée ; rend le manifeste des workers.
+
+    Le parent se sert lui-même du segment (ses propres lectures passent par les mêmes vues).
+    Le segment vit jusqu'à ``release_board_assets`` — appelé aussi à la sortie du processus.
+    """
+    layout: Dict[str, Any] = {}
+    offset = 0
+    for key, array in assets.items():
+        offset = -(-offset // _ALIGN) * _ALIGN
+        layout[key] = (array.dtype.str, tuple(int(d) for d in array.shape), offset)
+        offset += int(array.nbytes)
+    segment = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    _OWNED.append(segment.name)
+    _SEGMENTS[segment.name] = segment
+    for key, array in assets.items():
+        dtype, shape, start = layout[key]
+        np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf, offset=start)[...] = array
+    manifest = {"segment": segment.name, "arrays": layout}
+    attach_board_assets(manifest)
+    return manifest
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """Ouvre un segment EXISTANT sans l'inscrire au ``resource_tracker`` de ce processus.
+
+    Avant Python 3.13, s'attacher inscrit le segment comme si on l'avait créé : un processus qui
+    n'hérite pas du traqueur du parent (lancé hors ``multiprocessing``) le DÉTRUIT à sa sortie,
+    sous les pieds des autres workers. Seul le créateur doit en répondre.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, create=False, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *_args, **_kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name, create=False)
+    finally:
+        resource_tracker.register = register
+
+
+def attach_board_assets(manifest: Dict[str, Any]) -> None:
+    """Expose à ce processus les actifs d'un manifeste. Idempotent."""
+    name = str(require_key(manifest, "segment"))
+    segment = _SEGMENTS.get(name)  # get allowed (premier attachement de ce processus)
+    if segment is None:
+        segment = _attach_untracked(name)
+        _SEGMENTS[name] = segment
+    for key, (dtype, shape, start) in require_key(manifest, "arrays").items():
+        view = np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=segment.buf, offset=start)
+        view.setflags(write=False)
+        _SHARED[key] = view
+
+
+def release_board_assets() -> None:
+    """Oublie les actifs partagés de ce processus ; détruit les segments qu'il a créés."""
+    _SHARED.clear()
+    while _SEGMENTS:
+        name, segment = _SEGMENTS.popitem()
+        try:
+            segment.close()
+        except BufferError:
+            # Une vue survit encore dans un cache appelant (cartes d'objectifs…) : le tampon ne
+            # peut pas être fermé, mais le nom peut être détruit — le noyau libère les pages au
+            # dernier détachement, donc à la sortie de ce processus.
+            pass
+        if name in _OWNED:
+            _OWNED.remove(name)
+            segment.unlink()
+
+
+atexit.register(release_board_assets)
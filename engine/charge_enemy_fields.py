@@ -0,0 +1,191 @@
+"""
+charge_enemy_fields.py - Champs de distance multi-source par escouade ennemie, partages par la phase de charge.
+
+Les BFS de charge mesurent tous la meme chose autour de chaque ennemi : « les cases a au plus
+`r` pas de son empreinte ». Le pool de destinations (`charge_build_valid_destinations_pool`) le
+reconstruisait par dilatation pour CHAQUE chargeur (zone d'engagement `ez`, voisinage
+`ez + rayons`), l'eligibilite par BFS inverse idem, et le contexte de plan par-figurine
+(`_compute_plan_context`) relancait un BFS multi-source depuis l'union des cibles a chaque plan.
+Sur une phase a N chargeurs et M ennemis, c'etait N x M dilatations pour M champs distincts.
+
+Ici, un champ par ennemi, construit UNE fois et etendu a la demande (le BFS reprend depuis sa
+derniere frontiere quand un rayon plus grand est demande) :
+
+- `within(...)` : couches hexagonales SANS bornes ni murs — la dilatation de
+  `dilate_hex_set_unbounded`, servie pour tout rayon par union de couches ;
+- `distance_field(...)` : BFS borne au plateau, murs bloquants ou non (vol) — le `_dist_field` du
+  contexte de plan. L'union de plusieurs ennemis est le MIN point a point de leurs champs : memes
+  obstacles, donc meme distance que le BFS lance depuis l'union des empreintes.
+
+Invalidation : le conteneur porte `_unit_move_version`. Tout deplacement de figurine (une charge
+qui se commit, une perte de figurine) incremente la version via `_touch_unit_los` ; le premier
+acces suivant repart vide. Rien d'autre ne perime un champ : les murs sont statiques. La phase de
+charge le remet aussi a zero a son ouverture (`charge_phase_start`).
+
+Cle = id d'escouade. L'empreinte passee par l'appelant n'est lue qu'a la construction : a
+version egale, l'empreinte d'un id ne peut pas avoir change.
+"""
+
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from engine.hex_utils import get_neighbors
+
+Cell = Tuple[int, int]
+
+
+class _Rings:
+    """Couches de distance hexagonale autour d'une empreinte, sur grille infinie."""
+
+    __slots__ = ("layers", "seen", "unions")
+
+    def __init__(self, footprint: Iterable[Cell]) -> None:
+        seeds = list({(int(c), int(r)) for c, r in footprint})
+        self.layers: List[List[Cell]] = [seeds]
+        self.seen: Set[Cell] = set(seeds)
+        self.unions: Dict[int, FrozenSet[Cell]] = {}
+
+    def within(self, radius: int) -> FrozenSet[Cell]:
+        cached = self.unions.get(radius)  # get allowed (rayon pas encore servi)
+        if cached is not None:
+            return cached
+        while len(self.layers) <= radius and self.layers[-1]:
+            nxt: List[Cell] = []
+            for c, r in self.layers[-1]:
+                for cell in get_neighbors(c, r):
+                    if cell not in self.seen:
+                        self.seen.add(cell)
+                        nxt.append(cell)
+            self.layers.append(nxt)
+        out: Set[Cell] = set()
+        for layer in self.layers[: radius + 1]:
+            out.update(layer)
+        frozen = frozenset(out)
+        self.unions[radius] = frozen
+        return frozen
+
+
+class _BoundedField:
+    """BFS multi-source sur le plateau, reprenable : `dist` est exact jusqu'a `steps` pas."""
+
+    __slots__ = ("dist", "frontier", "steps")
+
+    def __init__(self, footprint: Iterable[Cell], cols: int, rows: int) -> None:
+        self.dist: Dict[Cell, int] = {}
+        self.frontier: List[Cell] = []
+        # Graines hors plateau ignorees : meme contrat que le BFS qu'il remplace.
+        for c, r in footprint:
+            cell = (int(c), int(r))
+            if 0 <= cell[0] < cols and 0 <= cell[1] < rows and cell not in self.dist:
+                self.dist[cell] = 0
+                self.frontier.append(cell)
+        self.steps = 0
+
+    def extend(self, max_steps: int, cols: int, rows: int, blocked: AbstractSet[Cell]) -> None:
+        while self.frontier and self.steps < max_steps:
+            self.steps += 1
+            nxt: List[Cell] = []
+            for c, r in self.frontier:
+                for cell in get_neighbors(c, r):
+                    nc, nr = cell
+                    if nc < 0 or nr < 0 or nc >= cols or nr >= rows:
+                        continue
+                    if cell in self.dist or cell in blocked:
+                        continue
+                    self.dist[cell] = self.steps
+                    nxt.append(cell)
+            self.frontier = nxt
+
+
+class ChargeEnemyFields:
+    """Champs par ennemi d'une version de positions (cf. module)."""
+
+    __slots__ = ("version", "rings", "fields", "hits", "misses")
+
+    def __init__(self, version: int) -> None:
+        self.version = version
+        self.rings: Dict[str, _Rings] = {}
+        self.fields: Dict[Tuple[str, bool], _BoundedField] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def within(self, enemy_id: Any, footprint: Iterable[Cell], radius: int) -> FrozenSet[Cell]:
+        """Cases a au plus `radius` pas de l'empreinte, graines comprises, sans bornes ni murs.
+
+        Meme ensemble que `dilate_hex_set_unbounded(footprint, radius)` ; LECTURE SEULE (partage).
+        """
+        if radius < 0:
+            raise ValueError("radius must be non-negative")
+        key = str(enemy_id)
+        rings = self.rings.get(key)  # get allowed (ennemi pas encore servi)
+        if rings is None:
+            self.misses += 1
+            rings = _Rings(footprint)
+            self.rings[key] = rings
+        else:
+            self.hits += 1
+        return rings.within(int(radius))
+
+    def distance_field(
+        self,
+        enemy_ids_and_footprints: Iterable[Tuple[Any, Iterable[Cell]]],
+        max_steps: int,
+        cols: int,
+        rows: int,
+        walls: AbstractSet[Cell],
+        *,
+        walls_block: bool,
+    ) -> Dict[Cell, int]:
+        """Distance en pas de chaque case du plateau a l'union des empreintes, bornee a `max_steps`.
+
+        Les cases au-dela sont absentes. `walls_block=False` (vol, 21.03) : les murs ne bloquent
+        pas. Le dict rendu est NEUF (l'appelant peut le garder ou le muter).
+        """
+        blocked: AbstractSet[Cell] = walls if walls_block else frozenset()
+        limit = int(max_steps)
+        merged: Dict[Cell, int] = {}
+        for enemy_id, footprint in enemy_ids_and_footprints:
+            key = (str(enemy_id), bool(walls_block))
+            field = self.fields.get(key)  # get allowed (ennemi pas encore servi)
+            if field is None:
+                self.misses += 1
+                field = _BoundedField(footprint, cols, rows)
+                self.fields[key] = field
+            else:
+                self.hits += 1
+            if field.steps < limit:
+                field.extend(limit, cols, rows, blocked)
+            for cell, d in field.dist.items():
+                if d <= limit and d < merged.get(cell, limit + 1):  # get allowed (case pas encore atteinte)
+                    merged[cell] = d
+        return merged
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "rings": len(self.rings),
+            "fields": len(self.fields),
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ChargeEnemyFields":
+        # Copie d'etat : memes positions, meme version — repartir vide y est exact.
+        fresh = ChargeEnemyFields(self.version)
+        memo[id(self)] = fresh
+        return fresh
+
+
+def charge_enemy_fields(game_state: Dict[str, Any]) -> ChargeEnemyFields:
+    """Champs de la version de positions courante ; recrees vides si des figurines ont bouge."""
+    version = int(game_state["_unit_move_version"])
+    holder = game_state.get("_charge_enemy_fields")  # get allowed (absent au 1er appel)
+    if holder is None or holder.version != version:
+        holder = ChargeEnemyFields(version)
+        game_state["_charge_enemy_fields"] = holder
+    return holder
+
+
+def reset_charge_enemy_fields(game_state: Dict[str, Any]) -> None:
+    """Ouverture de phase de charge : aucun champ d'une phase precedente n'est relu."""
+    game_state["_charge_enemy_fields"] = ChargeEnemyFields(int(game_state["_unit_move_version"]))
@@ -546,9 +546,13 @@ def ranged_edge_distance_to_cell(shooter: Any, anchor_col: int, anchor_row: int,
 
 
 def get_hex_line(start_col: int, start_row: int, end_col: int, end_row: int) -> List[Tuple[int, int]]:
-        """Get hex line using handler delegation."""
-        from engine.phase_handlers import shooting_handlers
-        return shooting_handlers._get_accurate_hex_line(start_col, start_row, end_col, end_row)
+        """Get hex line — alias de ``hex_utils.hex_line`` (table de tracés relatifs, nudge compris).
+
+        Déléguait à une seconde implémentation du cube-lerp (``shooting_handlers``, sans nudge de
+        départage) qui pouvait rendre une autre ligne que celle de la LoS du moteur.
+        """
+        from engine.hex_utils import hex_line
+        return hex_line(start_col, start_row, end_col, end_row)
 
 
 # ============================================================================
@@ -0,0 +1,168 @@
+"""
+deployment_erosion.py - Zone de mise en place érodée par l'empreinte d'un socle, partagée par
+le masque, le décodeur et le pool par-figurine du front.
+
+« Où l'empreinte de ce socle tient-elle entièrement dans la zone ? » était reposée à chaque
+consultation : le décodeur (`ActionDecoder._compute_valid_deployment_hexes`, donc le masque et
+le commit) ré-érodait la grille du pool à CHAQUE pose — son fingerprint porte les empreintes
+posées, qui changent à chaque pose — et le pool par-figurine
+(`deployment_build_model_destinations_pool`, endpoint de preview) ré-érodait ~60 000 ancres en
+coordonnées cube à chaque clic.
+
+Or l'érosion se SÉPARE. Une ancre est valide ssi toute son empreinte est dans
+``zone − bloqué`` ; c'est exactement « empreinte ⊆ zone » ET NON « empreinte ∩ bloqué ≠ ∅ ».
+Le premier terme ne dépend que de (zone, noyau d'empreinte) : il est STATIQUE sur l'épisode et
+vit dans ce cache. Le second — l'occupation — est la dilatation des cases bloquées par le même
+noyau : quelques centaines de cases autour des unités posées, recalculées à la demande. Clefer
+l'érosion complète par une version d'occupation la ferait rater à chaque pose, c'est-à-dire à
+chaque consultation utile.
+
+Les deux termes passent par `erode_by_kernel` / `dilate_by_kernel` sur une grille DENSE du
+plateau, noyau par parité de colonne (odd-q) : la source unique des décalages de masque du moteur.
+Une case hors plateau n'est jamais acceptable (lecture hors grille = faux), ce que les deux
+consommateurs supposaient déjà — zones et aires d'arrivée sont rastérisées sur le plateau.
+
+Durée de vie : le cache vit dans `game_state` (un moteur = un cache) et est purgé à chaque
+épisode et à chaque rotation de scénario, avec les autres dérivés des murs et des zones. Une
+COPIE d'état repart vide (`__deepcopy__`), comme `TargetPoolCache`.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, Set, Tuple
+
+import numpy as np
+
+from engine.hex_utils import cube_to_offset, dilate_by_kernel, erode_by_kernel, offset_to_cube
+from engine.target_pool_cache import _LRUStore
+
+#: Clé du cache dans `game_state`.
+DEPLOYMENT_EROSION_CACHE_KEY = "_deployment_erosion_cache"
+#: Une entrée par (zone, socle) : un roster compte une poignée de socles distincts par joueur,
+#: plus une aire d'arrivée par configuration ennemie pour les réserves.
+DEPLOYMENT_EROSION_CACHE_MAX = 32
+
+Cell = Tuple[int, int]
+#: Noyau d'empreinte par parité de colonne : (offsets des ancres à colonne paire, impaire).
+ParityKernels = Tuple["np.ndarray", "np.ndarray"]
+
+
+class DeploymentErosionCache:
+    """LRU borné des zones érodées, clefées par l'appelant (zone, socle)."""
+
+    __slots__ = ("store",)
+
+    def __init__(self, max_entries: int = DEPLOYMENT_EROSION_CACHE_MAX) -> None:
+        self.store = _LRUStore(max_entries)
+
+    def eroded(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Valeur sous `key`, construite par `build()` au premier appel. Ne pas la muter."""
+        value = self.store.get(key)
+        if value is None:
+            value = build()
+            self.store.put(key, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        return self.store.stats()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DeploymentErosionCache":
+        fresh = DeploymentErosionCache(self.store.max_entries)
+        memo[id(self)] = fresh
+        return fresh
+
+
+def deployment_erosion_cache(game_state: Dict[str, Any]) -> DeploymentErosionCache:
+    """Cache du moteur propriétaire de `game_state`, créé au premier appel."""
+    cache = game_state.get(DEPLOYMENT_EROSION_CACHE_KEY)  # get allowed (absent au 1er appel)
+    if cache is None:
+        cache = DeploymentErosionCache()
+        game_state[DEPLOYMENT_EROSION_CACHE_KEY] = cache
+    return cache
+
+
+def parity_kernels_from_cube(cube_offsets: Iterable[Tuple[int, int, int]]) -> ParityKernels:
+    """Noyaux (pair, impair) en offsets odd-q d'une empreinte donnée en offsets CUBE.
+
+    Une translation cube est rigide, mais son écriture en (dc, dr) dépend de la parité de la
+    colonne de l'ancre : on la résout une fois à une ancre de chaque parité.
+    """
+    cube_offsets = list(cube_offsets)
+    kernels = []
+    for parity in (0, 1):
+        ax, ay, az = offset_to_cube(parity, 0)
+        kernels.append(np.array(
+            [
+                (c - parity, r)
+                for c, r in (cube_to_offset(ax + ox, ay + oy, az + oz) for ox, oy, oz in cube_offsets)
+            ],
+            dtype=np.int32,
+        ).reshape(-1, 2))
+    return kernels[0], kernels[1]
+
+
+def _board_grid(cells: Iterable[Cell], board_cols: int, board_rows: int) -> "np.ndarray":
+    """Grille booléenne du plateau marquée sur `cells` ; les cases hors plateau sont ignorées."""
+    grid = np.zeros((board_cols, board_rows), dtype=bool)
+    arr = np.fromiter((v for cell in cells for v in cell), dtype=np.int64).reshape(-1, 2)
+    if arr.size:
+        on_board = (
+            (arr[:, 0] >= 0) & (arr[:, 0] < board_cols) & (arr[:, 1] >= 0) & (arr[:, 1] < board_rows)
+        )
+        arr = arr[on_board]
+        grid[arr[:, 0], arr[:, 1]] = True
+    return grid
+
+
+def _by_parity(
+    op: Callable[..., "np.ndarray"],
+    src: "np.ndarray",
+    kernels: ParityKernels,
+    board_cols: int,
+    board_rows: int,
+) -> "np.ndarray":
+    """`op(src, noyau)` lu avec le noyau pair sur les colonnes paires, impair sur les impaires."""
+    out = op(src, kernels[0], board_cols, board_rows)
+    out[1::2, :] = op(src, kernels[1], board_cols, board_rows)[1::2, :]
+    return out
+
+
+def _cells_of(mask: "np.ndarray") -> Set[Cell]:
+    cols, rows = np.nonzero(mask)
+    return set(zip(cols.tolist(), rows.tolist()))
+
+
+def erode_anchors(
+    anchors: Iterable[Cell],
+    allowed: Iterable[Cell],
+    kernels: ParityKernels,
+    board_cols: int,
+    board_rows: int,
+) -> Set[Cell]:
+    """Ancres dont TOUTE l'empreinte (``ancre + noyau``) est dans ``allowed``."""
+    kept = _by_parity(erode_by_kernel, _board_grid(allowed, board_cols, board_rows), kernels,
+                      board_cols, board_rows)
+    return _cells_of(kept & _board_grid(anchors, board_cols, board_rows))
+
+
+def footprint_hit_anchors(
+    blocked: Iterable[Cell],
+    kernels: ParityKernels,
+    board_cols: int,
+    board_rows: int,
+) -> Set[Cell]:
+    """Ancres du plateau dont l'empreinte touche au moins une case de ``blocked``.
+
+    Le complément de l'érosion par ``plateau − blocked`` sur les ancres en jeu : c'est ce qui
+    permet de retrancher l'occupation d'une zone érodée en cache au lieu de tout ré-éroder.
+    """
+    blocked_grid = _board_grid(blocked, board_cols, board_rows)
+    if not blocked_grid.any():
+        return set()
+    return _cells_of(_by_parity(dilate_by_kernel, blocked_grid, kernels, board_cols, board_rows))
+
+
+def kernel_cache_key(kernels: ParityKernels) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """Forme hachable d'un noyau (indépendante de l'ordre des offsets)."""
+    return tuple(
+        tuple(sorted((int(dc), int(dr)) for dc, dr in kernel.tolist())) for kernel in kernels
+    )
+
@@ -0,0 +1,108 @@
+"""
+entity_encoding_cache.py - Part INTRINSÈQUE de l'encodage des entités, mémoïsée par unité.
+
+`ObservationBuilder._encode_unit_entity` ré-encode à chaque step les 28 entités (alliées et
+ennemies) de l'observation squad. Une partie de chaque ligne se mesure depuis l'observatrice
+(position relative, distance de bord, LoS et couvert de paire, engagement, comptages de mêlée)
+et doit être recalculée ; le reste ne décrit que l'unité elle-même : effectifs et PV, profil
+défensif, capacités en vigueur (`_fill_id_slots` sur tout le registre des effets), types de
+figurines. Ce reste ne change que lorsque l'UNITÉ change — entre deux steps, pour presque toutes.
+
+Clé d'une entrée : la RÉVISION de l'unité, plus les lectures vives bon marché qui couvrent les
+écritures hors choke-point (liste `UNIT_RULES` et sa longueur, profil de l'unité ; rôle, profil
+défensif, PV et valeur de chaque figurine vivante) et le seul facteur d'armée (Waaagh! actif sur
+l'unité). La révision est un compteur par unité, incrémenté par les écrivains de l'état
+d'unité : `update_units_cache_hp`, `update_units_cache_position`,
+`recompute_unit_rules_in_effect` (capacités en vigueur, 19.04) et `roll_battle_shock` (statut).
+Elle seule couvre une entrée de `UNIT_RULES` retouchée EN PLACE.
+
+Vérification : au niveau 1 de `engine.mask_verification` (contrôles de MÉMOÏSATION), chaque hit
+est recalculé et comparé ; une divergence lève en nommant l'unité et le champ.
+
+Durée de vie : `game_state` (purgé au reset d'épisode, cf. w40k_core) ; une COPIE d'état repart
+vide (`__deepcopy__`), comme `TargetPoolCache` — révisions comprises, puisqu'aucune entrée ne
+survit pour s'y référer.
+"""
+
+from typing import Any, Dict, Hashable, NamedTuple, Optional
+
+import numpy as np
+
+#: Clé du holder dans `game_state`.
+ENTITY_ENCODING_CACHE_KEY = "_entity_encoding_cache"
+
+
+class EntityIntrinsics(NamedTuple):
+    """Part de la ligne d'une entité qui ne dépend pas de l'observatrice (tableaux en lecture seule)."""
+
+    cont: np.ndarray         # valeurs de `INTRINSIC_CONT_FIELDS` (observation_builder), dans l'ordre
+    ability_ids: np.ndarray  # (UNIT_ABILITY_SLOTS,)
+    types_cont: np.ndarray   # (K_MODEL_TYPES, MODEL_TYPE_CONT_SIZE)
+    types_bin: np.ndarray    # (K_MODEL_TYPES, MODEL_TYPE_BIN_SIZE)
+
+
+class EntityEncodingCache:
+    """Révisions par unité et dernier encodage intrinsèque de chacune (cf. module)."""
+
+    __slots__ = ("revisions", "entries", "hits", "misses", "verified")
+
+    def __init__(self) -> None:
+        self.revisions: Dict[str, int] = {}
+        # Une entrée par unité : la dernière clé vue et son encodage. Un changement d'unité
+        # remplace l'entrée, donc la taille reste bornée par le nombre d'unités de la partie.
+        self.entries: Dict[str, tuple] = {}
+        self.hits = 0
+        self.misses = 0
+        self.verified = 0
+
+    def revision(self, unit_id: str) -> int:
+        return self.revisions.get(unit_id, 0)  # get allowed (jamais modifiée = révision 0)
+
+    def bump(self, unit_id: str) -> None:
+        self.revisions[unit_id] = self.revisions.get(unit_id, 0) + 1  # get allowed (idem)
+
+    def get(self, unit_id: str, key: Hashable) -> Optional[EntityIntrinsics]:
+        entry = self.entries.get(unit_id)  # get allowed (absence = cache froid)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, unit_id: str, key: Hashable, intrinsics: EntityIntrinsics) -> None:
+        self.entries[unit_id] = (key, intrinsics)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "verified": self.verified,
+            "size": len(self.entries),
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "EntityEncodingCache":
+        fresh = EntityEncodingCache()
+        memo[id(self)] = fresh
+        return fresh
+
+
+def entity_encoding_cache(game_state: Dict[str, Any]) -> EntityEncodingCache:
+    """Holder du moteur propriétaire de `game_state`, créé au premier appel."""
+    cache = game_state.get(ENTITY_ENCODING_CACHE_KEY)  # get allowed (absent au 1er appel)
+    if cache is None:
+        cache = EntityEncodingCache()
+        game_state[ENTITY_ENCODING_CACHE_KEY] = cache
+    return cache
+
+
+def bump_unit_revision(game_state: Dict[str, Any], unit_id: str) -> None:
+    """L'état de l'unité vient de changer : son encodage intrinsèque est à refaire.
+
+    Sans holder (aucune observation encore construite), rien à invalider : le premier encodage
+    partira de toute façon d'une entrée vide.
+    """
+    cache = game_state.get(ENTITY_ENCODING_CACHE_KEY)  # get allowed (absent avant la 1re obs)
+    if cache is not None:
+        cache.bump(str(unit_id))
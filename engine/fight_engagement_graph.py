@@ -0,0 +1,197 @@
+"""
+fight_engagement_graph.py - Graphe d'engagement de la phase de combat, entretenu par evenements.
+
+Chaque lecture d'eligibilite du combat V11 (pile-in groupe, selection 12.04 fights first /
+remaining, overrun 12.06, consolidation, snapshot `engaged_at_fight_step_start`) repose sur
+« cette escouade est-elle engagee MAINTENANT ? ». La reponse passait par `engagement_matrix`, qui
+revalide son cache en recalculant la signature de TOUTES les escouades posees (empreintes en
+`frozenset`) a chaque appel. Or `fight_v11_current_pool` pose la question pour chaque escouade de
+chaque camp, jusqu'a huit fois par lecture, et le masque, l'observation et le driver relisent le
+pool a chaque step : O(escouades² x empreinte) par step pour une geometrie qui, entre deux
+pile-in, ne bouge pas.
+
+Le graphe garde les ARETES d'engagement (escouades posees en noeuds, une arete par paire
+ennemie engagee). Il est ouvert par `fight_v11_start` et ferme par `_fight_v11_phase_complete`,
+construit paresseusement a la premiere lecture, puis mis a jour aux deux seuls evenements qui
+changent une arete :
+
+- ecriture de position (pile-in, consolidation, overrun, toute autre ecriture) :
+  `_apply_los_invalidation` / `_los_end_batch` (shared_utils) appellent
+  `fight_engagement_graph_after_move` APRES le bump de `_unit_move_version` ; les escouades
+  deplacees sont marquees, et seules leurs lignes sont remesurees a la lecture suivante ;
+- mort d'escouade : `remove_from_units_cache` appelle `fight_engagement_graph_drop_unit`, qui
+  retire le noeud et ses aretes.
+
+Les mesures passent toujours par `engagement_matrix` (meme primitive, memes verdicts) : le graphe
+n'a pas de geometrie a lui. Comme `shoot_target_matrix`, il suit `_unit_move_version` pas a pas ;
+un bump rate (ecriture hors choke-point, version incrementee a la main) est vu a la lecture
+suivante et le graphe repart de zero plutot que de servir une arete perimee.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from shared.data_validation import require_key
+
+_HOLDER_KEY = "_fight_engagement_graph"
+
+
+class FightEngagementGraph:
+    """Aretes d'engagement de la phase de combat en cours (cf. module)."""
+
+    __slots__ = ("phase_key", "version", "edges", "dirty", "built", "rebuilds", "row_updates")
+
+    def __init__(self, phase_key: Tuple[Hashable, ...], version: int) -> None:
+        self.phase_key = phase_key
+        self.version = version
+        self.edges: Dict[str, Set[str]] = {}
+        self.dirty: Set[str] = set()
+        self.built = False
+        self.rebuilds = 0
+        self.row_updates = 0
+
+    def reset(self, version: int) -> None:
+        self.version = version
+        self.edges.clear()
+        self.dirty.clear()
+        self.built = False
+
+    def drop_node(self, unit_id: str) -> None:
+        for other in self.edges.pop(unit_id, ()):
+            neighbours = self.edges.get(other)  # get allowed (voisin deja retire)
+            if neighbours is not None:
+                neighbours.discard(unit_id)
+        self.dirty.discard(unit_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "nodes": len(self.edges),
+            "edges": sum(len(n) for n in self.edges.values()) // 2,
+            "rebuilds": self.rebuilds,
+            "row_updates": self.row_updates,
+        }
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FightEngagementGraph":
+        # Copie d'etat : memes positions, meme version — un graphe vide s'y reconstruit a l'identique.
+        fresh = FightEngagementGraph(self.phase_key, self.version)
+        memo[id(self)] = fresh
+        return fresh
+
+
+def _phase_key(game_state: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    return (
+        game_state.get("episode_number"),  # get allowed (absent hors episode gym)
+        game_state["turn"],
+        game_state["current_player"],
+    )
+
+
+def open_fight_engagement_graph(game_state: Dict[str, Any]) -> FightEngagementGraph:
+    """Ouvre un graphe vide pour la phase de combat qui commence (`fight_v11_start`)."""
+    graph = FightEngagementGraph(_phase_key(game_state), int(game_state["_unit_move_version"]))
+    game_state[_HOLDER_KEY] = graph
+    return graph
+
+
+def close_fight_engagement_graph(game_state: Dict[str, Any]) -> None:
+    """Ferme le graphe en fin de phase de combat : rien ne doit le lire hors de sa phase."""
+    game_state.pop(_HOLDER_KEY, None)
+
+
+def _measure_rows(
+    game_state: Dict[str, Any], graph: FightEngagementGraph, unit_ids: Iterable[str]
+) -> None:
+    """(Re)mesure les aretes de `unit_ids` contre toutes les escouades ennemies posees."""
+    from engine.spatial_relations import engagement_matrix, get_engagement_zone
+
+    units_cache = require_key(game_state, "units_cache")
+    matrix = engagement_matrix(game_state, get_engagement_zone(game_state))
+    placed = set(matrix.ids)
+    for uid in unit_ids:
+        for other in graph.edges.pop(uid, ()):
+            neighbours = graph.edges.get(other)  # get allowed (voisin absent du graphe)
+            if neighbours is not None:
+                neighbours.discard(uid)
+        if uid not in placed:
+            continue
+        player = int(require_key(units_cache[uid], "player"))
+        engaged = set(matrix.enemies_engaging(uid, player))
+        graph.edges[uid] = engaged
+        for other in engaged:
+            graph.edges.setdefault(other, set()).add(uid)
+    for uid in placed:
+        graph.edges.setdefault(uid, set())
+
+
+def active_fight_engagement_graph(game_state: Dict[str, Any]) -> Optional[FightEngagementGraph]:
+    """Graphe de la phase de combat EN COURS, a jour de toutes les ecritures, ou None.
+
+    None hors phase de combat, ou si le graphe appartient a une autre phase (fin de phase non
+    traversee : reset d'episode, chargement d'etat) — l'appelant mesure alors sans graphe.
+    """
+    graph = game_state.get(_HOLDER_KEY)  # get allowed (absent hors phase de combat)
+    if graph is None or game_state.get("phase") != "fight":  # get allowed
+        return None
+    if graph.phase_key != _phase_key(game_state):
+        return None
+    version = int(game_state["_unit_move_version"])
+    if graph.version != version:
+        graph.reset(version)
+    if not graph.built:
+        from engine.spatial_relations import engagement_matrix, get_engagement_zone
+
+        graph.edges.clear()
+        graph.dirty.clear()
+        _measure_rows(
+            game_state, graph, engagement_matrix(game_state, get_engagement_zone(game_state)).ids
+        )
+        graph.built = True
+        graph.rebuilds += 1
+    elif graph.dirty:
+        dirty = list(graph.dirty)
+        graph.dirty.clear()
+        moved = [uid for uid in dirty if uid in require_key(game_state, "units_cache")]
+        for uid in dirty:
+            graph.drop_node(uid)
+        _measure_rows(game_state, graph, moved)
+        graph.row_updates += len(moved)
+    return graph
+
+
+def graph_engaged(graph: FightEngagementGraph, game_state: Dict[str, Any], unit_id: str) -> bool:
+    """L'escouade est-elle engagee avec au moins un ennemi ? (hors table : non, 20.01)."""
+    if unit_id not in require_key(game_state, "units_cache"):
+        raise ValueError(f"Unit {unit_id} not in units_cache (dead or absent); cannot read engagement")
+    return bool(graph.edges.get(unit_id))  # get allowed (hors table = absente du graphe)
+
+
+def graph_enemies_engaged_with(
+    graph: FightEngagementGraph, game_state: Dict[str, Any], unit_id: str
+) -> List[str]:
+    """Ennemis engages avec l'escouade, dans l'ordre de `units_cache` (celui de la matrice)."""
+    neighbours = graph.edges.get(unit_id)  # get allowed (hors table = absente du graphe)
+    if not neighbours:
+        return []
+    return [str(uid) for uid in require_key(game_state, "units_cache") if str(uid) in neighbours]
+
+
+def fight_engagement_graph_after_move(game_state: Dict[str, Any], unit_ids: Iterable[str]) -> None:
+    """Apres UN bump de `_unit_move_version` couvrant `unit_ids` : marque leurs lignes a remesurer.
+
+    Seul un bump suivi pas a pas (version du graphe = version courante - 1) est applique de facon
+    ciblee ; sinon le graphe a deja rate un evenement et la lecture suivante le reconstruira.
+    """
+    graph = game_state.get(_HOLDER_KEY)  # get allowed (absent hors phase de combat)
+    if graph is None:
+        return
+    version = int(game_state["_unit_move_version"])
+    if graph.version != version - 1:
+        return
+    graph.dirty.update(str(uid) for uid in unit_ids)
+    graph.version = version
+
+
+def fight_engagement_graph_drop_unit(game_state: Dict[str, Any], unit_id: str) -> None:
+    """Escouade detruite : retire son noeud et ses aretes."""
+    graph = game_state.get(_HOLDER_KEY)  # get allowed (absent hors phase de combat)
+    if graph is not None:
+        graph.drop_node(str(unit_id))
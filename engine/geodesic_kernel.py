@@ -0,0 +1,624 @@
+"""Backend COMPILÉ (numba) du champ géodésique any-angle — ``geodesic_field`` en tableaux.
+
+POURQUOI CE MODULE EXISTE
+=========================
+``hex_utils.geodesic_field`` / ``geodesic_field_multi_source`` passent leur temps dans
+l'interpréteur : un ``heapq`` de tuples, un ``dict`` par distance et par parent, un appel
+``_segment_clear_indexed`` (lui-même un dict de buckets et une liste de sommets allouée par
+obstacle testé) pour chaque voisin. Ce module rejoue EXACTEMENT le même algorithme sur des
+tableaux plats, compilé une fois par processus :
+
+- cellule = indice plat ``col * rows + row`` ; distances, parents et « fermé » sont des grilles ;
+- la frontière est un tas binaire INDEXÉ, PRÉALLOUÉ sur ces indices (une entrée par cellule
+  ouverte, clé baissée en place) : la référence empile une entrée par amélioration et saute les
+  périmées ; les cellules sortent pourtant dans le même ordre (cf. ci-dessous) ;
+- l'index d'obstacles est le même partitionnement en buckets (chaque obstacle inscrit dans son
+  bucket et ses 8 voisins), rangé en CSR (``bucket_start`` / centres) au lieu d'un dict de listes,
+  plus les sommes cumulées 2D des effectifs : un segment dont le rectangle de buckets est vide
+  est dégagé en O(1), sans DDA.
+
+BIT-IDENTITÉ, PAS « À TOLÉRANCE PRÈS »
+======================================
+Le champ rendu est ÉGAL au champ de référence : mêmes cellules, mêmes distances au bit près,
+même ordre d'insertion. Trois choix y concourent, chacun nécessaire :
+
+1. ordre du tas : la référence compare des tuples ``(distance, (col, row))`` ; la clé
+   ``(distance, col * rows + row)`` ordonne les ex-aequo de la même façon pour toute cellule du
+   plateau. Une entrée périmée de la référence a une distance strictement supérieure à l'entrée
+   vivante de la même cellule, donc ne sort jamais avant elle : la suite des cellules FERMÉES
+   est celle du tas indexé, et chacune reçoit le même parent ;
+2. distances en float64 : en float32 (~1e-7 relatif) des ex-aequo de la référence se
+   départageraient autrement et ``cand <= budget + 1e-9`` basculerait au bord du budget ;
+3. ``_hypot`` reproduit ``math.hypot`` de CPython (norme compensée de ``vector_norm``), pas la
+   ``hypot`` de la libm, qui en diffère au dernier ulp sur ~0,6 % des pas du plateau.
+
+Le backend ``"python"`` reste la référence testable (``test_geodesic_kernel.py`` les compare) ;
+ce module n'est importé que si la config ``move.geodesic_backend`` vaut ``"compiled"``.
+"""
+
+import math
+from typing import AbstractSet, Dict, Optional, Set, Tuple
+
+import numpy as np
+from numba import njit
+
+from engine.hex_utils import (
+    _HEX_CIRCUMRADIUS,
+    _HEX_CORNER_OFFSETS,
+    _SEG_TOL,
+    _obstacle_bucket_size,
+)
+
+#: Sommets flat-top (mêmes flottants que ``hex_utils._HEX_CORNER_OFFSETS``, figés à la compilation).
+_CORNER_DX = np.array([c[0] for c in _HEX_CORNER_OFFSETS], dtype=np.float64)
+_CORNER_DY = np.array([c[1] for c in _HEX_CORNER_OFFSETS], dtype=np.float64)
+_HEX_HEIGHT = math.sqrt(3.0)
+_VELTKAMP = 134217729.0  # 2**27 + 1
+
+# Voisins odd-q, même ordre que ``hex_utils.get_neighbors`` (pair puis impair).
+_NB_EVEN_DC = np.array([0, 1, 1, 0, -1, -1], dtype=np.int64)
+_NB_EVEN_DR = np.array([-1, -1, 0, 1, 0, -1], dtype=np.int64)
+_NB_ODD_DC = np.array([0, 1, 1, 0, -1, -1], dtype=np.int64)
+_NB_ODD_DR = np.array([-1, 0, 1, 1, 1, 0], dtype=np.int64)
+
+
+@njit(cache=True)
+def _center_x(col):
+    return col * 1.5 + 1.5 / 2.0
+
+
+@njit(cache=True)
+def _center_y(col, row):
+    # Même expression, même ordre d'opérations que ``hex_utils._hex_center``.
+    return row * _HEX_HEIGHT + ((col & 1) * _HEX_HEIGHT) / 2.0 + _HEX_HEIGHT / 2.0
+
+
+@njit(cache=True)
+def _two_product(x, y):
+    """Produit sans erreur (Dekker) : ``x*y == hi + lo`` exactement."""
+    t = x * _VELTKAMP
+    xh = t - (t - x)
+    xl = x - xh
+    t = y * _VELTKAMP
+    yh = t - (t - y)
+    yl = y - yh
+    hi = x * y
+    lo = ((xh * yh - hi) + xh * yl + xl * yh) + xl * yl
+    return hi, lo
+
+
+@njit(cache=True)
+def _hypot(a, b):
+    """``math.hypot(a, b)`` de CPython 3.11 (``vector_norm`` à 2 composantes), au bit près."""
+    a = abs(a)
+    b = abs(b)
+    mx = a if a > b else b
+    if mx == 0.0:
+        return mx
+    _m, e = math.frexp(mx)
+    scale = math.ldexp(1.0, -e)
+    csum = 1.0
+    frac1 = 0.0
+    frac2 = 0.0
+    for x in (a * scale, b * scale):
+        hi, lo = _two_product(x, x)
+        s = csum + hi
+        frac2 += (csum - s) + hi
+        csum = s
+        frac1 += lo
+    h = math.sqrt(csum - 1.0 + (frac1 + frac2))
+    hi, lo = _two_product(-h, h)
+    s = csum + hi
+    frac2 += (csum - s) + hi
+    csum = s
+    frac1 += lo
+    x = csum - 1.0 + (frac1 + frac2)
+    h += x / (2.0 * h)
+    return h / scale
+
+
+@njit(cache=True)
+def _build_index(ocols, orows, bs, center_x, center_y, reach_sq):
+    """Index CSR : bucket ``(gx, gy)`` → centres des obstacles inscrits (bucket + 8 voisins).
+
+    ``reach_sq < 0`` : pas d'élagage (cf. ``hex_utils._build_obstacle_index``).
+    Rend ``(gx0, gy0, nbx, nby, bucket_start, ox, oy, csum)`` ; ``nbx == 0`` = index vide.
+    ``csum`` : sommes cumulées 2D des effectifs de buckets (rejet d'un segment en O(1), cf.
+    ``_segment_clear``).
+    """
+    n = ocols.size
+    keep_x = np.empty(n, dtype=np.float64)
+    keep_y = np.empty(n, dtype=np.float64)
+    k = 0
+    for i in range(n):
+        ocx = _center_x(ocols[i])
+        ocy = _center_y(ocols[i], orows[i])
+        if reach_sq >= 0.0 and (ocx - center_x) * (ocx - center_x) + (ocy - center_y) * (ocy - center_y) > reach_sq:
+            continue
+        keep_x[k] = ocx
+        keep_y[k] = ocy
+        k += 1
+    empty = np.zeros(1, dtype=np.int64)
+    none = np.empty(0, dtype=np.float64)
+    if k == 0:
+        return 0, 0, 0, 0, empty, none, none, np.zeros((1, 1), dtype=np.int64)
+    bgx = np.empty(k, dtype=np.int64)
+    bgy = np.empty(k, dtype=np.int64)
+    for i in range(k):
+        bgx[i] = int(keep_x[i] // bs)
+        bgy[i] = int(keep_y[i] // bs)
+    gx0 = bgx.min() - 1
+    gy0 = bgy.min() - 1
+    nbx = bgx.max() + 2 - gx0
+    nby = bgy.max() + 2 - gy0
+    counts = np.zeros(nbx * nby + 1, dtype=np.int64)
+    for i in range(k):
+        for gx in range(bgx[i] - 1, bgx[i] + 2):
+            for gy in range(bgy[i] - 1, bgy[i] + 2):
+                counts[(gx - gx0) * nby + (gy - gy0) + 1] += 1
+    csum = np.zeros((nbx + 1, nby + 1), dtype=np.int64)
+    for ix in range(nbx):
+        for iy in range(nby):
+            csum[ix + 1, iy + 1] = (
+                counts[ix * nby + iy + 1] + csum[ix, iy + 1] + csum[ix + 1, iy] - csum[ix, iy]
+            )
+    for b in range(nbx * nby):
+        counts[b + 1] += counts[b]
+    fill = counts[:-1].copy()
+    ox = np.empty(counts[-1], dtype=np.float64)
+    oy = np.empty(counts[-1], dtype=np.float64)
+    for i in range(k):
+        for gx in range(bgx[i] - 1, bgx[i] + 2):
+            for gy in range(bgy[i] - 1, bgy[i] + 2):
+                b = (gx - gx0) * nby + (gy - gy0)
+                ox[fill[b]] = keep_x[i]
+                oy[fill[b]] = keep_y[i]
+                fill[b] += 1
+    return gx0, gy0, nbx, nby, counts, ox, oy, csum
+
+
+@njit(cache=True)
+def _point_segment_dist_sq(px, py, ax, ay, bx, by):
+    dx = bx - ax
+    dy = by - ay
+    seg_sq = dx * dx + dy * dy
+    if seg_sq <= 0.0:
+        return (px - ax) ** 2 + (py - ay) ** 2
+    t = ((px - ax) * dx + (py - ay) * dy) / seg_sq
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    qx = ax + t * dx
+    qy = ay + t * dy
+    return (px - qx) ** 2 + (py - qy) ** 2
+
+
+@njit(cache=True)
+def _segment_crosses_hex_interior(ax, ay, bx, by, cx, cy):
+    dx = bx - ax
+    dy = by - ay
+    t_enter = 0.0
+    t_exit = 1.0
+    for i in range(6):
+        j = (i + 1) % 6
+        x1 = cx + _CORNER_DX[i]
+        y1 = cy + _CORNER_DY[i]
+        ex = (cx + _CORNER_DX[j]) - x1
+        ey = (cy + _CORNER_DY[j]) - y1
+        nx = ey
+        ny = -ex
+        if (nx * (cx - x1) + ny * (cy - y1)) > 0:
+            nx = -nx
+            ny = -ny
+        denom = nx * dx + ny * dy
+        num = nx * (ax - x1) + ny * (ay - y1)
+        if abs(denom) < 1e-12:
+            if num > 1e-12:
+                return False
+            continue
+        t = -num / denom
+        if denom < 0:
+            t_enter = max(t_enter, t)
+        else:
+            t_exit = min(t_exit, t)
+        if t_enter > t_exit:
+            return False
+    return (t_exit - t_enter) > _SEG_TOL
+
+
+@njit(cache=True)
+def _seg_seg_dist_sq(ax, ay, bx, by, cx, cy, dx, dy):
+    r0x = bx - ax
+    r0y = by - ay
+    s0x = dx - cx
+    s0y = dy - cy
+    denom = r0x * s0y - r0y * s0x
+    if abs(denom) > 1e-12:
+        t = ((cx - ax) * s0y - (cy - ay) * s0x) / denom
+        u = ((cx - ax) * r0y - (cy - ay) * r0x) / denom
+        if -1e-12 <= t <= 1.0 + 1e-12 and -1e-12 <= u <= 1.0 + 1e-12:
+            return 0.0
+    return min(
+        _point_segment_dist_sq(cx, cy, ax, ay, bx, by),
+        _point_segment_dist_sq(dx, dy, ax, ay, bx, by),
+        _point_segment_dist_sq(ax, ay, cx, cy, dx, dy),
+        _point_segment_dist_sq(bx, by, cx, cy, dx, dy),
+    )
+
+
+@njit(cache=True)
+def _segment_hits_hex(ax, ay, bx, by, cx, cy, clearance):
+    if clearance <= _SEG_TOL:
+        return _segment_crosses_hex_interior(ax, ay, bx, by, cx, cy)
+    if _segment_crosses_hex_interior(ax, ay, bx, by, cx, cy):
+        return True
+    thr_sq = (clearance - _SEG_TOL) ** 2
+    for i in range(6):
+        j = (i + 1) % 6
+        if _seg_seg_dist_sq(
+            ax, ay, bx, by,
+            cx + _CORNER_DX[i], cy + _CORNER_DY[i], cx + _CORNER_DX[j], cy + _CORNER_DY[j],
+        ) < thr_sq:
+            return True
+    return False
+
+
+@njit(cache=True)
+def _bucket_hits(gx, gy, ax, ay, bx, by, gx0, gy0, nbx, nby, bstart, ox, oy, reach_sq, clearance):
+    """Un obstacle du bucket ``(gx, gy)`` heurte-t-il le segment ? (hors grille = bucket vide)."""
+    ix = gx - gx0
+    iy = gy - gy0
+    if ix < 0 or iy < 0 or ix >= nbx or iy >= nby:
+        return False
+    b = ix * nby + iy
+    for k in range(bstart[b], bstart[b + 1]):
+        ocx = ox[k]
+        ocy = oy[k]
+        if _point_segment_dist_sq(ocx, ocy, ax, ay, bx, by) <= reach_sq and _segment_hits_hex(
+            ax, ay, bx, by, ocx, ocy, clearance
+        ):
+            return True
+    return False
+
+
+@njit(cache=True)
+def _empty_span(gxa, gya, gxb, gyb, gx0, gy0, nbx, nby, csum):
+    """Aucun obstacle dans le rectangle de buckets ``[gxa..gxb] x [gya..gyb]`` (élargi d'un bucket) ?
+
+    La DDA ne visite que des buckets compris entre ceux des deux extrémités : si le rectangle
+    qui les borne est vide, le segment est dégagé sans le parcourir. L'anneau d'un bucket en plus
+    absorbe une dérive d'arrondi de ``t_max`` au dernier pas — le rejet ne peut donc jamais
+    déclarer dégagé un segment que la DDA aurait trouvé bloqué.
+    """
+    x0 = min(gxa, gxb) - 1 - gx0
+    x1 = max(gxa, gxb) + 2 - gx0
+    y0 = min(gya, gyb) - 1 - gy0
+    y1 = max(gya, gyb) + 2 - gy0
+    x0 = min(max(x0, 0), nbx)
+    x1 = min(max(x1, 0), nbx)
+    y0 = min(max(y0, 0), nby)
+    y1 = min(max(y1, 0), nby)
+    if x0 >= x1 or y0 >= y1:
+        return True
+    return csum[x1, y1] - csum[x0, y1] - csum[x1, y0] + csum[x0, y0] == 0
+
+
+@njit(cache=True)
+def _segment_clear(ax, ay, bx, by, bs, index, clearance):
+    """``hex_utils._segment_clear_indexed`` sur l'index CSR : même DDA, mêmes buckets visités."""
+    gx0, gy0, nbx, nby, bstart, ox, oy, csum = index
+    if nbx == 0:
+        return True
+    gx = int(ax // bs)
+    gy = int(ay // bs)
+    gxe = int(bx // bs)
+    gye = int(by // bs)
+    if _empty_span(gx, gy, gxe, gye, gx0, gy0, nbx, nby, csum):
+        return True
+    reach = _HEX_CIRCUMRADIUS + (clearance if clearance > 0.0 else 0.0) + _SEG_TOL
+    reach_sq = reach * reach
+    if _bucket_hits(gx, gy, ax, ay, bx, by, gx0, gy0, nbx, nby, bstart, ox, oy, reach_sq, clearance):
+        return False
+    if gx == gxe and gy == gye:
+        return True
+    dx = bx - ax
+    dy = by - ay
+    step_x = 1 if dx > 0 else -1
+    step_y = 1 if dy > 0 else -1
+    t_delta_x = bs / abs(dx) if dx != 0 else np.inf
+    t_delta_y = bs / abs(dy) if dy != 0 else np.inf
+    if dx > 0:
+        t_max_x = ((gx + 1) * bs - ax) / dx
+    elif dx < 0:
+        t_max_x = (gx * bs - ax) / dx
+    else:
+        t_max_x = np.inf
+    if dy > 0:
+        t_max_y = ((gy + 1) * bs - ay) / dy
+    elif dy < 0:
+        t_max_y = (gy * bs - ay) / dy
+    else:
+        t_max_y = np.inf
+    while True:
+        if t_max_x < t_max_y:
+            if t_max_x > 1.0:
+                break
+            gx += step_x
+            t_max_x += t_delta_x
+        else:
+            if t_max_y > 1.0:
+                break
+            gy += step_y
+            t_max_y += t_delta_y
+        if _bucket_hits(gx, gy, ax, ay, bx, by, gx0, gy0, nbx, nby, bstart, ox, oy, reach_sq, clearance):
+            return False
+        if gx == gxe and gy == gye:
+            break
+    return True
+
+
+@njit(cache=True)
+def _before(g, a, b):
+    """Ordre du tas : ``(g[a], a) < (g[b], b)`` — celui des tuples ``(distance, (col, row))``."""
+    return g[a] < g[b] or (g[a] == g[b] and a < b)
+
+
+@njit(cache=True)
+def _sift_up(heap, pos, g, i):
+    cell = heap[i]
+    while i > 0:
+        p = (i - 1) >> 1
+        if not _before(g, cell, heap[p]):
+            break
+        heap[i] = heap[p]
+        pos[heap[i]] = i
+        i = p
+    heap[i] = cell
+    pos[cell] = i
+
+
+@njit(cache=True)
+def _heap_push_or_decrease(heap, pos, g, size, cell):
+    """Insère ``cell`` ou remonte son entrée (``g[cell]`` vient de baisser). Rend la taille."""
+    i = pos[cell]
+    if i < 0:
+        i = size
+        heap[i] = cell
+        size += 1
+    _sift_up(heap, pos, g, i)
+    return size
+
+
+@njit(cache=True)
+def _heap_pop(heap, pos, g, size):
+    """Retire la cellule de plus petite clé. Rend ``(cellule, taille)``."""
+    top = heap[0]
+    pos[top] = -1
+    size -= 1
+    if size > 0:
+        cell = heap[size]
+        i = 0
+        while True:
+            l = 2 * i + 1
+            if l >= size:
+                break
+            m = l
+            if l + 1 < size and _before(g, heap[l + 1], heap[l]):
+                m = l + 1
+            if not _before(g, heap[m], cell):
+                break
+            heap[i] = heap[m]
+            pos[heap[i]] = i
+            i = m
+        heap[i] = cell
+        pos[cell] = i
+    return top, size
+
+
+@njit(cache=True)
+def _flood(
+    src_idx, src_d, cols, rows, blocked, budget, clearance, contact_start,
+    bs, idx, idx_far, bs0, idx_contact,
+):
+    """Lazy Theta* en flood multi-source — transcription de ``hex_utils.geodesic_field_multi_source``.
+
+    Rend ``(order, g)`` : cellules dans l'ordre de PREMIÈRE affectation (ordre d'insertion du dict
+    de référence) et grille des distances.
+    """
+    n = cols * rows
+    g = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int64)
+    closed = np.zeros(n, dtype=np.uint8)
+    order = np.empty(n, dtype=np.int64)
+    n_order = 0
+    heap = np.empty(n, dtype=np.int64)
+    pos = np.full(n, -1, dtype=np.int64)
+    size = 0
+    has_contact = idx_contact[2] > 0
+    for s in range(src_idx.size):
+        cell = src_idx[s]
+        d0 = src_d[s]
+        if blocked[cell] or d0 > budget + _SEG_TOL:
+            continue
+        if d0 < g[cell]:
+            if g[cell] == np.inf:
+                order[n_order] = cell
+                n_order += 1
+            g[cell] = d0
+            parent[cell] = cell
+            size = _heap_push_or_decrease(heap, pos, g, size, cell)
+    while size > 0:
+        cur, size = _heap_pop(heap, pos, g, size)
+        closed[cur] = 1
+        ccol = cur // rows
+        crow = cur - ccol * rows
+        cx = _center_x(ccol)
+        cy = _center_y(ccol, crow)
+        par = parent[cur]
+        pcol = par // rows
+        prow = par - pcol * rows
+        px = _center_x(pcol)
+        py = _center_y(pcol, prow)
+        g_par = g[par]
+        g_cur = g[cur]
+        odd = ccol & 1
+        for k in range(6):
+            if odd:
+                nc = ccol + _NB_ODD_DC[k]
+                nr = crow + _NB_ODD_DR[k]
+            else:
+                nc = ccol + _NB_EVEN_DC[k]
+                nr = crow + _NB_EVEN_DR[k]
+            if nc < 0 or nr < 0 or nc >= cols or nr >= rows:
+                continue
+            nb = nc * rows + nr
+            if blocked[nb] or closed[nb]:
+                continue
+            nx = _center_x(nc)
+            ny = _center_y(nc, nr)
+            if _segment_clear(px, py, nx, ny, bs, idx, clearance) or (
+                has_contact and par == contact_start
+                and _segment_clear(px, py, nx, ny, bs, idx_far, clearance)
+                and _segment_clear(px, py, nx, ny, bs0, idx_contact, 0.0)
+            ):
+                axr = px
+                ayr = py
+                anchor = par
+                base = g_par
+            elif (
+                clearance <= _SEG_TOL
+                or _segment_clear(cx, cy, nx, ny, bs, idx, clearance)
+                or (
+                    has_contact and cur == contact_start
+                    and _segment_clear(cx, cy, nx, ny, bs, idx_far, clearance)
+                    and _segment_clear(cx, cy, nx, ny, bs0, idx_contact, 0.0)
+                )
+            ):
+                axr = cx
+                ayr = cy
+                anchor = cur
+                base = g_cur
+            else:
+                continue
+            cand = base + _hypot(nx - axr, ny - ayr)
+            if cand <= budget + _SEG_TOL and cand < g[nb]:
+                if g[nb] == np.inf:
+                    order[n_order] = nb
+                    n_order += 1
+                g[nb] = cand
+                parent[nb] = anchor
+                size = _heap_push_or_decrease(heap, pos, g, size, nb)
+    return order[:n_order], g
+
+
+def _cells_array(cells: AbstractSet[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    if not cells:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    arr = np.array(list(cells), dtype=np.int64).reshape(-1, 2)
+    return arr[:, 0].copy(), arr[:, 1].copy()
+
+
+def _index(
+    cells: AbstractSet[Tuple[int, int]], bs: float,
+    center: Optional[Tuple[float, float]] = None, reach_sq: float = -1.0,
+) -> Tuple[object, ...]:
+    cc, rr = _cells_array(cells)
+    cx, cy = center if center is not None else (0.0, 0.0)
+    return _build_index(cc, rr, float(bs), float(cx), float(cy), float(reach_sq))
+
+
+def _blocked_grid(obstacles: AbstractSet[Tuple[int, int]], board_cols: int, board_rows: int) -> np.ndarray:
+    blocked = np.zeros(board_cols * board_rows, dtype=np.uint8)
+    cc, rr = _cells_array(obstacles)
+    inside = (cc >= 0) & (rr >= 0) & (cc < board_cols) & (rr < board_rows)
+    blocked[cc[inside] * board_rows + rr[inside]] = 1
+    return blocked
+
+
+def _to_field(order: np.ndarray, g: np.ndarray, board_rows: int) -> Dict[Tuple[int, int], float]:
+    cols_, rows_ = np.divmod(order, board_rows)
+    return dict(zip(zip(cols_.tolist(), rows_.tolist()), g[order].tolist()))
+
+
+def _run(
+    starts: Dict[Tuple[int, int], float],
+    board_cols: int,
+    board_rows: int,
+    obstacles: Set[Tuple[int, int]],
+    budget: float,
+    clearance: float,
+    contact: AbstractSet[Tuple[int, int]],
+    contact_start: Optional[Tuple[int, int]],
+    prune_center: Optional[Tuple[float, float]],
+    prune_reach_sq: float,
+) -> Dict[Tuple[int, int], float]:
+    for (sc, sr) in starts:
+        if not (0 <= sc < board_cols and 0 <= sr < board_rows):
+            raise ValueError(
+                f"geodesic_kernel: source {(sc, sr)} hors plateau {board_cols}x{board_rows} "
+                "(le backend compilé indexe les cellules du plateau seulement)"
+            )
+    bs = _obstacle_bucket_size(clearance)
+    bs0 = _obstacle_bucket_size(0.0)
+    idx = _index(obstacles, bs, prune_center, prune_reach_sq)
+    if contact:
+        idx_far = _index(obstacles - contact, bs, prune_center, prune_reach_sq)
+        idx_contact = _index(contact, bs0)
+    else:
+        idx_far = idx
+        idx_contact = _index(frozenset(), bs0)
+    src = list(starts.items())
+    src_idx = np.array([c * board_rows + r for (c, r), _d in src], dtype=np.int64)
+    src_d = np.array([float(d) for _c, d in src], dtype=np.float64)
+    cs = -1 if contact_start is None else contact_start[0] * board_rows + contact_start[1]
+    order, g = _flood(
+        src_idx, src_d, board_cols, board_rows, _blocked_grid(obstacles, board_cols, board_rows),
+        float(budget), float(clearance), cs,
+        bs, idx, idx_far, bs0, idx_contact,
+    )
+    return _to_field(order, g, board_rows)
+
+
+def geodesic_field_compiled(
+    start: Tuple[int, int],
+    board_cols: int,
+    board_rows: int,
+    obstacles: Set[Tuple[int, int]],
+    budget: float,
+    clearance: float = 0.0,
+    contact_obstacles: Optional[AbstractSet[Tuple[int, int]]] = None,
+) -> Dict[Tuple[int, int], float]:
+    """``hex_utils.geodesic_field`` en tableaux compilés — même contrat, même résultat."""
+    if start in obstacles:
+        raise ValueError(f"geodesic_field: start {start} est un obstacle")
+    sx, sy = float(_center_x(start[0])), float(_center_y(start[0], start[1]))
+    reach = budget + (clearance if clearance > 0.0 else 0.0) + 4.0 * _HEX_CIRCUMRADIUS
+    contact = frozenset(contact_obstacles) & obstacles if contact_obstacles else frozenset()
+    return _run(
+        {start: 0.0}, board_cols, board_rows, obstacles, budget, clearance,
+        contact, start, (sx, sy), reach * reach,
+    )
+
+
+def geodesic_field_multi_source_compiled(
+    starts: Dict[Tuple[int, int], float],
+    board_cols: int,
+    board_rows: int,
+    obstacles: Set[Tuple[int, int]],
+    budget: float,
+    clearance: float = 0.0,
+    contact_obstacles: Optional[AbstractSet[Tuple[int, int]]] = None,
+    contact_start: Optional[Tuple[int, int]] = None,
+) -> Dict[Tuple[int, int], float]:
+    """``hex_utils.geodesic_field_multi_source`` en tableaux compilés — même contrat, même résultat."""
+    contact = frozenset(contact_obstacles) & obstacles if contact_obstacles else frozenset()
+    if contact and contact_start is None:
+        raise ValueError(
+            "geodesic_field_multi_source: contact_obstacles exige contact_start "
+            "(la position RÉELLE du mobile parmi les sources)"
+        )
+    return _run(
+        starts, board_cols, board_rows, obstacles, budget, clearance,
+        contact, contact_start, None, -1.0,
+    )
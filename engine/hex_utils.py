@@ -10,6 +10,7 @@ All functions are O(1) per call unless documented otherwise.
 
 import heapq
 import math
+from collections.abc import Iterable, MutableSet
 from functools import lru_cache
 from typing import (
     AbstractSet,
@@ -340,37 +341,56 @@ def _lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
 
 
-def hex_line_iter(
-    col1: int, row1: int, col2: int, row2: int
-) -> Iterator[Tuple[int, int]]:
-    """Yield hex cells along the line from (col1,row1) to (col2,row2), lazily.
-
-    Corps historique de :func:`hex_line`, transformé en générateur : les appelants qui s'arrêtent au
-    premier hex bloquant (LoS) ne paient plus la construction de la ligne entière — mesuré : 52 % des
-    cellules construites n'étaient jamais examinées. Séquence, ordre et déduplication IDENTIQUES à
-    :func:`hex_line`, qui n'est plus qu'un ``list()`` de ce générateur (source de vérité unique).
+# Borne de la table des tracés relatifs (entrées = déplacements distincts). Une entrée coûte
+# ~48 octets par cellule de ligne : ~6 Ko pour une ligne de 120 cellules à x10, donc ~45 Mo au
+# plein de la table, par processus (chaque worker SubprocVecEnv a la sienne). Une preview de tir
+# rejoue les mêmes déplacements d'une cellule source à l'autre de l'empreinte du tireur (mesuré,
+# `scripts/bench_hex_line_table.py` : 97 % de succès, x8,4) ; un défaut de table coûte ~15 % de
+# plus que le calcul d'origine, une fois.
+HEX_LINE_TABLE_SIZE = 8192
+
+
+@lru_cache(maxsize=HEX_LINE_TABLE_SIZE)
+def _hex_line_table(
+    dcol: int, drow: int, parity: int
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Tracé RELATIF d'une ligne hex : ``(dcols, drows)`` pour un déplacement ``(dcol, drow)``
+    partant d'une colonne de parité ``parity``.
+
+    La k-ième cellule de la ligne est ``(col1 + dcols[k], row1 + drows[k])``. Une translation de
+    colonne PAIRE et de ligne quelconque est une translation exacte en cube ; le tracé ne dépend
+    donc que de ``(dcol, drow, parity)``. Deux tuples d'entiers plutôt qu'un tuple de couples :
+    trois fois moins de mémoire par entrée, pour la même traduction (``zip``).
+
+    SOURCE UNIQUE de la géométrie de ligne : :func:`hex_line_iter`, :func:`hex_line_iter_t` et
+    :func:`hex_line` traduisent cette table, et :func:`batch_hex_line_steps` refait ici le MÊME
+    calcul flottant en vectoriel. Le cube-lerp est mené dans le repère de la source (cube
+    ``(0, 0, 0)`` + nudge) et non en coordonnées absolues : sans cela, le départage des cellules
+    à égalité EXACTE entre deux axes (que le nudge ``+1e-6`` commun à x et y ne tranche pas) se
+    jouait sur le bruit d'arrondi des coordonnées absolues — mesuré : 5,7 % des lignes d'un plateau
+    250x180 changeaient d'une cellule selon l'endroit où on les posait. Le couvert (13.06) ne
+    dépend plus de la position du tir sur la table.
+
+    L'EXPRESSION reste `a + (b - a) * t` avec `t = i / n` recalculé à chaque point — surtout pas
+    une accumulation incrémentale, dont la dérive flottante changerait le départage des lignes
+    rasantes. Les ``n + 1`` cellules sont deux à deux distinctes (la i-ème est à distance cube
+    ``i`` de la source) : la k-ième cellule est donc celle du rang ``i = k``, et ``t = k / n`` se
+    relit sans être stocké (:func:`hex_line_iter_t`).
     """
-    if col1 == col2 and row1 == row2:
-        yield (col1, row1)
-        return
-
-    x1, y1, z1 = offset_to_cube(col1, row1)
-    x2, y2, z2 = offset_to_cube(col2, row2)
-
-    n = max(abs(x1 - x2), abs(y1 - y2), abs(z1 - z2))
-    seen: Set[Tuple[int, int]] = set()
-
-    # Chemin chaud (~1,6 M d'itérations par preview de tir) : ``_lerp`` et ``cube_to_offset`` sont
-    # inlinés et les bornes hissées hors boucle. L'EXPRESSION reste `a + (b - a) * t` avec
-    # `t = i / n` recalculé à chaque point — surtout pas une accumulation incrémentale, dont la
-    # dérive flottante changerait le départage des lignes rasantes, donc le couvert (rule 13.06).
-    ax = x1 + 1e-6
-    ay = y1 + 1e-6
-    az = z1 - 2e-6
-    bx = (x2 + 1e-6) - ax
-    by = (y2 + 1e-6) - ay
-    bz = (z2 - 2e-6) - az
-
+    x2, y2, z2 = offset_to_cube(parity + dcol, drow)
+    # Cube de la source de base `(parity, 0)` : (parity, -parity, 0).
+    dx, dy, dz = x2 - parity, y2 + parity, z2
+    n = max(abs(dx), abs(dy), abs(dz))
+
+    ax = 1e-6
+    ay = 1e-6
+    az = -2e-6
+    bx = (dx + 1e-6) - ax
+    by = (dy + 1e-6) - ay
+    bz = (dz - 2e-6) - az
+
+    dcols: List[int] = []
+    drows: List[int] = []
     for i in range(n + 1):
         t = i / n if n > 0 else 0.0
         fx = ax + bx * t
@@ -381,26 +401,36 @@ def hex_line_iter(
         ry = round(fy)
         rz = round(fz)
 
-        dx = rx - fx
-        if dx < 0.0:
-            dx = -dx
-        dy = ry - fy
-        if dy < 0.0:
-            dy = -dy
-        dz = rz - fz
-        if dz < 0.0:
-            dz = -dz
-        if dx > dy and dx > dz:
+        ex = abs(rx - fx)
+        ey = abs(ry - fy)
+        ez = abs(rz - fz)
+        if ex > ey and ex > ez:
             rx = -ry - rz
-        elif dy > dz:
+        elif ey > ez:
             ry = -rx - rz
         else:
             rz = -rx - ry
 
-        cell = (rx, rz + ((rx - (rx & 1)) >> 1))
-        if cell not in seen:
-            seen.add(cell)
-            yield cell
+        # cube_to_offset de la cellule absolue (source de base + relatif), puis relative à la source.
+        col = parity + rx
+        dcols.append(rx)
+        drows.append(rz + ((col - (col & 1)) >> 1))
+    return tuple(dcols), tuple(drows)
+
+
+def hex_line_iter(
+    col1: int, row1: int, col2: int, row2: int
+) -> Iterator[Tuple[int, int]]:
+    """Yield hex cells along the line from (col1,row1) to (col2,row2), lazily.
+
+    Traduction du tracé relatif de :func:`_hex_line_table` : le cube-lerp n'est calculé qu'une
+    fois par déplacement ``(dcol, drow, parité)``, plus à chaque rayon. Reste un générateur : les
+    appelants qui s'arrêtent au premier hex bloquant (LoS) ne paient pas la traduction des
+    cellules jamais examinées (mesuré : 52 % des cellules construites ne l'étaient jamais).
+    """
+    dcols, drows = _hex_line_table(col2 - col1, row2 - row1, col1 & 1)
+    for dc, dr in zip(dcols, drows):
+        yield (col1 + dc, row1 + dr)
 
 
 def hex_line_iter_t(
@@ -409,59 +439,14 @@ def hex_line_iter_t(
     """Comme :func:`hex_line_iter`, mais yield ``(cell, t)`` avec ``t = i / n`` la position
     paramétrique de la cellule le long du tracé (0.0 au départ, 1.0 à l'arrivée).
 
-    MIROIR EXACT de :func:`hex_line_iter` : même nudge de départage, même cube-lerp
-    ``a + (b - a) * t`` recalculé à chaque point, même déduplication, même séquence. Sert la LoS 3D
-    plancher-occulteur (interpolation de hauteur ``h(t)``) sans alourdir le chemin chaud 2D de
-    :func:`hex_line_iter`. La duplication du corps est VOULUE : garder les deux boucles
-    byte-identiques est plus sûr qu'une factorisation qui ralentirait le hot path 2D.
+    Même table, même séquence que :func:`hex_line_iter` ; sert la LoS 3D plancher-occulteur
+    (interpolation de hauteur ``h(t)``). Les deux boucles dupliquées d'avant — gardées
+    byte-identiques à la main — n'ont plus lieu d'être : la géométrie n'existe qu'une fois.
     """
-    if col1 == col2 and row1 == row2:
-        yield (col1, row1), 0.0
-        return
-
-    x1, y1, z1 = offset_to_cube(col1, row1)
-    x2, y2, z2 = offset_to_cube(col2, row2)
-
-    n = max(abs(x1 - x2), abs(y1 - y2), abs(z1 - z2))
-    seen: Set[Tuple[int, int]] = set()
-
-    ax = x1 + 1e-6
-    ay = y1 + 1e-6
-    az = z1 - 2e-6
-    bx = (x2 + 1e-6) - ax
-    by = (y2 + 1e-6) - ay
-    bz = (z2 - 2e-6) - az
-
-    for i in range(n + 1):
-        t = i / n if n > 0 else 0.0
-        fx = ax + bx * t
-        fy = ay + by * t
-        fz = az + bz * t
-
-        rx = round(fx)
-        ry = round(fy)
-        rz = round(fz)
-
-        dx = rx - fx
-        if dx < 0.0:
-            dx = -dx
-        dy = ry - fy
-        if dy < 0.0:
-            dy = -dy
-        dz = rz - fz
-        if dz < 0.0:
-            dz = -dz
-        if dx > dy and dx > dz:
-            rx = -ry - rz
-        elif dy > dz:
-            ry = -rx - rz
-        else:
-            rz = -rx - ry
-
-        cell = (rx, rz + ((rx - (rx & 1)) >> 1))
-        if cell not in seen:
-            seen.add(cell)
-            yield cell, t
+    dcols, drows = _hex_line_table(col2 - col1, row2 - row1, col1 & 1)
+    n = len(dcols) - 1
+    for i, (dc, dr) in enumerate(zip(dcols, drows)):
+        yield (col1 + dc, row1 + dr), (i / n if n > 0 else 0.0)
 
 
 def hex_line(
@@ -472,7 +457,8 @@ def hex_line(
     Uses cube-space linear interpolation then rounds to nearest hex.
     Includes both endpoints. Order: from start to end.
     """
-    return list(hex_line_iter(col1, row1, col2, row2))
+    dcols, drows = _hex_line_table(col2 - col1, row2 - row1, col1 & 1)
+    return [(col1 + dc, row1 + dr) for dc, dr in zip(dcols, drows)]
 
 
 # ── PIERRE TOMBALE — `batch_has_los_from_source` (2026-08-03) ────────────────────────────
@@ -507,14 +493,14 @@ def batch_hex_line_steps(
     lignes sont bloquées, la moitié des cellules ne sert à rien).
 
     IDENTITÉ AVEC LE CHEMIN SCALAIRE — ce qu'il faut savoir avant d'y toucher :
-    - même nudge de départage (``+1e-6``, ``-2e-6``), même expression ``a + (b - a) * t`` avec
-      ``t = i / n`` RECALCULÉ à chaque rang. Surtout pas une accumulation incrémentale : la
+    - même repère (celui de la source), même nudge de départage (``+1e-6``, ``-2e-6``), même
+      expression ``a + (b - a) * t`` avec ``t = i / n`` RECALCULÉ à chaque rang. Surtout pas une accumulation incrémentale : la
       dérive flottante changerait le départage des lignes rasantes, donc le couvert (13.06).
       numpy calcule en float64, comme Python : les deux suites sont bit-à-bit les mêmes.
     - ``np.round`` et ``round`` arrondissent tous deux au pair le plus proche (round-half-even).
-    - la déduplication du générateur scalaire (``seen``) n'a pas d'équivalent ici, et n'en a pas
-      besoin : la i-ème cellule d'un cube-lerp est à distance cube ``i`` de la source, donc les
-      ``n+1`` cellules sont deux à deux distinctes et ``seen`` ne retire jamais rien. Cette
+    - pas de déduplication, ni ici ni dans la table (l'ancien ``seen`` scalaire est parti avec
+      elle) : la i-ème cellule d'un cube-lerp est à distance cube ``i`` de la source, donc les
+      ``n+1`` cellules sont deux à deux distinctes et ``seen`` ne retirait jamais rien. Cette
       propriété n'est pas une supposition : elle est vérifiée par test sur un échantillon de
       paires (``test_deployment_los_vectorized_equivalence``), en même temps que l'égalité
       hexe par hexe des deux chemins.
@@ -540,12 +526,14 @@ def batch_hex_line_steps(
     if max_n <= 1:
         return  # 0 ou 1 pas : aucune cellule intermédiaire
 
-    fx1 = float(x1) + 1e-6
-    fy1 = float(y1) + 1e-6
-    fz1 = float(z1) - 2e-6
-    fx2 = x2.astype(np.float64) + 1e-6
-    fy2 = y2.astype(np.float64) + 1e-6
-    fz2 = z2.astype(np.float64) - 2e-6
+    # Repère de la SOURCE, comme `_hex_line_table` : lerp depuis le cube (0, 0, 0) + nudge, puis
+    # retour en absolu après l'arrondi. Mêmes flottants que le scalaire, opération pour opération.
+    fx1 = 1e-6
+    fy1 = 1e-6
+    fz1 = -2e-6
+    fx2 = (x2 - x1).astype(np.float64) + 1e-6
+    fy2 = (y2 - y1).astype(np.float64) + 1e-6
+    fz2 = (z2 - z1).astype(np.float64) - 2e-6
 
     for i in range(1, max_n):
         active = alive & (n_arr > i)
@@ -574,13 +562,453 @@ def batch_hex_line_steps(
         # directement — `(~mask_x) & ~(dy > dz)` est `(~mask_x) & (dy <= dz)`.
         mask_x = (dx > dy) & (dx > dz)
         mask_z = (~mask_x) & (dy <= dz)
-        rx_f = np.where(mask_x, -ry - rz, rx)
-        rz_f = np.where(mask_z, -rx - ry, rz)
+        rx_f = np.where(mask_x, -ry - rz, rx) + x1
+        rz_f = np.where(mask_z, -rx - ry, rz) + z1
 
         # cube_to_offset : col = x, row = z + ((x - (x & 1)) >> 1)
         yield idx, rx_f, rz_f + ((rx_f - (rx_f & 1)) >> 1)
 
 
+def batch_pair_hex_line_steps(
+    from_arr: np.ndarray,
+    to_arr: np.ndarray,
+    alive: np.ndarray,
+) -> "Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]":
+    """:func:`batch_hex_line_steps` généralisé à N paires ``(source_i, cible_i)`` quelconques.
+
+    Même contrat de sortie : ``(idx, c_off, r_off)`` sur les seules cellules INTERMÉDIAIRES, et
+    ``alive`` (bool, shape (N,)) relu entre deux rangs — l'appelant y met ``False`` les paires
+    qu'il vient de déclarer bloquées. ``idx`` indexe ici les PAIRES (donc ``from_arr``/``to_arr``).
+
+    Pas de second tracé : les paires sont regroupées par source distincte et chaque groupe passe
+    par :func:`batch_hex_line_steps`, seule implémentation vectorisée de la ligne. Le regroupement
+    coûte une boucle Python par SOURCE, pas par paire — en tir, les sources sont les figurines du
+    tireur (une vingtaine au plus) et les cibles se comptent en centaines.
+    """
+    n_pairs = len(to_arr)
+    if n_pairs == 0:
+        return
+    if len(from_arr) != n_pairs:
+        raise ValueError(
+            f"batch_pair_hex_line_steps: {len(from_arr)} sources pour {n_pairs} cibles"
+        )
+    if alive.shape != (n_pairs,):
+        raise ValueError(
+            f"batch_pair_hex_line_steps: alive de forme {alive.shape}, attendu ({n_pairs},)"
+        )
+    from_arr = np.asarray(from_arr, dtype=np.int64)
+    to_arr = np.asarray(to_arr, dtype=np.int64)
+    sources, group = np.unique(from_arr, axis=0, return_inverse=True)
+    group = group.reshape(-1)
+    for g in range(len(sources)):
+        sel = np.flatnonzero(group == g)
+        sub_alive = alive[sel]
+        if not sub_alive.any():
+            continue
+        steps = batch_hex_line_steps(
+            int(sources[g, 0]), int(sources[g, 1]), to_arr[sel], sub_alive
+        )
+        for idx, c_off, r_off in steps:
+            yield sel[idx], c_off, r_off
+            # Le consommateur a écrit dans `alive` (indices de paires) : on reporte ses
+            # verdicts sur la copie locale que lit le générateur du groupe.
+            sub_alive &= alive[sel]
+
+
+def batch_los_visibility(
+    from_arr: np.ndarray,
+    to_arr: np.ndarray,
+    wall_grid: np.ndarray,
+) -> np.ndarray:
+    """JUMEAU VECTORISÉ de :func:`compute_los_visibility` — N paires hexe→hexe d'un coup.
+
+    ``from_arr``/``to_arr`` : int, shape (N, 2), colonnes ``(col, row)``. ``wall_grid`` : bool,
+    shape ``(cols, rows)``, ``True`` = mur. Rend un bool (N,) : ``True`` si aucune cellule
+    intermédiaire de la ligne n'est un mur. Une cellule hors grille est libre, comme ``(c, r) in
+    wall_set`` est faux hors plateau ; source == cible → visible.
+
+    Murs seuls, exactement comme le scalaire : les areas obscurantes (13.10) et la LoS 3D sont
+    des RÈGLES, elles vivent dans ``shooting_handlers`` (cf. la pierre tombale ci-dessus).
+    """
+    n_pairs = len(to_arr)
+    result = np.ones(n_pairs, dtype=bool)
+    if n_pairs == 0:
+        return result
+    grid_cols, grid_rows = wall_grid.shape
+    for idx, c_off, r_off in batch_pair_hex_line_steps(from_arr, to_arr, result):
+        inside = (c_off >= 0) & (c_off < grid_cols) & (r_off >= 0) & (r_off < grid_rows)
+        if not inside.all():
+            idx, c_off, r_off = idx[inside], c_off[inside], r_off[inside]
+        result[idx[wall_grid[c_off, r_off]]] = False
+    return result
+
+
+def hex_neighbor_dilate(mask: np.ndarray) -> np.ndarray:
+    """Un pas de dilatation hexagonale d'un bitmap ``(cols, rows)`` : ``mask`` ∪ ses 6 voisins.
+
+    Les voisins odd-q dépendent de la PARITÉ de colonne (``_NEIGHBORS_EVEN_COL`` /
+    ``_NEIGHBORS_ODD_COL``), ce qu'un noyau unique de ``dilate_by_kernel`` ne sait pas dire : on
+    traite donc les colonnes paires et impaires de destination séparément, chacune avec sa table.
+    """
+    cols, rows = mask.shape
+    out = mask.copy()
+    for parity, offsets in ((0, _NEIGHBORS_EVEN_COL), (1, _NEIGHBORS_ODD_COL)):
+        for dc, dr in offsets:
+            # Destinations de cette parité dont le voisin (c + dc, r + dr) est dans la grille.
+            c_lo = parity if parity >= -dc else parity + 2
+            c_hi = cols - max(0, dc)
+            if c_lo >= c_hi:
+                continue
+            r_lo, r_hi = max(0, -dr), rows - max(0, dr)
+            if r_lo >= r_hi:
+                continue
+            out[c_lo:c_hi:2, r_lo:r_hi] |= mask[c_lo + dc:c_hi + dc:2, r_lo + dr:r_hi + dr]
+    return out
+
+
+def hex_set_to_grid(
+    hexes: AbstractSet[Tuple[int, int]], cols: int, rows: int
+) -> np.ndarray:
+    """Bitmap bool ``(cols, rows)`` d'un ensemble de cellules, pour :func:`batch_los_visibility`.
+
+    Les cellules hors ``[0, cols) × [0, rows)`` sont ignorées : hors grille = libre, c'est la
+    convention des deux chemins de LoS. Un :class:`HexBitmap` aux mêmes dimensions est recopié
+    tel quel, sans repasser par les tuples.
+    """
+    if isinstance(hexes, HexBitmap) and hexes.shape == (cols, rows):
+        return hexes.grid.copy()
+    grid = np.zeros((cols, rows), dtype=bool)
+    if hexes:
+        arr = np.fromiter(
+            (v for h in hexes for v in (int(h[0]), int(h[1]))), dtype=np.int64,
+            count=2 * len(hexes),
+        ).reshape(-1, 2)
+        keep = (arr[:, 0] >= 0) & (arr[:, 0] < cols) & (arr[:, 1] >= 0) & (arr[:, 1] < rows)
+        arr = arr[keep]
+        grid[arr[:, 0], arr[:, 1]] = True
+    return grid
+
+
+def hex_cell_index(col: int, row: int, rows: int) -> int:
+    """Index à plat de ``(col, row)`` dans un bitmap ``(cols, rows)`` C-contigu (colonne majeure)."""
+    return col * rows + row
+
+
+def hex_index_cell(index: int, rows: int) -> Tuple[int, int]:
+    """Inverse de :func:`hex_cell_index`."""
+    col, row = divmod(index, rows)
+    return col, row
+
+
+class HexBitmap(MutableSet):
+    """Ensemble de cellules ``(col, row)`` porté par un bitmap bool ``(cols, rows)``.
+
+    Remplace le ``set`` de tuples rendu par les constructeurs d'occupation et de murs
+    (``build_wall_set``, ``build_occupied_positions_set``, ``build_enemy_adjacent_hexes``…) : un
+    octet par case au lieu d'un tuple + une entrée de table de hachage, et les opérations entre
+    bitmaps de même forme (``|``, ``&``, ``-``, :meth:`dilate`, :meth:`contains_many`) deviennent
+    des opérations NumPy sur tout le plateau.
+
+    Le contrat reste celui d'un ``set`` : ``in``, itération, ``len``, égalité avec un ``set``,
+    ``add``/``discard``/``update``. Les appelants qui combinent encore avec des ``set`` de tuples
+    (``set(walls) | occupied``…) reçoivent un ``set`` ordinaire (:meth:`_from_iterable`), on ne
+    convertit rien en silence dans l'autre sens.
+
+    Les cellules hors ``[0, cols) × [0, rows)`` (empreinte d'un socle qui déborde du bord) ne sont
+    PAS perdues : elles vivent dans un petit ensemble annexe. Les dimensions sont un choix de
+    stockage, jamais un filtre — un ``HexBitmap`` contient exactement ce qu'aurait contenu le
+    ``set``. L'ordre d'itération est l'ordre du plateau (colonne, puis ligne), puis l'annexe.
+
+    Le stockage est un ``bytearray`` vu par NumPy : ``__contains__`` indexe l'octet directement,
+    sans passer par un scalaire NumPy (c'est l'appel le plus fréquent des BFS de mouvement).
+    """
+
+    __slots__ = ("_cols", "_rows", "_flat", "_grid", "_outside", "_len")
+
+    def __init__(self, cols: int, rows: int, cells: Iterable[Tuple[int, int]] = ()) -> None:
+        cols, rows = int(cols), int(rows)
+        if cols < 0 or rows < 0:
+            raise ValueError(f"HexBitmap dimensions must be >= 0, got {cols}x{rows}")
+        self._cols = cols
+        self._rows = rows
+        self._flat = bytearray(cols * rows)
+        self._grid = np.frombuffer(self._flat, dtype=np.bool_).reshape(cols, rows)
+        self._outside: Set[Tuple[int, int]] = set()
+        self._len: Optional[int] = 0
+        if cells:
+            self.update(cells)
+
+    @classmethod
+    def from_cells(
+        cls,
+        cells: Iterable[Tuple[int, int]],
+        cols: Optional[int] = None,
+        rows: Optional[int] = None,
+    ) -> "HexBitmap":
+        """Bitmap d'un itérable de cellules.
+
+        Sans dimensions (état de jeu construit à la main, sans ``board_cols``/``board_rows``), la
+        grille couvre la boîte englobante des cellules : le contenu est le même, seul le stockage
+        change.
+        """
+        if cols is not None and rows is not None:
+            return cls(cols, rows, cells)
+        arr = _cells_to_array(cells)
+        if cols is None:
+            cols = int(arr[:, 0].max()) + 1 if len(arr) else 0
+        if rows is None:
+            rows = int(arr[:, 1].max()) + 1 if len(arr) else 0
+        out = cls(max(0, cols), max(0, rows))
+        out._update_from_array(arr)
+        return out
+
+    @classmethod
+    def from_grid(cls, grid: np.ndarray) -> "HexBitmap":
+        """Bitmap recopiant une grille bool ``(cols, rows)``."""
+        cols, rows = grid.shape
+        out = cls(cols, rows)
+        out._grid[...] = grid
+        out._len = None
+        return out
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        # Résultat des opérateurs mixtes (bitmap ⊕ set de tuples) : un set ordinaire.
+        return set(it)
+
+    # -- accès -----------------------------------------------------------------
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._cols, self._rows
+
+    @property
+    def grid(self) -> np.ndarray:
+        """Grille bool ``(cols, rows)`` en lecture seule (vue, pas copie)."""
+        view = self._grid.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def outside(self) -> FrozenSet[Tuple[int, int]]:
+        """Cellules hors grille (débord de plateau)."""
+        return frozenset(self._outside)
+
+    def __contains__(self, cell: object) -> bool:
+        try:
+            col, row = cell  # type: ignore[misc]
+        except (TypeError, ValueError):
+            return False
+        if 0 <= col < self._cols and 0 <= row < self._rows:
+            return self._flat[col * self._rows + row] != 0
+        return cell in self._outside
+
+    def contains_many(self, cols: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Appartenance vectorisée de ``len(cols)`` cellules (tableaux d'entiers de même forme)."""
+        cols = np.asarray(cols, dtype=np.int64)
+        rows = np.asarray(rows, dtype=np.int64)
+        inside = (cols >= 0) & (cols < self._cols) & (rows >= 0) & (rows < self._rows)
+        out = np.zeros(cols.shape, dtype=bool)
+        out[inside] = self._grid[cols[inside], rows[inside]]
+        if self._outside and not inside.all():
+            for i in np.flatnonzero(~inside.ravel()):
+                out.flat[i] = (int(cols.flat[i]), int(rows.flat[i])) in self._outside
+        return out
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        c, r = np.nonzero(self._grid)
+        yield from zip(c.tolist(), r.tolist())
+        yield from list(self._outside)
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = int(np.count_nonzero(self._grid)) + len(self._outside)
+        return self._len
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        return f"HexBitmap({self._cols}x{self._rows}, {len(self)} cells)"
+
+    # -- mutation --------------------------------------------------------------
+
+    def add(self, cell: Tuple[int, int]) -> None:
+        col, row = cell
+        if 0 <= col < self._cols and 0 <= row < self._rows:
+            i = col * self._rows + row
+            if not self._flat[i]:
+                self._flat[i] = 1
+                if self._len is not None:
+                    self._len += 1
+        elif cell not in self._outside:
+            self._outside.add((col, row))
+            if self._len is not None:
+                self._len += 1
+
+    def discard(self, cell: Tuple[int, int]) -> None:
+        try:
+            col, row = cell
+        except (TypeError, ValueError):
+            return
+        if 0 <= col < self._cols and 0 <= row < self._rows:
+            i = col * self._rows + row
+            if self._flat[i]:
+                self._flat[i] = 0
+                if self._len is not None:
+                    self._len -= 1
+        elif cell in self._outside:
+            self._outside.discard(cell)
+            if self._len is not None:
+                self._len -= 1
+
+    def update(self, *others: Iterable[Tuple[int, int]]) -> None:
+        """``set.update`` : un bitmap de même forme est fusionné en un ``|=`` NumPy."""
+        for other in others:
+            if isinstance(other, HexBitmap) and other.shape == self.shape:
+                self._grid |= other._grid
+                self._outside |= other._outside
+                self._len = None
+            else:
+                self._update_from_array(_cells_to_array(other))
+
+    def _update_from_array(self, arr: np.ndarray) -> None:
+        if not len(arr):
+            return
+        inside = (arr[:, 0] >= 0) & (arr[:, 0] < self._cols) & (arr[:, 1] >= 0) & (arr[:, 1] < self._rows)
+        self._grid[arr[inside, 0], arr[inside, 1]] = True
+        if not inside.all():
+            self._outside.update(zip(arr[~inside, 0].tolist(), arr[~inside, 1].tolist()))
+        self._len = None
+
+    def clear(self) -> None:
+        self._grid[...] = False
+        self._outside.clear()
+        self._len = 0
+
+    def copy(self) -> "HexBitmap":
+        out = HexBitmap(self._cols, self._rows)
+        out._flat[:] = self._flat
+        out._outside = set(self._outside)
+        out._len = self._len
+        return out
+
+    def __reduce__(self):
+        # La vue NumPy partage le bytearray : copie/pickle reconstruisent les deux ensemble.
+        return (_hex_bitmap_restore, (self._cols, self._rows, bytes(self._flat), tuple(self._outside)))
+
+    # -- algèbre d'ensembles (vectorisée entre bitmaps de même forme) -------------
+
+    def _same_shape(self, other: object) -> bool:
+        return isinstance(other, HexBitmap) and other.shape == self.shape
+
+    def _combine(self, other: "HexBitmap", grid: np.ndarray, outside: Set[Tuple[int, int]]) -> "HexBitmap":
+        out = HexBitmap(self._cols, self._rows)
+        out._grid[...] = grid
+        out._outside = outside
+        out._len = None
+        return out
+
+    def __or__(self, other):
+        if self._same_shape(other):
+            return self._combine(other, self._grid | other._grid, self._outside | other._outside)
+        return super().__or__(other)
+
+    __ror__ = MutableSet.__ror__
+
+    def __and__(self, other):
+        if self._same_shape(other):
+            return self._combine(other, self._grid & other._grid, self._outside & other._outside)
+        return super().__and__(other)
+
+    __rand__ = MutableSet.__rand__
+
+    def __sub__(self, other):
+        if self._same_shape(other):
+            return self._combine(other, self._grid & ~other._grid, self._outside - other._outside)
+        return super().__sub__(other)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __isub__(self, other):
+        if self._same_shape(other):
+            self._grid &= ~other._grid
+            self._outside -= other._outside
+            self._len = None
+            return self
+        return super().__isub__(other)
+
+    def __eq__(self, other: object) -> bool:
+        if self._same_shape(other):
+            return self._outside == other._outside and bool(np.array_equal(self._grid, other._grid))
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    # Noms de méthode de ``set`` utilisés par les appelants historiques.
+    def union(self, *others: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        out = set(self)
+        out.update(*others)
+        return out
+
+    def intersection(self, *others: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        return set(self).intersection(*others)
+
+    def difference(self, *others: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        return set(self).difference(*others)
+
+    def issubset(self, other: Iterable[Tuple[int, int]]) -> bool:
+        return all(cell in other for cell in self)
+
+    def issuperset(self, other: Iterable[Tuple[int, int]]) -> bool:
+        return all(cell in self for cell in other)
+
+    # -- géométrie -------------------------------------------------------------
+
+    def dilate(self, radius: int) -> "HexBitmap":
+        """Cellules à distance hex ``[1, radius]`` d'au moins une cellule, dans la grille.
+
+        Même contrat que :func:`dilate_hex_set` (sources exclues, hors grille ignoré, chemins
+        restreints à la grille) : ``radius`` pas de :func:`hex_neighbor_dilate` sur les cellules
+        de la grille, et :func:`dilate_hex_set` pour les rares sources hors grille.
+        """
+        out = HexBitmap(self._cols, self._rows)
+        if radius <= 0 or not len(self):
+            return out
+        grid = self._grid
+        for _ in range(int(radius)):
+            grown = hex_neighbor_dilate(grid)
+            if np.array_equal(grown, grid):
+                break
+            grid = grown
+        out._grid[...] = grid
+        if self._outside:
+            out.update(dilate_hex_set(self._outside, radius, self._cols, self._rows))
+        out._grid &= ~self._grid
+        out._len = None
+        return out
+
+
+def _hex_bitmap_restore(
+    cols: int, rows: int, flat: bytes, outside: Tuple[Tuple[int, int], ...]
+) -> HexBitmap:
+    out = HexBitmap(cols, rows)
+    out._flat[:] = flat
+    out._outside = set(outside)
+    out._len = None
+    return out
+
+
+def _cells_to_array(cells: Iterable[Tuple[int, int]]) -> np.ndarray:
+    """Tableau ``(n, 2)`` int64 d'un itérable de cellules ``(col, row)``."""
+    if isinstance(cells, HexBitmap):
+        cells = list(cells)
+    flat = np.fromiter((v for h in cells for v in (int(h[0]), int(h[1]))), dtype=np.int64)
+    return flat.reshape(-1, 2)
+
+
 def expand_wall_group_to_hex_list(
     group: Dict[str, Any],
     *,
@@ -803,7 +1231,21 @@ def polygon_to_hex_list(vertices: list, cols: int, rows: int) -> List[List[int]]
     """
     if not isinstance(vertices, (list, tuple)) or len(vertices) < 3:
         raise ValueError(f"polygon_to_hex_list: need >= 3 vertices, got {vertices!r}")
-    return _objective_polygon_hexes(vertices=vertices, cols=cols, rows=rows)
+    # Raster publié par le parent d'un entraînement vectorisé (`engine.board_assets`) : le même
+    # polygone sur le même plateau se rasterise une fois pour tous les workers, pas à chaque
+    # rechargement de scénario de chacun.
+    from engine.board_assets import asset_key, record_asset, shared_asset
+
+    key = asset_key(
+        "polygon_hexes",
+        (tuple((int(v[0]), int(v[1])) for v in vertices), int(cols), int(rows)),
+    )
+    shared = shared_asset(key)
+    if shared is not None:
+        return shared.tolist()
+    hexes = _objective_polygon_hexes(vertices=vertices, cols=cols, rows=rows)
+    record_asset(key, np.asarray(hexes, dtype=np.int32).reshape(-1, 2))
+    return hexes
 
 
 def _objective_disc_hexes(
@@ -1740,18 +2182,28 @@ def validate_placement(
 # Wall set helper
 # ---------------------------------------------------------------------------
 
-def build_wall_set(game_state: Dict[str, Any]) -> Set[Tuple[int, int]]:
-    """Extract wall_hexes from game_state as a set of (int, int) tuples."""
+def board_hex_bitmap(
+    game_state: Dict[str, Any], cells: Iterable[Tuple[int, int]] = ()
+) -> HexBitmap:
+    """:class:`HexBitmap` aux dimensions du plateau (``board_cols`` × ``board_rows``).
+
+    Un état de jeu sans dimensions (fixtures de tests construites à la main) reçoit la boîte
+    englobante des cellules : même contenu, seul le stockage diffère.
+    """
+    cols = game_state.get("board_cols")  # get allowed
+    rows = game_state.get("board_rows")  # get allowed
+    if cols is None or rows is None:
+        return HexBitmap.from_cells(cells)
+    return HexBitmap(int(cols), int(rows), cells)
+
+
+def build_wall_set(game_state: Dict[str, Any]) -> HexBitmap:
+    """Extract wall_hexes from game_state as a board bitmap of (int, int) cells."""
     raw = game_state.get("wall_hexes")
-    if not raw:
-        return set()
-    return {
-        (int(w[0]), int(w[1])) if isinstance(w, (list, tuple)) else w
-        for w in raw
-    }
+    return board_hex_bitmap(game_state, raw or ())
 
 
-def build_dense_wall_set(game_state: Dict[str, Any]) -> Set[Tuple[int, int]]:
+def build_dense_wall_set(game_state: Dict[str, Any]) -> HexBitmap:
     """Extract dense_wall_hexes (murs issus de terrains Solid/dense, rule 13.11) as a hex set.
 
     Sous-ensemble de wall_hexes limité aux murs typés ``"dense"`` à la source. Sert la règle
@@ -1760,12 +2212,7 @@ def build_dense_wall_set(game_state: Dict[str, Any]) -> Set[Tuple[int, int]]:
     classification) ne sont PAS Solid-prouvables → absents de ce set (aucun repli : on ne
     déclenche GtG que derrière un terrain dense avéré)."""
     raw = game_state.get("dense_wall_hexes")
-    if not raw:
-        return set()
-    return {
-        (int(w[0]), int(w[1])) if isinstance(w, (list, tuple)) else w
-        for w in raw
-    }
+    return board_hex_bitmap(game_state, raw or ())
 
 
 # ---------------------------------------------------------------------------
@@ -2898,6 +3345,17 @@ def obstacles_touching_disc(
     return touching
 
 
+#: Implémentations de ``geodesic_field`` / ``geodesic_field_multi_source`` (config
+#: ``move.geodesic_backend``). ``"python"`` : la référence ci-dessous. ``"compiled"`` : la même
+#: boucle en tableaux compilés (``engine.geodesic_kernel``, numba), champ rendu bit-identique.
+GEODESIC_BACKENDS: Tuple[str, ...] = ("python", "compiled")
+
+
+def _check_geodesic_backend(backend: str) -> None:
+    if backend not in GEODESIC_BACKENDS:
+        raise ValueError(f"geodesic backend {backend!r} inconnu, attendu un de {GEODESIC_BACKENDS}")
+
+
 def geodesic_field(
     start: Tuple[int, int],
     board_cols: int,
@@ -2906,6 +3364,7 @@ def geodesic_field(
     budget: float,
     clearance: float = 0.0,
     contact_obstacles: Optional[AbstractSet[Tuple[int, int]]] = None,
+    backend: str = "python",
 ) -> Dict[Tuple[int, int], float]:
     """Distance géodésique any-angle de `start` à chaque cellule atteignable dans `budget`.
 
@@ -2940,7 +3399,16 @@ def geodesic_field(
 
     Retourne {cellule: distance}. Une seule passe (champ complet), pas point-à-point.
     Sur-estime légèrement (lazy Theta* quasi-optimal) → ne triche jamais vs la règle 03.
+
+    `backend` : cf. ``GEODESIC_BACKENDS``. Le module compilé n'est importé qu'à sa sélection.
     """
+    _check_geodesic_backend(backend)
+    if backend == "compiled":
+        from engine.geodesic_kernel import geodesic_field_compiled
+
+        return geodesic_field_compiled(
+            start, board_cols, board_rows, obstacles, budget, clearance, contact_obstacles
+        )
     if start in obstacles:
         raise ValueError(f"geodesic_field: start {start} est un obstacle")
     bs = _obstacle_bucket_size(clearance)
@@ -3029,6 +3497,7 @@ def geodesic_field_multi_source(
     clearance: float = 0.0,
     contact_obstacles: Optional[AbstractSet[Tuple[int, int]]] = None,
     contact_start: Optional[Tuple[int, int]] = None,
+    backend: str = "python",
 ) -> Dict[Tuple[int, int], float]:
     """Variante MULTI-SOURCE de ``geodesic_field`` : plusieurs départs, chacun avec sa distance
     initiale ``starts[cell]``. Une seule passe couvre toutes les sources (Dijkstra classique à
@@ -3043,7 +3512,16 @@ def geodesic_field_multi_source(
     supposition sur l'appelant.
 
     Retourne ``{cellule: distance_totale}`` — chaque source est sa propre ancre (any-angle depuis elle).
+    ``backend`` : cf. ``geodesic_field``.
     """
+    _check_geodesic_backend(backend)
+    if backend == "compiled":
+        from engine.geodesic_kernel import geodesic_field_multi_source_compiled
+
+        return geodesic_field_multi_source_compiled(
+            starts, board_cols, board_rows, obstacles, budget, clearance,
+            contact_obstacles, contact_start,
+        )
     bs = _obstacle_bucket_size(clearance)
     _gm_contact = frozenset(contact_obstacles) & obstacles if contact_obstacles else frozenset()
     if _gm_contact and contact_start is None:
@@ -0,0 +1,145 @@
+"""Champ de DÉGAGEMENT de la ligne de vue : distance de chaque hexe au plus proche bloqueur.
+
+POURQUOI CE MODULE EXISTE
+=========================
+Un tracé de LoS 2D n'est bloqué que par une case intermédiaire mur ou obscuring (13.10). Or la
+i-ème case d'un cube-lerp est à distance cube ``i`` de la source (propriété vérifiée par
+``test_deployment_los_vectorized_equivalence``) : les cases intermédiaires d'une ligne de ``n``
+pas sont donc toutes à distance ``1 .. n-1`` de la source. Si AUCUN bloqueur n'est à moins de
+``n`` hexes de la source, la ligne est dégagée — sans la tracer.
+
+``clearance[c, r]`` = distance hexagonale de ``(c, r)`` à la plus proche case mur OU obscuring
+(saturée à ``_CLEARANCE_CAP``). Le test ``n <= clearance[source]`` est EXACT dans le sens où il
+sert : il ne déclare visible que ce que le tracé déclarerait visible. Il prend en compte TOUTES
+les areas obscurantes, y compris celles que la règle exclurait pour une paire donnée — c'est
+un sur-ensemble des bloqueurs, donc le raccourci ne peut que manquer des lignes dégagées (elles
+repassent alors par le tracé), jamais en inventer.
+
+UNE FOIS PAR TERRAIN, PAS PAR ÉPISODE
+=====================================
+Le champ ne dépend que des grilles de blocage (``shooting_handlers._get_los_blocking_grids``),
+donc du terrain — et un entraînement tourne sur quelques dizaines de terrains pour des milliers
+d'épisodes, dans chaque worker ``SubprocVecEnv``. Trois niveaux, du plus chaud au plus froid :
+
+1. ``_CLEARANCE_CACHE`` (module, borné) : le champ déjà servi dans ce processus ;
+2. le disque, ``.cache/los_clearance/<digest>.npy``, ouvert en ``mmap_mode="r"`` : les workers
+   d'une même machine partagent les pages du cache système au lieu d'en garder chacun une copie ;
+3. la construction (BFS multi-source par dilatations hexagonales), puis écriture atomique.
+
+La clé est ``ground_los_blocking_signature`` — le digest des grilles elles-mêmes, celui qui clefe
+déjà le cache disque des expositions de déploiement (`ActionDecoder`). Clefer sur les murs seuls
+(``_load_terrain_walls_from_ref``) oublierait les areas obscurantes : c'est exactement le défaut
+que V11 §0.65 a réparé sur ce cache-là.
+"""
+
+import hashlib
+import os
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from engine.hex_utils import hex_neighbor_dilate, offset_to_cube_vec
+
+#: Version du MODÈLE de champ. Entre dans le nom du fichier disque : à incrémenter à chaque
+#: changement de ce que le champ mesure, sinon les runs reliraient l'ancien sans rien signaler.
+LOS_CLEARANCE_MODEL_VERSION = 1
+
+#: Saturation du champ (uint8). Une case à ``_CLEARANCE_CAP`` est à AU MOINS cette distance d'un
+#: bloqueur : le raccourci reste exact, il couvre seulement moins de lignes au-delà.
+_CLEARANCE_CAP = 255
+
+#: Terrains gardés en mémoire par processus. Au-delà, le plus ancien est jeté (il reste sur disque).
+_MAX_CACHED_TOPOLOGIES = 8
+
+_CLEARANCE_CACHE: Dict[Tuple[Any, ...], np.ndarray] = {}
+
+
+def build_blocker_clearance(blocked: np.ndarray, cap: int = _CLEARANCE_CAP) -> np.ndarray:
+    """Distance hexagonale de chaque case à la plus proche case ``blocked`` (uint8, saturée à ``cap``).
+
+    BFS multi-source par dilatations successives (:func:`hex_neighbor_dilate`) : le front du pas
+    ``d`` est exactement l'ensemble des cases à distance ``d``. Sans bloqueur, tout vaut ``cap``.
+    """
+    if not 0 < cap <= _CLEARANCE_CAP:
+        raise ValueError(f"build_blocker_clearance: cap={cap} hors de ]0, {_CLEARANCE_CAP}]")
+    clearance = np.full(blocked.shape, cap, dtype=np.uint8)
+    reached = blocked.astype(bool, copy=True)
+    if not reached.any():
+        return clearance
+    clearance[reached] = 0
+    for d in range(1, cap):
+        grown = hex_neighbor_dilate(reached)
+        front = grown & ~reached
+        if not front.any():
+            break
+        clearance[front] = d
+        reached = grown
+    return clearance
+
+
+def _cache_file_path(signature: Tuple[Any, ...]) -> str:
+    payload = (LOS_CLEARANCE_MODEL_VERSION, _CLEARANCE_CAP, *signature)
+    digest = hashlib.sha256(repr(payload).encode("utf-8")).hexdigest()
+    project_root = os.path.dirname(os.path.dirname(__file__))
+    cache_dir = os.path.join(project_root, ".cache", "los_clearance")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"{digest}.npy")
+
+
+def blocker_clearance_for(
+    signature: Tuple[Any, ...],
+    wall_grid: np.ndarray,
+    area_grid: np.ndarray,
+) -> np.ndarray:
+    """Champ de dégagement du terrain ``signature`` — mémoire, puis disque (mmap), puis construit.
+
+    ``signature`` DOIT être ``ground_los_blocking_signature`` des mêmes grilles : c'est elle qui
+    nomme le fichier, et un fichier lu sous une autre signature servirait le champ d'un autre
+    terrain. Le tableau rendu est en LECTURE SEULE (mmap ``"r"`` ou copie verrouillée).
+    """
+    cached = _CLEARANCE_CACHE.get(signature)
+    if cached is not None:
+        return cached
+    path = _cache_file_path(signature)
+    if os.path.exists(path):
+        field = np.load(path, mmap_mode="r")
+        if field.shape != wall_grid.shape or field.dtype != np.uint8:
+            raise ValueError(
+                f"Champ de degagement {path} de forme {field.shape}/{field.dtype}, "
+                f"attendu {wall_grid.shape}/uint8 — fichier corrompu ou d'un autre modele"
+            )
+    else:
+        field = build_blocker_clearance(wall_grid | (area_grid >= 0))
+        tmp_path = f"{path}.tmp.{os.getpid()}.npy"
+        np.save(tmp_path, field)
+        os.replace(tmp_path, path)
+        field.setflags(write=False)
+    if len(_CLEARANCE_CACHE) >= _MAX_CACHED_TOPOLOGIES:
+        _CLEARANCE_CACHE.pop(next(iter(_CLEARANCE_CACHE)))
+    _CLEARANCE_CACHE[signature] = field
+    return field
+
+
+def clear_by_clearance(
+    clearance: np.ndarray,
+    from_arr: np.ndarray,
+    to_arr: np.ndarray,
+) -> np.ndarray:
+    """Paires dont la ligne est dégagée SANS tracé : ``n <= clearance[source]``, ``n`` = longueur cube.
+
+    ``from_arr``/``to_arr`` : int (N, 2). Une source hors de la grille n'est jamais tranchée ici
+    (pas de champ pour elle) — elle repart au tracé.
+    """
+    from_arr = np.asarray(from_arr, dtype=np.int64).reshape(-1, 2)
+    to_arr = np.asarray(to_arr, dtype=np.int64).reshape(-1, 2)
+    x1, y1, z1 = offset_to_cube_vec(from_arr[:, 0], from_arr[:, 1])
+    x2, y2, z2 = offset_to_cube_vec(to_arr[:, 0], to_arr[:, 1])
+    steps = np.maximum(np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)), np.abs(z2 - z1))
+    cols, rows = clearance.shape
+    src_c = from_arr[:, 0]
+    src_r = from_arr[:, 1]
+    inside = (src_c >= 0) & (src_c < cols) & (src_r >= 0) & (src_r < rows)
+    out = np.zeros(len(from_arr), dtype=bool)
+    if inside.any():
+        out[inside] = steps[inside] <= clearance[src_c[inside], src_r[inside]]
+    return out
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 """engine/macro_intents.py - Zone intent system Phase 2."""
 
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
 from engine.observation_entities import K_ALLY_SLOTS, MAX_DECISION_OPTIONS
 from shared.data_validation import require_key
 
@@ -368,3 +373,20 @@ def charge_pair_decode(pair_idx: int, n: int = CHARGE_SLOT_COUNT) -> tuple:
         remaining -= count
     raise ValueError(f"charge_pair_decode : échec pour pair_idx={pair_idx}, n={n}")
 
+
+@lru_cache(maxsize=None)
+def charge_pair_members(n: int = CHARGE_SLOT_COUNT) -> Tuple[np.ndarray, np.ndarray]:
+    """(slots_i, slots_j) des C(n,2) paires, dans l'ordre de `charge_pair_encode`.
+
+    Le masque en tire tout le bloc des paires d'une seule opération — `ouvert[slots_i] &
+    ouvert[slots_j]` — au lieu d'encoder les paires une à une. Dérivés de `charge_pair_decode`,
+    donc de la même formule : aucune seconde écriture de l'indexation. Tableaux partagés, en
+    lecture seule.
+    """
+    members = [charge_pair_decode(pair_idx, n) for pair_idx in range(n * (n - 1) // 2)]
+    slots_i = np.array([i for i, _ in members], dtype=np.intp)
+    slots_j = np.array([j for _, j in members], dtype=np.intp)
+    slots_i.setflags(write=False)
+    slots_j.setflags(write=False)
+    return slots_i, slots_j
+
@@ -23,8 +23,9 @@ ACTIVATION (jamais active en production) — DEUX NIVEAUX
 --------------------------------------------------------
 - ``W40K_MASK_VERIFY=1`` (ou ``true`` / ``yes`` / ``on`` / ``y``), ou
   ``game_state["mask_verification"]`` a ``True``, ``1`` ou ``"1"`` :
-  controles de MEMOISATION — carte de cellules et cycle des jets d'Advance. ~113 verifications par
-  episode.
+  controles de MEMOISATION — carte de cellules et cycle des jets d'Advance (~113 verifications par
+  episode), et part intrinseque de l'encodage des entites (``engine.entity_encoding_cache`` :
+  chaque hit est recalcule, donc jusqu'a 28 recalculs par observation).
 - ``W40K_MASK_VERIFY=2`` (ou ``game_state["mask_verification"]`` a ``2`` / ``"2"``) : ajoute les
   controles de MASQUE TRANSMIS (``verify_supplied_mask``), ~315 verifications par episode, chacune
   avec copie profonde et recalcul complet du masque.
@@ -0,0 +1,288 @@
+"""engine/model_spatial_index.py - Index spatial persistant des figurines (grille a seaux).
+
+Les requetes de portee bord-a-bord (eligibilite de charge 11.02, distance maximale 11.04) se
+posaient en parcourant TOUS les ennemis et en mesurant chacun par ``euclidean_edge_distance`` :
+O(figurines x figurines) des qu'on les pose pour chaque escouade du joueur actif. Or la quasi
+totalite de ces paires est a l'autre bout du plateau, et ``_group_lower_bound`` ne les ecarte
+qu'APRES avoir construit les deux ``Socle`` et leurs disques.
+
+Cet index range le CENTRE de chaque figurine sur table (espace ``_hex_center``) dans une grille
+uniforme de seaux carres. Une requete ne visite que les seaux que le disque de recherche touche,
+et n'y mesure que les figurines dont le disque englobant peut encore etre a portee.
+
+Tenue a jour INCREMENTALE, pas d'empreinte de geometrie a chaque lecture : les ecrivains de
+position de ``models_cache`` (``update_model_position``, ``translate_squad_to_destination``, la
+resync mono-figurine de ``update_units_cache_position``) et ``destroy_model`` appellent
+``note_model_moved`` / ``note_model_removed``. Un ``models_cache`` RECONSTRUIT (reset, chargement)
+est un autre objet : l'index, qui retient celui qu'il decrit, se reconstruit alors au premier
+appel de ``model_spatial_index``.
+
+Deux niveaux de reponse :
+  - ``within`` / ``nearest`` : EXACTS, par figurine, avec le socle propre de chaque figurine
+    (forme, taille et orientation lues dans ``models_cache``) ;
+  - ``squads_within_reach`` : broad-phase CONSERVATIVE par escouade. L'appelant garde sa
+    primitive d'escouade (``ranged_in_range``) sur les seules escouades rendues — le verdict est
+    donc celui d'avant, au bit pres, l'index ne fait qu'ecarter des escouades hors d'atteinte.
+
+Metrique EUCLIDIENNE uniquement : la distance hex entre empreintes n'est pas bornee par les
+disques de l'espace ``_hex_center`` avec le meme facteur, et le chemin hex (gym) a deja sa propre
+borne par rayons d'empreinte.
+"""
+
+import math
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from engine.hex_utils import (
+    Socle,
+    _hex_center,
+    _socle_bounding_circles,
+    bounding_radius_norm,
+    euclidean_edge_distance,
+)
+from shared.data_validation import require_key
+
+# Cote d'un seau, en unites ``_hex_center`` (1 subhex = 1,5). 12 = 8 subhex : de l'ordre d'un
+# rayon de socle de vehicule plus une zone d'engagement, si bien qu'une requete de charge (12")
+# visite une poignee de seaux et qu'un seau contient rarement plus d'une escouade. Plus fin, la
+# requete paie l'enumeration des seaux vides ; plus gros, elle remesure le voisinage entier.
+_BUCKET_SIZE = 12.0
+
+# Marge flottante du test de broad-phase : les disques sont calcules par ``hypot`` et comparés a
+# un seuil que la primitive exacte compare, elle, apres une division par 1,5. Une paire a la
+# frontiere ne doit jamais etre ecartee par un arrondi.
+_REACH_TOL = 1e-9
+
+_INDEX_KEY = "_model_spatial_index"
+
+
+class _IndexedModel:
+    """Ce que l'index retient d'une figurine : sa case, son disque englobant, son seau."""
+    __slots__ = ("squad_id", "player", "col", "row", "cx", "cy", "reach", "bucket")
+
+    squad_id: str
+    player: int
+    col: int
+    row: int
+    cx: float
+    cy: float
+    reach: float
+    bucket: Optional[Tuple[int, int]]
+
+
+def _bucket_of(cx: float, cy: float) -> Tuple[int, int]:
+    return int(math.floor(cx / _BUCKET_SIZE)), int(math.floor(cy / _BUCKET_SIZE))
+
+
+class ModelSpatialIndex:
+    """Grille uniforme de seaux sur les centres de figurines d'un ``models_cache``.
+
+    ``reach`` d'une figurine = rayon englobant de SON socle, elargi a celui du socle de son
+    escouade dans ``units_cache`` : ``socle_from_cache_entry`` mesure une escouade avec la forme
+    et la taille de l'ENTREE (un personnage attache y prend le socle du bloc), et la broad-phase
+    par escouade doit englober cette mesure-la aussi, sans quoi elle ecarterait une escouade que
+    la primitive aurait declaree a portee.
+
+    Les figurines hors table (sentinelle ``(-1,-1)``, reserves 20.01) sont ENREGISTREES sans seau :
+    elles ne sont a aucune distance, mais leur presence garde ``len(index) == len(models_cache)``.
+    """
+    __slots__ = ("models", "_cells", "_buckets", "_max_reach")
+
+    def __init__(self, models_cache: Dict[str, Any], units_cache: Dict[str, Any]) -> None:
+        self.models = models_cache
+        self._cells: Dict[str, _IndexedModel] = {}
+        self._buckets: Dict[Tuple[int, int], Set[str]] = {}
+        # Jamais diminue au retrait : un majorant perime elargit la recherche, il ne la fausse pas.
+        self._max_reach = 0.0
+        for model_id, model in models_cache.items():
+            self.place(str(model_id), model, units_cache)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __contains__(self, model_id: object) -> bool:
+        return model_id in self._cells
+
+    def place(self, model_id: str, model: Dict[str, Any], units_cache: Dict[str, Any]) -> None:
+        """(Re)range une figurine d'apres sa position et son socle COURANTS dans ``model``."""
+        self.discard(model_id)
+        rec = _IndexedModel()
+        rec.squad_id = str(require_key(model, "squad_id"))
+        rec.player = int(require_key(model, "player"))
+        rec.col = int(require_key(model, "col"))
+        rec.row = int(require_key(model, "row"))
+        reach = bounding_radius_norm(require_key(model, "BASE_SHAPE"), require_key(model, "BASE_SIZE"))
+        entry = units_cache.get(rec.squad_id)  # get allowed (escouade retiree / pas encore en cache)
+        if entry is not None:
+            reach = max(reach, bounding_radius_norm(entry["BASE_SHAPE"], entry["BASE_SIZE"]))
+        rec.reach = reach
+        self._cells[model_id] = rec
+        if rec.col < 0:
+            rec.cx = rec.cy = math.nan
+            rec.bucket = None
+            return
+        rec.cx, rec.cy = _hex_center(rec.col, rec.row)
+        rec.bucket = _bucket_of(rec.cx, rec.cy)
+        self._buckets.setdefault(rec.bucket, set()).add(model_id)
+        if reach > self._max_reach:
+            self._max_reach = reach
+
+    def discard(self, model_id: str) -> None:
+        """Retire une figurine de l'index (sans effet si elle n'y est pas)."""
+        rec = self._cells.pop(model_id, None)
+        if rec is None or rec.bucket is None:
+            return
+        bucket = self._buckets[rec.bucket]
+        bucket.discard(model_id)
+        if not bucket:
+            del self._buckets[rec.bucket]
+
+    def _ids_in_disc(self, cx: float, cy: float, radius: float) -> Iterator[str]:
+        """Figurines dont le SEAU touche le carre englobant le disque ``(cx, cy, radius)``."""
+        bx0, by0 = _bucket_of(cx - radius, cy - radius)
+        bx1, by1 = _bucket_of(cx + radius, cy + radius)
+        buckets = self._buckets
+        if (bx1 - bx0 + 1) * (by1 - by0 + 1) > len(buckets):
+            # Disque plus large que le plateau peuple : parcourir les seaux existants coute moins
+            # que d'enumerer les cases vides du rectangle.
+            for (bx, by), ids in buckets.items():
+                if bx0 <= bx <= bx1 and by0 <= by <= by1:
+                    yield from ids
+            return
+        for bx in range(bx0, bx1 + 1):
+            for by in range(by0, by1 + 1):
+                ids = buckets.get((bx, by))
+                if ids:
+                    yield from ids
+
+    def _candidates(
+        self, socle: Socle, distance: float, player: Optional[int], exclude_squad: Optional[str],
+    ) -> Set[str]:
+        """Figurines dont le disque englobant est a ``<= distance`` d'un disque du socle sonde."""
+        out: Set[str] = set()
+        cells = self._cells
+        for x, y, r in _socle_bounding_circles(socle):
+            for model_id in self._ids_in_disc(x, y, r + distance + self._max_reach):
+                if model_id in out:
+                    continue
+                rec = cells[model_id]
+                if player is not None and rec.player != player:
+                    continue
+                if exclude_squad is not None and rec.squad_id == exclude_squad:
+                    continue
+                if math.hypot(rec.cx - x, rec.cy - y) - r - rec.reach <= distance + _REACH_TOL:
+                    out.add(model_id)
+        return out
+
+    def model_socle(self, model_id: str) -> Socle:
+        """Socle PROPRE d'une figurine (forme, taille, orientation par figurine) a sa case indexee."""
+        model = require_key(self.models, model_id)
+        rec = self._cells[model_id]
+        return Socle(
+            model["BASE_SHAPE"], model["BASE_SIZE"], rec.col, rec.row, None, None,
+            int(model.get("orientation", 0)),  # get allowed — figurine legacy sans orientation = facing 0
+        )
+
+    def within(
+        self, socle: Socle, distance: float, *,
+        player: Optional[int] = None, exclude_squad: Optional[str] = None,
+    ) -> List[str]:
+        """Figurines a distance bord-a-bord ``<= distance`` (unites ``_hex_center``) du socle.
+
+        Exact : chaque candidat de la broad-phase est mesure par ``euclidean_edge_distance``
+        contre son socle propre. Ordre = ordre des identifiants, deterministe.
+        """
+        hits = [
+            mid for mid in self._candidates(socle, distance, player, exclude_squad)
+            if euclidean_edge_distance(socle, self.model_socle(mid), max_distance=distance) <= distance
+        ]
+        hits.sort()
+        return hits
+
+    def nearest(
+        self, socle: Socle, k: int, *,
+        player: Optional[int] = None, exclude_squad: Optional[str] = None,
+    ) -> List[Tuple[float, str]]:
+        """Les ``k`` figurines les plus proches (bord-a-bord), en ``(distance, model_id)`` croissants.
+
+        Parcours par anneaux de seaux autour du disque d'escouade du socle sonde : l'anneau ``n``
+        est a au moins ``(n - 1) x _BUCKET_SIZE`` du centre, donc des que ce minorant (moins les
+        deux rayons) depasse la k-ieme distance trouvee, aucun anneau plus lointain ne peut
+        entrer dans le resultat. Egalites departagees par identifiant.
+        """
+        if k <= 0 or not self._buckets:
+            return []
+        circles = _socle_bounding_circles(socle)
+        gx = sum(c[0] for c in circles) / len(circles)
+        gy = sum(c[1] for c in circles) / len(circles)
+        gr = max(math.hypot(x - gx, y - gy) + r for x, y, r in circles)
+        bx, by = _bucket_of(gx, gy)
+        span = max(
+            max(abs(kx - bx), abs(ky - by)) for kx, ky in self._buckets
+        )
+        best: List[Tuple[float, str]] = []
+        for ring in range(span + 1):
+            if len(best) >= k and (ring - 1) * _BUCKET_SIZE - gr - self._max_reach > best[k - 1][0]:
+                break
+            for kx in range(bx - ring, bx + ring + 1):
+                for ky in range(by - ring, by + ring + 1):
+                    if max(abs(kx - bx), abs(ky - by)) != ring:
+                        continue
+                    for mid in self._buckets.get((kx, ky), ()):
+                        rec = self._cells[mid]
+                        if player is not None and rec.player != player:
+                            continue
+                        if exclude_squad is not None and rec.squad_id == exclude_squad:
+                            continue
+                        best.append((euclidean_edge_distance(socle, self.model_socle(mid)), mid))
+            best.sort()
+            del best[k:]
+        return best
+
+    def squads_within_reach(
+        self, socle: Socle, distance: float, *,
+        player: Optional[int] = None, exclude_squad: Optional[str] = None,
+    ) -> Set[str]:
+        """Escouades dont UNE figurine peut etre a ``<= distance`` du socle — broad-phase seule.
+
+        Sur-ensemble garanti de ce que rendrait ``euclidean_edge_distance`` entre le socle et
+        ``socle_from_cache_entry`` de l'escouade (cf. ``reach`` dans la docstring de classe) ;
+        l'appelant tranche les escouades rendues avec sa propre primitive.
+        """
+        cells = self._cells
+        return {cells[mid].squad_id for mid in self._candidates(socle, distance, player, exclude_squad)}
+
+
+def model_spatial_index(game_state: Dict[str, Any]) -> ModelSpatialIndex:
+    """Index de l'etat, construit au premier appel ou quand ``models_cache`` a ete remplace.
+
+    Le test de taille attrape un retrait fait hors de ``destroy_model`` : un index qui ne
+    decrirait plus les memes figurines serait reconstruit plutot que cru.
+    """
+    models_cache = require_key(game_state, "models_cache")
+    index = game_state.get(_INDEX_KEY)  # get allowed (absent au 1er appel)
+    if index is None or index.models is not models_cache or len(index) != len(models_cache):
+        index = ModelSpatialIndex(models_cache, require_key(game_state, "units_cache"))
+        game_state[_INDEX_KEY] = index
+    return index
+
+
+def note_model_moved(game_state: Dict[str, Any], model_id: str) -> None:
+    """A appeler apres toute ecriture de ``col``/``row``/socle d'une figurine de ``models_cache``.
+
+    Sans index construit, rien a faire : le premier ``model_spatial_index`` lira l'etat courant.
+    """
+    index = game_state.get(_INDEX_KEY)  # get allowed (index jamais construit)
+    if index is None:
+        return
+    models_cache = require_key(game_state, "models_cache")
+    if index.models is not models_cache:
+        return
+    index.place(model_id, require_key(models_cache, model_id), require_key(game_state, "units_cache"))
+
+
+def note_model_removed(game_state: Dict[str, Any], model_id: str) -> None:
+    """A appeler apres le retrait d'une figurine de ``models_cache``."""
+    index = game_state.get(_INDEX_KEY)  # get allowed (index jamais construit)
+    if index is None:
+        return
+    index.discard(model_id)
@@ -137,6 +137,44 @@ def _cache_key(zones: Sequence[Tuple[Any, Set[Tuple[int, int]]]], cols: int, row
     )
 
 
+def _shared_or_built_maps(
+    zones: Sequence[Tuple[Any, Set[Tuple[int, int]]]], board_cols: int, board_rows: int
+) -> List["np.ndarray"]:
+    """Cartes d'un jeu d'aires : publiées par le parent (`engine.board_assets`), sinon construites.
+
+    Publiées, ce sont des vues en LECTURE SEULE sur la mémoire partagée — une seule copie pour
+    tous les workers d'un entraînement vectorisé, au lieu de 345 ms et ~645 Ko par worker.
+    """
+    from engine.board_assets import asset_key, record_asset, shared_asset
+
+    shared_key = asset_key(
+        "objective_distance",
+        (
+            board_cols,
+            board_rows,
+            tuple(
+                (str(objective_id), tuple(sorted(zone_hexes)))
+                for objective_id, zone_hexes in zones
+            ),
+        ),
+    )
+    stacked = shared_asset(shared_key)
+    if stacked is None:
+        all_cols, all_rows = np.meshgrid(
+            np.arange(board_cols), np.arange(board_rows), indexing="ij"
+        )
+        flat_cols = all_cols.ravel()
+        flat_rows = all_rows.ravel()
+        stacked = np.stack([
+            distances_to_zone(flat_cols, flat_rows, _zone_column_segments(zone_hexes))
+            .astype(np.int16)
+            .reshape(board_cols, board_rows)
+            for _objective_id, zone_hexes in zones
+        ])
+        record_asset(shared_key, stacked)
+    return list(stacked)
+
+
 def objective_distance_maps(game_state: Dict[str, Any]) -> List["np.ndarray"]:
     """Carte ``[col, row] → distance à l'aire``, une par objectif, DANS L'ORDRE de ``objectives``.
 
@@ -172,17 +210,7 @@ def objective_distance_maps(game_state: Dict[str, Any]) -> List["np.ndarray"]:
         _DISTANCE_MAP_CACHE[key] = _DISTANCE_MAP_CACHE.pop(key)
         maps = cached[2]
     else:
-        all_cols, all_rows = np.meshgrid(
-            np.arange(board_cols), np.arange(board_rows), indexing="ij"
-        )
-        flat_cols = all_cols.ravel()
-        flat_rows = all_rows.ravel()
-        maps = [
-            distances_to_zone(flat_cols, flat_rows, _zone_column_segments(zone_hexes))
-            .astype(np.int16)
-            .reshape(board_cols, board_rows)
-            for _objective_id, zone_hexes in zones
-        ]
+        maps = _shared_or_built_maps(zones, board_cols, board_rows)
         _DISTANCE_MAP_CACHE[key] = (board_cols, board_rows, maps)
         while len(_DISTANCE_MAP_CACHE) > _MAX_CACHED_BOARDS:
             _DISTANCE_MAP_CACHE.pop(next(iter(_DISTANCE_MAP_CACHE)))
@@ -0,0 +1,57 @@
+"""
+observation_buffers.py - Tampons d'observation PRÉALLOUÉS d'un environnement.
+
+`ObservationBuilder` allouait à chaque step un tableau neuf par clé de l'observation squad
+(`_empty_squad_observation`, ~30 clés) plus la grille égocentrique (9 x 32 x 32 float32) :
+environ 70 kio écrits dans de la mémoire fraîche, jetés au step suivant. Ce module porte le jeu
+de tableaux d'UN environnement, aux formes déclarées par `ObservationBuilder.squad_obs_shapes`
+(source unique — aucune forme n'est recopiée ici) : le builder les remet à zéro EN PLACE et
+écrit dedans.
+
+CONTRAT D'ALIAS — la raison pour laquelle le mode est OPT-IN (`use_preallocated_buffers`) :
+une observation rendue est valide jusqu'à la construction SUIVANTE du même builder, qui la
+réécrit. C'est sûr pour les transports qui consomment l'observation tout de suite (le
+`DummyVecEnv` de SB3 la recopie dans ses propres tampons, un `SubprocVecEnv` la picke à
+l'envoi), et c'est précisément ce qu'un transport par mémoire partagée lirait sans copie. Ça ne
+l'est PAS pour un appelant qui garde une observation en main pendant qu'il en construit une
+autre — les tests qui comparent deux grilles successives, ou l'observation terminale que les
+vec-envs de SB3 rangent dans `info` avant le reset. Le mode par défaut reste donc l'allocation
+fraîche ; un appelant qui active les tampons prend ce contrat à son compte.
+"""
+
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+
+
+class ObservationBuffers:
+    """Un tableau float32 par clé de l'observation squad, plus la grille, alloués une fois."""
+
+    __slots__ = ("arrays", "grid", "reuses")
+
+    def __init__(
+        self, shapes: Mapping[str, Tuple[int, ...]], grid_shape: Tuple[int, ...]
+    ) -> None:
+        self.arrays: Dict[str, np.ndarray] = {
+            key: np.zeros(shape, dtype=np.float32) for key, shape in shapes.items()
+        }
+        self.grid = np.zeros(grid_shape, dtype=np.float32)
+        self.reuses = 0
+
+    @property
+    def allocations(self) -> int:
+        """Tableaux alloués par ce jeu — une fois pour toutes, à la construction."""
+        return len(self.arrays) + 1
+
+    def squad_observation(self) -> Dict[str, np.ndarray]:
+        """Les tableaux de l'observation squad, remis à zéro en place (cf. contrat d'alias)."""
+        for array in self.arrays.values():
+            array.fill(0.0)
+        self.reuses += 1
+        # Dict NEUF sur les mêmes tableaux : l'appelant y ajoute "grid" sans toucher au jeu.
+        return dict(self.arrays)
+
+    def squad_grid(self) -> np.ndarray:
+        """La grille égocentrique, remise à zéro en place (cf. contrat d'alias)."""
+        self.grid.fill(0.0)
+        return self.grid
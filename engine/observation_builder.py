@@ -41,7 +41,18 @@ from engine.agent_decision import read_pending_agent_decision
 # `macro_intents` est une FEUILLE (constantes de l'espace d'action, aucune dépendance moteur) :
 # l'importer ici ne crée pas de cycle, et c'est la seule façon d'aligner l'index de slot du bloc
 # candidat sur l'action qu'il décrit sans recopier un littéral.
+from engine.entity_encoding_cache import EntityIntrinsics, entity_encoding_cache
 from engine.macro_intents import DEPLOY_SLOT_BASE
+from engine.mask_verification import mask_verification_enabled
+from engine.observation_buffers import ObservationBuffers
+from engine.spatial_grid import GRID_CH_COVER, GRID_CH_LEVEL, GRID_CH_OBJECTIVE, GRID_CH_WALL
+from engine.squad_grid_layers import (
+    DYNAMIC_CHANNELS,
+    STATIC_CHANNELS,
+    SquadGridLayers,
+    StaticLayerStack,
+    squad_grid_layers,
+)
 from engine.observation_entities import (
     AGENT_DECISION_TYPE_IDS,
     DECISION_CTX_BIN_SIZE,
@@ -79,6 +90,25 @@ from engine.observation_entities import (
     unit_cont_index,
 )
 
+#: Champs continus d'une entité qui ne décrivent que l'unité elle-même : mémoïsés par unité
+#: (`engine/entity_encoding_cache`), avec ses capacités en vigueur et ses types de figurines.
+INTRINSIC_CONT_FIELDS = (
+    "alive_models",
+    "hp_total",
+    "value_alive",
+    "model_count_ratio",
+    "wounded_hp_ratio",
+    "move",
+    "hp_max",
+    "toughness",
+    "armor_save",
+)
+_INTRINSIC_CONT_IDX = np.array([unit_cont_index(f) for f in INTRINSIC_CONT_FIELDS], dtype=np.intp)
+#: Champs bruts que cette part lit sur l'unité et sur chaque figurine vivante (hors rôle,
+#: facultatif) : ils entrent tels quels dans la clé du cache.
+INTRINSIC_UNIT_PROFILE_FIELDS = ("MOVE", "HP_MAX", "T", "ARMOR_SAVE")
+INTRINSIC_MODEL_FIELDS = ("HP_CUR", "HP_MAX", "T", "ARMOR_SAVE", "INVUL_SAVE", "VALUE")
+
 
 def _obs_ids_for_vocabulary(
     registry: Dict[str, Any],
@@ -309,6 +339,36 @@ class ObservationBuilder:
                 f"Must be defined in training_config.json. Current obs_params: {obs_params}"
             )
         self.obs_size = obs_params["obs_size"]  # Source unique de vérité
+        # Tampons préalloués (engine/observation_buffers.py) : OPT-IN, cf. son contrat d'alias.
+        # `obs_array_allocations` compte les tableaux d'observation alloués FRAIS par ce builder
+        # (clés squad + grille) — le compteur que lit scripts/profile_env_step_360x312.py.
+        self._obs_buffers: Optional[ObservationBuffers] = None
+        self.obs_array_allocations = 0
+
+    def use_preallocated_buffers(self, enabled: bool = True) -> None:
+        """Écrit les observations dans un jeu de tableaux préalloué (ou revient à l'allocation).
+
+        Chaque observation rendue est alors valide jusqu'à la construction suivante de CE
+        builder : l'appelant qui active ce mode s'engage à la consommer (copie, pickle, lecture
+        en mémoire partagée) avant d'en demander une autre.
+        """
+        if not enabled:
+            self._obs_buffers = None
+            return
+        if self._obs_buffers is None:
+            from engine.spatial_grid import GRID_CHANNELS, GRID_SIZE
+
+            self._obs_buffers = ObservationBuffers(
+                self.squad_obs_shapes(), (GRID_CHANNELS, GRID_SIZE, GRID_SIZE)
+            )
+            self.obs_array_allocations += self._obs_buffers.allocations
+
+    def observation_allocation_stats(self) -> Dict[str, int]:
+        """Tableaux d'observation alloués depuis la création du builder, et réutilisations."""
+        return {
+            "arrays_allocated": self.obs_array_allocations,
+            "buffer_reuses": self._obs_buffers.reuses if self._obs_buffers is not None else 0,
+        }
 
     # ============================================================================
     # ============================================================================
@@ -1075,12 +1135,66 @@ class ObservationBuilder:
         game_state["_grid_static_hex_arrays"] = static
         return static
 
-    def _empty_squad_observation(self) -> Dict[str, np.ndarray]:
-        """Observation nulle (escouade morte/absente) — mêmes clés et formes que le cas nominal."""
-        return {
-            key: np.zeros(shape, dtype=np.float32)
-            for key, shape in self.squad_obs_shapes().items()
+    @classmethod
+    def _squad_grid_layers(cls, game_state: Dict[str, Any]) -> SquadGridLayers:
+        """Couches de la grille egocentrique (`engine/squad_grid_layers`), raster statique pret.
+
+        Le raster est construit depuis `_static_hex_arrays` — la MEME source que les drapeaux
+        de deploiement — plus les etages, et reconstruit des que cette memo est remplacee.
+        """
+        layers = squad_grid_layers(game_state)
+        static = cls._static_hex_arrays(game_state)
+        if layers.static is not None and layers.static_source is static:
+            return layers
+        from engine.terrain_utils import floor_hexes_at_level, floor_levels_present
+
+        # Canal niveau : valeur level / max_level par hexe d'etage (0 partout sans etage : le sol
+        # EST le niveau 0, ce n'est pas une absence de donnee, spec §6.1).
+        terrain_areas = game_state.get("terrain_areas", [])  # get allowed (scenario sans terrain)
+        levels = floor_levels_present(terrain_areas)
+        level_cols: List[int] = []
+        level_rows: List[int] = []
+        level_values: List[float] = []
+        for level in levels:
+            for col, row in floor_hexes_at_level(terrain_areas, level):
+                level_cols.append(int(col))
+                level_rows.append(int(row))
+                level_values.append(float(level) / float(levels[-1]))
+        level_arrays = (np.array(level_cols, dtype=np.int64), np.array(level_rows, dtype=np.int64))
+        by_channel = {
+            GRID_CH_WALL: (static["walls"], 1.0),
+            GRID_CH_OBJECTIVE: (static["objectives"], 1.0),
+            GRID_CH_COVER: (static["cover"], 1.0),
+            GRID_CH_LEVEL: (level_arrays, np.array(level_values, dtype=np.float32)),
         }
+        layers.static = StaticLayerStack(
+            require_key(game_state, "board_cols"),
+            require_key(game_state, "board_rows"),
+            [by_channel[channel] for channel in STATIC_CHANNELS],
+        )
+        layers.static_source = static
+        return layers
+
+    def _empty_squad_observation(self) -> Dict[str, np.ndarray]:
+        """Observation nulle (escouade morte/absente) — mêmes clés et formes que le cas nominal.
+
+        C'est aussi le support sur lequel `build_squad_observation` écrit : les tampons
+        préalloués quand ils sont actifs, des tableaux neufs sinon.
+        """
+        if self._obs_buffers is not None:
+            return self._obs_buffers.squad_observation()
+        shapes = self.squad_obs_shapes()
+        self.obs_array_allocations += len(shapes)
+        return {key: np.zeros(shape, dtype=np.float32) for key, shape in shapes.items()}
+
+    def _empty_squad_grid(self) -> np.ndarray:
+        """Grille nulle, support de `build_squad_grid` (tampon préalloué ou tableau neuf)."""
+        if self._obs_buffers is not None:
+            return self._obs_buffers.squad_grid()
+        from engine.spatial_grid import GRID_CHANNELS, GRID_SIZE
+
+        self.obs_array_allocations += 1
+        return np.zeros((GRID_CHANNELS, GRID_SIZE, GRID_SIZE), dtype=np.float32)
 
     # ------------------------------------------------------------------
     # Sous-registres d'une entité (armes, types de figurines)
@@ -1170,9 +1284,15 @@ class ObservationBuilder:
         squad_id: str,
         alive_mids: List[str],
         models_cache: Dict[str, Any],
+        out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        waaagh_invul: Optional[bool] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Sous-tenseurs (K_MODEL_TYPES, …) des TYPES de figurines d'une unité.
 
+        ``out`` : vues NULLES (continus, binaires) où écrire, comme pour `_encode_unit_entity`.
+        ``waaagh_invul`` : prédicat Waaagh! déjà évalué par l'appelant (il fait partie de la clé
+        de `_entity_intrinsics`) ; ``None`` -> évalué ici.
+
         Chaque type porte son profil défensif, son rôle d'allocation (règle 19) et son effectif
         VIVANT : l'unité entière est décrite, quelle que soit sa taille. Émis pour les DEUX
         camps (§3.3) — les slots ennemis n'avaient auparavant qu'un profil défensif d'escouade,
@@ -1180,8 +1300,11 @@ class ObservationBuilder:
         l'agent ne pouvait pas voir qu'un Nob est plus dur que les Boyz qui l'entourent, ce qui
         décide pourtant de l'allocation des pertes et de la rentabilité d'une cible.
         """
-        cont = np.zeros((self.K_MODEL_TYPES, MODEL_TYPE_CONT_SIZE), dtype=np.float32)
-        binv = np.zeros((self.K_MODEL_TYPES, MODEL_TYPE_BIN_SIZE), dtype=np.float32)
+        if out is not None:
+            cont, binv = out
+        else:
+            cont = np.zeros((self.K_MODEL_TYPES, MODEL_TYPE_CONT_SIZE), dtype=np.float32)
+            binv = np.zeros((self.K_MODEL_TYPES, MODEL_TYPE_BIN_SIZE), dtype=np.float32)
         types = self._squad_model_types(alive_mids, models_cache)
         if len(types) > self.K_MODEL_TYPES:
             # Troncature LOGUÉE, jamais silencieuse (§11).
@@ -1204,8 +1327,9 @@ class ObservationBuilder:
         # que de l'unité, et cette boucle tourne jusqu'à `K_MODEL_TYPES` fois — pour 28 entités,
         # à CHAQUE step gym. Seul l'octroi lui-même reste dans la boucle, car il dépend de
         # l'invulnérable propre à chaque type (une 4+ existante est conservée).
-        entity_unit = get_unit_by_id(game_state, str(squad_id))
-        waaagh_invul = entity_unit is not None and waaagh_applies_to_unit(game_state, entity_unit)
+        if waaagh_invul is None:
+            entity_unit = get_unit_by_id(game_state, str(squad_id))
+            waaagh_invul = entity_unit is not None and waaagh_applies_to_unit(game_state, entity_unit)
         for t_idx in range(min(self.K_MODEL_TYPES, len(types))):
             (role, hp_max, toughness, save, invul), count = types[t_idx]
             if waaagh_invul:
@@ -1218,6 +1342,161 @@ class ObservationBuilder:
             binv[t_idx, len(self.SQUAD_MODEL_ROLES)] = 1.0  # slot occupé
         return cont, binv
 
+    def _entity_intrinsics(
+        self,
+        game_state: Dict[str, Any],
+        squad_id: str,
+        unit: Dict[str, Any],
+        entry: Dict[str, Any],
+        model_count_at_start: int,
+        alive_mids: List[str],
+        models_cache: Dict[str, Any],
+        waaagh_invul: bool,
+    ) -> EntityIntrinsics:
+        """Part de la ligne d'une entité qui ne dépend que de l'unité (`INTRINSIC_CONT_FIELDS`,
+        capacités en vigueur, types de figurines), calculée sans cache. Tableaux en lecture seule.
+
+        ``model_count_at_start`` : déjà validé par `_cached_entity_intrinsics`.
+        """
+        models = [models_cache[mid] for mid in alive_mids]
+        cont = np.array(
+            [
+                len(alive_mids),
+                # HP_CUR : REQUIS. `build_units_cache` le pose toujours et les writers
+                # l'entretiennent — un défaut à 0 dirait « escouade à 0 PV » sur une entrée de
+                # cache incomplète (§0.32 T-J).
+                int(require_key(entry, "HP_CUR")),
+                # VALUE vivante : somme PAR FIGURINE (exacte sur une escouade hétérogène en points).
+                sum(float(require_key(m, "VALUE")) for m in models),
+                len(alive_mids) / float(model_count_at_start),
+                # En 40K les pertes s'allouent une figurine à la fois : au plus une figurine est
+                # partiellement blessée. Aucune entamée -> 1.0, lecture exacte du minimum.
+                min(
+                    int(require_key(m, "HP_CUR")) / float(int(require_key(m, "HP_MAX")))
+                    for m in models
+                ),
+                require_key(unit, "MOVE"),
+                require_key(unit, "HP_MAX"),
+                require_key(unit, "T"),
+                require_key(unit, "ARMOR_SAVE"),
+            ],
+            dtype=np.float32,
+        )
+        # Capacités EN VIGUEUR (19.04 : union escouade + characters attachés encore vivants),
+        # écrites en `obs_id` TRIÉS CROISSANT puis paddées à 0 (chantier 01).
+        #
+        # Émises pour TOUTE entité, amie comme ennemie : savoir qu'une escouade adverse relance
+        # ses charges ou pénètre l'armure de la cible la plus proche change l'évaluation de la
+        # menace autant que ses armes. La source est `unit_has_rule_effect`, EXACTEMENT celle des
+        # bits qu'elle remplace : elle résout les règles SOURCES vers leurs effets (une capacité
+        # nommée confère un effet technique), donc ce qui est écrit décrit ce que le moteur
+        # applique — et le jeu produit est identique à celui d'avant le chantier.
+        ability_obs_ids = unit_ability_obs_ids()
+        ability_ids = _fill_id_slots(
+            [
+                ability_obs_ids[rule_id]
+                for rule_id in UNIT_RULE_EFFECT_IDS
+                if unit_has_rule_effect(unit, rule_id)
+            ],
+            UNIT_ABILITY_SLOTS,
+            registry=ability_obs_ids,
+            kind="capacites",
+            slots_constant="observation_entities.UNIT_ABILITY_SLOTS",
+            squad_id=squad_id,
+        )
+        types_cont, types_bin = self._encode_entity_model_types(
+            game_state, squad_id, alive_mids, models_cache, waaagh_invul=waaagh_invul
+        )
+        intrinsics = EntityIntrinsics(cont, ability_ids, types_cont, types_bin)
+        for array in intrinsics:
+            array.setflags(write=False)
+        return intrinsics
+
+    def _cached_entity_intrinsics(
+        self,
+        game_state: Dict[str, Any],
+        squad_id: str,
+        unit: Dict[str, Any],
+        entry: Dict[str, Any],
+        sq: Dict[str, Any],
+        alive_mids: List[str],
+        models_cache: Dict[str, Any],
+        ctx: Dict[str, Any],
+    ) -> EntityIntrinsics:
+        """`_entity_intrinsics` mémoïsée par unité (`engine/entity_encoding_cache`).
+
+        Clé : révision de l'unité (bumpée par les écrivains de son état), prédicat Waaagh! (le
+        seul facteur d'ARMÉE de la part intrinsèque) et les LECTURES BRUTES : liste `UNIT_RULES`,
+        PV courants, effectif de départ, profil de l'unité et, par figurine vivante, rôle, profil
+        défensif, PV et valeur. Ces lectures ne coûtent que des accès dict — ce que le cache
+        évite, c'est la résolution des capacités sur tout le registre des effets et le
+        regroupement par type. Les mettre dans la clé couvre une écriture qui ne passe par aucun
+        écrivain (§0.18), comme un profil posé directement dans `models_cache`.
+        Mode vérification (niveau 1 de `engine.mask_verification`) : chaque hit est recalculé et
+        comparé ; une divergence lève en nommant le champ.
+        """
+        from engine.game_state import waaagh_applies_to_unit
+
+        # `model_count_at_start` est POSÉ pour chaque escouade par `build_units_cache`
+        # (`entry["model_count_at_start"] = entry["model_count"]`) et PRÉSERVÉ à chaque
+        # recalcul (`_recompute_squad_cache`) : absent, ou nul sur une escouade qu'on encode
+        # comme vivante, c'est une incohérence de cache. Les deux replis précédents la
+        # masquaient (§0.32 T-J) : `.get(…, len(alive_mids))` rendait un ratio de 1.0 —
+        # « escouade intacte » — sur une escouade décimée, et `max(1, …)` transformait un 0 en
+        # ratio > 1 servi tel quel au réseau. Le reste du moteur lit déjà cette clé sans repli
+        # (`shared_utils.py:4331`, `:7151`, `fight_handlers.py:5175`). Contrôlé AVANT la lecture
+        # du cache : un hit ne doit pas taire l'incohérence.
+        model_count_at_start = int(require_key(sq, "model_count_at_start"))
+        if model_count_at_start <= 0:
+            raise ValueError(
+                f"build_squad_observation: squad_cache[{squad_id!r}]['model_count_at_start'] = "
+                f"{model_count_at_start} pour une escouade encodee vivante "
+                f"({len(alive_mids)} figurines) — incoherence de cache."
+            )
+        cache = entity_encoding_cache(game_state)
+        waaagh_invul = bool(waaagh_applies_to_unit(game_state, unit))
+        unit_rules = require_key(unit, "UNIT_RULES")
+        key = (
+            cache.revision(squad_id),
+            waaagh_invul,
+            model_count_at_start,
+            int(require_key(entry, "HP_CUR")),
+            # La LISTE des règles elle-même, et sa longueur : une liste remplacée (montage d'un
+            # roster, écriture directe) se compare par contenu, un ajout en place change la
+            # longueur. Seule une retouche en place d'une entrée reste à la charge de la révision.
+            unit_rules,
+            len(unit_rules),
+            tuple(require_key(unit, field) for field in INTRINSIC_UNIT_PROFILE_FIELDS),
+            tuple(
+                (
+                    mid,
+                    models_cache[mid].get("role"),  # get allowed (None = figurine de base)
+                    *(require_key(models_cache[mid], field) for field in INTRINSIC_MODEL_FIELDS),
+                )
+                for mid in alive_mids
+            ),
+        )
+        hit = cache.get(squad_id, key)
+        if hit is not None and not ctx["verify_entity_encoding"]:
+            return hit
+        fresh = self._entity_intrinsics(
+            game_state, squad_id, unit, entry, model_count_at_start, alive_mids, models_cache,
+            waaagh_invul,
+        )
+        if hit is None:
+            cache.put(squad_id, key, fresh)
+            return fresh
+        cache.verified += 1
+        for name, memoised, recomputed in zip(EntityIntrinsics._fields, hit, fresh):
+            if not np.array_equal(memoised, recomputed):
+                raise RuntimeError(
+                    f"entity_encoding_cache: encodage intrinseque memoise perime pour l'unite "
+                    f"{squad_id} (champ {name}) — memoise {memoised.tolist()}, recalcule "
+                    f"{recomputed.tolist()}. Un ecrivain de l'etat d'unite ne bumpe pas sa "
+                    f"revision (`bump_unit_revision`)."
+                )
+        return hit
+
     def _encode_unit_entity(
         self,
         game_state: Dict[str, Any],
@@ -1226,6 +1505,7 @@ class ObservationBuilder:
         *,
         is_ally: bool,
         is_active: bool,
+        out: Optional[Dict[str, np.ndarray]] = None,
     ) -> Tuple[
         np.ndarray, np.ndarray, np.ndarray, np.ndarray,
         np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray,
@@ -1236,6 +1516,10 @@ class ObservationBuilder:
         types_cont, types_bin). Les features
         marquées « unité ACTIVE uniquement » dans le schéma restent à zéro pour les autres
         entités : leur masque est le bit `is_active` (§3.3).
+
+        ``out`` — lignes de l'observation (vues NULLES, clés "cont", "bin", "types_cont",
+        "types_bin") où écrire directement : les sous-tenseurs rendus sont alors ces vues, et
+        l'entité n'alloue plus rien de son côté. Sans ``out``, tableaux neufs.
         """
         units_cache = game_state["units_cache"]
         models_cache = game_state["models_cache"]
@@ -1261,8 +1545,11 @@ class ObservationBuilder:
             )
         models = [models_cache[mid] for mid in alive_mids]
 
-        cont = np.zeros(UNIT_CONT_SIZE, dtype=np.float32)
-        binv = np.zeros(UNIT_BIN_SIZE, dtype=np.float32)
+        if out is not None:
+            cont, binv = out["cont"], out["bin"]
+        else:
+            cont = np.zeros(UNIT_CONT_SIZE, dtype=np.float32)
+            binv = np.zeros(UNIT_BIN_SIZE, dtype=np.float32)
 
         def _c(field: str, value: float) -> None:
             cont[unit_cont_index(field)] = float(value)
@@ -1270,40 +1557,15 @@ class ObservationBuilder:
         def _b(field: str, value: bool) -> None:
             binv[unit_bin_index(field)] = 1.0 if value else 0.0
 
-        # `model_count_at_start` est POSÉ pour chaque escouade par `build_units_cache`
-        # (`entry["model_count_at_start"] = entry["model_count"]`) et PRÉSERVÉ à chaque
-        # recalcul (`_recompute_squad_cache`) : absent, ou nul sur une escouade qu'on encode
-        # comme vivante, c'est une incohérence de cache. Les deux replis précédents la
-        # masquaient (§0.32 T-J) : `.get(…, len(alive_mids))` rendait un ratio de 1.0 —
-        # « escouade intacte » — sur une escouade décimée, et `max(1, …)` transformait un 0 en
-        # ratio > 1 servi tel quel au réseau. Le reste du moteur lit déjà cette clé sans repli
-        # (`shared_utils.py:4331`, `:7151`, `fight_handlers.py:5175`).
-        model_count_at_start = int(require_key(sq, "model_count_at_start"))
-        if model_count_at_start <= 0:
-            raise ValueError(
-                f"build_squad_observation: squad_cache[{squad_id!r}]['model_count_at_start'] = "
-                f"{model_count_at_start} pour une escouade encodee vivante "
-                f"({len(alive_mids)} figurines) — incoherence de cache."
-            )
-        _c("alive_models", len(alive_mids))
-        # HP_CUR : REQUIS. `build_units_cache` le pose toujours et les writers l'entretiennent —
-        # un défaut à 0 dirait « escouade à 0 PV » sur une entrée de cache incomplète (§0.32 T-J).
-        _c("hp_total", int(require_key(entry, "HP_CUR")))
-        # VALUE vivante : somme PAR FIGURINE (exacte sur une escouade hétérogène en points).
-        _c("value_alive", sum(float(require_key(models_cache[mid], "VALUE")) for mid in alive_mids))
+        # Part INTRINSÈQUE (effectifs, PV, profil, capacités, types) : mémoïsée par unité.
+        intrinsics = self._cached_entity_intrinsics(
+            game_state, squad_id, unit, entry, sq, alive_mids, models_cache, ctx
+        )
+        cont[_INTRINSIC_CONT_IDX] = intrinsics.cont
         # OC cumulé : REQUIS. Un défaut à 0 aurait dit « cette escouade ne prend aucun objectif »
-        # (règle 14) pour une entrée de cache incomplète, sans rien lever (§0.32 T-J).
+        # (règle 14) pour une entrée de cache incomplète, sans rien lever (§0.32 T-J). Hors de la
+        # part mémoïsée : `oc_total` suit les modificateurs d'OC, que la révision ne voit pas.
         _c("oc_total", int(require_key(sq, "oc_total")))
-        _c("model_count_ratio", len(alive_mids) / float(model_count_at_start))
-        # En 40K les pertes s'allouent une figurine à la fois : au plus une figurine est
-        # partiellement blessée. Aucune entamée -> 1.0, lecture exacte du minimum (pas un repli).
-        _c(
-            "wounded_hp_ratio",
-            min(
-                int(require_key(m, "HP_CUR")) / float(int(require_key(m, "HP_MAX")))
-                for m in models
-            ),
-        )
         # Position mesurée depuis la figurine la PLUS PROCHE de mon centroïde, et non depuis
         # l'ancre (V11 §9.2) : sur une escouade de 20 Boyz étalée, l'ancre peut être à l'opposé
         # de la figurine qui me menace.
@@ -1358,10 +1620,6 @@ class ObservationBuilder:
                     )
                 ),
             )
-        _c("move", require_key(unit, "MOVE"))
-        _c("hp_max", require_key(unit, "HP_MAX"))
-        _c("toughness", require_key(unit, "T"))
-        _c("armor_save", require_key(unit, "ARMOR_SAVE"))
         # Sauvegarde invulnérable EFFECTIVE — jumeau de `_encode_entity_model_types` : le Waaagh!
         # accorde une 5+ que la datasheet ne porte pas, et c'est celle-là que le moteur applique.
         from engine.game_state import effective_invul_save
@@ -1401,28 +1659,9 @@ class ObservationBuilder:
             "deployed_this_turn",
             deployed_on_turn is not None and int(deployed_on_turn) == ctx["current_turn"],
         )
-        # Capacités EN VIGUEUR (19.04 : union escouade + characters attachés encore vivants),
-        # écrites en `obs_id` TRIÉS CROISSANT puis paddées à 0 (chantier 01).
-        #
-        # Émises pour TOUTE entité, amie comme ennemie : savoir qu'une escouade adverse relance
-        # ses charges ou pénètre l'armure de la cible la plus proche change l'évaluation de la
-        # menace autant que ses armes. La source est `unit_has_rule_effect`, EXACTEMENT celle des
-        # bits qu'elle remplace : elle résout les règles SOURCES vers leurs effets (une capacité
-        # nommée confère un effet technique), donc ce qui est écrit décrit ce que le moteur
-        # applique — et le jeu produit est identique à celui d'avant le chantier.
-        ability_obs_ids = unit_ability_obs_ids()
-        ability_ids = _fill_id_slots(
-            [
-                ability_obs_ids[rule_id]
-                for rule_id in UNIT_RULE_EFFECT_IDS
-                if unit_has_rule_effect(unit, rule_id)
-            ],
-            UNIT_ABILITY_SLOTS,
-            registry=ability_obs_ids,
-            kind="capacites",
-            slots_constant="observation_entities.UNIT_ABILITY_SLOTS",
-            squad_id=squad_id,
-        )
+        # Capacités EN VIGUEUR : part intrinsèque (cf. `_entity_intrinsics`). Tableau du cache,
+        # en lecture seule — l'appelant le copie dans la ligne de l'observation.
+        ability_ids = intrinsics.ability_ids
         status_ids = _fill_id_slots(
             _unit_statuses_in_effect(unit, ctx),
             UNIT_STATUS_SLOTS,
@@ -1541,107 +1780,52 @@ class ObservationBuilder:
         wpn_cont, wpn_bin, wpn_rule_ids = self._encode_entity_weapons(
             game_state, squad_id, models, alive_mids
         )
-        types_cont, types_bin = self._encode_entity_model_types(
-            game_state, squad_id, alive_mids, models_cache
-        )
+        if out is not None:
+            types_cont, types_bin = out["types_cont"], out["types_bin"]
+            types_cont[...] = intrinsics.types_cont
+            types_bin[...] = intrinsics.types_bin
+        else:
+            types_cont, types_bin = intrinsics.types_cont.copy(), intrinsics.types_bin.copy()
         return (
             cont, binv, ability_ids, status_ids,
             wpn_cont, wpn_bin, wpn_rule_ids, types_cont, types_bin,
         )
 
-    def build_squad_observation(
-        self, game_state: Dict[str, Any], active_squad_id: str
-    ) -> Dict[str, np.ndarray]:
-        """Construit l'observation squad en TENSEURS D'ENTITÉS (clés : cf. en-tête de section).
-
-        La grille égocentrique est fournie à part par `build_squad_grid` ; l'assemblage du Dict
-        final (avec "grid") est la responsabilité de `W40KEngine._build_observation`.
+    def _side_observation_context(
+        self, game_state: Dict[str, Any], active_player: int
+    ) -> Dict[str, Any]:
+        """Ce que l'observation squad partage entre TOUTES les escouades d'un camp.
+
+        Le contexte global (hors géométrie des objectifs, mesurée depuis l'escouade), la passe
+        d'engagement (escouades engagées + ennemis pertinents de chaque escouade amie) et le
+        mapping des slots ennemis ne dépendent que du JOUEUR. `build_squad_observation` les
+        recalculait pour chaque escouade observée — la passe d'engagement est O(escouades amies
+        x ennemies) en empreintes, donc O(n²) par camp quand on observe n escouades.
+
+        Valide pour l'état de `game_state` à l'appel, et pour lui seul : `build_side_observations`
+        le construit et le consomme d'un seul tenant ; `build_squad_observation` en construit un
+        à chaque appel quand on ne lui en donne pas.
         """
-        from engine.perf_timing import append_perf_timing_line, perf_timing_enabled
-
-        _perf = perf_timing_enabled(game_state)
-        _t0 = time.perf_counter() if _perf else None
-
-        # C2 cleanup (audit) : message d'erreur explicite si l'ordre d'init est cassé.
-        if not all(k in game_state for k in ("units_cache", "models_cache", "squad_models", "squad_cache")):
-            missing = [k for k in ("units_cache", "models_cache", "squad_models", "squad_cache") if k not in game_state]
-            raise RuntimeError(
-                f"build_squad_observation requires fully initialized caches. "
-                f"Missing: {missing}. Initialize caches via build_units_cache before calling this function."
-            )
-        units_cache = game_state["units_cache"]
-        models_cache = game_state["models_cache"]
-        squad_models = game_state["squad_models"]
-        squad_cache = game_state["squad_cache"]
-
-        if active_squad_id not in units_cache or active_squad_id not in squad_cache:
-            if _perf and _t0 is not None:
-                append_perf_timing_line(
-                    f"SQUAD_OBSERVATION episode={game_state.get('episode_number', '?')} "
-                    f"turn={game_state.get('turn', '?')} squad={active_squad_id} "
-                    f"outcome=squad_absent ctx_s=0.000000 entities_s=0.000000 "
-                    f"total_s={time.perf_counter() - _t0:.6f} entities_n=0"
-                )
-            return self._empty_squad_observation()  # squad dead/absent -> zero observation
-        active_entry = units_cache[active_squad_id]
-        active_sq = squad_cache[active_squad_id]
-        active_player = int(active_entry["player"])
-        active_unit = get_unit_by_id(game_state, str(active_squad_id))
-        if active_unit is None:
-            raise KeyError(f"Unit {active_squad_id} missing from game_state['units'] for observation")
-
         from engine.spatial_relations import (
             get_engagement_zone,
             unit_entries_within_engagement_zone,
         )
-        from engine.phase_handlers.shared_utils import _synth_model_entry
-        from engine.phase_handlers.shooting_handlers import _ranged_distance_metric
-        from engine.combat_utils import socle_from_cache_entry
 
+        units_cache = require_key(game_state, "units_cache")
+        shapes = self.squad_obs_shapes()
         ez_zone = get_engagement_zone(game_state)
-        # Engagement 3D (§03.04) : l'observation mesure EXACTEMENT ce que le moteur résout —
-        # sans rien passer, parce que la primitive applique le gate dès que les deux entrées
-        # portent leurs cartes verticales (cf. `entries_in_engagement_zone`). Laisser l'obs en 2D
-        # pendant que le fight résout en 3D annoncerait à l'agent des engagements que la
-        # résolution refuse (divergence masque/exécution).
         current_turn = int(game_state.get("turn", 0))  # get allowed (etat non initialise = tour 0)
         enemy_player = 2 if active_player == 1 else 1
-        # Centroïde : REQUIS. `_compute_squad_cache_entry` le pose toujours (même escouade morte) ;
-        # un repli sur l'ancre de l'unité déplacerait l'origine T-I en silence sur un cache
-        # incomplet — même famille que les replis fermés en §0.32 T-J.
-        #
-        # §0.40 point 4 : SAUF si l'escouade n'est pas encore posée. Son centroïde vaut alors
-        # (-1,-1) — la moyenne des figurines, toutes à la sentinelle « pas sur le board ». Tout ce
-        # que l'obs exprime « depuis moi » était donc mesuré depuis un coin HORS PLATEAU : sur le
-        # scénario d'entraînement, l'agent voyait l'objectif 0 à 38,3 (le plus proche) alors qu'il
-        # est à 178,9 de sa zone, et ne voyait pas l'objectif 4 à 11,3 — l'ORDRE des objectifs
-        # était inversé, et les 3 actions de zone s'appuient sur ces nombres.
-        # L'origine devient celle de la grille (`squad_grid_anchor`, §0.40 point 2), ce qui REND
-        # l'invariant T-I ci-dessous : un seul repère pour toute l'observation. Sans cela, le
-        # vecteur et la grille décriraient deux régions différentes du plateau.
-        active_not_deployed = require_key(active_unit, "deployed_on_turn") is None
-        if active_not_deployed:
-            _anchor_col, _anchor_row = self.squad_grid_anchor(game_state, active_squad_id)
-            cx, cy = float(_anchor_col), float(_anchor_row)
-        else:
-            cx = float(require_key(active_sq, "centroid_col"))
-            cy = float(require_key(active_sq, "centroid_row"))
-        # Origine des positions RELATIVES, dans la projection `_hex_center` (§0.32 T-I) : la même
-        # origine que les directions d'objectif (`_squad_objective_geometry`), donc un seul repère
-        # pour tout ce que l'observation exprime « depuis moi ».
-        anchor_x, anchor_y = _hex_center(int(round(cx)), int(round(cy)))
-
-        obs = self._empty_squad_observation()
 
-        # === CONTEXTE GLOBAL ===
+        # === CONTEXTE GLOBAL (hors géométrie des objectifs, mesurée depuis chaque escouade) ===
         victory_points = require_key(game_state, "victory_points")
         value_at_start = require_key(game_state, "value_at_start")
         value_alive = {active_player: 0.0, enemy_player: 0.0}
-        for m in models_cache.values():
+        for m in require_key(game_state, "models_cache").values():
             p = int(require_key(m, "player"))
             if p in value_alive:
                 value_alive[p] += float(require_key(m, "VALUE"))
-        g_cont = obs["global_cont"]
+        g_cont = np.zeros(shapes["global_cont"], dtype=np.float32)
         g_cont[global_cont_index("turn")] = float(current_turn)
         g_cont[global_cont_index("episode_steps")] = float(int(game_state.get("episode_steps", 0)))  # get allowed
         g_cont[global_cont_index("my_victory_points")] = float(require_key(victory_points, active_player))
@@ -1659,7 +1843,7 @@ class ObservationBuilder:
                     f"force d usure indefinie (donnee de roster invalide)."
                 )
             g_cont[global_cont_index(field)] = value_alive[p] / start_value
-        g_bin = obs["global_bin"]
+        g_bin = np.zeros(shapes["global_bin"], dtype=np.float32)
         g_bin[global_bin_index("is_my_turn")] = (
             1.0 if int(require_key(game_state, "current_player")) == active_player else 0.0
         )
@@ -1680,14 +1864,6 @@ class ObservationBuilder:
         for i in range(self.SQUAD_N_OBJECTIVE_SLOTS):
             g_bin[global_bin_index(f"objective_control_{i}")] = control[i]
             g_bin[global_bin_index(f"objective_present_{i}")] = presence[i]
-        # Où est cet objectif, depuis MOI : distance (continue, brute) + direction unitaire.
-        # La grille égocentrique ne porte que ce qui tombe dans le budget d'Advance ; au-delà,
-        # ces trois nombres sont la SEULE trace d'un objectif que 3 actions de zone désignent.
-        obj_dist, obj_cos, obj_sin = self._squad_objective_geometry(game_state, cx, cy)
-        for i in range(self.SQUAD_N_OBJECTIVE_SLOTS):
-            g_cont[global_cont_index(f"objective_distance_{i}")] = obj_dist[i]
-            g_bin[global_bin_index(f"objective_dir_cos_{i}")] = obj_cos[i]
-            g_bin[global_bin_index(f"objective_dir_sin_{i}")] = obj_sin[i]
 
         # === CAPACITÉS DE FACTION (chantier 03) ===
         # Waaagh! et Oath sont des faits d'ARMÉE, pas d'unité — d'où leur place ici. Les quatre
@@ -1699,7 +1875,6 @@ class ObservationBuilder:
             waaagh_is_active, waaagh_is_available,
         )
 
-        enemy_player = 2 if int(active_player) == 1 else 1
         g_bin[global_bin_index("my_waaagh_available")] = (
             1.0 if waaagh_is_available(game_state, active_player) else 0.0
         )
@@ -1736,15 +1911,6 @@ class ObservationBuilder:
             else 0.0
         )
 
-        # === DÉCISION AGENT EN ATTENTE (V11 §9.3 P2) ===
-        self._encode_pending_decision(game_state, obs, active_player)
-        # §0.40 point 3 — ce que chaque slot 4-8 poserait réellement. Après le contexte global :
-        # il lui faut l'origine de mesure (`anchor_x/y`), déjà établie plus haut.
-        self._encode_deployment_candidates(
-            game_state, obs, str(active_squad_id), anchor_x, anchor_y,
-            active_not_deployed=active_not_deployed,
-        )
-
         # === ENGAGEMENT (règle 03.04) — une seule passe pour toutes les entités ===
         # Le test EZ exact compare des EMPREINTES (jusqu'à ~200 cases pour une grande base) :
         # on élimine d'abord les escouades trop loin pour POUVOIR engager, avec la même borne
@@ -1769,9 +1935,9 @@ class ObservationBuilder:
         # mutuellement engagées — mesuré pendant le déploiement : `engaged = 1`,
         # `n_in_enemy_ez = 6`, `n_fight_eligible = 6` sur une escouade qui n'est pas sur la table.
         # La primitive moteur n'est pas en cause : on lui donnait des empreintes fantômes. Le
-        # filtre est donc ici, à l'appelant, en UN point — l'active exclue de `friendly_sids`
-        # rend `active_relevant_enemies` vide, donc `in_enemy_ez` tombe avec, sans garde
-        # supplémentaire.
+        # filtre est donc ici, à l'appelant, en UN point — une escouade exclue de
+        # `friendly_sids` n'a pas d'entrée dans `relevant_enemies`, donc son `in_enemy_ez` tombe
+        # avec, sans garde supplémentaire.
         on_battlefield: Dict[str, bool] = {}
         for sid in units_cache:
             sid_unit = get_unit_by_id(game_state, str(sid))
@@ -1783,7 +1949,7 @@ class ObservationBuilder:
         # recopier ici ferait diverger « ce que le reseau voit » de « ce que l'action designe ».
         friendly_sids = deployed_friendly_squad_ids(game_state, active_player)
         engaged_squads: set = set()
-        active_relevant_enemies: List[Dict[str, Any]] = []
+        relevant_enemies: Dict[str, List[Dict[str, Any]]] = {}
         # Les entrees de `units_cache` ne portent pas leur identifiant : on retrouve le sid par
         # identite d objet (les entrees rendues par le pruning SONT celles du cache).
         sid_by_entry_id: Dict[int, str] = {id(e): sid for sid, e in units_cache.items()}
@@ -1796,8 +1962,7 @@ class ObservationBuilder:
                 )
                 if on_battlefield.get(str(sid_by_entry_id.get(id(e_entry))), False)
             ]
-            if fsid == active_squad_id:
-                active_relevant_enemies = relevant
+            relevant_enemies[fsid] = relevant
             for e_entry in relevant:
                 if unit_entries_within_engagement_zone(f_entry, e_entry, ez_zone, game_state=game_state):
                     engaged_squads.add(fsid)
@@ -1809,6 +1974,147 @@ class ObservationBuilder:
                         )
                     engaged_squads.add(esid_of_entry)
 
+        return {
+            "player": active_player,
+            "global_cont": g_cont,
+            "global_bin": g_bin,
+            "on_battlefield": on_battlefield,
+            "engaged_squads": engaged_squads,
+            "relevant_enemies": relevant_enemies,
+            # Même source que le masque et le décodeur (invariant D1), lue une fois par camp.
+            "enemy_slot_ids": get_enemy_slot_mapping(game_state, active_player),
+        }
+
+    def build_squad_observation(
+        self,
+        game_state: Dict[str, Any],
+        active_squad_id: str,
+        side: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Construit l'observation squad en TENSEURS D'ENTITÉS (clés : cf. en-tête de section).
+
+        La grille égocentrique est fournie à part par `build_squad_grid` ; l'assemblage du Dict
+        final (avec "grid") est la responsabilité de `W40KEngine._build_observation`.
+
+        ``side`` : contexte partagé du camp (`_side_observation_context`), fourni par
+        `build_side_observations` ; construit ici quand il est absent.
+        """
+        from engine.perf_timing import append_perf_timing_line, perf_timing_enabled
+
+        _perf = perf_timing_enabled(game_state)
+        _t0 = time.perf_counter() if _perf else None
+
+        # C2 cleanup (audit) : message d'erreur explicite si l'ordre d'init est cassé.
+        if not all(k in game_state for k in ("units_cache", "models_cache", "squad_models", "squad_cache")):
+            missing = [k for k in ("units_cache", "models_cache", "squad_models", "squad_cache") if k not in game_state]
+            raise RuntimeError(
+                f"build_squad_observation requires fully initialized caches. "
+                f"Missing: {missing}. Initialize caches via build_units_cache before calling this function."
+            )
+        units_cache = game_state["units_cache"]
+        models_cache = game_state["models_cache"]
+        squad_models = game_state["squad_models"]
+        squad_cache = game_state["squad_cache"]
+
+        if active_squad_id not in units_cache or active_squad_id not in squad_cache:
+            if _perf and _t0 is not None:
+                append_perf_timing_line(
+                    f"SQUAD_OBSERVATION episode={game_state.get('episode_number', '?')} "
+                    f"turn={game_state.get('turn', '?')} squad={active_squad_id} "
+                    f"outcome=squad_absent ctx_s=0.000000 entities_s=0.000000 "
+                    f"total_s={time.perf_counter() - _t0:.6f} entities_n=0"
+                )
+            return self._empty_squad_observation()  # squad dead/absent -> zero observation
+        active_entry = units_cache[active_squad_id]
+        active_sq = squad_cache[active_squad_id]
+        active_player = int(active_entry["player"])
+        active_unit = get_unit_by_id(game_state, str(active_squad_id))
+        if active_unit is None:
+            raise KeyError(f"Unit {active_squad_id} missing from game_state['units'] for observation")
+
+        from engine.spatial_relations import (
+            get_engagement_zone,
+            unit_entries_within_engagement_zone,
+        )
+        from engine.phase_handlers.shared_utils import _synth_model_entry
+        from engine.phase_handlers.shooting_handlers import _ranged_distance_metric
+        from engine.combat_utils import socle_from_cache_entry
+
+        ez_zone = get_engagement_zone(game_state)
+        # Engagement 3D (§03.04) : l'observation mesure EXACTEMENT ce que le moteur résout —
+        # sans rien passer, parce que la primitive applique le gate dès que les deux entrées
+        # portent leurs cartes verticales (cf. `entries_in_engagement_zone`). Laisser l'obs en 2D
+        # pendant que le fight résout en 3D annoncerait à l'agent des engagements que la
+        # résolution refuse (divergence masque/exécution).
+        current_turn = int(game_state.get("turn", 0))  # get allowed (etat non initialise = tour 0)
+        if side is None:
+            side = self._side_observation_context(game_state, active_player)
+        elif int(side["player"]) != active_player:
+            raise ValueError(
+                f"build_squad_observation: contexte du joueur {side['player']} fourni pour "
+                f"l'escouade {active_squad_id} du joueur {active_player}."
+            )
+        # Centroïde : REQUIS. `_compute_squad_cache_entry` le pose toujours (même escouade morte) ;
+        # un repli sur l'ancre de l'unité déplacerait l'origine T-I en silence sur un cache
+        # incomplet — même famille que les replis fermés en §0.32 T-J.
+        #
+        # §0.40 point 4 : SAUF si l'escouade n'est pas encore posée. Son centroïde vaut alors
+        # (-1,-1) — la moyenne des figurines, toutes à la sentinelle « pas sur le board ». Tout ce
+        # que l'obs exprime « depuis moi » était donc mesuré depuis un coin HORS PLATEAU : sur le
+        # scénario d'entraînement, l'agent voyait l'objectif 0 à 38,3 (le plus proche) alors qu'il
+        # est à 178,9 de sa zone, et ne voyait pas l'objectif 4 à 11,3 — l'ORDRE des objectifs
+        # était inversé, et les 3 actions de zone s'appuient sur ces nombres.
+        # L'origine devient celle de la grille (`squad_grid_anchor`, §0.40 point 2), ce qui REND
+        # l'invariant T-I ci-dessous : un seul repère pour toute l'observation. Sans cela, le
+        # vecteur et la grille décriraient deux régions différentes du plateau.
+        active_not_deployed = require_key(active_unit, "deployed_on_turn") is None
+        if active_not_deployed:
+            _anchor_col, _anchor_row = self.squad_grid_anchor(game_state, active_squad_id)
+            cx, cy = float(_anchor_col), float(_anchor_row)
+        else:
+            cx = float(require_key(active_sq, "centroid_col"))
+            cy = float(require_key(active_sq, "centroid_row"))
+        # Origine des positions RELATIVES, dans la projection `_hex_center` (§0.32 T-I) : la même
+        # origine que les directions d'objectif (`_squad_objective_geometry`), donc un seul repère
+        # pour tout ce que l'observation exprime « depuis moi ».
+        anchor_x, anchor_y = _hex_center(int(round(cx)), int(round(cy)))
+
+        obs = self._empty_squad_observation()
+
+        # === CONTEXTE GLOBAL === partagé par le camp (`_side_observation_context`), sauf la
+        # géométrie des objectifs, mesurée depuis CETTE escouade.
+        g_cont = obs["global_cont"]
+        g_bin = obs["global_bin"]
+        g_cont[:] = side["global_cont"]
+        g_bin[:] = side["global_bin"]
+        # Où est cet objectif, depuis MOI : distance (continue, brute) + direction unitaire.
+        # La grille égocentrique ne porte que ce qui tombe dans le budget d'Advance ; au-delà,
+        # ces trois nombres sont la SEULE trace d'un objectif que 3 actions de zone désignent.
+        obj_dist, obj_cos, obj_sin = self._squad_objective_geometry(game_state, cx, cy)
+        for i in range(self.SQUAD_N_OBJECTIVE_SLOTS):
+            g_cont[global_cont_index(f"objective_distance_{i}")] = obj_dist[i]
+            g_bin[global_bin_index(f"objective_dir_cos_{i}")] = obj_cos[i]
+            g_bin[global_bin_index(f"objective_dir_sin_{i}")] = obj_sin[i]
+
+
+        # === DÉCISION AGENT EN ATTENTE (V11 §9.3 P2) ===
+        self._encode_pending_decision(game_state, obs, active_player)
+        # §0.40 point 3 — ce que chaque slot 4-8 poserait réellement. Après le contexte global :
+        # il lui faut l'origine de mesure (`anchor_x/y`), déjà établie plus haut.
+        self._encode_deployment_candidates(
+            game_state, obs, str(active_squad_id), anchor_x, anchor_y,
+            active_not_deployed=active_not_deployed,
+        )
+
+        # === ENGAGEMENT (règle 03.04) — passe unique du camp (`_side_observation_context`) ===
+        on_battlefield: Dict[str, bool] = side["on_battlefield"]
+        engaged_squads: set = side["engaged_squads"]
+        # L'active absente des escouades posées (pas encore mise en place, §0.40 point 5) n'a
+        # aucun ennemi pertinent : `in_enemy_ez` tombe avec.
+        active_relevant_enemies: List[Dict[str, Any]] = side["relevant_enemies"].get(
+            str(active_squad_id), []
+        )  # get allowed (escouade active hors table)
+
         # === FIGURINES DE L'UNITÉ ACTIVE (bloc irréductiblement individuel) ===
         # Contact par figurine = présence dans la ZONE D'ENGAGEMENT (03.04) : même primitive que
         # le moteur, sur des entrées synthétiques par figurine (comme get_fighting_models).
@@ -1961,24 +2267,30 @@ class ObservationBuilder:
             "engagement_zone": ez_zone,
             # V11 §9.5 P4 — portée MAXIMALE en subhexes des armes de tir de l'unité active.
             "active_max_ranged_range": _active_max_ranged_range,
+            # Mode vérification du cache d'encodage intrinsèque, lu UNE fois par observation.
+            "verify_entity_encoding": mask_verification_enabled(game_state),
         }
 
         def _write_entity(prefix: str, row: int, sid: str, *, is_ally: bool, is_active: bool) -> None:
+            # Continus, binaires et types sont écrits DANS la ligne (vues de l'observation, nulles
+            # à ce stade) ; les armes viennent du cache de profils et y sont copiées.
             (
-                e_cont, e_bin, e_ability_ids, e_status_ids,
-                e_wpn_cont, e_wpn_bin, e_wpn_rule_ids, e_types_cont, e_types_bin,
+                _e_cont, _e_bin, e_ability_ids, e_status_ids,
+                e_wpn_cont, e_wpn_bin, e_wpn_rule_ids, _e_types_cont, _e_types_bin,
             ) = self._encode_unit_entity(
-                game_state, sid, ctx, is_ally=is_ally, is_active=is_active
+                game_state, sid, ctx, is_ally=is_ally, is_active=is_active,
+                out={
+                    "cont": obs[f"{prefix}_cont"][row],
+                    "bin": obs[f"{prefix}_bin"][row],
+                    "types_cont": obs[f"{prefix}_types_cont"][row],
+                    "types_bin": obs[f"{prefix}_types_bin"][row],
+                },
             )
-            obs[f"{prefix}_cont"][row] = e_cont
-            obs[f"{prefix}_bin"][row] = e_bin
             obs[f"{prefix}_ability_ids"][row] = e_ability_ids
             obs[f"{prefix}_status_ids"][row] = e_status_ids
             obs[f"{prefix}_wpn_cont"][row] = e_wpn_cont
             obs[f"{prefix}_wpn_bin"][row] = e_wpn_bin
             obs[f"{prefix}_wpn_rule_ids"][row] = e_wpn_rule_ids
-            obs[f"{prefix}_types_cont"][row] = e_types_cont
-            obs[f"{prefix}_types_bin"][row] = e_types_bin
 
         # === ENTITÉS AMIES — l'ordre des slots EST celui de l'action d'activation (invariant D1)
         # Ligne 0 = l'unité ACTIVE (contrat, cf. en-tête de section). Depuis V11 §0.48 élément L2,
@@ -1997,7 +2309,7 @@ class ObservationBuilder:
         # === ENTITÉS ENNEMIES — l'ordre des slots EST celui de l'action de tir (invariant D1) ===
         # Source unique partagée avec le masque (build_squad_action_mask) et l'exécution
         # (action_decoder) : obs-slot-i et action-slot-i décrivent le MÊME ennemi.
-        enemy_slot_ids = get_enemy_slot_mapping(game_state, active_player)
+        enemy_slot_ids = side["enemy_slot_ids"]
         for slot_i in range(self.K_ENEMY_SLOTS):
             esid = enemy_slot_ids[slot_i] if slot_i < len(enemy_slot_ids) else None
             if esid is None or esid not in units_cache:
@@ -2015,6 +2327,52 @@ class ObservationBuilder:
             )
         return obs
 
+    def build_side_observations(
+        self, game_state: Dict[str, Any], player: int
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """Observations complètes (grille comprise) de TOUTES les escouades vivantes de `player`.
+
+        Pour les appelants qui interrogent un camp escouade par escouade (macro/micro, PvE) :
+        le contexte partagé du camp (`_side_observation_context` — contexte global, passe
+        d'engagement, slots ennemis) est calculé UNE fois, puis chaque escouade n'écrit que ce
+        qui se mesure depuis elle. Résultat identique, clé pour clé, à des appels successifs de
+        `build_squad_observation` + `build_squad_grid`.
+
+        Tableaux NEUFS même quand les tampons préalloués sont actifs : l'appelant tient toutes
+        les observations à la fois, ce que le contrat d'alias des tampons interdit.
+
+        Hors phase de move seulement : en move, la grille relit la carte de cellules que le masque
+        mémoïse pour la SEULE escouade active (T-K) ; pour les autres, `build_squad_grid` lève,
+        comme en appel escouade par escouade.
+        """
+        from engine.perf_timing import append_perf_timing_line, perf_timing_enabled
+
+        _perf = perf_timing_enabled(game_state)
+        _t0 = time.perf_counter() if _perf else None
+        player_int = int(player)
+        squad_ids = [
+            str(sid)
+            for sid, entry in require_key(game_state, "units_cache").items()
+            if int(require_key(entry, "player")) == player_int
+        ]
+        buffers, self._obs_buffers = self._obs_buffers, None
+        try:
+            side = self._side_observation_context(game_state, player_int) if squad_ids else None
+            observations: Dict[str, Dict[str, np.ndarray]] = {}
+            for sid in squad_ids:
+                obs = self.build_squad_observation(game_state, sid, side=side)
+                obs["grid"] = self.build_squad_grid(game_state, sid)
+                observations[sid] = obs
+        finally:
+            self._obs_buffers = buffers
+        if _perf and _t0 is not None:
+            append_perf_timing_line(
+                f"SIDE_OBSERVATIONS episode={game_state.get('episode_number', '?')} "
+                f"turn={game_state.get('turn', '?')} player={player_int} "
+                f"squads_n={len(squad_ids)} total_s={time.perf_counter() - _t0:.6f}"
+            )
+        return observations
+
     # ========================================================================
     # T1 — GRILLE SPATIALE EGOCENTRIQUE (move_action_space_spatial_rework §6.2)
     # ========================================================================
@@ -2109,29 +2467,20 @@ class ObservationBuilder:
         et le decoder (T3). Layout (C,H,W) = convention CNN de sb3 (`NatureCNN`).
 
         Rasterisation depuis les caches existants (spec §7 T1) : `wall_hexes`, `models_cache`,
-        `enemy_adjacent_hexes_player_*`. On itere le CONTENU (sparse) et non la fenetre : a
-        half_extent=60 la fenetre fait ~17 900 hexes, alors que murs+figurines+EZ en couvrent
-        une fraction.
+        `enemy_adjacent_hexes_player_*`. Les canaux du plateau sont recueillis dans un raster
+        statique par episode, ceux des unites dans une surcouche par escouade reprojetee quand
+        sa geometrie change (`engine/squad_grid_layers`) ; seuls la dilatation du couvert et le
+        cout du pool de move sont refaits a chaque appel.
         """
         from engine.spatial_grid import (
-            GRID_CHANNELS,
-            GRID_CH_ALLY,
-            GRID_CH_COVER,
-            GRID_CH_ENEMY,
-            GRID_CH_EZ,
-            GRID_CH_LEVEL,
             GRID_CH_MOVE_COST,
-            GRID_CH_OBJECTIVE,
-            GRID_CH_SELF,
-            GRID_CH_WALL,
             GRID_SIZE,
             cover_dilation_cells,
             dilate_channel,
             grid_half_extent_subhex,
-            hex_arrays_to_cells,
         )
 
-        grid = np.zeros((GRID_CHANNELS, GRID_SIZE, GRID_SIZE), dtype=np.float32)
+        grid = self._empty_squad_grid()
 
         units_cache = require_key(game_state, "units_cache")
         if active_squad_id not in units_cache:
@@ -2143,27 +2492,13 @@ class ObservationBuilder:
         anchor_col, anchor_row = self.squad_grid_anchor(game_state, active_squad_id)
 
         half_extent = grid_half_extent_subhex(game_state, active_squad_id)
+        layers = self._squad_grid_layers(game_state)
 
-        def _paint_arrays(channel: int, cols: np.ndarray, rows: np.ndarray, value: float = 1.0) -> None:
-            """Peint un LOT d'hexes (tableaux) sur un canal. Hors grille ecarte (pas de clamp)."""
-            if cols.size == 0:
-                return
-            gx, gy, valid = hex_arrays_to_cells(cols, rows, anchor_col, anchor_row, half_extent)
-            if not valid.any():
-                return
-            np.maximum.at(grid[channel], (gy[valid], gx[valid]), np.float32(value))
-
-        def _paint(channel: int, hexes, value: float = 1.0) -> None:
-            if not hexes:
-                return
-            cols = np.fromiter((h[0] for h in hexes), dtype=np.int64, count=len(hexes))
-            rows = np.fromiter((h[1] for h in hexes), dtype=np.int64, count=len(hexes))
-            _paint_arrays(channel, cols, rows, value)
-
-        static = self._static_hex_arrays(game_state)
-
-        # --- Canal 0 : murs ---------------------------------------------------
-        _paint_arrays(GRID_CH_WALL, *static["walls"])
+        # --- Canaux 0/4/6/5 : murs, objectifs, couvert (avant dilatation), niveau -------
+        # Recueil fenetre du raster statique de l'episode (`engine/squad_grid_layers`), memoise
+        # par ancre : sur le board x5 les objectifs sont des ZONES (~10 500 hexes), c'etait de
+        # loin la peinture la plus lourde, refaite a chaque decision.
+        grid[list(STATIC_CHANNELS)] = layers.static.window(anchor_col, anchor_row, half_extent)
 
         # --- Canaux 1/2/7 : occupation self / alliee / ennemie ----------------
         # V11 §0.32 T-L : l'escouade ACTIVE a son propre canal. La grille est centree sur elle et
@@ -2187,9 +2522,6 @@ class ObservationBuilder:
                 if model is None:
                     continue
                 sink.append((int(model["col"]), int(model["row"])))
-        _paint(GRID_CH_SELF, self_hexes)
-        _paint(GRID_CH_ALLY, ally_hexes)
-        _paint(GRID_CH_ENEMY, enemy_hexes)
 
         # --- Canal 3 : EZ ennemie ---------------------------------------------
         # Meme ensemble que celui consomme par le pool BFS (source unique de la regle).
@@ -2203,44 +2535,26 @@ class ObservationBuilder:
             from engine.phase_handlers.shared_utils import build_enemy_adjacent_hexes
 
             ez_hexes = build_enemy_adjacent_hexes(game_state, active_player)
-        _paint(GRID_CH_EZ, list(ez_hexes))
 
-        # --- Canal 4 : objectifs ----------------------------------------------
-        # Sur le board x5 les objectifs sont des ZONES (~10 500 hexes), pas des points : c'est
-        # de loin le canal le plus lourd, d'ou la memoisation ci-dessus.
-        _paint_arrays(GRID_CH_OBJECTIVE, *static["objectives"])
+        # Surcouche dynamique de l'escouade, reprojetee seulement si la geometrie lue ci-dessus
+        # (hexes des figurines, ensemble EZ) a change depuis sa derniere decision.
+        grid[list(DYNAMIC_CHANNELS)] = layers.overlay(
+            active_squad_id, anchor_col, anchor_row, half_extent,
+            (self_hexes, ally_hexes, enemy_hexes), ez_hexes,
+        )
 
-        # --- Canal 6 : couvert -------------------------------------------------
+        # --- Canal 6 : dilatation du couvert ------------------------------------
         # Hexes des terrain areas, PUIS dilatation du rayon de socle de l escouade active :
         # la regle 13.08 accorde le couvert des que le SOCLE chevauche la zone, donc les cases
         # de la couronne autour de la zone donnent aussi le couvert. Sans dilatation, l agent
         # voyait ces cases a 0 alors qu elles couvrent (ecart ~2 cellules pour un socle
         # d infanterie de 16 subhex sur le board x5). Dilatation en espace grille : exacte au
         # grain de la grille et de cout negligeable.
-        _paint_arrays(GRID_CH_COVER, *static["cover"])
         grid[GRID_CH_COVER] = dilate_channel(
             grid[GRID_CH_COVER],
             cover_dilation_cells(require_key(active_entry, "BASE_SIZE"), half_extent),
         )
 
-        # --- Canal 5 : niveau (etages) ----------------------------------------
-        # Vaut 0 partout tant qu'aucun etage n'est declare : le sol EST le niveau 0, ce n'est
-        # pas une absence de donnee (les etages sont un chantier en cours, spec §6.1).
-        terrain_areas = game_state.get("terrain_areas", [])  # get allowed (scenario sans terrain)
-        from engine.terrain_utils import floor_levels_present
-
-        levels = floor_levels_present(terrain_areas)
-        if levels:
-            from engine.terrain_utils import floor_hexes_at_level
-
-            max_level = float(levels[-1])
-            for level in levels:
-                _paint(
-                    GRID_CH_LEVEL,
-                    list(floor_hexes_at_level(terrain_areas, level)),
-                    value=float(level) / max_level,
-                )
-
         # --- Canal 8 : cout geodesique du pool de move (V11 §0.32 T-K) --------
         # Ce cout etait deja calcule a chaque activation POUR LE MASQUE, puis jete — alors que
         # c'est lui qui arbitre normal vs advance (`classify_squad_move_type`), donc le droit de
@@ -82,8 +82,10 @@ Lignes typiques (référence) :
   réellement écrites), ``outcome`` (``built`` / ``squad_absent``).
 - ``SQUAD_ACTION_MASK`` — un masque d'actions (``build_squad_action_mask``) : ``cell_map_s``
   (uniquement ``build_squad_move_cell_map`` quand le masque doit la construire lui-même — nul si
-  l'appelant la fournit, cf. paramètre ``move_cell_map``), ``total_s``, ``ones_n`` (actions
-  légales), ``phase``, ``outcome`` (``built`` / ``squad_absent``).
+  l'appelant la fournit, cf. paramètre ``move_cell_map``), une durée par famille
+  (``move_cells_s``, ``shoot_s``, ``shoot_indirect_s``, ``charge_s``, ``charge_pairs_s``,
+  ``fight_s`` — ``SQUAD_ACTION_MASK_FAMILIES``, nulles hors de leur phase), ``total_s``,
+  ``ones_n`` (actions légales), ``phase``, ``outcome`` (``built`` / ``squad_absent``).
 - ``SQUAD_MOVE_CELL_MAP`` — carte des cellules de move (``build_squad_move_cell_map``) :
   ``cache_hit`` (1 = servie par la mémoïsation intra-step, les autres durées sont alors nulles),
   ``fp_s`` (calcul du fingerprint de cache, payé même sur un hit), ``pool_s``
@@ -91,6 +93,12 @@ Lignes typiques (référence) :
   ``erode_s`` (``erode_move_pool_by_squad_block``, érosion par-figurine), ``project_s``
   (``project_pool_to_grid``), ``total_s``, ``cells_n``. Le taux de hit se lit en comptant les
   lignes ``cache_hit=1`` vs ``cache_hit=0``.
+- ``GEODESIC_FIELD`` — un champ géodésique hex construit par ``geodesic_field_for_origin`` (les
+  hits du cache du move ne journalisent rien, ils sont comptés) : ``outcome`` (``repair`` = ancien
+  champ de la même origine réparé après un déplacement, ``miss`` = BFS complet), ``build_s``,
+  ``field_n``, ``delta_n`` (cases de transit ajoutées + retirées), ``affected_n`` (cases
+  invalidées par la réparation), et les cumuls ``hit_total`` / ``repair_total`` / ``miss_total``
+  de l'état de jeu.
 - ``MOVE_POOL_BUILD`` — ``prep_s`` (caches occupation / EZ), ``bfs_s`` (exploration seule), ``post_bfs_s``
   (union empreintes + écriture état + masque), découpé en ``footprint_union_s`` (construction
   ``move_preview_footprint_zone`` + clés état jusqu’au sync) et ``mask_loops_s`` (uniquement
@@ -146,6 +154,10 @@ Lignes typiques (référence) :
   ``visited_n``, ``strict_closer_calls_n``, ``strict_eval_s``, ``other_filter_s``, ``filter_s``,
   ``start_d_obj`` (distance départ → marqueur). ``strict_eval_s`` mesure le coût du test
   « strictement plus proche » sur toutes les ancres (distance empreinte → palier marqueur).
+- ``AUTOPLACE_MILP`` — une résolution de l'ILP d'auto-placement (``engine/autoplace_milp.py``) :
+  ``label`` (``charge_cover`` / ``charge`` / ``pile_in``), ``nvar``, ``nodes`` (nœuds de
+  branch-and-bound), ``gap`` (écart d'optimalité, -1 sans solution), ``status``, ``budget_exhausted``
+  (1 = budget temps/nœuds atteint : la meilleure affectation trouvée est rendue), ``found``, ``solve_s``.
 """
 
 from __future__ import annotations
@@ -549,7 +561,9 @@ if __name__ == "__main__":
     # gain. D'ou l'ajout des quatre evenements intermediaires, qui etaient mesures mais absents.
     ROWS = [
         ("SQUAD_OBSERVATION",       "total_s",    [("entities_s", "ent"), ("ctx_s", "ctx")],            None, None),
-        ("SQUAD_ACTION_MASK",       "total_s",    [("cell_map_s", "cellmap")],                          None, None),
+        ("SQUAD_ACTION_MASK",       "total_s",    [("cell_map_s", "cellmap"), ("move_cells_s", "move"),
+                                                   ("shoot_s", "shoot"), ("charge_s", "charge"),
+                                                   ("fight_s", "fight")],                               None, None),
         ("SQUAD_MOVE_CELL_MAP",     "total_s",    [("pool_s", "pool"), ("erode_s", "erode")],           None, None),
         ("MOVE_POOL_BUILD",         "total_s",    [("bfs_s", "bfs")],                                   "SQUAD_MOVE_CELL_MAP", "partiel"),
         ("MOVE_DEST_TIMING",        "total_s",    [("attempt_s", "attempt")],                          None, None),
@@ -21,6 +21,8 @@ l allocation.
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from shared.data_validation import require_key
 from engine.utils.weapon_helpers import weapon_has_rule, weapon_rule_parameter
 from engine.weapons.rules import MIN_ANTI_THRESHOLD
@@ -369,6 +371,9 @@ def roll_attack_pool(
 
     Ordre des des (stable, verrouille par les tests) : par attaque, touche -> [reroll touche]
     -> blessure -> [reroll blessure] -> sauvegarde -> [reroll sauvegarde].
+
+    Jumeau par tableaux, a des tires d un `numpy.random.Generator` : `roll_attack_pool_batched`
+    (meme verdict par de, autre ordre de tirage — il ne remplace pas ce roller sur le chemin vif).
     """
     shot_records: List[Dict[str, Any]] = []
     pending_wounds: List[Dict[str, Any]] = []
@@ -557,6 +562,273 @@ def roll_attack_pool(
     }
 
 
+def _evaluate_rolls(
+    rolls: np.ndarray, crit_on: int, target: int, fail_below: int = NATURAL_FAIL_ROLL + 1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """JUMEAU VECTORISE de `_evaluate_roll` : `(critique, reussite)` pour un tableau de des.
+
+    Meme table 05.01, memes operations, element par element. Un 0 (« pas de jet ») n est ni
+    critique ni reussi ; l appelant pose lui-meme le verdict des attaques sans jet.
+    """
+    is_critical = rolls >= crit_on
+    return is_critical, is_critical | ((rolls >= fail_below) & (rolls >= target))
+
+
+#: Causes de relance, codees en `int8` dans `BatchedAttackPool` (0 = pas de relance). Les
+#: chaines sont CELLES du roller unitaire : les consommateurs des records ne voient pas la
+#: difference (cf. `shared_utils._hit_reroll_ability_name` et son jumeau de blessure).
+_HIT_REROLL_CAUSES: Tuple[Optional[str], ...] = (None, "hit_1", "hit_any_fail")
+_WOUND_REROLL_CAUSES: Tuple[Optional[str], ...] = (None, "wound_1", "wound_any_fail", "twin_linked")
+
+
+@dataclass(frozen=True, eq=False)
+class BatchedAttackPool:
+    """Pool d attaques resolu par `roll_attack_pool_batched` : des et verdicts en TABLEAUX.
+
+    Les records (`shot_records` / `pending_wounds`) ne sont construits qu a la demande, par
+    `as_pool_result` : un consommateur qui ne lit que les compteurs ou les jets de sauvegarde
+    (rollout, estimation) ne paie aucun dict. Un de absent vaut 0 (pas de jet, pas de relance).
+
+    Axe « attaque » (n,) : `hit_*`. Axe « touche » (m,) : une entree par touche, touches
+    [SUSTAINED HITS] comprises, dans l ordre (attaque, rang) du roller unitaire.
+    """
+
+    hit_target: int
+    wound_target: int
+    torrent: bool
+    hit_roll: np.ndarray
+    hit_roll_initial: np.ndarray
+    hit_reroll_cause: np.ndarray
+    hit_success: np.ndarray
+    critical_hit: np.ndarray
+    hit_attack: np.ndarray
+    sustained_hit: np.ndarray
+    auto_wound: np.ndarray
+    wound_roll: np.ndarray
+    wound_roll_initial: np.ndarray
+    wound_reroll_cause: np.ndarray
+    wound_success: np.ndarray
+    critical_wound: np.ndarray
+    devastating: np.ndarray
+    save_roll: np.ndarray
+    save_roll_initial: np.ndarray
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return {
+            "attacks": int(len(self.hit_roll)),
+            "hits": int(len(self.hit_attack)),
+            "wounds": int(self.wound_success.sum()),
+        }
+
+    def as_pool_result(self) -> Dict[str, Any]:
+        """Structure de `roll_attack_pool` (`shot_records`, `pending_wounds`, `counts`), cle pour
+        cle : les records sont construits ICI, une fois, a partir des tableaux."""
+        shot_records: List[Dict[str, Any]] = []
+        pending_wounds: List[Dict[str, Any]] = []
+        torrent = self.torrent
+        hit_target, wound_target = self.hit_target, self.wound_target
+        hit_roll = self.hit_roll.tolist()
+        hit_init = self.hit_roll_initial.tolist()
+        hit_cause = self.hit_reroll_cause.tolist()
+        hit_ok = self.hit_success.tolist()
+        crit_hit = self.critical_hit.tolist()
+        sustained = self.sustained_hit.tolist()
+        auto = self.auto_wound.tolist()
+        w_roll = self.wound_roll.tolist()
+        w_init = self.wound_roll_initial.tolist()
+        w_cause = self.wound_reroll_cause.tolist()
+        w_ok = self.wound_success.tolist()
+        w_crit = self.critical_wound.tolist()
+        dev = self.devastating.tolist()
+        s_roll = self.save_roll.tolist()
+        s_init = self.save_roll_initial.tolist()
+
+        # Touches de l attaque `a` : `[bounds[a], bounds[a + 1])` (axe touche trie par attaque).
+        bounds = np.searchsorted(self.hit_attack, np.arange(len(hit_roll) + 1)).tolist()
+        for a in range(len(hit_roll)):
+            cause = _HIT_REROLL_CAUSES[hit_cause[a]]
+            if not hit_ok[a]:
+                miss_rec: Dict[str, Any] = {
+                    "attackRoll": hit_roll[a], "hitResult": "MISS", "hitTarget": hit_target,
+                }
+                if cause is not None:
+                    miss_rec["hitRerollCause"] = cause
+                    miss_rec["attackRollInitial"] = hit_init[a]
+                shot_records.append(miss_rec)
+                continue
+            for j in range(bounds[a], bounds[a + 1]):
+                sustained_hit = sustained[j]
+                base_rec: Dict[str, Any] = {
+                    "attackRoll": None if (torrent or sustained_hit) else hit_roll[a],
+                    "hitResult": "HIT",
+                    "hitTarget": None if torrent else hit_target,
+                }
+                if torrent:
+                    base_rec["autoHit"] = True
+                if sustained_hit:
+                    base_rec["sustainedHit"] = True
+                if crit_hit[a] and not sustained_hit:
+                    base_rec["criticalHit"] = True
+                if cause is not None and not sustained_hit:
+                    base_rec["hitRerollCause"] = cause
+                    base_rec["attackRollInitial"] = hit_init[a]
+                wound_cause = _WOUND_REROLL_CAUSES[w_cause[j]]
+                if wound_cause is not None:
+                    base_rec["woundRerollCause"] = wound_cause
+                    base_rec["strengthRollInitial"] = w_init[j]
+                wound_roll = None if auto[j] else w_roll[j]
+                if not w_ok[j]:
+                    base_rec.update({
+                        "strengthRoll": wound_roll, "strengthResult": "FAILED",
+                        "woundTarget": wound_target,
+                    })
+                    shot_records.append(base_rec)
+                    continue
+                base_rec.update({
+                    "strengthRoll": wound_roll, "strengthResult": "SUCCESS",
+                    "woundTarget": wound_target, "damageDealt": 0,
+                })
+                save_roll = None if dev[j] else s_roll[j]
+                if not dev[j]:
+                    base_rec["saveRoll"] = save_roll
+                    if s_init[j]:
+                        base_rec["saveRollInitial"] = s_init[j]
+                if auto[j]:
+                    base_rec["lethalHit"] = True
+                if w_crit[j]:
+                    base_rec["criticalWound"] = True
+                if dev[j]:
+                    base_rec["devastating"] = True
+                shot_records.append(base_rec)
+                pending_wounds.append({
+                    "save_roll": save_roll, "rec": base_rec, "devastating": dev[j],
+                })
+
+        return {"shot_records": shot_records, "pending_wounds": pending_wounds, "counts": self.counts}
+
+
+def roll_attack_pool_batched(
+    *,
+    n_attacks: int,
+    hit_target: int,
+    wound_target: int,
+    save_threshold_value: int,
+    profile: WeaponAttackProfile,
+    rerolls: RerollProfile,
+    rng: np.random.Generator,
+    hit_fail_below: int = NATURAL_FAIL_ROLL + 1,
+) -> BatchedAttackPool:
+    """`roll_attack_pool` par TABLEAUX : une tirage `Generator` par jambe, regles en masques.
+
+    Memes regles, meme verdict par de que le roller unitaire ([TORRENT], relances d abilites et
+    [TWIN-LINKED], [SUSTAINED HITS], [LETHAL HITS] et son arbitrage, [DEVASTATING WOUNDS]) ;
+    seule change la SOURCE des des. Pour un pool de 40 tirs, le roller unitaire fait ~120 appels
+    `roll_d6` et autant de branches Python ; ici six tirages au plus, quelle que soit la taille.
+
+    Ordre des des (stable, verrouille par le test d equivalence) : par JAMBE et non par attaque —
+    toutes les touches, puis leurs relances, puis toutes les blessures (ordre des touches), leurs
+    relances, les sauvegardes, leurs relances ; dans chaque jambe, l ordre des attaques. C est un
+    AUTRE ordre que celui de `roll_attack_pool` : a graine egale, les des different, la loi non.
+    Le chemin vif garde donc le roller unitaire et son `roll_d6` — les replays seedes par
+    `random.seed` et les tests qui scriptent `random.randint` en dependent, de par de. Ce roller
+    sert les appelants qui tirent leurs propres des (rollouts, estimations) et n ont pas besoin
+    des records : `BatchedAttackPool.as_pool_result` ne les construit qu a la demande.
+    """
+    n = int(n_attacks)
+    no_roll = np.zeros(n, dtype=np.int64)
+    if profile.torrent:
+        # [TORRENT] 24.37 : touche automatique, aucun de, jamais critique.
+        hit_roll = no_roll
+        hit_roll_initial = no_roll
+        hit_cause = np.zeros(n, dtype=np.int8)
+        hit_success = np.ones(n, dtype=bool)
+        critical_hit = np.zeros(n, dtype=bool)
+    else:
+        hit_roll = rng.integers(1, 7, size=n)
+        critical_hit, hit_success = _evaluate_rolls(
+            hit_roll, profile.crit_hit_on, hit_target, hit_fail_below
+        )
+        # Meme priorite de cause que le roller unitaire : `hit_1` d abord, puis `hit_any_fail`.
+        by_one = ~hit_success & (hit_roll == NATURAL_FAIL_ROLL) & rerolls.hit_1
+        redo = by_one | (~hit_success & rerolls.hit_any_fail)
+        hit_cause = np.where(by_one, 1, np.where(redo, 2, 0)).astype(np.int8)
+        hit_roll_initial = np.where(redo, hit_roll, 0)
+        if redo.any():
+            hit_roll = hit_roll.copy()
+            hit_roll[redo] = rng.integers(1, 7, size=int(redo.sum()))
+            critical_hit, hit_success = _evaluate_rolls(
+                hit_roll, profile.crit_hit_on, hit_target, hit_fail_below
+            )
+
+    # [SUSTAINED HITS X] 24.36 : 1 + X touches sur critique, la premiere seule « reelle ».
+    per_attack = np.where(
+        hit_success, 1 + np.where(critical_hit, int(profile.sustained_hits), 0), 0
+    )
+    hit_attack = np.repeat(np.arange(n), per_attack)
+    m = len(hit_attack)
+    first = np.cumsum(per_attack) - per_attack
+    sustained_hit = (np.arange(m) - first[hit_attack]) > 0
+    critical_here = critical_hit[hit_attack] & ~sustained_hit
+    # [LETHAL HITS] 24.23 : l arbitrage ne depend que du profil et des seuils, constant sur le pool.
+    lethal_better = bool(
+        profile.lethal_hits
+        and lethal_hits_auto_wound_is_better(profile, wound_target, save_threshold_value)
+    )
+    auto_wound = critical_here & lethal_better
+
+    rolled = ~auto_wound
+    wound_roll = np.zeros(m, dtype=np.int64)
+    wound_roll[rolled] = rng.integers(1, 7, size=int(rolled.sum()))
+    critical_wound, wound_success = _evaluate_rolls(wound_roll, profile.crit_wound_on, wound_target)
+    failed = rolled & ~wound_success
+    by_one = failed & (wound_roll == NATURAL_FAIL_ROLL) & rerolls.wound_1
+    redo = by_one | (failed & (rerolls.wound_any_fail or profile.twin_linked))
+    wound_cause = np.where(
+        by_one, 1, np.where(redo, 2 if rerolls.wound_any_fail else 3, 0)
+    ).astype(np.int8)
+    wound_roll_initial = np.where(redo, wound_roll, 0)
+    if redo.any():
+        wound_roll[redo] = rng.integers(1, 7, size=int(redo.sum()))
+        critical_wound, wound_success = _evaluate_rolls(
+            wound_roll, profile.crit_wound_on, wound_target
+        )
+    wound_success = wound_success | auto_wound
+    critical_wound = critical_wound & rolled
+
+    # [DEVASTATING WOUNDS] 24.10 : aucune sauvegarde n est FAITE contre une blessure critique.
+    devastating = critical_wound & bool(profile.devastating)
+    saved = wound_success & ~devastating
+    save_roll = np.zeros(m, dtype=np.int64)
+    save_roll[saved] = rng.integers(1, 7, size=int(saved.sum()))
+    redo = (save_roll == NATURAL_FAIL_ROLL) & rerolls.save_1
+    save_roll_initial = np.where(redo, save_roll, 0)
+    if redo.any():
+        save_roll[redo] = rng.integers(1, 7, size=int(redo.sum()))
+
+    return BatchedAttackPool(
+        hit_target=int(hit_target),
+        wound_target=int(wound_target),
+        torrent=bool(profile.torrent),
+        hit_roll=hit_roll,
+        hit_roll_initial=hit_roll_initial,
+        hit_reroll_cause=hit_cause,
+        hit_success=hit_success,
+        critical_hit=critical_hit,
+        hit_attack=hit_attack,
+        sustained_hit=sustained_hit,
+        auto_wound=auto_wound,
+        wound_roll=wound_roll,
+        wound_roll_initial=wound_roll_initial,
+        wound_reroll_cause=wound_cause,
+        wound_success=wound_success,
+        critical_wound=critical_wound,
+        devastating=devastating,
+        save_roll=save_roll,
+        save_roll_initial=save_roll_initial,
+    )
+
+
 def count_selected_hazardous_weapons(
     weapons_by_model: Sequence[Sequence[Dict[str, Any]]],
 ) -> int:
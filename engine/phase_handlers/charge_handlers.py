@@ -25,6 +25,7 @@ from engine.game_state import (
     waaagh_applies_to_unit,
 )
 from engine.hex_utils import hex_distance as _hex_distance
+from engine.charge_enemy_fields import charge_enemy_fields, reset_charge_enemy_fields
 from engine.game_utils import add_console_log, safe_print, add_debug_file_log, enter_phase
 from engine.combat_utils import (
     normalize_coordinates,
@@ -44,6 +45,7 @@ from .shared_utils import (
     get_source_unit_rule_id_for_effect as shared_get_source_unit_rule_id_for_effect,
     get_source_unit_rule_display_name_for_effect as shared_get_source_unit_rule_display_name_for_effect,
     build_occupied_positions_set, build_enemy_occupied_positions_set, compute_candidate_footprint, is_footprint_placement_valid,
+    footprint_placement_valid_mask,
     is_placement_valid_with_clearance, candidate_overlaps_any_unit, wall_blocked_anchors,
     socle_orientation,
     _synth_model_entry,
@@ -755,17 +757,15 @@ def _charge_reverse_goal_bfs_for_eligibility(
         _er_c = int(sum(r for _, r in enemy_occupied) / len(enemy_occupied))
         goal_zone = sorted(goal_zone, key=lambda h: hex_distance(h[0], h[1], _ec_c, _er_c))[:_TRAINING_GOAL_CAP]
         goal_candidates_n = _TRAINING_GOAL_CAP
-    enemy_engagement_zones: Dict[Any, Set[Tuple[int, int]]] = {}
-    for eid, enemy_entry in indexed_enemy_engagement:
-        ec = int(enemy_entry["col"])
-        er = int(enemy_entry["row"])
-        enemy_fp = entry_footprint(enemy_entry)
-        enemy_engagement_zones[eid] = dilate_hex_set(
-            {(int(fc), int(fr)) for fc, fr in enemy_fp},
-            engagement_zone,
-            board_cols,
-            board_rows,
-        )
+    # Zones d'engagement servies par les champs par-ennemi de la phase. Elles contiennent aussi
+    # l'empreinte ennemie et les cases hors plateau (dilatation non bornée) : sans effet ici, le
+    # chevauchement avec l'ennemi est testé AVANT ce préfiltre et le placement a déjà rejeté les
+    # empreintes hors plateau.
+    _enemy_fields = charge_enemy_fields(game_state)
+    enemy_engagement_zones: Dict[Any, FrozenSet[Tuple[int, int]]] = {
+        eid: _enemy_fields.within(eid, entry_footprint(enemy_entry), engagement_zone)
+        for eid, enemy_entry in indexed_enemy_engagement
+    }
     # Pre-filtre hex-distance pour round-vs-round : évite d'appeler unit_entries_within_engagement_zone
     # sur des candidates clairement hors portée euclidienne. Seuil conservatif par ennemi.
     _mover_bs = unit["BASE_SIZE"]
@@ -790,10 +790,25 @@ def _charge_reverse_goal_bfs_for_eligibility(
     rejected_engagement_prefilter_n = 0
     rejected_no_engagement_n = 0
 
-    for anchor_col, anchor_row in goal_zone:
-        anchor = (int(anchor_col), int(anchor_row))
+    goal_anchors = [(int(anchor_col), int(anchor_row)) for anchor_col, anchor_row in goal_zone]
+    # Placement de TOUTES les ancres de but en un lot (dilatation de l'occupation par le noyau
+    # d'empreinte) : l'empreinte d'une ancre refusée n'est alors jamais construite. Sans paire
+    # d'offsets (empreinte legacy), le chemin unitaire reste seul juge.
+    placement_ok: Optional[List[bool]] = None
+    if fp_offset_pair is not None:
+        _t_placement0 = time.perf_counter() if _perf else None
+        placement_ok = footprint_placement_valid_mask(
+            goal_anchors, game_state, occupied_positions, offsets=fp_offset_pair, socle=unit,
+        ).tolist()
+        if _perf and _t_placement0 is not None:
+            goal_placement_s += time.perf_counter() - _t_placement0
+
+    for goal_i, anchor in enumerate(goal_anchors):
         if anchor == start_pos:
             continue
+        if placement_ok is not None and not placement_ok[goal_i]:
+            rejected_placement_n += 1
+            continue
         _t_candidate_fp0 = time.perf_counter() if _perf else None
         candidate_fp = _candidate_footprint_charge(
             anchor[0], anchor[1], unit, game_state, fp_offset_pair
@@ -801,7 +816,7 @@ def _charge_reverse_goal_bfs_for_eligibility(
         if _perf and _t_candidate_fp0 is not None:
             goal_candidate_fp_s += time.perf_counter() - _t_candidate_fp0
         _t_placement0 = time.perf_counter() if _perf else None
-        if not is_footprint_placement_valid(
+        if placement_ok is None and not is_footprint_placement_valid(
             candidate_fp, game_state, occupied_positions,
             anchor=(anchor[0], anchor[1]), socle=unit,
         ):
@@ -973,6 +988,7 @@ def charge_phase_start(game_state: Dict[str, Any]) -> Dict[str, Any]:
     # Clear charge preview state
     game_state["valid_charge_destinations_pool"] = []
     game_state["_charge_dest_bfs_cache"] = {}
+    reset_charge_enemy_fields(game_state)  # champs de distance par ennemi (dilatations, champs de plan)
     game_state["_charge_fp_offset_pair_cache"] = {}
     game_state["_has_valid_charge_cache"] = {}
     game_state["_charge_reach_disk_cache"] = {}
@@ -1857,13 +1873,18 @@ def _compute_plan_context(
     target_entries: List[Dict[str, Any]] = []
     target_fps: List[Set[Tuple[int, int]]] = []
     nontarget_entries: List[Dict[str, Any]] = []
+    # (id, empreinte) par ennemi : clés des champs de distance partagés (`charge_enemy_fields`).
+    target_sources: List[Tuple[str, Set[Tuple[int, int]]]] = []
+    nontarget_sources: List[Tuple[str, Set[Tuple[int, int]]]] = []
     for eid, entry in enemy_entries_on_battlefield(units_cache, player):
         cells = set(entry_footprint(entry))
         if str(eid) in declared:
             target_entries.append(entry)
             target_fps.append(cells)
+            target_sources.append((str(eid), cells))
         else:
             nontarget_entries.append(entry)
+            nontarget_sources.append((str(eid), cells))
     # Blocage de traversée SOL par-figurine niveau 0 (ennemis) : une fig ennemie à l'étage ne bloque
     # pas le pas d'un chargeur au sol (03.04). Sert path_blocked (BFS 2D) et les obstacles sol du climb.
     # Miroir move/fight (build_enemy_occupied_positions_set).
@@ -1981,32 +2002,6 @@ def _compute_plan_context(
     # entre distance d'empreinte (hex) et clairance euclidienne (socles ronds). Au-delà = jamais engagé.
     _ENG_MARGIN = within_1_zone
 
-    def _dist_field(seeds: Set[Tuple[int, int]], max_steps: int) -> Dict[Tuple[int, int], int]:
-        """BFS multi-source : distance (hex) de chaque case à ``seeds``, bornée à ``max_steps`` (cases
-        au-delà absentes). Ne traverse pas les murs. Sert à obtenir d_min en O(1) par hex (le calcul de
-        distance par hex via min_distance_between_sets était le 2e poste de coût)."""
-        dist: Dict[Tuple[int, int], int] = {}
-        frontier: List[Tuple[int, int]] = []
-        for s in seeds:
-            if 0 <= s[0] < board_cols and 0 <= s[1] < board_rows:
-                dist[s] = 0
-                frontier.append(s)
-        step = 0
-        while frontier and step < max_steps:
-            step += 1
-            nxt: List[Tuple[int, int]] = []
-            for (c, r) in frontier:
-                for nc, nr in get_hex_neighbors(c, r):
-                    if nc < 0 or nr < 0 or nc >= board_cols or nr >= board_rows:
-                        continue
-                    cell = (nc, nr)
-                    if cell in dist or (not fly_active and cell in wall_hexes):
-                        continue
-                    dist[cell] = step
-                    nxt.append(cell)
-            frontier = nxt
-        return dist
-
     can_classify = bool(target_fps)
     # 1) Reachability BFS par fig (cheap) + champs de distance (cibles / non-cibles), calculés 1×.
     reach_by_model: Dict[str, List[Tuple[int, int]]] = {}
@@ -2060,11 +2055,14 @@ def _compute_plan_context(
                 )
             if _perf and _tb is not None:
                 _acc_bfs += time.perf_counter() - _tb
-        tgt_union: Set[Tuple[int, int]] = set()
-        for tfp in target_fps:
-            tgt_union |= tfp
+        # Champs cibles / non-cibles : union (min point à point) des champs PAR ENNEMI de la phase,
+        # partagés entre figurines, plans et chargeurs tant qu'aucune figurine n'a bougé. Même
+        # résultat que le BFS multi-source depuis l'union des empreintes (mêmes murs, même borne).
+        _enemy_fields = charge_enemy_fields(game_state)
         _td = time.perf_counter() if _perf else None
-        dist_tgt = _dist_field(tgt_union, int(budget))
+        dist_tgt = _enemy_fields.distance_field(
+            target_sources, int(budget), board_cols, board_rows, wall_hexes, walls_block=not fly_active
+        )
         if _perf and _td is not None:
             _acc_distfield += time.perf_counter() - _td
         for m in list(reach_by_model.keys()):
@@ -2072,11 +2070,11 @@ def _compute_plan_context(
             sfp = _charge_model_footprint(game_state, sib, int(sib["col"]), int(sib["row"]))
             start_min_by_model[m] = min((dist_tgt.get(h, INF) for h in sfp), default=INF)
         if nontarget_entries:
-            ntgt_union: Set[Tuple[int, int]] = set()
-            for ne in nontarget_entries:
-                ntgt_union |= set(entry_footprint(ne))
             _td2 = time.perf_counter() if _perf else None
-            dist_ntgt = _dist_field(ntgt_union, ez + _ENG_MARGIN)
+            dist_ntgt = _enemy_fields.distance_field(
+                nontarget_sources, ez + _ENG_MARGIN, board_cols, board_rows, wall_hexes,
+                walls_block=not fly_active,
+            )
             if _perf and _td2 is not None:
                 _acc_distfield += time.perf_counter() - _td2
 
@@ -2706,6 +2704,29 @@ def charge_unit_activation_start(game_state: Dict[str, Any], unit_id: str) -> No
     charge_record_declaration(game_state, unit_id)
 
 
+def _charge_squads_in_reach(
+    game_state: Dict[str, Any], charger_id: str, charger_entry: Dict[str, Any], charger_socle: Any,
+    max_distance: int,
+) -> Optional[Set[str]]:
+    """Escouades qu'une mesure EUCLIDIENNE bord-à-bord ``<= max_distance`` (subhex) peut retenir.
+
+    Sur-ensemble (broad-phase de ``model_spatial_index``) : l'appelant garde ``ranged_in_range``
+    pour trancher, seules les escouades hors de ce sur-ensemble sont écartées sans mesure.
+    ``None`` pour un chargeur hors table : il n'a pas de position à indexer, et l'appelant
+    retombe sur sa boucle complète.
+    """
+    from engine.combat_utils import socle_from_cache_entry
+    from engine.hex_utils import ENGAGEMENT_NORM_HEX_WIDTH
+    from engine.model_spatial_index import model_spatial_index
+
+    if not entry_is_on_battlefield(charger_entry):
+        return None
+    socle = charger_socle if charger_socle is not None else socle_from_cache_entry(charger_entry)
+    return model_spatial_index(game_state).squads_within_reach(
+        socle, max_distance * ENGAGEMENT_NORM_HEX_WIDTH, exclude_squad=charger_id
+    )
+
+
 def charge_build_valid_targets(game_state: Dict[str, Any], unit_id: str, max_distance: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Build list of valid charge targets for unit activation.
@@ -2770,10 +2791,22 @@ def charge_build_valid_targets(game_state: Dict[str, Any], unit_id: str, max_dis
     # déclarable. Le pool BFS n'est mis en cache que pour la déclaration à 12" sans cible.
     enemy_index: List[Tuple[Any, Dict[str, Any], Set[Tuple[int, int]]]] = []
     _out_of_range: List[str] = []
+    # Même borne que `charge_target_within_max_distance`, pré-filtrée par l'index de figurines
+    # (None en hex : la primitive mesure alors chaque ennemi, comme avant).
+    _in_reach = (
+        _charge_squads_in_reach(game_state, unit_id_str, unit_entry, None, effective_max)
+        if _edm_bvt() == "euclidean" else None
+    )
     for enemy_id in enemies:
         enemy_entry = units_cache.get(str(enemy_id))
         if enemy_entry is None:
             raise KeyError(f"Enemy {enemy_id} not in units_cache (dead or absent)")
+        if _in_reach is not None and str(enemy_id) not in _in_reach:
+            _out_of_range.append(
+                f"unit_{enemy_id}(col={enemy_entry['col']},row={enemy_entry['row']})"
+                f" out_of_max_distance={effective_max}"
+            )
+            continue
         # 11.04 BEFORE MOVING « within the maximum distance of your unit » — meme borne que le
         # chemin gym (`charge_build_valid_plan`), lue dans la MEME fonction. Ici aussi la seule
         # borne etait « une destination du pool BFS engage cet ennemi », donc une portee de
@@ -3312,11 +3345,19 @@ def _has_valid_charge_target(game_state: Dict[str, Any], unit: Dict[str, Any],
     if _charge_distance_metric(game_state) == "euclidean":
         from engine.combat_utils import ranged_in_range, socle_from_cache_entry
         units_cache = require_key(game_state, "units_cache")
-        _charger_socle = socle_from_cache_entry(require_key(units_cache, str(unit["id"])))
+        _charger_entry = require_key(units_cache, str(unit["id"]))
+        _charger_socle = socle_from_cache_entry(_charger_entry)
         _unit_player = int(unit["player"])
+        # Broad-phase par l'index de figurines : seules les escouades dont une figurine peut être
+        # à 12" sont mesurées par `ranged_in_range`, qui garde le verdict. Sans elle, chaque
+        # escouade du joueur actif mesurait tout l'ennemi, plateau entier.
+        _in_reach = _charge_squads_in_reach(
+            game_state, _uid, _charger_entry, _charger_socle, int(CHARGE_MAX_DISTANCE)
+        )
         _elig = any(
             ranged_in_range(_charger_socle, socle_from_cache_entry(e), int(CHARGE_MAX_DISTANCE), "euclidean")
             for _eid, e in enemy_entries_on_battlefield(units_cache, _unit_player)
+            if _in_reach is None or str(_eid) in _in_reach
         )
         _hvt_cache[_hvt_key] = _elig
         return _elig
@@ -3951,7 +3992,6 @@ def charge_build_valid_destinations_pool(game_state: Dict[str, Any], unit_id: st
         from engine.hex_utils import (
             ENGAGEMENT_NORM_HEX_WIDTH as _EU_NORM,
             precompute_footprint_offsets as _eu_pfo,
-            dilate_hex_set_unbounded as _eu_dilate,
         )
         from engine.phase_handlers.geodesic_move import _euclidean_move_field as _eu_field_fn
 
@@ -3971,10 +4011,10 @@ def charge_build_valid_destinations_pool(game_state: Dict[str, Any], unit_id: st
         )
 
         # Ancres candidates = cellules du champ proches d'un ennemi (seuil = EZ + rayons, cf. _charge_enemy_prox).
+        _eu_fields = charge_enemy_fields(game_state)
         _eu_near: Set[Tuple[int, int]] = set()
         for (_ene_id, _ce_near), (_pec, _per, _peth) in zip(indexed_enemy_engagement, _charge_enemy_prox):
-            _ce_occ = entry_footprint(_ce_near)
-            _eu_near.update(_eu_dilate({(int(c), int(r)) for c, r in _ce_occ}, _peth))
+            _eu_near.update(_eu_fields.within(_ene_id, entry_footprint(_ce_near), _peth))
 
         valid_destinations = []
         _eu_short = False
@@ -4051,11 +4091,12 @@ def charge_build_valid_destinations_pool(game_state: Dict[str, Any], unit_id: st
 
     # Precompute set of all hexes within proximity threshold of any enemy → O(1) lookup in BFS loop.
     # Use ALL occupied hexes (not just anchor) so multi-model squads are fully covered.
-    from engine.hex_utils import dilate_hex_set_unbounded as _dilate_unbounded
+    # Dilatations servies par les champs par-ennemi de la phase (`charge_enemy_fields`) : calculées
+    # une fois par ennemi et par version de positions, pas une fois par chargeur.
+    _enemy_fields = charge_enemy_fields(game_state)
     _near_enemy_set: Set[Tuple[int, int]] = set()
     for (_ene_id_prox, _ce_prox), (_pec, _per, _peth) in zip(indexed_enemy_engagement, _charge_enemy_prox):
-        _ce_occ_all: Set[Tuple[int, int]] = entry_footprint(_ce_prox)
-        _near_enemy_set.update(_dilate_unbounded({(int(c), int(r)) for c, r in _ce_occ_all}, _peth))
+        _near_enemy_set.update(_enemy_fields.within(_ene_id_prox, entry_footprint(_ce_prox), _peth))
 
     # Opt 3 — neighbor offsets inlinés : évite get_hex_neighbors (normalize_coordinates + int() redondants).
     _BFS_OFF_EVEN = ((0, -1), (1, -1), (1, 0), (0, 1), (-1, 0), (-1, -1))
@@ -4071,12 +4112,10 @@ def charge_build_valid_destinations_pool(game_state: Dict[str, Any], unit_id: st
         _bfs_ee_occ_all = entry_footprint(_bfs_ee)
         if _bfs_is_mover_round and _bfs_ee.get("BASE_SHAPE") == "round":
             # Round-round: proximity set from all model positions (not just anchor)
-            _bfs_rr_near_set[_bfs_eid] = _dilate_unbounded(
-                {(int(c), int(r)) for c, r in _bfs_ee_occ_all}, _bfs_peth
-            )
+            _bfs_rr_near_set[_bfs_eid] = _enemy_fields.within(_bfs_eid, _bfs_ee_occ_all, _bfs_peth)
         else:
-            _bfs_enemy_eng_zones[_bfs_eid] = _dilate_unbounded(
-                {(int(fc), int(fr)) for fc, fr in _bfs_ee_occ_all}, engagement_zone
+            _bfs_enemy_eng_zones[_bfs_eid] = _enemy_fields.within(
+                _bfs_eid, _bfs_ee_occ_all, engagement_zone
             )
 
     _t_bfs0 = time.perf_counter() if _perf else None
@@ -5042,8 +5081,9 @@ def charge_autoplace_plan(
     from collections import deque
     import math
     import numpy as np
-    from scipy.optimize import milp, LinearConstraint, Bounds
+    from scipy.optimize import LinearConstraint
     from scipy.sparse import coo_matrix
+    from engine.autoplace_milp import solve_autoplace_milp
     from engine.hex_utils import min_distance_between_sets, footprints_overlap, dilate_hex_set_unbounded
     from engine.spatial_relations import unit_entries_within_engagement_zone, _entry_is_multi_figure
     from .shared_utils import get_engagement_zone
@@ -5485,11 +5525,14 @@ def charge_autoplace_plan(
                     continue  # hors budget (atteignabilité réelle)
                 edges.append((mid, si, pd))
 
-    def _solve(cover: bool) -> Optional[Dict[str, Tuple[int, int, int]]]:
-        """Résout l'ILP d'affectation ; ``cover`` ajoute la contrainte dure « chaque cible engagée ».
-        Renvoie {mid: (c, r)} ou None si infaisable."""
-        if not edges:
-            return None
+    # Système d'empaquetage (1)(2)(3) et objectif : communs aux deux résolutions (avec / sans
+    # couverture). Construits UNE fois — les paires de conflit (3) sont en O(n_slot²) tests de
+    # chevauchement, le poste le plus cher hors solveur, et la 2e résolution les recalculait.
+    _packing: Dict[str, Any] = {}
+
+    def _packing_system() -> Tuple[List[Any], "np.ndarray"]:
+        if _packing:
+            return _packing["constraints"], _packing["cost"]
         mids_sorted = sorted({e[0] for e in edges})
         mids_idx = {m: i for i, m in enumerate(mids_sorted)}
         used_slots = sorted({e[1] for e in edges})
@@ -5526,21 +5569,8 @@ def charge_autoplace_plan(
         # Les stubs scipy declarent `lb`/`ub` en `float` alors que l'API accepte officiellement
         # un tableau (une borne par ligne) — c'est meme l'usage normal pour un systeme de
         # contraintes. Lacune du typage externe, pas du code : le vecteur est bien ce qu'attend
-        # `milp`. Idem ligne suivante et dans fight_handlers (meme empaquetage).
-        constraints = [LinearConstraint(A, np.zeros(n_pack), np.ones(n_pack))]  # type: ignore[arg-type]
-        # (4) Couverture DURE : chaque cible déclarée présente reçoit ≥ 1 fig l'engageant.
-        if cover:
-            crows: List[int] = []
-            ccols: List[int] = []
-            for ti, t in enumerate(present_target_ids):
-                for e_i, (_mid, si, _pd) in enumerate(edges):
-                    if t in all_slots[si][4]:
-                        crows.append(ti); ccols.append(e_i)
-            if crows:
-                ncov = len(present_target_ids)
-                Ac = coo_matrix(([1.0] * len(crows), (crows, ccols)), shape=(ncov, nvar))
-                # Bornes vectorielles : meme lacune de stubs scipy que ci-dessus.
-                constraints.append(LinearConstraint(Ac, np.ones(ncov), np.full(ncov, float(nvar))))  # type: ignore[arg-type]
+        # `milp`. Idem dans _solve et dans fight_handlers (meme empaquetage).
+        _packing["constraints"] = [LinearConstraint(A, np.zeros(n_pack), np.ones(n_pack))]  # type: ignore[arg-type]
         max_pd = max((e[2] for e in edges), default=0) + 1
         max_dt = max((all_slots[e[1]][3] for e in edges), default=0) + 1
         BIG = 1.0e6
@@ -5548,20 +5578,52 @@ def charge_autoplace_plan(
         sign = 1.0 if mode == "offensive" else -1.0  # offensif → min dist cibles ; défensif → max
         # Toute arête engage ≥1 cible (par construction) → -BIG sur chaque arête maximise le nb de
         # figs engagées ; W2 départage selon le mode (distance aux cibles) ; pd minimise le déplacement.
-        c = np.array(
+        _packing["cost"] = np.array(
             [-BIG
              + sign * W2 * (all_slots[si][3] / max_dt)
              + pd / (max_pd * 1.0e3)
              for (_mid, si, pd) in edges],
             dtype=float,
         )
-        res = milp(c=c, constraints=constraints, integrality=np.ones(nvar),
-                   bounds=Bounds(0, 1), options={"time_limit": 2.0})
-        if res.x is None:
+        return _packing["constraints"], _packing["cost"]
+
+    # Cibles qu'au moins une arête engage. S'il en manque une, la couverture (4) est prouvée
+    # infaisable sans solveur : borne triviale, mais elle évite une résolution entière à chaque
+    # charge « trop courte » pour l'une des cibles.
+    coverable_targets = {t for (_mid, si, _pd) in edges for t in all_slots[si][4]}
+
+    def _solve(cover: bool) -> Optional[Dict[str, Tuple[int, int, int]]]:
+        """Résout l'ILP d'affectation ; ``cover`` ajoute la contrainte dure « chaque cible engagée ».
+        Renvoie {mid: (c, r, niveau)} ou None si infaisable (ou budget épuisé sans solution)."""
+        if not edges:
+            return None
+        if cover and not coverable_targets.issuperset(present_target_ids):
+            return None
+        packing, c = _packing_system()
+        constraints = list(packing)
+        nvar = len(edges)
+        # (4) Couverture DURE : chaque cible déclarée présente reçoit ≥ 1 fig l'engageant.
+        if cover:
+            crows: List[int] = []
+            ccols: List[int] = []
+            for ti, t in enumerate(present_target_ids):
+                for e_i, (_mid, si, _pd) in enumerate(edges):
+                    if t in all_slots[si][4]:
+                        crows.append(ti); ccols.append(e_i)
+            ncov = len(present_target_ids)
+            Ac = coo_matrix(([1.0] * len(crows), (crows, ccols)), shape=(ncov, nvar))
+            # Bornes vectorielles : meme lacune de stubs scipy que ci-dessus.
+            constraints.append(LinearConstraint(Ac, np.ones(ncov), np.full(ncov, float(nvar))))  # type: ignore[arg-type]
+        # Budget temps / nœuds partagé par les auto-placements ; à épuisement, la meilleure
+        # affectation entière trouvée est rendue (cf. engine/autoplace_milp.py).
+        x = solve_autoplace_milp(
+            game_state, "charge_cover" if cover else "charge", c, constraints, squad_id=squad_id
+        )
+        if x is None:
             return None
         out: Dict[str, Tuple[int, int, int]] = {}
-        for e_i, x in enumerate(res.x):
-            if x > 0.5:
+        for e_i, xv in enumerate(x):
+            if xv > 0.5:
                 mid, si, _pd = edges[e_i]
                 out[mid] = (all_slots[si][0], all_slots[si][1], all_slots[si][5])
         return out
@@ -659,7 +659,8 @@ def deployment_build_model_destinations_pool(
         )
     squad_id = str(require_key(model, "squad_id"))
     player = int(require_key(model, "player"))
-    pool_set = _deploy_pool_set(game_state, player, placement_pool_for_squad(game_state, squad_id))
+    pool_override = placement_pool_for_squad(game_state, squad_id)
+    pool_set = _deploy_pool_set(game_state, player, pool_override)
     level = int(level or 0)
     terrain_areas = require_key(game_state, "terrain_areas")
     from engine.terrain_utils import (
@@ -693,8 +694,8 @@ def deployment_build_model_destinations_pool(
     # stationnaire) — jamais l'empreinte hex (qui sur-couvre et poussait le deploy plus loin que le move).
     # Base ronde → test disque↔hexunion _low_clear ; oval/carré → empreinte hex (comme le move non-rond).
     from engine.hex_utils import (
-        _hex_center, _HEX_CIRCUMRADIUS, build_hex_center_index, disc_overlaps_indexed_hexes,
-        round_base_radius_norm,
+        _hex_center, _HEX_CIRCUMRADIUS, base_size_cache_key, build_hex_center_index,
+        disc_overlaps_indexed_hexes, round_base_radius_norm,
     )
     _m_round = _m_shape == "round"
     _m_radius = round_base_radius_norm(_m_base) if _m_round else 0.0
@@ -756,40 +757,62 @@ def deployment_build_model_destinations_pool(
     for (fc, fr) in _model_footprint(game_state, model, int(ref_c), int(ref_r)):
         fx, fy, fz = offset_to_cube(int(fc), int(fr))
         fp_offsets.append((fx - rcx, fy - rcy, fz - rcz))
-    # Filtrage par ÉROSION (même primitive que le suivi de bloc) au lieu d'un `any` par case :
-    # « l'empreinte translatée tient-elle entièrement dans les cases acceptables ? ». Les cases
-    # acceptables sont la zone MOINS les murs et les positions occupées — et elles dépendent du
-    # niveau EFFECTIF de la candidate, d'où une érosion par niveau ATTEIGNABLE (cf. `_levels`).
-    # Mesuré sur l'aire d'arrivée Deep Strike : 1,6 s de `any` par case avant ce filtrage.
-    # Les coordonnées du pool sont déjà normalisées `(int, int)` par `_deploy_pool_set` : la
-    # soustraction d'ensembles fait donc le même travail que la comprehension qui les recastait.
+    # Filtrage par ÉROSION au lieu d'un `any` par case : « l'empreinte translatée tient-elle
+    # entièrement dans les cases acceptables ? ». Les cases acceptables sont la zone MOINS les murs
+    # et les positions occupées — et l'occupation dépend du niveau EFFECTIF de la candidate, d'où
+    # un terme par niveau ATTEIGNABLE (cf. `_levels`). Mesuré sur l'aire d'arrivée Deep Strike :
+    # 1,6 s de `any` par case avant ce filtrage.
     #
-    # Les murs sont retirés UNE FOIS, hors de la boucle : ils ne dépendent pas du niveau, alors que
-    # l'occupation et les sœurs en dépendent. Les refaire par niveau réallouait un ensemble de
-    # ~60 000 tuples pour rien — mesuré 12,7 ms par appel à `level >= 1`. Associativité de la
-    # différence : `(pool − occ − sœurs − lc) − murs == (pool − murs) − occ − sœurs − lc`.
-    # L'occupation déployée est lue ICI, à son unique consommateur, et non pré-calculée dans un
-    # dict par niveau : c'est ce producteur-là qui s'était désynchronisé des niveaux réellement
-    # atteignables. Il ne peut plus, il itère `_levels`.
-    # Murs : ancres où le SOCLE chevauche un mur (géométrie d'hexagone, jumeau exact du move).
-    # `pool_set - wall_hexes` mesurait le mur comme un point, si bien que le déploiement offrait
-    # des cases d'où la figurine ne pouvait plus faire un seul pas (664 sur `terrain-mc1`).
-    pool_free = pool_set - wall_blocked_anchors(game_state, model)
-    allowed_by_level: List[Optional[AbstractSet[Tuple[int, int]]]] = []
+    # L'érosion se SÉPARE (cf. `engine.deployment_erosion`) : « empreinte ⊆ zone − murs » ne
+    # dépend que de la zone et du socle, elle est érodée UNE fois par épisode et partagée avec le
+    # décodeur ; l'occupation (unités posées, sœurs, clairance basse) n'en retranche que les ancres
+    # dont l'empreinte la TOUCHE — une dilatation de quelques centaines de cases, au lieu de
+    # ré-éroder ~60 000 ancres à chaque clic.
+    from engine.deployment_erosion import (
+        deployment_erosion_cache, erode_anchors, footprint_hit_anchors, kernel_cache_key,
+        parity_kernels_from_cube,
+    )
+    board_cols = int(require_key(game_state, "board_cols"))
+    board_rows = int(require_key(game_state, "board_rows"))
+    kernels = parity_kernels_from_cube(fp_offsets)
+
+    def _erode_zone() -> AbstractSet[Tuple[int, int]]:
+        # Murs : ancres où le SOCLE chevauche un mur (géométrie d'hexagone, jumeau exact du move).
+        # `pool_set - wall_hexes` mesurait le mur comme un point, si bien que le déploiement
+        # offrait des cases d'où la figurine ne pouvait plus faire un seul pas (664 sur
+        # `terrain-mc1`).
+        pool_free = pool_set - wall_blocked_anchors(game_state, model)
+        return frozenset(erode_anchors(pool_set, pool_free, kernels, board_cols, board_rows))
+
+    # Clé de zone : la zone de déploiement du joueur, ou l'aire d'arrivée elle-même — un
+    # `frozenset` mémoïsé par `ingress_setup_pool`, dont le hash est calculé une fois. Une aire
+    # non figée n'a pas d'identité stable : elle est érodée sans cache.
+    zone_key = ("zone", player) if pool_override is None else (
+        pool_override if isinstance(pool_override, frozenset) else None
+    )
+    if zone_key is None:
+        zone_kept = _erode_zone()
+    else:
+        zone_kept = deployment_erosion_cache(game_state).eroded(
+            (
+                "model", zone_key, str(_m_shape), base_size_cache_key(_m_base),
+                0 if _m_round else _m_orient, kernel_cache_key(kernels),
+            ),
+            _erode_zone,
+        )
+    kept_by_level: Dict[int, AbstractSet[Tuple[int, int]]] = {}
     for lv in _levels:
         # Occupation des unités déployées AU NIVEAU EFFECTIF de la candidate — plus d'union
-        # tous-niveaux (bug : une fig à l'étage bloquait le sol dessous).
-        allowed = pool_free - _deployed_occupied_positions(game_state, squad_id, level=lv)
-        allowed -= same_squad_by_level.get(lv, set())
+        # tous-niveaux (bug : une fig à l'étage bloquait le sol dessous). Lue ICI, à son unique
+        # consommateur, qui itère `_levels` : elle ne peut plus se désynchroniser des niveaux
+        # réellement atteignables.
+        blocked = _deployed_occupied_positions(game_state, squad_id, level=lv)
+        blocked |= same_squad_by_level.get(lv, set())
         if lv == 0 and _low_clear and not _m_round:
-            allowed -= _low_clear
-        allowed_by_level.append(allowed)
-    # UNE seule érosion pour les deux niveaux : mêmes ancres, mêmes offsets, seul l'ensemble
-    # acceptable change. Deux appels séparés refaisaient les bornes d'ancres et le remappage de
-    # sortie — deux parcours complets du pool, 59,8 ms par appel à `level >= 1`.
-    kept_by_level: Dict[int, Set[Tuple[int, int]]] = dict(
-        zip(_levels, erode_pool_by_block_offsets_multi(pool_set, fp_offsets, allowed_by_level))
-    )
+            blocked |= _low_clear
+        kept_by_level[lv] = zone_kept - footprint_hit_anchors(
+            blocked, kernels, board_cols, board_rows
+        )
     # Le niveau effectif d'une candidate n'est PAS connu d'avance : il vaut le niveau de vue si
     # l'empreinte tient entièrement sur le plancher (§13.06 euclidien), sinon le sol.
     #
@@ -1006,8 +1029,8 @@ def deployment_preview_plan(
     # Clairance verticale — miroir du pool per-fig / du move. Base ronde : le DISQUE ne doit chevaucher
     # aucun hex de clairance (capsule, index spatial). Base non-ronde : empreinte hex ∩ clairance.
     from engine.hex_utils import (
-        _hex_center, _HEX_CIRCUMRADIUS, build_hex_center_index, disc_overlaps_indexed_hexes,
-        round_base_radius_norm,
+        _hex_center, _HEX_CIRCUMRADIUS, base_size_cache_key, build_hex_center_index,
+        disc_overlaps_indexed_hexes, round_base_radius_norm,
     )
     # Gabarit (hauteur ET socle) pris sur la FIGURINE, pas sur l'escouade : le voile rouge de cette
     # fonction juge chaque figurine du plan, et le reste de son verdict (empreinte, plancher) la lit
@@ -39,6 +39,13 @@ from engine.hex_utils import cube_to_offset, offset_to_cube
 # a chaque appel. Aucun cycle ne le justifiait : `engine.terrain_utils` n'importe rien de
 # `engine.phase_handlers`.
 from engine.terrain_utils import resolved_floor_height_at
+from engine.fight_engagement_graph import (
+    active_fight_engagement_graph,
+    close_fight_engagement_graph,
+    graph_enemies_engaged_with,
+    graph_engaged,
+    open_fight_engagement_graph,
+)
 from .shared_utils import (
     # Libelle de token de [CLEAVE] : la cle de `additive_rules_applied`, lue par l afficheur
     # partage. Importee et non reecrite en litteral — c est ce qui lie les deux producteurs
@@ -1402,12 +1409,16 @@ def fight_compute_engaged_snapshot(game_state: Dict[str, Any]) -> Dict[str, bool
         unit_within_engagement_zone_footprints,
     )
 
+    graph = active_fight_engagement_graph(game_state)
     ez = get_engagement_zone(game_state)
     snapshot: Dict[str, bool] = {}
     for u in require_key(game_state, "units"):
         uid = str(require_key(u, "id"))
         if not is_unit_alive(uid, game_state):
             continue
+        if graph is not None:
+            snapshot[uid] = graph_engaged(graph, game_state, uid)
+            continue
         snapshot[uid] = unit_within_engagement_zone_footprints(
             game_state, u, engagement_zone=ez, max_distance=ez,
         )
@@ -1416,28 +1427,22 @@ def fight_compute_engaged_snapshot(game_state: Dict[str, Any]) -> Dict[str, bool
 
 def _fight_units_engaged_with(game_state: Dict[str, Any], unit: Dict[str, Any]) -> List[str]:
     """Liste des ids d'unités ennemies actuellement engagées avec ``unit`` (zone d'engagement)."""
-    from engine.spatial_relations import (
-        get_engagement_zone,
-        unit_entries_within_engagement_zone,
-        engagement_distance_metric,
-    )
+    from engine.spatial_relations import engagement_matrix, get_engagement_zone
 
     ez = get_engagement_zone(game_state)
-    metric = engagement_distance_metric(game_state)
     units_cache = require_key(game_state, "units_cache")
     unit_id_str = str(require_key(unit, "id"))
     entry = units_cache.get(unit_id_str)
     if entry is None:
         raise ValueError(f"Unit {unit_id_str} not in units_cache; cannot compute engagement")
     unit_player = int(require_key(entry, "player"))
-    engaged: List[str] = []
     # Hors table = engagée avec personne (20.01). Même raison que le pool de cibles fight.
     if not entry_is_on_battlefield(entry):
-        return engaged
-    for eid, ce in enemy_entries_on_battlefield(units_cache, unit_player, exclude_id=unit_id_str):
-        if unit_entries_within_engagement_zone(entry, ce, ez, metric=metric):
-            engaged.append(str(eid))
-    return engaged
+        return []
+    graph = active_fight_engagement_graph(game_state)
+    if graph is not None:
+        return graph_enemies_engaged_with(graph, game_state, unit_id_str)
+    return engagement_matrix(game_state, ez).enemies_engaging(unit_id_str, unit_player)
 
 
 def pile_in_targets_within_range(game_state: Dict[str, Any], unit: Dict[str, Any]) -> List[str]:
@@ -1509,7 +1514,15 @@ def pile_in_select_targets_12_03(
 
 
 def _fight_v11_engaged_now(game_state: Dict[str, Any], unit: Dict[str, Any]) -> bool:
-    """True si l'unité est engagée (zone d'engagement) avec ≥1 ennemi MAINTENANT."""
+    """True si l'unité est engagée (zone d'engagement) avec ≥1 ennemi MAINTENANT.
+
+    En phase de combat, lu dans le graphe d'engagement de la phase (`fight_engagement_graph`) :
+    c'est le prédicat de toutes les éligibilités V11 (pile-in, 12.04, overrun, normal fight,
+    consolidation), relu pour chaque escouade à chaque lecture de pool.
+    """
+    graph = active_fight_engagement_graph(game_state)
+    if graph is not None:
+        return graph_engaged(graph, game_state, str(require_key(unit, "id")))
     from engine.spatial_relations import (
         get_engagement_zone,
         unit_within_engagement_zone_footprints,
@@ -1810,6 +1823,7 @@ def fight_v11_start(game_state: Dict[str, Any]) -> None:
     Réinitialise les états de suivi V11 de la phase et positionne la sous-phase.
     """
     enter_phase(game_state, "fight")
+    open_fight_engagement_graph(game_state)
     if "units_fought" not in game_state:
         game_state["units_fought"] = set()
     if "units_charged" not in game_state:
@@ -1958,6 +1972,7 @@ def _fight_v11_phase_complete(game_state: Dict[str, Any]) -> Dict[str, Any]:
     game_state["fight_selector"] = None
     game_state["fight_eligible_units"] = []
     game_state["active_fight_unit"] = None
+    close_fight_engagement_graph(game_state)
     # Purge de securite, jumelle de celle du tir : une declaration d attaque ne survit
     # jamais a sa phase. Laisser une activation en plan est un geste NORMAL du joueur
     # (il declare, puis change d avis et sort de la sous-phase) ; on ne leve donc pas,
@@ -2921,8 +2936,9 @@ def pile_in_autoplace_plan(
     Retour : {"plan": [[model_id, col, row, level], ...]} couvrant toutes les figs vivantes.
     """
     import numpy as np
-    from scipy.optimize import milp, LinearConstraint, Bounds
+    from scipy.optimize import LinearConstraint
     from scipy.sparse import coo_matrix
+    from engine.autoplace_milp import solve_autoplace_milp
     from engine.hex_utils import min_distance_between_sets, footprints_overlap, Socle
     from engine.spatial_relations import unit_entries_within_engagement_zone, engagement_distance_metric
     from engine.terrain_utils import low_clearance_ground_hexes
@@ -3367,12 +3383,10 @@ def pile_in_autoplace_plan(
              for (_mid, si, pd) in edges],
             dtype=float,
         )
-        res = milp(
-            c=c, constraints=[lc], integrality=np.ones(n),
-            bounds=Bounds(0, 1), options={"time_limit": 2.0},
-        )
-        if res.x is not None:
-            for e_i, x in enumerate(res.x):
+        # Budget temps / nœuds partagé avec la charge ; à épuisement, meilleure affectation trouvée.
+        x_best = solve_autoplace_milp(game_state, "pile_in", c, [lc], squad_id=squad_id)
+        if x_best is not None:
+            for e_i, x in enumerate(x_best):
                 if x > 0.5:
                     mid, si, _pd = edges[e_i]
                     sc, sr, soc, _sm, _df, slv = all_slots[si]
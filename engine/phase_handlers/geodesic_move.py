@@ -11,11 +11,34 @@ import math
 from typing import AbstractSet, Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from engine.hex_utils import (
-    geodesic_field, geodesic_field_multi_source, get_neighbors, round_base_radius_norm, _hex_center,
+    GEODESIC_BACKENDS, geodesic_field, geodesic_field_multi_source, get_neighbors,
+    round_base_radius_norm, _hex_center,
     inflate_obstacles_by_footprint as _inflate_obstacles_by_footprint, obstacles_touching_disc,
 )
 
 
+def geodesic_backend() -> str:
+    """Backend du champ géodésique lu dans ``config/game_config.json`` (``move.geodesic_backend``).
+
+    Lu sur la config GLOBALE, pas sur ``game_state["config"]`` : c'est un réglage du processus
+    (même champ rendu quel que soit le backend), pas une règle de la partie. Pas de défaut : clé
+    manquante ou valeur inconnue = erreur explicite.
+    """
+    from config_loader import get_config_loader
+
+    game_config = get_config_loader().get_game_config()
+    if "move" not in game_config:
+        raise KeyError("Missing 'move' section in game_config.json")
+    if "geodesic_backend" not in game_config["move"]:
+        raise KeyError("Missing move['geodesic_backend'] in game_config.json")
+    backend = game_config["move"]["geodesic_backend"]
+    if backend not in GEODESIC_BACKENDS:
+        raise ValueError(
+            f"Invalid move['geodesic_backend'] = {backend!r}, expected one of {GEODESIC_BACKENDS}"
+        )
+    return backend
+
+
 def _euclidean_move_field(
     start_pos: Tuple[int, int],
     base_shape: str,
@@ -45,10 +68,13 @@ def _euclidean_move_field(
             start_pos, board_cols, board_rows, obstacles_traverse,
             budget_norm, radius,
             contact_obstacles=obstacles_touching_disc(obstacles_traverse, start_pos, radius),
+            backend=geodesic_backend(),
         )
     _inflated = _inflate_obstacles_by_footprint(obstacles_traverse, off_even, off_odd)
     _inflated.discard(start_pos)  # start jamais obstacle (geodesic_field lèverait sinon)
-    return geodesic_field(start_pos, board_cols, board_rows, _inflated, budget_norm, 0.0)
+    return geodesic_field(
+        start_pos, board_cols, board_rows, _inflated, budget_norm, 0.0, backend=geodesic_backend()
+    )
 
 
 def _euclidean_move_field_multi(
@@ -75,11 +101,14 @@ def _euclidean_move_field_multi(
             starts, board_cols, board_rows, obstacles_traverse,
             budget_norm, round_base_radius_norm(base_size),
             contact_obstacles=contact_obstacles, contact_start=contact_start,
+            backend=geodesic_backend(),
         )
     _inflated = _inflate_obstacles_by_footprint(obstacles_traverse, off_even, off_odd)
     for s in starts:
         _inflated.discard(s)
-    return geodesic_field_multi_source(starts, board_cols, board_rows, _inflated, budget_norm, 0.0)
+    return geodesic_field_multi_source(
+        starts, board_cols, board_rows, _inflated, budget_norm, 0.0, backend=geodesic_backend()
+    )
 
 
 def _build_level_transitions(
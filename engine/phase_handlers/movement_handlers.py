@@ -52,6 +52,7 @@ from engine.hex_utils import (
     engagement_minimum_clearance_norm,
     euclidean_edge_clearance_round_round,
     dilate_by_kernel,
+    HexBitmap,
     min_distance_between_sets,
     ORIENTATION_STEP_COUNT,
     spread_by_kernel,
@@ -664,7 +665,9 @@ def _invalidate_all_destination_pools_after_movement(game_state: Dict[str, Any])
     - valid_move_destinations_pool (for all units)
     - valid_charge_destinations_pool (for all units)
     - valid_target_pool (for all units in shoot phase)
-    - _target_pool_cache (global cache in shooting_handlers)
+
+    The per-engine target pool cache (engine/target_pool_cache.py) is NOT cleared: its key
+    carries `_unit_move_version`, which the movement itself bumped.
     
     Called after every movement in move, shoot (advance), and charge phases.
     """
@@ -704,10 +707,6 @@ def _invalidate_all_destination_pools_after_movement(game_state: Dict[str, Any])
     for unit in require_key(game_state, "units"):
         if "valid_target_pool" in unit:
             unit["valid_target_pool"] = []
-    
-    # Clear global target pool cache (shooting_handlers)
-    from .shooting_handlers import _target_pool_cache
-    _target_pool_cache.clear()
 
     # Enemy adjacency caches are updated incrementally at movement execution time.
     
@@ -1645,7 +1644,7 @@ def _is_in_enemy_engagement_zone(game_state: Dict[str, Any], unit: Dict[str, Any
         unit_row,
         unit_fp,
         units_cache,
-        enemy_adj if isinstance(enemy_adj, set) else None,
+        enemy_adj if isinstance(enemy_adj, (set, HexBitmap)) else None,
     )
     
     # Log adjacency check result
@@ -11,7 +11,8 @@ import inspect
 import time
 
 if TYPE_CHECKING:
-    from engine.hex_utils import Socle
+    import numpy as np
+    from engine.hex_utils import HexBitmap, Socle
     from engine.phase_handlers.attack_sequence import WeaponAttackProfile
 
 from shared.data_validation import ConfigurationError, require_key, HAZARD_CONTEXT_DESPERATE_ESCAPE
@@ -41,6 +42,15 @@ from engine.action_log_utils import append_action_log, models_segment_for_unit
 # `spatial_grid` ne depend que de `hex_utils` -> import direct sans cycle (il importe
 # `get_squad_move_budget` en local dans sa seule fonction qui en a besoin).
 from engine.spatial_grid import GRID_CELL_COUNT
+# `shoot_target_matrix` est une FEUILLE (aucun import moteur) : pas de cycle non plus.
+from engine.shoot_target_matrix import shoot_target_matrix_after_move, shoot_target_matrix_drop_unit
+# Idem pour `fight_engagement_graph` (son seul import moteur, `spatial_relations`, est local).
+from engine.fight_engagement_graph import (
+    fight_engagement_graph_after_move,
+    fight_engagement_graph_drop_unit,
+)
+# `entity_encoding_cache` est une FEUILLE (aucun import moteur) : pas de cycle.
+from engine.entity_encoding_cache import bump_unit_revision
 # `observation_entities` est une FEUILLE (aucun import moteur) : l'importer au niveau module ne
 # cree pas de cycle. `K_ALLY_SLOTS` y vit parce que l'espace d'action en derive (V11 §0.48 L2).
 from engine.observation_entities import K_ALLY_SLOTS, MAX_DECISION_OPTIONS
@@ -72,6 +82,7 @@ from engine.combat_utils import (
 # ce module au niveau global → aucun cycle.
 from engine.spatial_relations import geometry_is_hex
 from engine.mask_verification import verify_memoised_move_cell_map
+from engine.model_spatial_index import note_model_moved, note_model_removed
 
 # end_activation / _handle_shooting_end_activation argument constants (AI_TURN.md)
 ACTION = "ACTION"
@@ -432,7 +443,7 @@ def _compute_unit_occupied_hexes(
 
 def _occupied_hexes_at_level(
     game_state: Dict[str, Any], level: int, skip: "Any",
-) -> Set[Tuple[int, int]]:
+) -> "HexBitmap":
     """Empreintes par-figurine des unités vivantes situées AU NIVEAU ``level`` (étages).
 
     ``skip(uid, entry) -> bool`` filtre les unités (exclusion / camp). Source par-figurine
@@ -441,7 +452,7 @@ def _occupied_hexes_at_level(
     units_cache = require_key(game_state, "units_cache")
     models_cache = require_key(game_state, "models_cache")
     squad_models = require_key(game_state, "squad_models")
-    occupied: Set[Tuple[int, int]] = set()
+    cells: List[Tuple[int, int]] = []
     for uid, entry in entries_on_battlefield(units_cache):
         if skip(uid, entry):
             continue
@@ -449,16 +460,17 @@ def _occupied_hexes_at_level(
             m = models_cache.get(mid)
             if m is None or int(require_key(m, "level")) != level:
                 continue
-            occupied |= compute_candidate_footprint(int(m["col"]), int(m["row"]), m, game_state)
-    return occupied
+            cells.extend(compute_candidate_footprint(int(m["col"]), int(m["row"]), m, game_state))
+    from engine.hex_utils import board_hex_bitmap
+    return board_hex_bitmap(game_state, cells)
 
 
 def build_occupied_positions_set(
     game_state: Dict[str, Any],
     exclude_unit_id: Optional[str] = None,
     level: Optional[int] = None,
-) -> Set[Tuple[int, int]]:
-    """Build set of all cells occupied by living units (full footprints).
+) -> "HexBitmap":
+    """Build the board bitmap of all cells occupied by living units (full footprints).
 
     Uses occupied_hexes from units_cache for multi-hex units.
     For single-hex units, equivalent to {(col, row)} per unit.
@@ -471,17 +483,18 @@ def build_occupied_positions_set(
             ne se gênent pas — murs verticaux prolongés gérés séparément, cf. stage.md).
 
     Returns:
-        Set of (col, row) cells occupied by other units
+        HexBitmap (contrat de set) des cellules (col, row) occupées par les autres unités
     """
     if level is not None:
         return _occupied_hexes_at_level(
             game_state, level, skip=lambda uid, entry: uid == exclude_unit_id
         )
     units_cache = require_key(game_state, "units_cache")
-    occupied: Set[Tuple[int, int]] = set()
+    cells: List[Tuple[int, int]] = []
     for _uid, entry in entries_on_battlefield(units_cache, exclude_id=exclude_unit_id):
-        occupied.update(entry_footprint(entry))
-    return occupied
+        cells.extend(entry_footprint(entry))
+    from engine.hex_utils import board_hex_bitmap
+    return board_hex_bitmap(game_state, cells)
 
 
 def build_enemy_occupied_positions_set(
@@ -489,8 +502,8 @@ def build_enemy_occupied_positions_set(
     *,
     current_player: int,
     level: Optional[int] = None,
-) -> Set[Tuple[int, int]]:
-    """Cells occupied by opposing players' units (full footprints).
+) -> "HexBitmap":
+    """Cells occupied by opposing players' units (full footprints), as a board bitmap.
 
     ``level`` : None = tous niveaux (historique) ; un entier restreint au niveau donné.
     """
@@ -501,10 +514,11 @@ def build_enemy_occupied_positions_set(
             skip=lambda uid, entry: int(require_key(entry, "player")) == current_player_int,
         )
     units_cache = require_key(game_state, "units_cache")
-    occupied: Set[Tuple[int, int]] = set()
+    cells: List[Tuple[int, int]] = []
     for _uid, entry in enemy_entries_on_battlefield(units_cache, current_player_int):
-        occupied.update(entry_footprint(entry))
-    return occupied
+        cells.extend(entry_footprint(entry))
+    from engine.hex_utils import board_hex_bitmap
+    return board_hex_bitmap(game_state, cells)
 
 
 def compute_candidate_footprint(
@@ -613,6 +627,100 @@ def is_footprint_placement_valid(
     return True
 
 
+def _board_cells_grid(
+    game_state: Dict[str, Any], cells: AbstractSet[Tuple[int, int]]
+) -> "np.ndarray":
+    """Grille bool ``(board_cols, board_rows)`` d'un ensemble de cellules (vue si déjà un bitmap).
+
+    Les cellules hors plateau sont ignorées : une empreinte qui y déborde est refusée par le volet
+    bornes avant que l'occupation ne soit lue.
+    """
+    from engine.hex_utils import HexBitmap, board_hex_bitmap
+
+    board_cols = int(require_key(game_state, "board_cols"))
+    board_rows = int(require_key(game_state, "board_rows"))
+    if isinstance(cells, HexBitmap) and cells.shape == (board_cols, board_rows):
+        return cells.grid
+    return board_hex_bitmap(game_state, cells).grid
+
+
+def footprint_placement_valid_mask(
+    anchors: Any,
+    game_state: Dict[str, Any],
+    occupied_positions: AbstractSet[Tuple[int, int]],
+    enemy_adjacent_hexes: Optional[AbstractSet[Tuple[int, int]]] = None,
+    *,
+    offsets: Tuple[Sequence[Tuple[int, int]], Sequence[Tuple[int, int]]],
+    socle: Mapping[str, Any],
+) -> "np.ndarray":
+    """``is_footprint_placement_valid`` pour un LOT d'ancres : masque bool ``(N,)``, même verdict.
+
+    ``anchors`` : ``(N, 2)`` (tableau ou séquence de ``(col, row)``). ``offsets`` : la paire
+    ``(pair, impair)`` de ``precompute_footprint_offsets`` pour ``socle`` — celle-là même avec
+    laquelle l'appelant construisait ``candidate_hexes``. Un appelant sans paire (empreinte
+    « legacy » de ``compute_candidate_footprint``) reste sur le chemin unitaire.
+
+    Une ancre par appel payait la construction d'un ``set`` de ``|empreinte|`` tuples puis deux
+    intersections ; sur une zone de milliers d'ancres (buts de charge, autoplace), c'était le poste
+    dominant. Ici l'occupation et la zone d'engagement sont des bitmaps plateau, DILATÉS une fois
+    par parité de colonne par le noyau d'empreinte (``dilate_by_kernel``, bornés à la boîte des
+    ancres) : ``hit[a]`` vaut « une case de l'empreinte posée en ``a`` est prise ». Les bornes
+    se lisent sur les extrêmes du noyau (une empreinte est une translation rigide : toutes ses
+    cases sont dans le plateau ssi ses deux coins extrêmes le sont), les murs sur les ancres
+    interdites de ``wall_blocked_anchors``, comme le chemin unitaire.
+    """
+    import numpy as np
+    from engine.hex_utils import dilate_by_kernel
+
+    arr = np.asarray(anchors, dtype=np.int64).reshape(-1, 2)
+    valid = np.zeros(len(arr), dtype=bool)
+    if not len(arr):
+        return valid
+    board_cols = int(require_key(game_state, "board_cols"))
+    board_rows = int(require_key(game_state, "board_rows"))
+    cols, rows = arr[:, 0], arr[:, 1]
+    on_board = (cols >= 0) & (cols < board_cols) & (rows >= 0) & (rows < board_rows)
+
+    blocked = np.zeros((board_cols, board_rows), dtype=bool)
+    if occupied_positions:
+        blocked |= _board_cells_grid(game_state, occupied_positions)
+    if enemy_adjacent_hexes:
+        blocked |= _board_cells_grid(game_state, enemy_adjacent_hexes)
+    walls = _board_cells_grid(game_state, wall_blocked_anchors(game_state, socle))
+
+    bbox = None
+    if on_board.any():
+        bbox = (
+            int(cols[on_board].min()), int(cols[on_board].max()) + 1,
+            int(rows[on_board].min()), int(rows[on_board].max()) + 1,
+        )
+    for parity, kernel_cells in enumerate(offsets):
+        sel = on_board & ((cols & 1) == parity)
+        if not sel.any():
+            continue
+        kernel = np.asarray(kernel_cells, dtype=np.int64).reshape(-1, 2)
+        if not len(kernel):
+            # Empreinte vide : refusée, comme `candidate_hexes` vide dans le chemin unitaire.
+            continue
+        c, r = cols[sel], rows[sel]
+        in_bounds = (
+            (c + int(kernel[:, 0].min()) >= 0) & (c + int(kernel[:, 0].max()) < board_cols)
+            & (r + int(kernel[:, 1].min()) >= 0) & (r + int(kernel[:, 1].max()) < board_rows)
+        )
+        hit = dilate_by_kernel(blocked, kernel, board_cols, board_rows, bbox=bbox)
+        valid[sel] = in_bounds & ~hit[c, r] & ~walls[c, r]
+    # Ancre HORS plateau : hors de toute grille, donc repassée au chemin unitaire — une empreinte
+    # décentrée pourrait encore y tenir, et ce verdict-là n'appartient qu'à lui.
+    for i in np.flatnonzero(~on_board).tolist():
+        ac, ar = int(cols[i]), int(rows[i])
+        offs = offsets[ac & 1]
+        valid[i] = is_footprint_placement_valid(
+            {(ac + dc, ar + dr) for dc, dr in offs}, game_state, set(occupied_positions),
+            enemy_adjacent_hexes, anchor=(ac, ar), socle=socle,
+        )
+    return valid
+
+
 def candidate_overlaps_any_unit(
     game_state: Dict[str, Any],
     candidate: "Socle",
@@ -838,6 +946,8 @@ def recompute_unit_rules_in_effect(game_state: Dict[str, Any], unit_id: str) ->
         native_alive=native_alive or grace_native,
         alive_attached_sources=alive_sources | grace_sources,
     )
+    # Capacites en vigueur = part intrinseque de l'encodage d'entite (`entity_encoding_cache`).
+    bump_unit_revision(game_state, str(unit_id))
 
 
 def _build_models_for_unit(
@@ -1348,6 +1458,8 @@ def remove_from_units_cache(game_state: Dict[str, Any], unit_id: str) -> None:
             f"pos=({entry.get('col')},{entry.get('row')}) HP_CUR={entry.get('HP_CUR')} player={entry.get('player')}"
         )
     game_state["units_cache"].pop(unit_id, None)
+    shoot_target_matrix_drop_unit(game_state, str(unit_id))
+    fight_engagement_graph_drop_unit(game_state, str(unit_id))
     _remove_unit_from_all_activation_pools(game_state, str(unit_id))
 
 
@@ -1536,7 +1648,9 @@ def is_unit_on_objective(unit: Dict[str, Any], game_state: Dict[str, Any]) -> bo
 #   - pair-cache (_unit_los_pair_cache) : dict pur {(s,t): result}, invalidé ciblé (D3)
 #   - los_cache + hex_los_cache : délégués à _invalidate_los_cache_for_moved_unit
 #   - _unit_move_version : bump centralisé (sert _target_pool_cache / _los_cache_version /
-#     enemy_pos_hash — D3)
+#     enemy_pos_hash — D3), puis oubli ciblé des cellules de la matrice de tir de la phase
+#     (engine.shoot_target_matrix) et des lignes du graphe d'engagement du combat
+#     (engine.fight_engagement_graph)
 # Batch (D1) : commit_move encadre ses N écritures pour n'émettre qu'UNE invalidation par unité
 # + UN bump. Réentrant : seul l'ouvreur externe committe.
 
@@ -1562,6 +1676,8 @@ def _apply_los_invalidation(
     _invalidate_los_cache_for_moved_unit(game_state, unit_id, old_col=old_col, old_row=old_row)
     _invalidate_pair_cache_for_unit(game_state, unit_id)
     game_state["_unit_move_version"] += 1
+    shoot_target_matrix_after_move(game_state, (unit_id,))
+    fight_engagement_graph_after_move(game_state, (unit_id,))
 
 
 def _touch_unit_los(
@@ -1605,6 +1721,8 @@ def _los_end_batch(game_state: Dict[str, Any], owned: bool) -> None:
         _invalidate_los_cache_for_moved_unit(game_state, uid, old_col=oc, old_row=orow)
         _invalidate_pair_cache_for_unit(game_state, uid)
     game_state["_unit_move_version"] += 1
+    shoot_target_matrix_after_move(game_state, batch.keys())
+    fight_engagement_graph_after_move(game_state, batch.keys())
 
 
 def assert_los_pair_cache_consistent(game_state: Dict[str, Any]) -> int:
@@ -1729,6 +1847,7 @@ def update_units_cache_position(game_state: Dict[str, Any], unit_id: str, col: i
             if isinstance(models_cache, dict) and mid in models_cache:
                 models_cache[mid]["col"] = col
                 models_cache[mid]["row"] = row
+                note_model_moved(game_state, mid)
                 # La HAUTEUR suit la position au même titre que l'empreinte : les deux cartes
                 # par-figurine sont lues ENSEMBLE par l'engagement 3D (`_vertical_classes`), et
                 # n'en resyncer qu'une laissait la figurine mesurée à l'altitude de son ANCIENNE
@@ -1767,6 +1886,7 @@ def update_units_cache_position(game_state: Dict[str, Any], unit_id: str, col: i
     # Choke-point LoS (a′) : toute écriture d'ancre invalide les caches LoS de l'unité.
     # Couvre translate_squad_to_destination, reactive move, move_after_shooting, deployment.
     _touch_unit_los(game_state, unit_id, old_col, old_row)
+    bump_unit_revision(game_state, unit_id)
 
 
 def get_hp_from_cache(unit_id: str, game_state: Dict[str, Any]) -> Optional[int]:
@@ -1851,6 +1971,7 @@ def update_units_cache_hp(game_state: Dict[str, Any], unit_id: str, new_hp_cur:
             f"old_hp={entry.get('HP_CUR')} new_hp={effective_hp}"
         )
         entry["HP_CUR"] = effective_hp
+        bump_unit_revision(game_state, unit_id_str)
 
 
 def check_if_melee_can_charge(target: Dict[str, Any], game_state: Dict[str, Any]) -> bool:
@@ -2046,7 +2167,7 @@ def get_max_base_size_hex(game_state: Dict[str, Any]) -> int:
     return int(require_key(game_rules, "max_base_size_hex"))
 
 
-def build_enemy_adjacent_hexes(game_state: Dict[str, Any], player: int) -> Set[Tuple[int, int]]:
+def build_enemy_adjacent_hexes(game_state: Dict[str, Any], player: int) -> "HexBitmap":
     """Pre-compute all hexes within engagement_zone of enemy units.
 
     Returns a set of (col, row) that are in the engagement zone of at least one enemy.
@@ -2063,7 +2184,7 @@ def build_enemy_adjacent_hexes(game_state: Dict[str, Any], player: int) -> Set[T
         player: The player checking adjacency (enemies are units with different player)
 
     Returns:
-        Set of hex coordinates in the engagement zone of any living enemy unit
+        HexBitmap (contrat de set) des hexes en zone d'engagement d'au moins un ennemi vivant
     """
     enemy_adjacent_counts, enemy_adjacent_hexes = _compute_enemy_adjacent_cache_for_player_from_units_cache(
         game_state, int(player)
@@ -2079,13 +2200,17 @@ def build_enemy_adjacent_hexes(game_state: Dict[str, Any], player: int) -> Set[T
 
 def _compute_enemy_adjacent_cache_for_player_from_units_cache(
     game_state: Dict[str, Any], player: int
-) -> Tuple[Dict[Tuple[int, int], int], Set[Tuple[int, int]]]:
+) -> Tuple[Dict[Tuple[int, int], int], "HexBitmap"]:
     """Compute per-player engagement-zone counters and set from current units_cache.
 
     For each enemy unit, dilates its occupied_hexes by the engagement zone distance
     (get_engagement_zone = engagement_zone inches × inches_to_subhex), cohérent avec
     l'éligibilité fight/pile-in et le blocage mouvement. NB: avant, ce cache dilatait de
     inches_to_subhex (1") en supposant engagement_zone == 1" ; faux dès engagement_zone ≠ 1".
+
+    La zone est un :class:`HexBitmap` du plateau dilaté par pas hexagonaux NumPy
+    (``HexBitmap.dilate``, même contrat que ``dilate_hex_set`` : sources exclues) ; ce cache est
+    recalculé après CHAQUE move ennemi, et le BFS de tuples dominait son coût à x10.
     """
     units_cache = require_key(game_state, "units_cache")
     board_cols = require_key(game_state, "board_cols")
@@ -2093,8 +2218,8 @@ def _compute_enemy_adjacent_cache_for_player_from_units_cache(
     ez_dilation = int(get_engagement_zone(game_state))
     player_int = int(player)
 
-    all_enemy_occupied: Set[Tuple[int, int]] = set()
-    per_unit_occupied: list = []
+    from engine.hex_utils import HexBitmap
+    all_enemy_occupied: List[Tuple[int, int]] = []
 
     for _uid, entry in enemy_entries_on_battlefield(units_cache, player_int):
         hp_cur = require_key(entry, "HP_CUR")
@@ -2104,14 +2229,11 @@ def _compute_enemy_adjacent_cache_for_player_from_units_cache(
         # EZ mesurée depuis le SOCLE (03.04 « engagement range » + 01.04 « closest part of the
         # model's base ») : dilater l'empreinte COMPLETE des figurines vivantes, pas l'ancre unique.
         # Dilater la seule ancre sous-estime la zone dès qu'un socle couvre plusieurs hexes.
-        unit_cells = set(require_key(entry, "occupied_hexes"))
-        all_enemy_occupied.update(unit_cells)
-        per_unit_occupied.append(unit_cells)
+        all_enemy_occupied.extend(require_key(entry, "occupied_hexes"))
 
-    from engine.hex_utils import dilate_hex_set
-    zone_hexes = dilate_hex_set(all_enemy_occupied, ez_dilation, board_cols, board_rows)
+    zone_hexes = HexBitmap(board_cols, board_rows, all_enemy_occupied).dilate(ez_dilation)
 
-    counts: Dict[Tuple[int, int], int] = {h: 1 for h in zone_hexes}
+    counts: Dict[Tuple[int, int], int] = dict.fromkeys(zone_hexes, 1)
 
     return counts, zone_hexes
 
@@ -2553,7 +2675,8 @@ def _build_reactive_move_destinations_pool(
                 "Cache must be initialized at phase start."
             )
         enemy_adjacent_hexes = require_key(game_state, cache_key)
-        if not isinstance(enemy_adjacent_hexes, set):
+        from engine.hex_utils import HexBitmap
+        if not isinstance(enemy_adjacent_hexes, (set, HexBitmap)):
             raise ValueError(
                 f"Invalid adjacency cache type for '{cache_key}': "
                 f"{type(enemy_adjacent_hexes).__name__}"
@@ -3626,6 +3749,7 @@ def translate_squad_to_destination(
             new_col, new_row = cube_to_offset(mx + dcx, my + dcy, mz + dcz)
             m["col"] = int(new_col)
             m["row"] = int(new_row)
+            note_model_moved(game_state, mid)
             # Niveau d'ARRIVÉE résolu (§13.06), miroir du chemin par plan (`commit_move` →
             # `resolve_model_floor_level`). Une translation rigide peut sortir une figurine de
             # l'empreinte de son plancher : la laisser marquée à l'étage faisait ensuite lever
@@ -3751,6 +3875,7 @@ def update_model_position(
         model["level"] = level
     if orientation is not None:
         model["orientation"] = orientation
+    note_model_moved(game_state, model_id)
 
     squad_id = str(model["squad_id"])
     # PR4 4e-i : sync occupied_hexes_by_model
@@ -3925,6 +4050,7 @@ def destroy_model(game_state: Dict[str, Any], model_id: str, reason: str) -> Non
 
     # 1. Retire du models_cache.
     del game_state["models_cache"][model_id]
+    note_model_removed(game_state, model_id)
     # 2. Retire de squad_models (preserve l ordre des autres figurines).
     squad_list = game_state["squad_models"].get(squad_id)
     if squad_list is not None and model_id in squad_list:
@@ -4549,6 +4675,96 @@ def geodesic_move_reach(
     return field
 
 
+def repair_geodesic_move_reach(
+    field: Dict[Tuple[int, int], int],
+    start: Tuple[int, int],
+    budget: int,
+    added: AbstractSet[Tuple[int, int]],
+    removed: AbstractSet[Tuple[int, int]],
+    transit_blocked: AbstractSet[Tuple[int, int]],
+    board_cols: int,
+    board_rows: int,
+) -> Tuple[Dict[Tuple[int, int], int], int]:
+    """RÉPARE un champ de ``geodesic_move_reach`` après un changement LOCAL des obstacles.
+
+    ``field`` est le champ exact pour l'ancien transit ; ``added`` / ``removed`` sont les cases
+    devenues / plus bloquantes ; ``transit_blocked`` est le NOUVEAU transit. Rend ``(champ, n)`` —
+    un NOUVEAU dict (``field`` n'est pas muté, d'autres lecteurs le tiennent) bit-identique à
+    ``geodesic_move_reach(start, budget, transit_blocked, ...)``, et ``n`` le nombre de cases
+    dont la distance a dû être invalidée.
+
+    Deux temps, à la D* Lite sur un graphe à coûts unitaires :
+
+    1. HAUSSES. Une case ``v`` à distance ``d`` garde sa distance tant qu'il lui reste UN voisin
+       à ``d - 1`` non invalidé. Parcourue par distance croissante depuis les cases nouvellement
+       bloquées, cette règle marque exactement le sous-arbre qui a perdu tout support — seul lui
+       est effacé. Le reste du champ est une borne ATTEIGNABLE sous le nouveau transit.
+    2. BAISSES. Les cases effacées et les cases libérées sont réensemencées depuis leurs voisins
+       encore étiquetés, puis un Dijkstra à coûts unitaires propage toute amélioration. Une case
+       jamais repoussée a une étiquette déjà exacte (elle l'était dans l'ancien champ, et aucun
+       de ses prédécesseurs n'a baissé).
+
+    Le départ n'est jamais invalidé : ``geodesic_move_reach`` ne le teste pas contre le transit.
+    """
+    from collections import defaultdict
+    import heapq
+
+    def _neighbors(cell: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
+        for nc, nr in get_hex_neighbors(cell[0], cell[1]):
+            if 0 <= nc < board_cols and 0 <= nr < board_rows:
+                yield (nc, nr)
+
+    repaired = dict(field)
+    affected: Set[Tuple[int, int]] = set()
+    buckets: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for cell in added:
+        if cell != start and cell in field:
+            affected.add(cell)
+            buckets[field[cell] + 1].extend(
+                nb for nb in _neighbors(cell) if field.get(nb) == field[cell] + 1
+            )
+    level = min(buckets) if buckets else 0
+    while buckets:
+        candidates = buckets.pop(level, ())
+        for cell in candidates:
+            if cell in affected or cell == start:
+                continue
+            if any(
+                field.get(nb) == level - 1 and nb not in affected for nb in _neighbors(cell)
+            ):
+                continue
+            affected.add(cell)
+            buckets[level + 1].extend(
+                nb for nb in _neighbors(cell) if field.get(nb) == level + 1
+            )
+        level += 1
+    for cell in affected:
+        del repaired[cell]
+
+    heap: List[Tuple[int, Tuple[int, int]]] = []
+    for cell in affected | set(removed):
+        if cell in transit_blocked or not (0 <= cell[0] < board_cols and 0 <= cell[1] < board_rows):
+            continue
+        best = min(
+            (repaired[nb] + 1 for nb in _neighbors(cell) if nb in repaired and repaired[nb] < budget),
+            default=None,
+        )
+        if best is not None and best < repaired.get(cell, budget + 1):
+            repaired[cell] = best
+            heapq.heappush(heap, (best, cell))
+    while heap:
+        dist, cell = heapq.heappop(heap)
+        if dist > repaired[cell] or dist >= budget:
+            continue
+        for nb in _neighbors(cell):
+            if nb in transit_blocked:
+                continue
+            if dist + 1 < repaired.get(nb, budget + 1):
+                repaired[nb] = dist + 1
+                heapq.heappush(heap, (dist + 1, nb))
+    return repaired, len(affected)
+
+
 # Le squad move rigide du gym atterrit TOUJOURS au SOL : en `read_only` le pool d'ancre
 # retourne avant son bloc multi-niveaux (`movement_build_valid_destinations_pool`), donc toutes ses
 # destinations sont des cases de niveau 0, et le coût vertical d'une figurine partant d'un étage est
@@ -4813,17 +5029,97 @@ def geodesic_field_for_origin(
     fkey = (str(squad_id), int(player), o_col, o_row, int(level))
     cached = fields.get(fkey)
     if cached is not None and cached[0] >= budget:
+        _geodesic_field_store(game_state)["stats"]["hit"] += 1
         return cached[1]
-    field = geodesic_move_reach(
-        o_col, o_row, budget,
-        build_move_transit_blocked(game_state, str(squad_id), int(player), int(level)),
-        int(require_key(game_state, "board_cols")),
-        int(require_key(game_state, "board_rows")),
-    )
+
+    # Le fingerprint a changé (une figurine a bougé) : le champ de la MÊME origine, calculé sous
+    # l'ancien transit, est RÉPARÉ au lieu d'être refait. Les murs ne bougent jamais et une
+    # activation ne déplace qu'une escouade : l'écart de transit tient en quelques dizaines de
+    # cases, là où le BFS complet en visite des milliers.
+    from engine.perf_timing import append_perf_timing_line, perf_timing_enabled
+
+    _t0 = time.perf_counter()
+    board_cols = int(require_key(game_state, "board_cols"))
+    board_rows = int(require_key(game_state, "board_rows"))
+    transit = build_move_transit_blocked(game_state, str(squad_id), int(player), int(level))
+    store = _geodesic_field_store(game_state)
+    skey = fkey + (board_cols, board_rows)
+    previous = store["fields"].pop(skey, None)
+    field: Optional[Dict[Tuple[int, int], int]] = None
+    outcome, delta_n, affected_n = "miss", 0, 0
+    if previous is not None and previous[0] >= budget:
+        prev_budget, prev_transit, prev_field = previous
+        added, removed = _transit_delta(store, prev_transit, transit)
+        delta_n = len(added) + len(removed)
+        # Au-delà, la réparation toucherait autant de cases que le BFS : autant le refaire.
+        if delta_n <= len(prev_field) // _GEODESIC_REPAIR_MAX_DELTA_RATIO:
+            field, affected_n = repair_geodesic_move_reach(
+                prev_field, (o_col, o_row), prev_budget, added, removed, transit,
+                board_cols, board_rows,
+            )
+            budget = prev_budget
+            outcome = "repair"
+    if field is None:
+        field = geodesic_move_reach(o_col, o_row, budget, transit, board_cols, board_rows)
+    store["stats"][outcome] += 1
+    store["fields"][skey] = (budget, transit, field)
+    while len(store["fields"]) > _GEODESIC_FIELD_STORE_MAX:
+        store["fields"].pop(next(iter(store["fields"])))
     fields[fkey] = (budget, field)
+    if perf_timing_enabled(game_state):
+        stats = store["stats"]
+        append_perf_timing_line(
+            f"GEODESIC_FIELD episode={game_state.get('episode_number', '?')} "  # get allowed
+            f"turn={game_state.get('turn', '?')} squad={squad_id} outcome={outcome} "  # get allowed
+            f"build_s={time.perf_counter() - _t0:.6f} field_n={len(field)} delta_n={delta_n} "
+            f"affected_n={affected_n} hit_total={stats['hit']} repair_total={stats['repair']} "
+            f"miss_total={stats['miss']}"
+        )
     return field
 
 
+#: Champs géodésiques gardés pour réparation, toutes escouades/origines confondues. Au-delà, le
+#: moins récemment servi est jeté — il sera recalculé, pas faux.
+_GEODESIC_FIELD_STORE_MAX = 256
+
+#: Réparer si l'écart de transit n'excède pas ``|champ| / ratio`` cases, sinon recalculer.
+_GEODESIC_REPAIR_MAX_DELTA_RATIO = 4
+
+
+def _geodesic_field_store(game_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Champs géodésiques de ``geodesic_field_for_origin`` qui SURVIVENT au fingerprint du move.
+
+    ``fields`` : ``{(escouade, joueur, col, row, niveau, cols, rows): (budget, transit, champ)}``.
+    Chaque champ est conservé AVEC le transit sous lequel il est exact : une réparation compare
+    ce transit au courant, jamais une version — même principe que ``_move_spatial_cache``, un
+    chemin d'écriture oublié ne peut donc pas servir un champ périmé. ``stats`` : compteurs
+    hit / repair / miss, publiés dans la ligne ``GEODESIC_FIELD`` de ``perf_timing``.
+    """
+    store = game_state.get("_geodesic_field_cache")  # get allowed (absent au 1er appel)
+    if store is None:
+        store = {"fields": {}, "delta": None, "stats": {"hit": 0, "repair": 0, "miss": 0}}
+        game_state["_geodesic_field_cache"] = store
+    return store
+
+
+def _transit_delta(
+    store: Dict[str, Any],
+    old: AbstractSet[Tuple[int, int]],
+    new: AbstractSet[Tuple[int, int]],
+) -> Tuple[AbstractSet[Tuple[int, int]], AbstractSet[Tuple[int, int]]]:
+    """``(ajoutées, retirées)`` de ``old`` à ``new``, mémorisé pour la dernière paire vue.
+
+    Toutes les origines d'une escouade partagent le même couple de transits (un par fingerprint) :
+    sans ce mémo, chaque figurine repayait la différence de deux ensembles de la taille des murs.
+    """
+    memo = store["delta"]
+    if memo is not None and memo[0] is old and memo[1] is new:
+        return memo[2], memo[3]
+    added, removed = new - old, old - new
+    store["delta"] = (old, new, added, removed)
+    return added, removed
+
+
 def _euclidean_move_field_for_model(
     game_state: Dict[str, Any],
     squad_id: str,
@@ -5639,6 +5935,7 @@ def roll_battle_shock(unit_id: str, game_state: Dict[str, Any]) -> bool:
     roll = random.randint(1, 6) + random.randint(1, 6)
     battle_shocked = roll < ld
     unit["battle_shocked"] = battle_shocked
+    bump_unit_revision(game_state, str(unit_id))
 
     col = int(unit.get("col", -1))
     row = int(unit.get("row", -1))
@@ -7929,17 +8226,16 @@ def _squads_are_engaged(
     Meme primitive que le ciblage 10.06 (`_shoot_engagement_blocks_target`) : zone
     d engagement sur les entrees de cache, pas une distance ad hoc.
     """
-    from engine.spatial_relations import (
-        get_engagement_zone,
-        unit_entries_within_engagement_zone,
-    )
+    from engine.spatial_relations import engagement_matrix, get_engagement_zone
 
     # L'unique appelant (`_manual_roll_intent`) a écarté la cible détruite (`squad_models`) et lit
     # déjà `units_cache[target_sid]` sans repli dix lignes plus haut. Un `False` ici effaçait en
     # silence le malus 10.06 [CLOSE-QUARTERS] — donc rendait le tir PLUS facile.
-    a = require_unit_from_cache(str(squad_id), game_state, "_squads_are_engaged/a")
-    b = require_unit_from_cache(str(other_squad_id), game_state, "_squads_are_engaged/b")
-    return unit_entries_within_engagement_zone(a, b, get_engagement_zone(game_state), game_state=game_state)
+    require_unit_from_cache(str(squad_id), game_state, "_squads_are_engaged/a")
+    require_unit_from_cache(str(other_squad_id), game_state, "_squads_are_engaged/b")
+    return engagement_matrix(game_state, get_engagement_zone(game_state)).pair_engaged(
+        str(squad_id), str(other_squad_id)
+    )
 
 
 #: Cle d etat du TYPE DE TIR CHOISI par activation (10.02, etape 2 : « Select one shooting type
@@ -9280,7 +9576,17 @@ def _cover_worsened_bs(
     if target_unit is None:
         raise ValueError(f"Cover: cible {target_sid!r} introuvable (unit_by_id)")
     cover = bool(compute_unit_los(game_state, shooter_unit, target_unit)["cover"])
-    if not cover:
+    return apply_cover_to_hit_target(bs, weapon, cover)
+
+
+def apply_cover_to_hit_target(bs: int, weapon: Dict[str, Any], cover: bool) -> Tuple[int, bool]:
+    """Le volet REGLE de `_cover_worsened_bs`, sans la ligne de vue : (bs_effectif, cover).
+
+    Separe pour que les estimateurs qui connaissent deja le couvert (cache de distributions de
+    degats, `weapon_damage_cache.weapon_damage_key`) appliquent [IGNORES COVER], [PSYCHIC] et le
+    clamp a 6 par le MEME code que la resolution, au lieu d'un `min(bs + 1, 6)` recopie.
+    """
+    if not cover or weapon_has_rule(weapon, "IGNORES_COVER"):
         return bs, False
     # [PSYCHIC] 24.29 : « you can ignore any or all modifiers to that attack's BS or WS
     # characteristic and any or all modifiers to the hit roll. » Le choix appartient au joueur
@@ -11339,17 +11645,20 @@ def _assign_cells_toward_enemies(
     #    plus contraint (aucune origine disponible) et on libere, par point fixe, les origines
     #    des figurines dont le couplage confirme le depart. `blocked` decroit strictement a
     #    chaque tour -> convergence ; et a chaque iteration le resultat est deja sans collision.
+    #    La matrice d'atteignabilite (figurine x cellule) ne depend pas de `blocked` : evaluee
+    #    UNE fois, chaque tour du point fixe n'en masque que les colonnes bloquees.
+    import numpy as np
+
+    cells = sorted(b2b_cells)
+    reach = np.array(
+        [[_reach_by_mid[mid](c, r) for c, r in cells] for mid in movers], dtype=bool,
+    ).reshape(len(movers), len(cells))
+    travel = _hex_travel_matrix([origins[mid] for mid in movers], cells)
     blocked: Set[Tuple[int, int]] = {origins[mid] for mid in mids}
     matching: Dict[str, Tuple[int, int]] = {}
     while True:
-        candidates = {
-            mid: sorted(
-                cell for cell in b2b_cells
-                if cell not in blocked and _reach_by_mid[mid](cell[0], cell[1])
-            )
-            for mid in movers
-        }
-        matching = _max_b2b_matching(candidates)
+        free = np.array([cell not in blocked for cell in cells], dtype=bool)
+        matching = _max_b2b_matching(movers, cells, reach & free[None, :], travel)
         freed = {origins[mid] for mid in matching}
         if not freed - static_cells or blocked - freed == blocked:
             break
@@ -11400,10 +11709,30 @@ def _assign_cells_toward_enemies(
     return chosen
 
 
+def _hex_travel_matrix(
+    origins: List[Tuple[int, int]], cells: List[Tuple[int, int]]
+) -> "np.ndarray":
+    """Distance hex (ligne droite) de chaque origine a chaque cellule : matrice ``(n, m)`` int64."""
+    import numpy as np
+    from engine.hex_utils import offset_to_cube_vec
+
+    o = np.asarray(origins, dtype=np.int64).reshape(-1, 2)
+    c = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+    ox, oy, oz = offset_to_cube_vec(o[:, 0], o[:, 1])
+    cx, cy, cz = offset_to_cube_vec(c[:, 0], c[:, 1])
+    return np.maximum(
+        np.maximum(np.abs(ox[:, None] - cx[None, :]), np.abs(oy[:, None] - cy[None, :])),
+        np.abs(oz[:, None] - cz[None, :]),
+    )
+
+
 def _max_b2b_matching(
-    candidates: Dict[str, List[Tuple[int, int]]]
+    movers: List[str],
+    cells: List[Tuple[int, int]],
+    usable: "np.ndarray",
+    travel: "np.ndarray",
 ) -> Dict[str, Tuple[int, int]]:
-    """Couplage maximum figurine -> cellule bord-a-bord (algorithme de Kuhn).
+    """Couplage maximum figurine -> cellule bord-a-bord, de deplacement total minimal.
 
     12.03 WHILE MOVING impose « engaged with it **if possible** » a chaque figurine deplacee,
     et l'encart du meme PDF donne l'intention : « units will pile in to **maximise** the number
@@ -11411,26 +11740,38 @@ def _max_b2b_matching(
     la 1re figurine prend la cellule dont la 2e avait un besoin exclusif. Le couplage maximum
     est la formulation exacte de cette obligation, et il est **independant de l'ordre**.
 
-    ``candidates`` : {model_id: [cellules B2B legales et atteignables]}.
+    Affectation a cout minimal (hongrois, `scipy.optimize.linear_sum_assignment`) : une paire
+    utilisable coute ``trajet - BIG``, une paire interdite 0. `BIG` depasse la somme des trajets
+    de tout couplage, donc une paire de plus l'emporte toujours sur n'importe quels trajets :
+    la cardinalite reste MAXIMALE (ce que garantissait l'ancien Kuhn), et a cardinalite egale
+    le trajet total est minimal — la ou Kuhn rendait le premier couplage trouve dans l'ordre
+    des index. Une seule resolution O(n^2 m) au lieu d'un chemin augmentant recursif par
+    figurine (20+ figurines x toutes les cellules B2B d'une horde).
+
+    ``usable`` : booleens ``(figurine, cellule)`` — cellule B2B legale, libre et atteignable.
+    ``travel`` : distances ``(figurine, cellule)``, meme forme.
     Retour : {model_id: cellule} pour les figurines couplees (les autres n'ont pas de B2B
     possible dans ce couplage maximum).
     """
-    match_cell: Dict[Tuple[int, int], str] = {}
-
-    def _augment(mid: str, visited: Set[Tuple[int, int]]) -> bool:
-        for cell in candidates[mid]:
-            if cell in visited:
-                continue
-            visited.add(cell)
-            holder = match_cell.get(cell)
-            if holder is None or _augment(holder, visited):
-                match_cell[cell] = mid
-                return True
-        return False
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
 
-    for mid in candidates:
-        _augment(mid, set())
-    return {mid: cell for cell, mid in match_cell.items()}
+    # Lignes / colonnes sans aucune paire utilisable retirees : elles ne changent pas l'optimum
+    # et la resolution est cubique.
+    rows = np.flatnonzero(usable.any(axis=1))
+    cols = np.flatnonzero(usable.any(axis=0))
+    if rows.size == 0:
+        return {}
+    sub = usable[np.ix_(rows, cols)]
+    sub_travel = travel[np.ix_(rows, cols)].astype(np.float64)
+    big = float(min(rows.size, cols.size) + 1) * (float(sub_travel.max()) + 1.0)
+    cost = np.where(sub, sub_travel - big, 0.0)
+    r_idx, c_idx = linear_sum_assignment(cost)
+    return {
+        movers[int(rows[r])]: cells[int(cols[c])]
+        for r, c in zip(r_idx, c_idx)
+        if sub[r, c]
+    }
 
 
 def fight_pile_in_plan(
@@ -12129,6 +12470,11 @@ SQUAD_ACTION_SHOOT_INDIRECT_SLOT_COUNT = SQUAD_ACTION_SHOOT_SLOT_COUNT  # 20 ->
 SQUAD_ACTION_SIZE = (
     SQUAD_ACTION_SHOOT_INDIRECT_SLOT_BASE + SQUAD_ACTION_SHOOT_INDIRECT_SLOT_COUNT
 )  # 1106
+# Familles du masque, chacune composee en bloc et chronometree a part (`<famille>_s` dans la
+# ligne `SQUAD_ACTION_MASK` de perf_timing). WAIT et FIGHT_NO_TARGET sont des bits isoles.
+SQUAD_ACTION_MASK_FAMILIES = (
+    "move_cells", "shoot", "shoot_indirect", "charge", "charge_pairs", "fight",
+)
 # Chantier 01 : la CIBLE D'OATH OF MOMENT est une dimension d'action, sur le MEME mapping de
 # slots ennemis que le tir, la charge et la melee (`get_enemy_slot_mapping`, invariant D1). Le
 # compte est DERIVE de celui du tir, exactement comme les deux precedents.
@@ -12269,6 +12615,24 @@ def classify_squad_move_type(
     return "advance"
 
 
+def squad_move_costs_are_normal(
+    in_enemy_er: bool, normal_budget: int, geodesic_costs: "np.ndarray"
+) -> "np.ndarray":
+    """`classify_squad_move_type(...) == "normal"` sur un TABLEAU de couts, d'une seule operation.
+
+    Forme tableau de la MEME regle, pour le masque qui classe jusqu'a 1024 cellules : engagee ->
+    aucune cellule Normal (tout move est un Fall Back, 09.05) ; sinon cout <= budget normal
+    executable. La forme scalaire reste l'autorite du decodage ; la parite des deux est
+    verrouillee par `test_squad_spatial_move_mask`.
+    """
+    import numpy as np
+
+    costs = np.asarray(geodesic_costs, dtype=np.float64)
+    if in_enemy_er:
+        return np.zeros(costs.shape, dtype=bool)
+    return costs <= normal_budget
+
+
 def infer_squad_move_type(
     game_state: Dict[str, Any], squad_id: str, geodesic_cost: float
 ) -> str:
@@ -12625,8 +12989,8 @@ def erode_move_pool_by_squad_block(
                 else:
                     # Champ hex conservé TEL QUEL (coûts entiers) : `Mapping[..., float]` est
                     # covariant, donc pas de dict recopié sur le chemin chaud du masque gym.
-                    _field_by_origin[_fkey] = geodesic_move_reach(
-                        ocol, orow, _extent, _transit_by_level[lvl], board_cols, board_rows
+                    _field_by_origin[_fkey] = geodesic_field_for_origin(
+                        game_state, str(squad_id), player, (ocol, orow), lvl, _extent
                     )
         if not _geo_models:
             _geo_budget = False  # aucune figurine à contraindre → pool d'ancre déjà exact
@@ -12885,9 +13249,16 @@ def build_squad_action_mask(
     enemy_slot_ids: Optional[List[Optional[str]]] = None,
     advance_roll: Optional[int] = None,
     move_cell_map: Optional[Dict[int, Tuple[Tuple[int, int], float]]] = None,
-) -> List[int]:
+) -> "np.ndarray":
     """Construit le masque `SQUAD_ACTION_SIZE` (1047) pour une escouade active.
 
+    Tableau booleen compose FAMILLE PAR FAMILLE (`SQUAD_ACTION_MASK_FAMILIES`) : chaque famille
+    ecrit son bloc d'un seul tenant — cellules de move depuis les tableaux de la carte, paires de
+    charge depuis le vecteur des cibles atteignables (`charge_pair_members`), slots de melee
+    depuis le pool 12.05. Les familles dont chaque slot est un ORACLE moteur (tir, charge) gardent
+    un appel par cible : c'est la regle qui coute, pas l'ecriture. Chaque famille est chronometree
+    a part dans la ligne `SQUAD_ACTION_MASK` de `perf_timing`.
+
     Phase move : les actions 0..1023 designent une CELLULE de la grille egocentrique, pas une
     direction (refonte spatiale, cf. `build_squad_move_cell_map`). Une cellule est mask=1 ssi
     elle porte une destination du pool BFS — le pool reste la seule autorite des regles.
@@ -12907,24 +13278,35 @@ def build_squad_action_mask(
     ce qui evite un 2e BFS quand l'appelant l'a deja, sans obliger les appelants isoles (tests,
     outils) a la fabriquer.
     """
+    import numpy as np
     from engine.perf_timing import append_perf_timing_line, perf_timing_enabled
 
     _perf = perf_timing_enabled(game_state)
     _t0 = time.perf_counter() if _perf else None
     _cell_map_s = 0.0
+    # Une duree par famille, toujours emise (0 pour les familles de l'autre phase) : la ligne
+    # garde la meme forme partout, et le rapport moyenne chaque champ sur toutes les lignes.
+    _family_s = dict.fromkeys(SQUAD_ACTION_MASK_FAMILIES, 0.0)
+
+    def _family_done(family: str, started: Optional[float]) -> None:
+        if started is not None:
+            _family_s[family] = time.perf_counter() - started
 
     def _log_mask(outcome: str) -> None:
         if not _perf or _t0 is None:
             return
+        families = " ".join(
+            f"{family}_s={_family_s[family]:.6f}" for family in SQUAD_ACTION_MASK_FAMILIES
+        )
         append_perf_timing_line(
             f"SQUAD_ACTION_MASK episode={game_state.get('episode_number', '?')} "
             f"turn={game_state.get('turn', '?')} squad={squad_id} "
             f"phase={str(game_state.get('phase', '')).lower()} outcome={outcome} "
-            f"cell_map_s={_cell_map_s:.6f} total_s={time.perf_counter() - _t0:.6f} "
-            f"ones_n={sum(mask)}"
+            f"cell_map_s={_cell_map_s:.6f} {families} total_s={time.perf_counter() - _t0:.6f} "
+            f"ones_n={int(mask.sum())}"
         )
 
-    mask = [0] * SQUAD_ACTION_SIZE
+    mask = np.zeros(SQUAD_ACTION_SIZE, dtype=bool)
     # Cache absent = moteur non initialisé -> require_key. Squad absent = mort ou pas déployé :
     # c'est le CONTRAT du masque (« absent/mort -> all-zero »), il reste.
     units_cache = require_key(game_state, "units_cache")
@@ -12968,23 +13350,28 @@ def build_squad_action_mask(
             )
             if _t_cm is not None:
                 _cell_map_s = time.perf_counter() - _t_cm
-            # Invariants de l'escouade resolus UNE fois : les reresoudre par cellule coutait 48%
-            # du masque (scan de `units` + empreintes d'engagement a chaque appel).
-            # Frontiere = budget normal EXECUTABLE (descente §13.06 deduite), la meme grandeur que
-            # `resolve_squad_move_constraints` valide a l'execution (§0.34).
-            normal_budget = squad_normal_move_frontier_subhex(game_state, squad_id)
-            for cell_idx, (_dest, cost) in cell_map.items():
-                # Type classe par `classify_squad_move_type`, la MEME regle que le decoder (T3)
-                # appliquera pour executer la cellule. La rejouer en ligne ici (`cost >
-                # normal_budget`) creerait une 2e implementation, donc un risque de divergence
-                # masque/execution — precisement ce que cette refonte supprime.
-                if classify_squad_move_type(in_er, normal_budget, cost) != "normal":
-                    # `fall_back` (escouade engagee) et `advance` sont fermes par has_advanced /
-                    # has_fled ; le Normal, lui, ne l'est pas (miroir exact du masque directionnel).
-                    if not advance_or_fall_back_allowed:
-                        continue
-                mask[SQUAD_ACTION_MOVE_CELL_BASE + cell_idx] = 1
-        mask[SQUAD_ACTION_WAIT] = 1
+            _t_family = time.perf_counter() if _perf else None
+            # Les cellules de la carte en TABLEAU, ouvertes d'une seule ecriture. La carte reste
+            # un dict : c'est le contrat que le decodage et `mask_verification` relisent.
+            cells = np.fromiter(cell_map.keys(), dtype=np.intp, count=len(cell_map))
+            if not advance_or_fall_back_allowed:
+                # `fall_back` (escouade engagee) et `advance` sont fermes par has_advanced /
+                # has_fled ; le Normal, lui, ne l'est pas (miroir exact du masque directionnel).
+                # Type classe par `squad_move_costs_are_normal`, forme tableau de
+                # `classify_squad_move_type` — la MEME regle que le decoder (T3) appliquera pour
+                # executer la cellule, et non un `cost > normal_budget` recopie en ligne.
+                # Frontiere = budget normal EXECUTABLE (descente §13.06 deduite), la meme grandeur
+                # que `resolve_squad_move_constraints` valide a l'execution (§0.34). Resolue une
+                # fois, et seulement ici : toutes les cellules sont ouvertes dans l'autre cas.
+                normal_budget = squad_normal_move_frontier_subhex(game_state, squad_id)
+                costs = np.fromiter(
+                    (cost for _dest, cost in cell_map.values()), dtype=np.float64,
+                    count=len(cell_map),
+                )
+                cells = cells[squad_move_costs_are_normal(in_er, normal_budget, costs)]
+            mask[SQUAD_ACTION_MOVE_CELL_BASE + cells] = True
+            _family_done("move_cells", _t_family)
+        mask[SQUAD_ACTION_WAIT] = True
 
     # --- Shoot phase: shoot slots 19-23 ---
     elif phase == "shoot":
@@ -12993,6 +13380,7 @@ def build_squad_action_mask(
         # supprimait donc deux types de tir entiers pour l agent (cf. resolve_squad_shooting_type).
         shooting_type = resolve_squad_shooting_type(game_state, squad_id)
         ez = get_engagement_zone(game_state)
+        _t_family = time.perf_counter() if _perf else None
         if shooting_type is not None:
             for slot_i, esid in enumerate(enemy_slot_ids):
                 if esid is None or esid not in units_cache:
@@ -13026,12 +13414,14 @@ def build_squad_action_mask(
                     if can_any_hit:
                         break
                 if can_any_hit:
-                    mask[SQUAD_ACTION_SHOOT_SLOT_BASE + slot_i] = 1
+                    mask[SQUAD_ACTION_SHOOT_SLOT_BASE + slot_i] = True
+        _family_done("shoot", _t_family)
         # 10.02 / 10.07 : le tir INDIRECT est un SECOND type jouable dans le meme etat, pas une
         # variante du premier. Son masque est donc calcule a part, avec le type indirect en
         # vigueur — c est lui qui ouvre le ciblage sans ligne de vue, et c est tout l interet du
         # choix. Le calculer avec `shooting_type` (le defaut) aurait rendu les deux blocs
         # identiques, donc l action indirecte inutile.
+        _t_family = time.perf_counter() if _perf else None
         if SHOOTING_TYPE_INDIRECT in eligible_squad_shooting_types(game_state, squad_id):
             for slot_i, esid in enumerate(enemy_slot_ids):
                 if esid is None or esid not in units_cache:
@@ -13044,8 +13434,9 @@ def build_squad_action_mask(
                 if _squad_can_shoot_target_under_type(
                     game_state, squad_id, esid, SHOOTING_TYPE_INDIRECT
                 ):
-                    mask[SQUAD_ACTION_SHOOT_INDIRECT_SLOT_BASE + slot_i] = 1
-        mask[SQUAD_ACTION_WAIT] = 1
+                    mask[SQUAD_ACTION_SHOOT_INDIRECT_SLOT_BASE + slot_i] = True
+        _family_done("shoot_indirect", _t_family)
+        mask[SQUAD_ACTION_WAIT] = True
 
     # --- Charge phase: un slot par cible de charge declarable (11.02) ---
     elif phase == "charge":
@@ -13074,7 +13465,8 @@ def build_squad_action_mask(
         )
 
         _charge_roll = charge_roll_for_activation(game_state, squad_id)
-        _reachable_slots: list = []
+        _t_family = time.perf_counter() if _perf else None
+        reachable = np.zeros(SQUAD_ACTION_CHARGE_SLOT_COUNT, dtype=bool)
         for slot_i, esid in enumerate(enemy_slot_ids[:SQUAD_ACTION_CHARGE_SLOT_COUNT]):
             if esid is None or esid not in units_cache:
                 continue
@@ -13083,22 +13475,29 @@ def build_squad_action_mask(
             # l'atteignabilite 11.04 par le jet. Pre-tester `charge_check_eligibility` ici
             # doublerait l'appel pour toute cible declarable sans changer un seul verdict.
             if charge_target_is_reachable(game_state, squad_id, str(esid), _charge_roll):
-                mask[SQUAD_ACTION_CHARGE_SLOT_BASE + slot_i] = 1
-                _reachable_slots.append(slot_i)
+                reachable[slot_i] = True
+        mask[
+            SQUAD_ACTION_CHARGE_SLOT_BASE:SQUAD_ACTION_CHARGE_SLOT_BASE + SQUAD_ACTION_CHARGE_SLOT_COUNT
+        ] = reachable
+        _family_done("charge", _t_family)
         # Slots de paires : ouverts ssi les deux cibles individuelles sont chacune declarables.
         # Parite masque/commit : le commit verifiable l'atteignabilite de chaque cible ; ici on
         # n'ouvre que les paires dont les deux membres passent deja le meme oracle. Une paire
         # geometriquement impossible (les deux cibles exigent des positions incompatibles) sera
         # rejetee au commit avec charge_fail, comme un jet insuffisant — c'est le bon comportement.
-        if len(_reachable_slots) >= 2:
-            from engine.macro_intents import charge_pair_encode
-            for _ii in range(len(_reachable_slots)):
-                for _jj in range(_ii + 1, len(_reachable_slots)):
-                    _pi = charge_pair_encode(_reachable_slots[_ii], _reachable_slots[_jj])
-                    mask[SQUAD_ACTION_CHARGE_PAIR_SLOT_BASE + _pi] = 1
+        # Tout le bloc d'une seule operation : la paire k est ouverte ssi ses deux membres le sont.
+        _t_family = time.perf_counter() if _perf else None
+        from engine.macro_intents import charge_pair_members
+
+        pair_i, pair_j = charge_pair_members(SQUAD_ACTION_CHARGE_SLOT_COUNT)
+        mask[
+            SQUAD_ACTION_CHARGE_PAIR_SLOT_BASE:
+            SQUAD_ACTION_CHARGE_PAIR_SLOT_BASE + SQUAD_ACTION_CHARGE_PAIR_SLOT_COUNT
+        ] = reachable[pair_i] & reachable[pair_j]
+        _family_done("charge_pairs", _t_family)
         # 11.02.3 « if you still want to » : renoncer apres le jet est un choix legal, et c'est
         # le seul qui reste quand le jet n'atteint rien.
-        mask[SQUAD_ACTION_WAIT] = 1
+        mask[SQUAD_ACTION_WAIT] = True
 
     # --- Fight phase: un slot par cible de melee eligible (12.05), ou « combat a vide » ---
     elif phase == "fight":
@@ -13118,6 +13517,7 @@ def build_squad_action_mask(
             _fight_v11_engaged_now,
             fight_v11_current_pool,
         )
+        _t_family = time.perf_counter() if _perf else None
         if (
             game_state.get("fight_subphase") == "fight"
             and squad_id in fight_v11_current_pool(game_state)
@@ -13130,11 +13530,15 @@ def build_squad_action_mask(
             if unit is None:
                 raise KeyError(f"Squad {squad_id} eligible au combat mais introuvable dans units")
             fight_targets = set(str(t) for t in _fight_build_valid_target_pool(game_state, unit))
-            opened = 0
-            for slot_i, esid in enumerate(enemy_slot_ids[:SQUAD_ACTION_FIGHT_SLOT_COUNT]):
-                if esid is not None and str(esid) in fight_targets:
-                    mask[SQUAD_ACTION_FIGHT_SLOT_BASE + slot_i] = 1
-                    opened += 1
+            fight_slot_ids = enemy_slot_ids[:SQUAD_ACTION_FIGHT_SLOT_COUNT]
+            fight_open = np.fromiter(
+                (esid is not None and str(esid) in fight_targets for esid in fight_slot_ids),
+                dtype=bool, count=len(fight_slot_ids),
+            )
+            mask[
+                SQUAD_ACTION_FIGHT_SLOT_BASE:SQUAD_ACTION_FIGHT_SLOT_BASE + len(fight_slot_ids)
+            ] = fight_open
+            opened = int(fight_open.sum())
             if opened == 0:
                 # Pool vide sur la position actuelle. En overrun 12.06 (a charge, non engagee),
                 # le commit execute d abord une pile-in avant de tester le pool — le masque doit
@@ -13164,7 +13568,7 @@ def build_squad_action_mask(
                                 for mid, c, r, lv in ov_plan
                                 if mid in models_cache
                             ):
-                                mask[SQUAD_ACTION_FIGHT_SLOT_BASE + slot_i] = 1
+                                mask[SQUAD_ACTION_FIGHT_SLOT_BASE + slot_i] = True
                                 opened += 1
                 if opened == 0:
                     if fight_targets:
@@ -13181,7 +13585,7 @@ def build_squad_action_mask(
                         # Aucune cible meme apres pile-in overrun : combat a vide (12.04/12.06).
                         # L'escouade DOIT pouvoir se declarer, sans quoi elle resterait eligible
                         # sans action et la sous-phase ne se draine jamais.
-                        mask[SQUAD_ACTION_FIGHT_NO_TARGET] = 1
+                        mask[SQUAD_ACTION_FIGHT_NO_TARGET] = True
             elif opened < len(fight_targets):
                 # Une cible legale sans slot serait INFRAPPABLE : troncature silencieuse interdite.
                 from engine.game_utils import add_debug_file_log
@@ -13192,11 +13596,12 @@ def build_squad_action_mask(
                     f"pour {opened} slot(s) ennemi(s) mappe(s) — cible(s) infrappable(s).",
                 )
         else:
-            mask[SQUAD_ACTION_WAIT] = 1
+            mask[SQUAD_ACTION_WAIT] = True
+        _family_done("fight", _t_family)
 
     # --- Other phases (command/deployment) ---
     else:
-        mask[SQUAD_ACTION_WAIT] = 1
+        mask[SQUAD_ACTION_WAIT] = True
 
     _log_mask("built")
     return mask
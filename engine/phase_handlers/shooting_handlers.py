@@ -21,6 +21,13 @@ from engine.combat_utils import (
 from shared.data_validation import require_key, require_present
 from engine.utils.weapon_helpers import ranged_weapons, weapon_has_rule
 from engine.action_log_utils import append_action_log
+from engine.target_pool_cache import target_pool_cache
+from engine.shoot_target_matrix import (
+    active_shoot_target_matrix,
+    close_shoot_target_matrix,
+    open_shoot_target_matrix,
+    shoot_target_matrix_drop_unit,
+)
 from .shared_utils import (
     calculate_target_priority_score, enrich_unit_for_reward_mapper, check_if_melee_can_charge,
     ACTION, WAIT, PASS, SHOOTING, ADVANCE, NOT_REMOVED,
@@ -44,69 +51,26 @@ from .shared_utils import (
 # ============================================================================
 # PERFORMANCE: Target pool caching (30-40% speedup)
 # ============================================================================
-# Cache valid target pools to avoid repeated distance/LoS calculations
-# Cache key: (pid, id(game_state), episode_num, turn, unit_id, col, row, advance_status, adjacent_status, player)
-_target_pool_cache = {}  # per-process, per-env, per-episode; invalidates when unit/weapon changes
-_move_los_preview_cache = {}
-_cache_size_limit = 100  # Prevent memory leak in long episodes
+# Les pools de cibles et les apercus LoS du move sont memoises PAR MOTEUR, dans
+# `game_state["_target_pool_cache"]` (LRU borne, cles a version entiere) : voir
+# `engine/target_pool_cache.py` pour le contrat d'invalidation.
 _MOVE_AFTER_SHOOTING_DISTANCE_ARG = "distance"
 _unit_registry_singleton = None  # UnitRegistry reads static files — safe to share across all episodes
 
 
-def clear_target_pool_cache() -> None:
-    """Clear _target_pool_cache. Call on scenario rotation to avoid stale pool from different topology."""
-    global _target_pool_cache
-    global _move_los_preview_cache
-    n = len(_target_pool_cache)
-    preview_n = len(_move_los_preview_cache)
-    _target_pool_cache.clear()
-    _move_los_preview_cache.clear()
-    if os.environ.get("LOS_DEBUG") == "1" and (n > 0 or preview_n > 0):
+def clear_target_pool_cache(game_state: Dict[str, Any]) -> None:
+    """Vide le cache de pools / apercus du moteur. A appeler a la rotation de scenario : une
+    topologie differente peut reutiliser les memes episode / tour / version."""
+    cleared = target_pool_cache(game_state).clear()
+    if os.environ.get("LOS_DEBUG") == "1" and (cleared["pools"] > 0 or cleared["previews"] > 0):
         import sys
         sys.stderr.write(
-            f"[LOS_DEBUG] clear_target_pool_cache cleared target_pool={n} "
-            f"move_los_preview={preview_n} entries\n"
+            f"[LOS_DEBUG] clear_target_pool_cache cleared target_pool={cleared['pools']} "
+            f"move_los_preview={cleared['previews']} entries\n"
         )
         sys.stderr.flush()
 
 
-def _tracking_collection_fingerprint(collection: Any) -> Tuple[str, ...]:
-    """Return normalized tracking collection fingerprint for cache keys."""
-    return tuple(sorted(str(item) for item in collection))
-
-
-def _occupied_hexes_fingerprint(raw_hexes: Any) -> Tuple[Tuple[int, int], ...]:
-    """Return normalized occupied hexes fingerprint for units_cache entries."""
-    if raw_hexes is None:
-        return ()
-    if not isinstance(raw_hexes, (set, list, tuple)):
-        raise TypeError(f"occupied_hexes must be a set/list/tuple when present, got {type(raw_hexes).__name__}")
-    normalized_hexes: List[Tuple[int, int]] = []
-    for raw_hex in raw_hexes:
-        if not isinstance(raw_hex, (list, tuple)) or len(raw_hex) < 2:
-            raise ValueError(f"occupied_hexes entry must contain col,row, got {raw_hex!r}")
-        hex_col, hex_row = normalize_coordinates(raw_hex[0], raw_hex[1])
-        normalized_hexes.append((hex_col, hex_row))
-    return tuple(sorted(normalized_hexes))
-
-
-def _units_cache_fingerprint(units_cache: Dict[str, Any]) -> Tuple[Tuple[Any, ...], ...]:
-    """Return units_cache fingerprint for exact move LoS preview memoization."""
-    rows: List[Tuple[Any, ...]] = []
-    for unit_id, entry in sorted(units_cache.items(), key=lambda item: str(item[0])):
-        if not isinstance(entry, dict):
-            raise TypeError(f"units_cache[{unit_id}] must be a dict, got {type(entry).__name__}")
-        rows.append((
-            str(unit_id),
-            int(require_key(entry, "col")),
-            int(require_key(entry, "row")),
-            int(require_key(entry, "player")),
-            int(require_key(entry, "HP_CUR")),
-            _occupied_hexes_fingerprint(entry.get("occupied_hexes")),
-        ))
-    return tuple(rows)
-
-
 def _weapon_rules_fingerprint(raw_rules: Any) -> Tuple[str, ...]:
     """Return normalized weapon rules fingerprint for cache keys."""
     if raw_rules is None:
@@ -148,9 +112,15 @@ def _move_los_preview_cache_key(
     escouade — une clé qui ne porterait que l'ancre servirait le résultat de l'un à l'autre. Le
     niveau et l'orientation en font partie : ils changent l'empreinte et le gate vertical, donc
     deux plans qui n'en diffèrent que par eux ne peuvent pas partager une entrée.
+
+    Le reste du plateau n'entre plus par empreinte mais par compteurs entiers :
+    `_unit_move_version` couvre toute écriture de position (cases occupées comprises) ; les
+    TAILLES de `units_cache`, `units_advanced` et `units_fled` couvrent ce qui change sans
+    déplacement — une mort retire l'entrée de `units_cache`, et les deux ensembles ne font que
+    croître au sein d'un tour (le tour est dans la clé), donc leur taille suffit à en détecter
+    une écriture. Les PV d'une unité survivante ne changent aucun champ de l'aperçu.
     """
     return (
-        os.getpid(),
         require_key(game_state, "episode_number"),
         require_key(game_state, "turn"),
         require_key(game_state, "episode_steps"),
@@ -158,9 +128,10 @@ def _move_los_preview_cache_key(
         unit_id_str,
         placement,
         bool(advance_position),
-        _units_cache_fingerprint(require_key(game_state, "units_cache")),
-        _tracking_collection_fingerprint(require_key(game_state, "units_advanced")),
-        _tracking_collection_fingerprint(require_key(game_state, "units_fled")),
+        require_key(game_state, "_unit_move_version"),
+        len(require_key(game_state, "units_cache")),
+        len(require_key(game_state, "units_advanced")),
+        len(require_key(game_state, "units_fled")),
         _rng_weapons_fingerprint(unit),
     )
 
@@ -407,6 +378,23 @@ def _ranged_distance_metric(game_state: Optional[Dict[str, Any]] = None) -> str:
     return "hex" if geometry_is_hex(game_state) else metric
 
 
+def _max_ranged_range(rng_weapons: List[Dict[str, Any]]) -> int:
+    """Portée maximale des armes de TIR de l'unité (0 sans arme de tir).
+
+    Aucun repli silencieux : `RNG` est porté par les 243 profils d'armes de tir des rosters — une
+    arme rangée sans portée est une donnee d'arme invalide, pas une arme à ignorer (l'ancien
+    `except Exception: continue` la faisait disparaître du calcul, et l'unité pouvait perdre sa
+    portée maximale réelle). `RNG` n'est absent que des armes de MÊLÉE, qui ne sont pas dans
+    `RNG_WEAPONS`.
+    """
+    max_rng = 0
+    for w in rng_weapons:
+        r = int(require_key(w, "RNG"))
+        if r > max_rng:
+            max_rng = r
+    return max_rng
+
+
 def _build_weapon_availability_enemy_precheck(
     game_state: Dict[str, Any],
     unit: Dict[str, Any],
@@ -421,16 +409,7 @@ def _build_weapon_availability_enemy_precheck(
 
     _ranged_metric = _ranged_distance_metric(game_state)
 
-    # Portée maximale des armes de TIR de l'unité. Aucun repli silencieux : `RNG` est porté
-    # par les 243 profils d'armes de tir des rosters — une arme rangée sans portée est une
-    # donnee d'arme invalide, pas une arme à ignorer (l'ancien `except Exception: continue`
-    # la faisait disparaître du calcul, et l'unité pouvait perdre sa portée maximale réelle).
-    # `RNG` n'est absent que des armes de MÊLÉE, qui ne sont pas dans `RNG_WEAPONS`.
-    max_rng = 0
-    for w in rng_weapons:
-        r = int(require_key(w, "RNG"))
-        if r > max_rng:
-            max_rng = r
+    max_rng = _max_ranged_range(rng_weapons)
     if max_rng <= 0:
         return []
 
@@ -497,6 +476,142 @@ def _build_weapon_availability_enemy_precheck(
     return out
 
 
+def _shoot_target_matrix_precheck(
+    game_state: Dict[str, Any],
+    unit: Dict[str, Any],
+    rng_weapons: List[Dict[str, Any]],
+) -> Optional[List[Dict[str, Any]]]:
+    """Même liste que ``_build_weapon_availability_enemy_precheck``, lue dans la matrice de phase.
+
+    None hors d'une phase de tir ouverte (cf. ``engine.shoot_target_matrix``) : l'appelant
+    recalcule. Seules les cellules absentes (1re lecture, unité déplacée depuis) sont mesurées ;
+    les drapeaux de LoS sont relus dans ``unit["los_cache"]`` et l'ordre des lignes reste celui
+    de ``units_cache``, comme dans le précalcul direct.
+    """
+    matrix = active_shoot_target_matrix(game_state)
+    if matrix is None:
+        return None
+    max_rng = _max_ranged_range(rng_weapons)
+    if max_rng <= 0:
+        return []
+    from engine.spatial_relations import get_engagement_zone, unit_entries_within_engagement_zone
+    from engine.combat_utils import ranged_edge_distance
+
+    units_cache = require_key(game_state, "units_cache")
+    shooter_id_str = str(unit["id"])
+    _ue = units_cache.get(shooter_id_str)
+    if _ue is None:
+        raise KeyError(f"Unit {shooter_id_str} not in units_cache (dead or absent)")
+    shooter_player_int = require_present(int(unit["player"]) if unit["player"] is not None else None, "unit['player']")
+    melee_range = get_engagement_zone(game_state)
+    cells = matrix.row(shooter_id_str, max_rng)
+    pairs = matrix.engaged_pairs
+    _shooter_socle = None
+    _ranged_metric = None
+
+    _los_map = unit.get("los_cache")
+    out: List[Dict[str, Any]] = []
+    for enemy_id_str, cache_entry in list(enemy_entries_on_battlefield(units_cache, shooter_player_int)):
+        los_cache_has_key = isinstance(_los_map, dict) and enemy_id_str in _los_map
+        los_cache_true = bool(_los_map[enemy_id_str]) if los_cache_has_key else False
+        if los_cache_has_key and not los_cache_true:
+            continue
+
+        cell = cells.get(enemy_id_str)  # get allowed (cellule absente = à mesurer)
+        if cell is None:
+            matrix.misses += 1
+            if _shooter_socle is None:
+                _shooter_socle = _socle_from_entry(_ue)
+                _ranged_metric = _ranged_distance_metric(game_state)
+            d = ranged_edge_distance(
+                _shooter_socle, _socle_from_entry(cache_entry), _ranged_metric, max_distance=max_rng
+            )
+            # Hors portée : l'engagement n'est jamais lu, inutile de le mesurer.
+            engaged = d <= max_rng and unit_entries_within_engagement_zone(
+                _ue, cache_entry, melee_range, game_state=game_state
+            )
+            cell = (d, engaged)
+            cells[enemy_id_str] = cell
+        else:
+            matrix.hits += 1
+        d, enemy_adjacent_to_shooter = cell
+        if d > max_rng:
+            continue
+
+        # Même règle que `_friendly_engagement_blocks_ranged_shot`, paire (cible, ami) mémoïsée.
+        friendly_blocks = False
+        if not enemy_adjacent_to_shooter:
+            for friendly_id, friendly_entry in entries_on_battlefield(units_cache, exclude_id=shooter_id_str):
+                if int(friendly_entry["player"]) != shooter_player_int:
+                    continue
+                engaged_with_friendly = pairs.get((enemy_id_str, friendly_id))  # get allowed
+                if engaged_with_friendly is None:
+                    engaged_with_friendly = unit_entries_within_engagement_zone(
+                        cache_entry, friendly_entry, melee_range, game_state=game_state
+                    )
+                    pairs[(enemy_id_str, friendly_id)] = engaged_with_friendly
+                if engaged_with_friendly:
+                    friendly_blocks = True
+                    break
+
+        out.append({
+            "enemy_id_str": enemy_id_str,
+            "distance": d,
+            "enemy_engaged_with_shooter": enemy_adjacent_to_shooter,
+            "friendly_blocks": friendly_blocks,
+            "los_cache_has_key": los_cache_has_key,
+            "los_cache_true": los_cache_true,
+        })
+    return out
+
+
+def _weapon_availability_enemy_precheck(
+    game_state: Dict[str, Any],
+    unit: Dict[str, Any],
+    rng_weapons: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Précalcul ennemi d'une activation : lecture de matrice en phase de tir, sinon recalcul."""
+    precheck = _shoot_target_matrix_precheck(game_state, unit, rng_weapons)
+    if precheck is None:
+        precheck = _build_weapon_availability_enemy_precheck(game_state, unit, rng_weapons)
+    return precheck
+
+
+def assert_shoot_target_matrix_consistent(game_state: Dict[str, Any]) -> int:
+    """Garde-fou debug, jumeau de ``assert_los_pair_cache_consistent`` (shared_utils) : compare,
+    pour chaque tireur du joueur actif, la liste servie par la matrice de phase au précalcul
+    recalculé (``_build_weapon_availability_enemy_precheck``). Zéro divergence tolérée. Retourne
+    le nb de lignes (tireur, ennemi) vérifiées ; 0 hors phase de tir ouverte.
+
+    Les lignes sont comparées PAR ENNEMI : l'ordre de la liste n'est pas un contrat (les deux
+    consommateurs indexent par id ou cherchent une seule ligne valide)."""
+    if active_shoot_target_matrix(game_state) is None:
+        return 0
+    units_cache = require_key(game_state, "units_cache")
+    player = int(require_key(game_state, "current_player"))
+    checked = 0
+    for unit_id, entry in list(entries_on_battlefield(units_cache)):
+        if int(require_key(entry, "player")) != player:
+            continue
+        unit = get_unit_by_id(game_state, unit_id)
+        if unit is None:
+            raise KeyError(f"Unit {unit_id} missing from game_state['units']")
+        rng_weapons = require_key(unit, "RNG_WEAPONS")
+        served = require_present(
+            _shoot_target_matrix_precheck(game_state, unit, rng_weapons), "shoot target matrix"
+        )
+        fresh = _build_weapon_availability_enemy_precheck(game_state, unit, rng_weapons)
+        served_by_id = {row["enemy_id_str"]: row for row in served}
+        fresh_by_id = {row["enemy_id_str"]: row for row in fresh}
+        checked += len(fresh_by_id)
+        if served_by_id != fresh_by_id:
+            raise AssertionError(
+                f"shoot target matrix stale: shooter={unit_id} "
+                f"ver={game_state['_unit_move_version']} served={served_by_id} fresh={fresh_by_id}"
+            )
+    return checked
+
+
 def weapon_availability_check(
     game_state: Dict[str, Any],
     unit: Dict[str, Any],
@@ -628,6 +743,10 @@ def weapon_availability_check(
                 # Check if at least ONE enemy unit meets ALL conditions
                 weapon_has_valid_target = False
 
+                if _enemy_precheck_for_availability is None:
+                    _enemy_precheck_for_availability = _shoot_target_matrix_precheck(
+                        game_state, unit, rng_weapons
+                    )
                 if _enemy_precheck_for_availability is None:
                     _mv = game_state.get("_unit_move_version")
                     _pc = unit.get("_precheck_cache")
@@ -740,8 +859,6 @@ def shooting_phase_start(game_state: Dict[str, Any]) -> Dict[str, Any]:
     AI_Shooting_Phase.md EXACT: Initialize shooting phase and build activation pool
     Initialize weapon_rule and weapon.shot flags
     """
-    global _target_pool_cache
-
     if game_state.get("pending_shooting_phase_init"):
         game_state["pending_shooting_phase_init"] = False
 
@@ -759,10 +876,12 @@ def shooting_phase_start(game_state: Dict[str, Any]) -> Dict[str, Any]:
     # This is a global variable that determines if weapon rules are applied
     game_state["weapon_rule"] = 1
 
-    # Clear target pool cache at phase start - targets may have moved
-    # The cache key only includes shooter position, not target positions
-    # So stale cache entries could allow shooting blocked targets
-    _target_pool_cache.clear()
+    # Clear target pool cache at phase start: the key carries `_unit_move_version`, so moved
+    # targets already miss; the clear keeps the phase's pools from aging out behind stale ones.
+    target_pool_cache(game_state).pools.clear()
+    # Matrice tireur x ennemi de la phase : cellules remplies à la 1re lecture, oubliées par
+    # unité au mouvement / à la mort (cf. engine.shoot_target_matrix).
+    open_shoot_target_matrix(game_state)
 
     # Initialize weapon.shot = 0 for all weapons in all units
     # Reset weapon.shot flag at phase start
@@ -1497,7 +1616,7 @@ def _preview_shoot_valid_targets(
             placement,
             advance_position,
         )
-        cached_preview = _move_los_preview_cache.get(preview_cache_key)
+        cached_preview = target_pool_cache(game_state).previews.get(preview_cache_key)
         if cached_preview is not None:
             return copy.deepcopy(cached_preview)
 
@@ -1537,6 +1656,11 @@ def _preview_shoot_valid_targets(
         "deployment_pools",
         "_obscuring_area_sets_cache",
         "_objective_hex_zones_cache",
+        # Champ de dégagement LoS : tableau en lecture seule (mmap ou verrouillé), jamais muté.
+        "_los_clearance_field_cache",
+        # Champs géodésiques réparables : chaque entrée porte le transit sous lequel elle est
+        # exacte, une écriture depuis l'aperçu reste donc vraie pour l'état réel.
+        "_geodesic_field_cache",
     ):
         _shared_val = game_state.get(_shared_key)
         if _shared_val is not None:
@@ -1639,9 +1763,7 @@ def _preview_shoot_valid_targets(
         "visible_cells_by_target": visible_cells_by_target,
     }
     if preview_cache_key is not None:
-        if len(_move_los_preview_cache) >= _cache_size_limit:
-            _move_los_preview_cache.clear()
-        _move_los_preview_cache[preview_cache_key] = copy.deepcopy(result_payload)
+        target_pool_cache(game_state).previews.put(preview_cache_key, copy.deepcopy(result_payload))
     return result_payload
 
 
@@ -1671,15 +1793,20 @@ def build_visible_cells_by_target(
     Source unique = ``compute_unit_los`` (le même calcul que le blink). Le frontend peint ces
     cases par-dessus le cône WASM : une cible qui blinke a donc toujours ses cases visibles
     peintes, avec l'exclusion obscuring correcte par-figurine — supprime la divergence
-    « unité ciblable hors du cône ». Coût borné aux seules cibles valides (pas de scan plateau).
+    « unité ciblable hors du cône ». Coût borné aux seules cibles valides (pas de scan plateau) ;
+    les paires absentes du pair-cache sont tracées ensemble (``compute_units_los``).
     """
-    out: Dict[str, List[List[int]]] = {}
+    target_ids: List[str] = []
+    target_units: List[Dict[str, Any]] = []
     for target_id in valid_targets:
         target_id_str = str(target_id)
         target_unit = _get_unit_by_id(game_state, target_id_str)
         if target_unit is None:
             continue
-        los = compute_unit_los(game_state, shooter, target_unit)
+        target_ids.append(target_id_str)
+        target_units.append(target_unit)
+    out: Dict[str, List[List[int]]] = {}
+    for target_id_str, los in zip(target_ids, compute_units_los(game_state, shooter, target_units)):
         out[target_id_str] = [[int(c), int(r)] for c, r in los["visible_cells"]]
     return out
 
@@ -1872,6 +1999,7 @@ def update_los_cache_after_target_death(game_state: Dict[str, Any], dead_target_
         if active_unit and "los_cache" in active_unit:
             if dead_target_id_str in active_unit["los_cache"]:
                 del active_unit["los_cache"][dead_target_id_str]
+    shoot_target_matrix_drop_unit(game_state, dead_target_id_str)
 
 
 def _remove_dead_unit_from_pools(game_state: Dict[str, Any], dead_unit_id: str) -> None:
@@ -2435,7 +2563,7 @@ def shooting_unit_activation_start(game_state: Dict[str, Any], unit_id: str) ->
     advance_status = 0  # STEP 2: Unit has NOT advanced yet
     adjacent_status = 1 if unit_is_adjacent else 0
     _t_ep0 = time.perf_counter() if _perf_act else None
-    _activation_enemy_precheck = _build_weapon_availability_enemy_precheck(
+    _activation_enemy_precheck = _weapon_availability_enemy_precheck(
         game_state, unit, require_key(unit, "RNG_WEAPONS")
     )
     if _perf_act and _t_ep0 is not None:
@@ -3023,8 +3151,6 @@ def shooting_build_valid_target_pool(
     - arg2 = (unit.id in units_advanced) ? 1 : 0
     - arg3 = (unit adjacent to enemy?) ? 1 : 0
     """
-    global _target_pool_cache
-
     unit = _get_unit_by_id(game_state, unit_id)
     if not unit:
         return []
@@ -3048,16 +3174,15 @@ def shooting_build_valid_target_pool(
     # Create cache key from unit identity, position, player, AND context (advance_status, adjacent_status)
     # Cache must include context to avoid wrong results after advance
     # CRITICAL: Include unit["player"] to ensure cache is invalidated when player changes
-    # CRITICAL: Include os.getpid() to avoid cross-worker pollution (SubprocVecEnv fork copies cache, id() can collide)
-    # CRITICAL: Use _cache_instance_id (engine id) to avoid cross-env pollution - id(game_state) can
-    # be reused after GC when multiple envs run in same process (bot eval), causing wrong pool reuse
-    gs_instance_id = game_state.get("_cache_instance_id", id(game_state))
-    # CRITICAL: Include episode_number to avoid cross-episode pollution (target positions differ between episodes)
+    # CRITICAL: Include episode_number to avoid cross-episode pollution (`_unit_move_version`
+    # restarts at 0 on reset, and the per-engine cache outlives the episode)
     # CRITICAL: Include turn - targets can MOVE between turns; pool built in turn 1 is stale in turn 2+
-    # CRITICAL: Include hash of enemy positions - targets can move between activations (reactive, etc.)
-    # Pool built when target at (5,5) is stale when target moved to (12,9)
-    # CRITICAL: Include wall_hexes (topology) so pool from one scenario/board is never reused for another.
-    # Multiple envs in same process (e.g. bot_eval) can have same (pid, id, ep, turn, positions); only topology differs.
+    # CRITICAL: Include `_unit_move_version` - targets can move between activations (reactive,
+    # etc.); every position write bumps it through `_touch_unit_los`. Safe on unit death: the
+    # cache-hit path re-filters with is_unit_alive().
+    # Engine identity and pid are NOT in the key: the cache lives in this engine's game_state
+    # (engine/target_pool_cache.py), and topology changes only on scenario rotation, which
+    # clears it (clear_target_pool_cache).
     unit_col, unit_row = require_unit_position(unit, game_state)
     unit_id_str = str(unit_id)
     unit_player = require_key(unit, "player")
@@ -3066,60 +3191,25 @@ def shooting_build_valid_target_pool(
     except (TypeError, ValueError) as exc:
         raise ValueError(f"Invalid unit player value: {unit_player}") from exc
     unit["player"] = unit_player_int
-    episode_num = require_key(game_state, "episode_number")
-    turn_num = require_key(game_state, "turn")
-    # wall_hexes_tuple: walls never change — compute once per game_state instance
-    if "_wall_hexes_tuple_cache" not in game_state:
-        _raw_walls = require_key(game_state, "wall_hexes")
-        if not isinstance(_raw_walls, (list, set, tuple)):
-            raise TypeError(f"wall_hexes must be list/set/tuple (got {type(_raw_walls).__name__})")
-        _norm: List[Tuple[int, int]] = []
-        for _raw_wall in _raw_walls:
-            if not isinstance(_raw_wall, (list, tuple)) or len(_raw_wall) != 2:
-                raise ValueError(f"Invalid wall hex format in game_state.wall_hexes: {_raw_wall!r}")
-            _wc, _wr = normalize_coordinates(_raw_wall[0], _raw_wall[1])
-            _norm.append((_wc, _wr))
-        game_state["_wall_hexes_tuple_cache"] = tuple(sorted(_norm))
-    wall_hexes_tuple = game_state["_wall_hexes_tuple_cache"]
-    # enemy_pos_hash: cache per player, invalidate when any unit moves (_unit_move_version)
-    # Safe on unit death: cache-hit path re-filters with is_unit_alive()
-    _move_ver = game_state["_unit_move_version"]
-    _eph_store = game_state.setdefault("_enemy_pos_hash_v", {})
-    _eph_entry = _eph_store.get(unit_player_int)
-    if _eph_entry is None or _eph_entry[0] != _move_ver:
-        units_cache = require_key(game_state, "units_cache")
-        _eph = tuple(
-            sorted(
-                (tid, int(e["col"]), int(e["row"]))
-                for tid, e in units_cache.items()
-                if int(e.get("player", -1)) != unit_player_int and is_unit_alive(tid, game_state)
-            )
-        )
-        _eph_store[unit_player_int] = (_move_ver, _eph)
-        enemy_pos_hash = _eph
-    else:
-        enemy_pos_hash = _eph_entry[1]
     precheck_cache_tag = 1 if precomputed_enemy_precheck is not None else 0
     cache_key = (
-        os.getpid(),
-        gs_instance_id,
-        episode_num,
-        turn_num,
+        require_key(game_state, "episode_number"),
+        require_key(game_state, "turn"),
+        require_key(game_state, "_unit_move_version"),
         unit_id_str,
         unit_col,
         unit_row,
         advance_status,
         adjacent_status,
         unit_player_int,
-        enemy_pos_hash,
-        wall_hexes_tuple,
         precheck_cache_tag,
     )
+    pool_cache = target_pool_cache(game_state).pools
 
     # Check cache
-    if cache_key in _target_pool_cache:
+    cached_pool = pool_cache.get(cache_key)
+    if cached_pool is not None:
         # Cache hit: Fast path - filter dead targets only
-        cached_pool = _target_pool_cache[cache_key]
 
         # Filter out units that died, friendly, or lost LoS
         alive_targets = []
@@ -3422,8 +3512,8 @@ def shooting_build_valid_target_pool(
     
     valid_target_pool = filtered_pool
 
-    # Store in cache
-    _target_pool_cache[cache_key] = valid_target_pool
+    # Store in cache (bounded LRU: evicts the least recently read pool)
+    pool_cache.put(cache_key, valid_target_pool)
 
     # LOS_DEBUG=1: Log LoS ratio for each target when storing (baseline for contradiction analysis)
     if os.environ.get("LOS_DEBUG") == "1" and valid_target_pool:
@@ -3451,10 +3541,6 @@ def shooting_build_valid_target_pool(
             sys.stderr.write(msg)
             sys.stderr.flush()
 
-    # Prevent memory leak: Clear cache if it grows too large
-    if len(_target_pool_cache) > _cache_size_limit:
-        _target_pool_cache.clear()
-
     # Update unit's target pool
     unit["valid_target_pool"] = valid_target_pool
     unit["_pool_from_cache"] = False
@@ -3786,6 +3872,36 @@ def ground_los_blocking_signature(game_state: Dict[str, Any]) -> Tuple[Any, ...]
     )
 
 
+def _get_los_clearance_field(game_state: Dict[str, Any]) -> np.ndarray:
+    """Champ de dégagement du terrain (``engine.los_clearance``), caché par état comme les grilles.
+
+    Précalculé une fois par TERRAIN et partagé entre épisodes et workers (mémoire de module, puis
+    fichier mmap) : seule la consultation du cache est payée ici, une fois par ``game_state``.
+    """
+    cached = game_state.get("_los_clearance_field_cache")
+    if cached is not None:
+        return cached
+    from engine.los_clearance import blocker_clearance_for
+    wall_grid, area_grid = _get_los_blocking_grids(game_state)
+    field = blocker_clearance_for(ground_los_blocking_signature(game_state), wall_grid, area_grid)
+    game_state["_los_clearance_field_cache"] = field
+    return field
+
+
+def _los_pairs_needing_trace(
+    game_state: Dict[str, Any],
+    from_arr: np.ndarray,
+    to_arr: np.ndarray,
+) -> np.ndarray:
+    """Indices des paires que le champ de dégagement ne tranche PAS — les seules à tracer.
+
+    Les autres sont dégagées par construction (aucun bloqueur, même exclu, à portée de la ligne).
+    """
+    from engine.los_clearance import clear_by_clearance
+    settled = clear_by_clearance(_get_los_clearance_field(game_state), from_arr, to_arr)
+    return np.flatnonzero(~settled)
+
+
 def batch_ground_hex_can_see(
     game_state: Dict[str, Any],
     from_hex: Tuple[int, int],
@@ -3843,7 +3959,17 @@ def batch_ground_hex_can_see(
     )
     target_area[in_grid] = area_grid[to_cols[in_grid], to_rows[in_grid]]
 
-    for idx, c_off, r_off in batch_hex_line_steps(from_col, from_row, to_arr, result):
+    # Champ de dégagement : les lignes trop courtes pour atteindre un bloqueur sont vues sans
+    # tracé ; seules les autres passent par le cube-lerp vectorisé.
+    todo = _los_pairs_needing_trace(
+        game_state, np.array([[from_col, from_row]], dtype=np.int64).repeat(n_targets, axis=0),
+        to_arr,
+    )
+    if todo.size == 0:
+        return result
+    traced = np.ones(todo.size, dtype=bool)
+    target_area = target_area[todo]
+    for idx, c_off, r_off in batch_hex_line_steps(from_col, from_row, to_arr[todo], traced):
         # Le test de bornes reste indispensable — une cellule hors grille est LIBRE, comme
         # `prev in wall_set` est faux hors plateau — mais il est presque toujours vrai partout
         # (mesuré : 0 cellule hors grille sur les deux terrains), d'où le chemin direct.
@@ -3861,8 +3987,9 @@ def batch_ground_hex_can_see(
             & (cell_area != source_area)
             & (cell_area != target_area[sel])
         )
-        result[sel[blocked]] = False
+        traced[sel[blocked]] = False
 
+    result[todo] = traced
     return result
 
 
@@ -4169,6 +4296,46 @@ def compute_unit_los(
     return _compute_unit_los_uncached(game_state, shooter, target)
 
 
+def compute_units_los(
+    game_state: Dict[str, Any],
+    shooter: Dict[str, Any],
+    targets: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """:func:`compute_unit_los` pour plusieurs cibles d'un même tireur, résultats alignés.
+
+    Même pair-cache : les paires déjà connues sont servies telles quelles, les autres sont
+    calculées ENSEMBLE (un seul passage vectorisé, ``_compute_units_los_uncached``) puis
+    écrites au cache. Les cibles coordonnées-seules (sans id) ne sont jamais cachées.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(targets)
+    sid = shooter.get("id")
+    holder = None
+    if sid is not None:
+        holder = game_state.get("_unit_los_pair_cache")
+        if holder is None:
+            holder = {}
+            game_state["_unit_los_pair_cache"] = holder
+    missing: List[int] = []
+    for i, target in enumerate(targets):
+        tid = target.get("id")
+        if holder is not None and tid is not None:
+            cached = holder.get((str(sid), str(tid)))
+            if cached is not None:
+                results[i] = cached
+                continue
+        missing.append(i)
+    if missing:
+        computed = _compute_units_los_uncached(
+            game_state, shooter, [targets[i] for i in missing]
+        )
+        for i, result in zip(missing, computed):
+            results[i] = result
+            tid = targets[i].get("id")
+            if holder is not None and tid is not None:
+                holder[(str(sid), str(tid))] = result
+    return [r for r in results if r is not None]
+
+
 def _resolve_target_models_for_los(
     game_state: Dict[str, Any],
     target: Dict[str, Any],
@@ -4373,6 +4540,151 @@ def _target_model_visible_cells(
     return vset
 
 
+def _batch_los_segments_clear(
+    game_state: Dict[str, Any],
+    src_arr: np.ndarray,
+    tgt_arr: np.ndarray,
+    pair_group: np.ndarray,
+    excluded_by_group: np.ndarray,
+) -> np.ndarray:
+    """JUMEAU VECTORISÉ du chemin 2D de :func:`_los_line_segment_clear`, N paires d'un coup.
+
+    Même règle de blocage, lue sur les grilles de ``_get_los_blocking_grids`` : un mur, ou une case
+    obscuring dont l'area n'est pas exclue pour CETTE paire. Les exclusions (13.10) dépendent du
+    couple tireur/figurine cible, pas de la case : ``excluded_by_group`` (bool, shape
+    ``(G, n_areas)``) porte un jeu d'exclusions par groupe, ``pair_group`` (int, shape (N,)) le
+    groupe de chaque paire. Murs = wall_set COMPLET du plateau : les figurines à l'étage (murs
+    ignorés) et la LoS 3D restent sur le chemin scalaire, c'est l'appelant qui trie.
+    """
+    from engine.hex_utils import batch_pair_hex_line_steps
+
+    n_pairs = len(tgt_arr)
+    result = np.ones(n_pairs, dtype=bool)
+    if n_pairs == 0:
+        return result
+    todo = _los_pairs_needing_trace(game_state, src_arr, tgt_arr)
+    if todo.size == 0:
+        return result
+    traced = np.ones(todo.size, dtype=bool)
+    todo_group = pair_group[todo]
+    wall_grid, area_grid = _get_los_blocking_grids(game_state)
+    grid_cols, grid_rows = wall_grid.shape
+    for idx, c_off, r_off in batch_pair_hex_line_steps(src_arr[todo], tgt_arr[todo], traced):
+        inside = (c_off >= 0) & (c_off < grid_cols) & (r_off >= 0) & (r_off < grid_rows)
+        if not inside.all():
+            idx, c_off, r_off = idx[inside], c_off[inside], r_off[inside]
+            if idx.size == 0:
+                continue
+        cell_area = area_grid[c_off, r_off]
+        in_area = cell_area >= 0
+        blocked = wall_grid[c_off, r_off]
+        if in_area.any():
+            area_blocks = np.zeros(idx.size, dtype=bool)
+            area_blocks[in_area] = ~excluded_by_group[
+                todo_group[idx[in_area]], cell_area[in_area]
+            ]
+            blocked = blocked | area_blocks
+        traced[idx[blocked]] = False
+    result[todo] = traced
+    return result
+
+
+def _target_models_visible_cells_batch(
+    game_state: Dict[str, Any],
+    shooter_models: List[Tuple[Tuple[int, int], List[Tuple[int, int]], Set[Tuple[int, int]], Optional[float], Any]],
+    target_models: List[Tuple[List[Tuple[int, int]], Set[str], Optional[float], Any]],
+) -> List[Set[Tuple[int, int]]]:
+    """:func:`_target_model_visible_cells` pour TOUTES les figurines cibles, en un passage vectorisé.
+
+    ``target_models`` : une entrée ``(model_hexes, excluded_areas, z_target, occ_target)`` par
+    figurine cible, éventuellement de plusieurs unités. Rend les cases vues, alignées sur
+    ``target_models``. Résultat identique au scalaire, figurine par figurine (test de parité
+    ``test_unit_los_batch_parity``) ; seul l'ORDRE d'examen change : toutes les ancres d'abord,
+    puis les vantages latéraux des seules cases qu'aucune ancre ne voit — le scalaire s'arrête à
+    la première figurine tireuse qui voit, le OU final est le même.
+
+    Les couples (figurine tireuse, figurine cible) hors du cas 2D plein plateau — tireur à l'étage
+    (wall_set réduit) ou LoS 3D plancher-occulteur — passent par le chemin scalaire
+    :func:`_los_hex_visible`, seule source de vérité de ces cas.
+    """
+    out: List[Set[Tuple[int, int]]] = [set() for _ in target_models]
+    if not target_models or not shooter_models:
+        return out
+    base_wall_set = _get_wall_set(game_state)
+    obscuring_by_hex = _get_obscuring_hex_to_area(game_state)
+    area_ids = [area_id for area_id, _hexes in _get_obscuring_area_sets(game_state)]
+    n_areas = max(len(area_ids), 1)
+
+    excluded_by_group = np.zeros((len(target_models), n_areas), dtype=bool)
+    # Paires vectorisables, ancres d'abord : (figurine tireuse, figurine cible, case).
+    pair_shooter: List[int] = []
+    pair_group: List[int] = []
+    pair_cells: List[Tuple[int, int]] = []
+    for g, (model_hexes, excluded, z_t, occ_t) in enumerate(target_models):
+        for a, area_id in enumerate(area_ids):
+            if area_id in excluded:
+                excluded_by_group[g, a] = True
+        for s, (s_anchor, s_footprint, s_wall, z_s, occ_s) in enumerate(shooter_models):
+            if (z_s is not None) and (z_t is not None):
+                occs = [o for o in (occ_s, occ_t) if o is not None]
+                floor_occ = occs or None
+            else:
+                floor_occ = None
+            if floor_occ is None and s_wall is base_wall_set:
+                for tc, tr in model_hexes:
+                    pair_shooter.append(s)
+                    pair_group.append(g)
+                    pair_cells.append((int(tc), int(tr)))
+                continue
+            for tc, tr in model_hexes:
+                cell = (int(tc), int(tr))
+                if cell in out[g]:
+                    continue
+                if _los_hex_visible(
+                    s_anchor, s_footprint, cell[0], cell[1], s_wall, obscuring_by_hex, excluded,
+                    floor_occluders=floor_occ, z_start=z_s, z_end=z_t,
+                ):
+                    out[g].add(cell)
+    if not pair_cells:
+        return out
+
+    group_arr = np.asarray(pair_group, dtype=np.int64)
+    tgt_arr = np.asarray(pair_cells, dtype=np.int64)
+    src_arr = np.asarray(
+        [shooter_models[s][0] for s in pair_shooter], dtype=np.int64
+    ).reshape(-1, 2)
+    seen = _batch_los_segments_clear(game_state, src_arr, tgt_arr, group_arr, excluded_by_group)
+    for i in np.flatnonzero(seen):
+        out[pair_group[i]].add(pair_cells[i])
+
+    # 2ᵉ chance (peek de coin) : vantages latéraux des paires dont la case n'est encore vue
+    # par AUCUNE figurine tireuse — même primitive géométrique que le scalaire.
+    lat_src: List[Tuple[int, int]] = []
+    lat_group: List[int] = []
+    lat_cells: List[Tuple[int, int]] = []
+    for i in np.flatnonzero(~seen):
+        g = pair_group[i]
+        cell = pair_cells[i]
+        if cell in out[g]:
+            continue
+        s_anchor, s_footprint = shooter_models[pair_shooter[i]][0], shooter_models[pair_shooter[i]][1]
+        for vantage in _shooter_lateral_vantage_hexes(s_anchor, s_footprint, cell):
+            lat_src.append(vantage)
+            lat_group.append(g)
+            lat_cells.append(cell)
+    if lat_cells:
+        lat_seen = _batch_los_segments_clear(
+            game_state,
+            np.asarray(lat_src, dtype=np.int64),
+            np.asarray(lat_cells, dtype=np.int64),
+            np.asarray(lat_group, dtype=np.int64),
+            excluded_by_group,
+        )
+        for i in np.flatnonzero(lat_seen):
+            out[lat_group[i]].add(lat_cells[i])
+    return out
+
+
 def _excluded_obscuring_areas(
     obscuring_by_hex: Dict[Tuple[int, int], str],
     *hex_groups: List[Tuple[int, int]],
@@ -4526,6 +4838,20 @@ def _compute_unit_los_uncached(
     target: Dict[str, Any],
 ) -> Dict[str, Any]:
     """Uncached core of compute_unit_los() — see that function for semantics."""
+    return _compute_units_los_uncached(game_state, shooter, [target])[0]
+
+
+def _compute_units_los_uncached(
+    game_state: Dict[str, Any],
+    shooter: Dict[str, Any],
+    targets: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Cœur non caché de :func:`compute_unit_los` pour PLUSIEURS cibles d'un même tireur.
+
+    Les cases de toutes les figurines de toutes les cibles sont tracées en UN passage vectorisé
+    (:func:`_target_models_visible_cells_batch`) ; le couvert reste évalué cible par cible.
+    Résultats alignés sur ``targets``, chacun identique à un appel unitaire.
+    """
     gym_training = bool(
         game_state.get("gym_training_mode", False)
         or require_key(game_state, "config").get("gym_training_mode", False)
@@ -4537,98 +4863,115 @@ def _compute_unit_los_uncached(
     shooter_models, shooter_hexes_all = _resolve_shooter_models_with_walls(
         game_state, shooter, gym_training
     )
+    obscuring_by_hex = _get_obscuring_hex_to_area(game_state)
+    excluded_base = _excluded_obscuring_areas(obscuring_by_hex, shooter_hexes_all)
 
     # Règles 06.01 + 13.10 : visibilité binaire évaluée PAR MODÈLE cible. Un modèle est
     # visible si >= 1 cellule de son socle a une ligne dégagée depuis >= 1 figurine tireuse ;
     # l'unité est visible si >= 1 modèle l'est. Chaque test exclut les areas obscuring du tireur
     # (union de l'escouade) et celles que CE modèle cible occupe.
-    (
-        target_model_footprints,
-        target_model_centers,
-        cover_base_shape,
-        cover_base_size,
-        cover_orientation,
-        target_model_levels,
-    ) = _resolve_target_models_for_los(game_state, target, gym_training)
-
-    obscuring_by_hex = _get_obscuring_hex_to_area(game_state)
-    excluded_base = _excluded_obscuring_areas(obscuring_by_hex, shooter_hexes_all)
-    # LoS 3D : MODEL_HEIGHT cible (None sur stubs 2D → z_t None → tracé 2D inchangé).
-    target_mh = float(target["MODEL_HEIGHT"]) if "MODEL_HEIGHT" in target else None
+    resolved: List[Tuple[Any, ...]] = []
+    target_models: List[Tuple[List[Tuple[int, int]], Set[str], Optional[float], Any]] = []
+    for target in targets:
+        (
+            target_model_footprints,
+            target_model_centers,
+            cover_base_shape,
+            cover_base_size,
+            cover_orientation,
+            target_model_levels,
+        ) = _resolve_target_models_for_los(game_state, target, gym_training)
+        # LoS 3D : MODEL_HEIGHT cible (None sur stubs 2D → z_t None → tracé 2D inchangé).
+        target_mh = float(target["MODEL_HEIGHT"]) if "MODEL_HEIGHT" in target else None
+        first = len(target_models)
+        for idx, model_hexes in enumerate(target_model_footprints):
+            excluded = excluded_base | _excluded_obscuring_areas(obscuring_by_hex, model_hexes)
+            if target_mh is None:
+                z_t, occ_t = None, None
+            else:
+                z_t, occ_t = _fig_z_and_occluder(
+                    game_state, target_model_levels[idx], model_hexes, target_mh
+                )
+            target_models.append((model_hexes, excluded, z_t, occ_t))
+        resolved.append((
+            target, first, target_model_footprints, target_model_centers,
+            cover_base_shape, cover_base_size, cover_orientation,
+        ))
+    visible_cells = _target_models_visible_cells_batch(game_state, shooter_models, target_models)
 
-    visible = 0
-    total = 0
-    visible_models = 0
-    visible_hex_set: Set[Tuple[int, int]] = set()
-    # Visibilité intégrale par figurine (index aligné sur target_model_footprints) : True si tout le
-    # socle de CETTE figurine est vu par le tireur. Base du test (b) par-figurine du couvert (13.08).
-    model_full_vis: List[bool] = []
-    for idx, model_hexes in enumerate(target_model_footprints):
-        excluded = excluded_base | _excluded_obscuring_areas(obscuring_by_hex, model_hexes)
-        if target_mh is None:
-            z_t, occ_t = None, None
-        else:
-            z_t, occ_t = _fig_z_and_occluder(
-                game_state, target_model_levels[idx], model_hexes, target_mh
-            )
-        vset = _target_model_visible_cells(
-            shooter_models, model_hexes, obscuring_by_hex, excluded,
-            z_target=z_t, occ_target=occ_t,
-        )
-        v = len(vset)
-        t = len(model_hexes)
-        visible += v
-        total += t
-        visible_hex_set |= vset
-        if v > 0:
-            visible_models += 1
-        model_full_vis.append(t > 0 and v == t)
-    can_see = visible_models > 0
-    fully_visible = total > 0 and visible == total
-
-    # Couvert (règle 13.08) évalué PAR FIGURINE : l'unité a le couvert si CHAQUE figurine vivante
-    # remplit au moins une condition :
-    #   (a) INFANTRY/BEASTS/SWARM et dans un terrain area (test terrain pur, indépendant du tireur),
-    #   (b) pas entièrement visible par le tireur (socle partiellement masqué, ou figurine invisible).
-    # Une seule figurine entièrement visible ET hors terrain area annule le couvert de toute l'unité.
     from engine.terrain_utils import model_within_terrain
     terrain_areas = require_key(game_state, "terrain_areas")
-    target_hideable = bool(target.get("hideable"))
-    cover = False
-    if can_see:
-        all_models_covered = True
-        for idx in range(len(target_model_footprints)):
-            # (b) : figurine pas entièrement visible → couverte, condition remplie.
-            if not model_full_vis[idx]:
-                continue
-            # Figurine entièrement visible → doit remplir (a), sinon l'unité perd le couvert.
-            center = target_model_centers[idx]
-            cond_a = (
-                target_hideable
-                and center is not None
-                and model_within_terrain(
-                    center[0], center[1],
-                    cover_base_shape, cover_base_size, cover_orientation,
-                    terrain_areas, obscuring_only=False,
+    results: List[Dict[str, Any]] = []
+    for (
+        target, first, target_model_footprints, target_model_centers,
+        cover_base_shape, cover_base_size, cover_orientation,
+    ) in resolved:
+        visible = 0
+        total = 0
+        visible_models = 0
+        visible_hex_set: Set[Tuple[int, int]] = set()
+        # Visibilité intégrale par figurine (index aligné sur target_model_footprints) : True si
+        # tout le socle de CETTE figurine est vu par le tireur. Base du test (b) par-figurine du
+        # couvert (13.08).
+        model_full_vis: List[bool] = []
+        for idx, model_hexes in enumerate(target_model_footprints):
+            vset = visible_cells[first + idx]
+            v = len(vset)
+            t = len(model_hexes)
+            visible += v
+            total += t
+            visible_hex_set |= vset
+            if v > 0:
+                visible_models += 1
+            model_full_vis.append(t > 0 and v == t)
+        can_see = visible_models > 0
+        fully_visible = total > 0 and visible == total
+
+        # Couvert (règle 13.08) évalué PAR FIGURINE : l'unité a le couvert si CHAQUE figurine
+        # vivante remplit au moins une condition :
+        #   (a) INFANTRY/BEASTS/SWARM et dans un terrain area (test terrain pur, indépendant du
+        #       tireur),
+        #   (b) pas entièrement visible par le tireur (socle partiellement masqué, ou figurine
+        #       invisible).
+        # Une seule figurine entièrement visible ET hors terrain area annule le couvert de toute
+        # l'unité.
+        target_hideable = bool(target.get("hideable"))
+        cover = False
+        if can_see:
+            all_models_covered = True
+            for idx in range(len(target_model_footprints)):
+                # (b) : figurine pas entièrement visible → couverte, condition remplie.
+                if not model_full_vis[idx]:
+                    continue
+                # Figurine entièrement visible → doit remplir (a), sinon l'unité perd le couvert.
+                center = target_model_centers[idx]
+                cond_a = (
+                    target_hideable
+                    and center is not None
+                    and model_within_terrain(
+                        center[0], center[1],
+                        cover_base_shape, cover_base_size, cover_orientation,
+                        terrain_areas, obscuring_only=False,
+                    )
                 )
-            )
-            if not cond_a:
-                all_models_covered = False
-                break
-        cover = all_models_covered
-
-    return {
-        "can_see": can_see,
-        "fully_visible": fully_visible,
-        "cover": cover,
-        "visible": visible,
-        "total": total,
-        # Cellules de l'empreinte cible réellement vues (règle 06.01/13.10 par-figurine).
-        # Consommé par la preview frontend pour peindre les cases visibles des cibles ciblables
-        # par-dessus le cône WASM → cohérence blink↔visuel garantie (une cible qui blinke a
-        # toujours ses cases peintes, mêmes exclusions obscuring que le ciblage).
-        "visible_cells": sorted(visible_hex_set),
-    }
+                if not cond_a:
+                    all_models_covered = False
+                    break
+            cover = all_models_covered
+
+        results.append({
+            "can_see": can_see,
+            "fully_visible": fully_visible,
+            "cover": cover,
+            "visible": visible,
+            "total": total,
+            # Cellules de l'empreinte cible réellement vues (règle 06.01/13.10 par-figurine).
+            # Consommé par la preview frontend pour peindre les cases visibles des cibles
+            # ciblables par-dessus le cône WASM → cohérence blink↔visuel garantie (une cible qui
+            # blinke a toujours ses cases peintes, mêmes exclusions obscuring que le ciblage).
+            "visible_cells": sorted(visible_hex_set),
+        })
+    return results
 
 
 def _update_unit_los_preview_data(
@@ -4756,65 +5099,6 @@ def _update_unit_los_preview_data(
     unit["los_preview_ratio_by_hex"] = ratio_by_hex
 
 
-def _get_accurate_hex_line(start_col: int, start_row: int, end_col: int, end_row: int) -> List[Tuple[int, int]]:
-    """Accurate hex line using cube coordinates."""
-    start_cube = _offset_to_cube(start_col, start_row)
-    end_cube = _offset_to_cube(end_col, end_row)
-    
-    distance = max(abs(start_cube.x - end_cube.x), abs(start_cube.y - end_cube.y), abs(start_cube.z - end_cube.z))
-    path = []
-    
-    for i in range(distance + 1):
-        t = i / distance if distance > 0 else 0
-        
-        cube_x = start_cube.x + t * (end_cube.x - start_cube.x)
-        cube_y = start_cube.y + t * (end_cube.y - start_cube.y)
-        cube_z = start_cube.z + t * (end_cube.z - start_cube.z)
-        
-        rounded_cube = _cube_round(cube_x, cube_y, cube_z)
-        offset_col, offset_row = _cube_to_offset(rounded_cube)
-        path.append((offset_col, offset_row))
-    
-    return path
-
-class CubeCoordinate:
-    def __init__(self, x: int, y: int, z: int):
-        self.x = x
-        self.y = y
-        self.z = z
-
-
-def _offset_to_cube(col: int, row: int) -> CubeCoordinate:
-    x = col
-    z = row - (col - (col & 1)) // 2
-    y = -x - z
-    return CubeCoordinate(x, y, z)
-
-
-def _cube_to_offset(cube: CubeCoordinate) -> Tuple[int, int]:
-    col = cube.x
-    row = cube.z + (cube.x - (cube.x & 1)) // 2
-    return col, row
-
-
-def _cube_round(x: float, y: float, z: float) -> CubeCoordinate:
-    rx = round(x)
-    ry = round(y)
-    rz = round(z)
-    
-    x_diff = abs(rx - x)
-    y_diff = abs(ry - y)
-    z_diff = abs(rz - z)
-    
-    if x_diff > y_diff and x_diff > z_diff:
-        rx = -ry - rz
-    elif y_diff > z_diff:
-        ry = -rx - rz
-    else:
-        rz = -rx - ry
-    
-    return CubeCoordinate(rx, ry, rz)
-
 def _shooting_phase_complete(game_state: Dict[str, Any]) -> Dict[str, Any]:
     """
     Complete shooting phase with player progression and turn management
@@ -4844,6 +5128,7 @@ def _shooting_phase_complete(game_state: Dict[str, Any]) -> Dict[str, Any]:
     # PERFORMANCE: Clear LoS cache at phase end (will rebuild next shooting phase)
     if "los_cache" in game_state:
         game_state["los_cache"] = {}
+    close_shoot_target_matrix(game_state)
     
     # Console log
     from engine.game_utils import add_console_log, add_debug_log
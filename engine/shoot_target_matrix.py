@@ -0,0 +1,155 @@
+"""
+shoot_target_matrix.py - Matrice tireur x ennemi de la phase de tir, entretenue par evenements.
+
+Chaque activation de tir (`shooting_unit_activation_start`, `weapon_availability_check`)
+reconstruisait `_build_weapon_availability_enemy_precheck` : pour CHAQUE ennemi, distance bord a
+bord des socles, engagement avec le tireur, puis une boucle sur tous les allies pour le blocage
+« cible engagee avec un ami ». Or, entre deux activations d'une meme phase, presque rien ne bouge :
+une cible meurt, parfois une escouade se deplace (tir puis mouvement, ingress). Recalculer toute la
+geometrie a chaque activation payait pour des cellules qui n'avaient pas change.
+
+La matrice est ouverte par `shooting_phase_start` et fermee par `_shooting_phase_complete`. Elle
+garde deux familles de cellules, toutes remplies PARESSEUSEMENT a la premiere lecture (le chemin
+gym n'active jamais par `shooting_unit_activation_start` : une construction eager a l'ouverture
+serait un cout pur pour lui) :
+
+- `rows[tireur][ennemi] = (distance, engage_avec_le_tireur)` — la geometrie de la paire ; la
+  distance est bornee a la portee max du tireur (`max_rng[tireur]`), seul axe « arme » dont depend
+  le precalcul : les profils d'une meme escouade se departagent ensuite par `distance <= RNG` ;
+- `engaged_pairs[(cible, ami)] = bool` — la cible est-elle dans la zone d'engagement de cet ami.
+
+Ce qui ne vit PAS ici : les drapeaux de LoS (lus dans `unit["los_cache"]` a chaque lecture, ils ont
+leur propre invalidation) et la liste des vivants (la lecture enumere `units_cache`).
+
+Invalidation CIBLEE, aux deux seuls evenements qui changent une cellule :
+
+- ecriture de position : `_apply_los_invalidation` / `_los_end_batch` (shared_utils) appellent
+  `shoot_target_matrix_after_move` APRES le bump de `_unit_move_version` ; seules les cellules de
+  l'unite deplacee sont oubliees ;
+- mort d'escouade : `remove_from_units_cache` appelle `shoot_target_matrix_drop_unit`.
+
+La matrice suit `_unit_move_version` pas a pas. Si elle rate un bump (ecriture qui n'a pas
+traverse le choke-point, test qui incremente la version a la main), la lecture suivante voit
+l'ecart et repart de zero au lieu de servir une cellule perimee.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+_HOLDER_KEY = "_shoot_target_matrix"
+
+
+class ShootTargetMatrix:
+    """Cellules geometriques de la phase de tir en cours (cf. module)."""
+
+    __slots__ = ("phase_key", "version", "rows", "max_rng", "engaged_pairs", "hits", "misses")
+
+    def __init__(self, phase_key: Tuple[Hashable, ...], version: int) -> None:
+        self.phase_key = phase_key
+        self.version = version
+        self.rows: Dict[str, Dict[str, Tuple[int, bool]]] = {}
+        self.max_rng: Dict[str, int] = {}
+        self.engaged_pairs: Dict[Tuple[str, str], bool] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def row(self, shooter_id: str, max_rng: int) -> Dict[str, Tuple[int, bool]]:
+        """Ligne du tireur ; repart vide si sa portee max a change (distances bornees a l'ancienne)."""
+        if self.max_rng.get(shooter_id) != max_rng:  # get allowed (ligne absente = a construire)
+            self.max_rng[shooter_id] = max_rng
+            self.rows[shooter_id] = {}
+        return self.rows[shooter_id]
+
+    def forget_unit(self, unit_id: str) -> None:
+        """Oublie toutes les cellules ou `unit_id` figure, comme tireur, cible ou ami."""
+        self.rows.pop(unit_id, None)
+        self.max_rng.pop(unit_id, None)
+        for cells in self.rows.values():
+            cells.pop(unit_id, None)
+        stale = [k for k in self.engaged_pairs if k[0] == unit_id or k[1] == unit_id]
+        for key in stale:
+            del self.engaged_pairs[key]
+
+    def reset(self, version: int) -> None:
+        self.version = version
+        self.rows.clear()
+        self.max_rng.clear()
+        self.engaged_pairs.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "rows": len(self.rows),
+            "cells": sum(len(cells) for cells in self.rows.values()),
+            "engaged_pairs": len(self.engaged_pairs),
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ShootTargetMatrix":
+        # Copie d'etat (apercu, snapshot) : memes positions, memes version — une matrice vide
+        # y est exacte, et ne recopie pas des cellules que la copie ne lira sans doute jamais.
+        fresh = ShootTargetMatrix(self.phase_key, self.version)
+        memo[id(self)] = fresh
+        return fresh
+
+
+def _phase_key(game_state: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    return (
+        game_state.get("episode_number"),  # get allowed (absent hors episode gym)
+        game_state["turn"],
+        game_state["current_player"],
+    )
+
+
+def open_shoot_target_matrix(game_state: Dict[str, Any]) -> ShootTargetMatrix:
+    """Ouvre une matrice vide pour la phase de tir qui commence (`shooting_phase_start`)."""
+    matrix = ShootTargetMatrix(_phase_key(game_state), int(game_state["_unit_move_version"]))
+    game_state[_HOLDER_KEY] = matrix
+    return matrix
+
+
+def close_shoot_target_matrix(game_state: Dict[str, Any]) -> None:
+    """Ferme la matrice en fin de phase de tir : rien ne doit la lire hors de sa phase."""
+    game_state.pop(_HOLDER_KEY, None)
+
+
+def active_shoot_target_matrix(game_state: Dict[str, Any]) -> Optional[ShootTargetMatrix]:
+    """Matrice de la phase de tir EN COURS, alignee sur `_unit_move_version`, ou None.
+
+    None hors phase de tir, ou si la matrice appartient a une autre phase (fin de phase non
+    traversee : reset d'episode, chargement d'etat) — l'appelant recalcule alors sans cache.
+    """
+    matrix = game_state.get(_HOLDER_KEY)  # get allowed (absente hors phase de tir)
+    if matrix is None or game_state.get("phase") != "shoot":  # get allowed
+        return None
+    if matrix.phase_key != _phase_key(game_state):
+        return None
+    version = int(game_state["_unit_move_version"])
+    if matrix.version != version:
+        matrix.reset(version)
+    return matrix
+
+
+def shoot_target_matrix_after_move(game_state: Dict[str, Any], unit_ids: Iterable[str]) -> None:
+    """Apres UN bump de `_unit_move_version` couvrant `unit_ids` : oublie leurs cellules.
+
+    Seul un bump suivi pas a pas (version de la matrice = version courante - 1) est applique de
+    facon ciblee ; sinon la matrice a deja rate un evenement et la lecture suivante la videra.
+    """
+    matrix = game_state.get(_HOLDER_KEY)  # get allowed (absente hors phase de tir)
+    if matrix is None:
+        return
+    version = int(game_state["_unit_move_version"])
+    if matrix.version != version - 1:
+        return
+    for unit_id in unit_ids:
+        matrix.forget_unit(str(unit_id))
+    matrix.version = version
+
+
+def shoot_target_matrix_drop_unit(game_state: Dict[str, Any], unit_id: str) -> None:
+    """Escouade detruite : retire sa ligne, sa colonne et ses paires d'engagement."""
+    matrix = game_state.get(_HOLDER_KEY)  # get allowed (absente hors phase de tir)
+    if matrix is not None:
+        matrix.forget_unit(str(unit_id))
@@ -479,27 +479,43 @@ def normalize_move_costs(
     return out.astype(np.float32)
 
 
-def iter_window_hexes(
+def window_bounds(
     anchor_col: int,
     anchor_row: int,
     half_extent_subhex: int,
     board_cols: int,
     board_rows: int,
-) -> Iterable[Tuple[int, int]]:
-    """Itere les hexes du board susceptibles de tomber dans la grille (bounding box).
+) -> Tuple[int, int, int, int]:
+    """Boite englobante (col_lo, col_hi, row_lo, row_hi), bornes incluses, des hexes du board
+    susceptibles de tomber dans la grille. Vide si col_lo > col_hi ou row_lo > row_hi.
 
-    Sur-approximation volontaire : le filtrage exact est fait par `hex_to_cell` (qui renvoie
-    None hors grille). Sert a borner la rasterisation sans scanner tout le board.
+    Sur-approximation volontaire : le filtrage exact est fait par `hex_to_cell` /
+    `hex_arrays_to_cells`. Sert a borner la rasterisation sans scanner tout le board.
     """
     w = _half_extent_px(half_extent_subhex)
     # `_hex_center` : x = col * 1.5 + cst, y = row * sqrt(3) + parite * sqrt(3)/2 + cst.
     # Marge de 1 hex pour absorber le demi-decalage de parite et les arrondis.
     d_col = int(math.ceil(w / 1.5)) + 1
     d_row = int(math.ceil(w / HEX_STEP_PX)) + 1
-    col_lo = max(0, anchor_col - d_col)
-    col_hi = min(board_cols - 1, anchor_col + d_col)
-    row_lo = max(0, anchor_row - d_row)
-    row_hi = min(board_rows - 1, anchor_row + d_row)
+    return (
+        max(0, anchor_col - d_col),
+        min(board_cols - 1, anchor_col + d_col),
+        max(0, anchor_row - d_row),
+        min(board_rows - 1, anchor_row + d_row),
+    )
+
+
+def iter_window_hexes(
+    anchor_col: int,
+    anchor_row: int,
+    half_extent_subhex: int,
+    board_cols: int,
+    board_rows: int,
+) -> Iterable[Tuple[int, int]]:
+    """Itere les hexes de `window_bounds` (bounding box de la grille)."""
+    col_lo, col_hi, row_lo, row_hi = window_bounds(
+        anchor_col, anchor_row, half_extent_subhex, board_cols, board_rows
+    )
     for c in range(col_lo, col_hi + 1):
         for r in range(row_lo, row_hi + 1):
             yield c, r
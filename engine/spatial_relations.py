@@ -764,6 +764,259 @@ def _entries_in_engagement_zone_3d(
     return False
 
 
+# ============================================================================
+# MATRICE D'ENGAGEMENT DU PLATEAU (§03.04)
+# ============================================================================
+# Les handlers posent sans cesse les MÊMES questions d'escouade dans une activation — « qui engage
+# X ? » (snapshot 12.04, éligibilité charge/fight, interdiction de tir 10.06, masque de move),
+# « X est-elle engagée ? », « cette ancre tombe-t-elle dans une EZ ennemie ? » — et chacune
+# reparcourait tous les ennemis en refabriquant deux empreintes par paire pour consulter
+# `_EZ_PAIR_CACHE`. La matrice tranche TOUTES les paires d'un coup par une broad-phase NumPy
+# (minorant de distance bord-à-bord par broadcasting), puis ne mesure exactement, avec la primitive
+# `entries_in_engagement_zone`, que les paires que le minorant n'écarte pas — à la demande, ligne
+# par ligne, et une seule fois par état.
+#
+# CLÉ = GÉOMÉTRIE, comme `_EZ_PAIR_CACHE` et pour la même raison (§0.18) : l'empreinte
+# `_engagement_entry_fingerprint` de chaque escouade posée, jamais un compteur de version. Une
+# figurine qui bouge change la clé par construction ; la matrice est alors reconstruite.
+#
+# Minorants — chacun ne peut que SOUS-estimer la distance, donc n'écarte que des paires vraiment
+# hors zone (le verdict est celui de la primitive, jamais une approximation) :
+# - `hex` : écart des boîtes cube (même minorant que `min_distance_between_sets`). La boîte
+#   couvre l'empreinte stockée ET les centres par-figurine élargis de la portée hex maximale d'un
+#   socle (`_base_hex_reach`) : le chemin 3D refabrique des empreintes par classe verticale avec
+#   l'orientation d'UNITÉ, qui peut différer de celle des figurines.
+# - `euclidean` : disques d'escouade de `_group_lower_bound` (centres `_hex_center` + rayon
+#   englobant `bounding_radius()`), vrais pour toute sous-classe verticale de figurines.
+# Le gate vertical ne fait que RETIRER des paires : un minorant horizontal reste valable en 3D.
+
+#: Portée hex maximale (centre → cellule) d'un socle, toutes orientations et parités confondues.
+_BASE_HEX_REACH_CACHE: Dict[Tuple[Any, ...], int] = {}
+
+#: Marge des comparaisons flottantes de la broad-phase euclidienne : `np.hypot` et `math.hypot`
+#: peuvent différer d'un ulp, la marge garde la prune du côté sûr (mesurer de trop, jamais l'inverse).
+_EZ_MATRIX_FLOAT_TOL = 1e-9
+
+
+def _base_hex_reach(base_shape: str, base_size: Any) -> int:
+    """Plus grande distance hex entre le centre d'un socle et une cellule de son empreinte."""
+    from engine.hex_utils import ORIENTATION_STEP_COUNT
+
+    key = (base_shape, base_size_cache_key(base_size))
+    cached = _BASE_HEX_REACH_CACHE.get(key)
+    if cached is None:
+        from engine.hex_utils import hex_distance
+
+        cached = 0
+        for parity in (0, 1):
+            for orientation in range(ORIENTATION_STEP_COUNT):
+                for c, r in compute_occupied_hexes(parity, 0, base_shape, base_size, orientation):
+                    cached = max(cached, hex_distance(parity, 0, c, r))
+        _BASE_HEX_REACH_CACHE[key] = cached
+    return cached
+
+
+def _entry_cube_box(entry: Dict[str, Any]) -> Tuple[int, int, int, int, int, int]:
+    """Boîte cube ``(xmin, xmax, ymin, ymax, zmin, zmax)`` couvrant tout ce que la mesure hex lit."""
+    from engine.hex_utils import offset_to_cube
+
+    cubes = [offset_to_cube(int(c), int(r)) for c, r in entry_footprint(entry)]
+    by_model = entry.get("occupied_hexes_by_model")  # get allowed (absente sur les synthétiques)
+    reach = 0
+    if by_model:
+        reach = _base_hex_reach(require_key(entry, "BASE_SHAPE"), require_key(entry, "BASE_SIZE"))
+        cubes.extend(offset_to_cube(int(c), int(r)) for c, r in by_model.values())
+    xs, ys, zs = zip(*cubes)
+    return (
+        min(xs) - reach, max(xs) + reach,
+        min(ys) - reach, max(ys) + reach,
+        min(zs) - reach, max(zs) + reach,
+    )
+
+
+def _entry_group_disc(entry: Dict[str, Any]) -> Tuple[float, float, float]:
+    """Disque englobant ``(cx, cy, r)`` de toute l'escouade (broad-phase euclidienne)."""
+    from engine.combat_utils import socle_from_cache_entry
+    from engine.hex_utils import _group_bounding_circle, _socle_bounding_circles
+
+    return _group_bounding_circle(_socle_bounding_circles(socle_from_cache_entry(entry)))
+
+
+class EngagementMatrix:
+    """Verdicts d'engagement de toutes les paires d'escouades POSÉES d'un état (cf. ci-dessus).
+
+    ``_verdict[i, j]`` : 1 engagées, 0 non engagées, -1 pas encore mesurée. La broad-phase pose
+    les 0 à la construction ; les -1 sont mesurés par la primitive au premier besoin et la
+    mesure, symétrique, remplit les deux cases.
+    """
+
+    __slots__ = (
+        "ids", "players", "_index", "_entries", "_verdict",
+        "_engagement_zone", "_metric", "_vertical_zone",
+    )
+
+    def __init__(
+        self,
+        items: List[Tuple[str, Dict[str, Any]]],
+        engagement_zone: int,
+        metric: str,
+        vertical_zone_inches: Optional[float],
+    ) -> None:
+        import numpy as np
+
+        self.ids: List[str] = [uid for uid, _ in items]
+        self.players = np.array([int(require_key(e, "player")) for _, e in items], dtype=np.int64)
+        self._index: Dict[str, int] = {uid: i for i, uid in enumerate(self.ids)}
+        self._entries: List[Dict[str, Any]] = [e for _, e in items]
+        self._engagement_zone = int(engagement_zone)
+        self._metric = metric
+        self._vertical_zone = vertical_zone_inches
+        near = self._near(self._bounds(self._entries))
+        self._verdict = np.where(near, np.int8(-1), np.int8(0))
+
+    # -- broad-phase -----------------------------------------------------------
+
+    def _bounds(self, entries: List[Dict[str, Any]]) -> Any:
+        import numpy as np
+
+        if self._metric == "hex":
+            return np.array([_entry_cube_box(e) for e in entries], dtype=np.int64).reshape(-1, 6)
+        if self._metric == "euclidean":
+            return np.array([_entry_group_disc(e) for e in entries], dtype=np.float64).reshape(-1, 3)
+        raise ValueError(f"Invalid engagement metric {self._metric!r}, expected 'hex' or 'euclidean'")
+
+    def _near(self, rows: Any, cols: Optional[Any] = None) -> Any:
+        """``(len(rows), len(cols))`` : True là où le minorant n'écarte PAS la paire."""
+        import numpy as np
+
+        cols = rows if cols is None else cols
+        if self._metric == "hex":
+            lower = np.zeros((len(rows), len(cols)), dtype=np.int64)
+            for lo, hi in ((0, 1), (2, 3), (4, 5)):
+                gap = np.maximum(
+                    cols[None, :, lo] - rows[:, None, hi], rows[:, None, lo] - cols[None, :, hi]
+                )
+                np.maximum(lower, gap, out=lower)
+            return lower <= self._engagement_zone
+        threshold = engagement_minimum_clearance_norm(self._engagement_zone)
+        lower = (
+            np.hypot(cols[None, :, 0] - rows[:, None, 0], cols[None, :, 1] - rows[:, None, 1])
+            - rows[:, None, 2] - cols[None, :, 2]
+        )
+        return lower <= threshold + _EZ_MATRIX_FLOAT_TOL
+
+    # -- requêtes --------------------------------------------------------------
+
+    def _measure(self, i: int, j: int) -> bool:
+        v = int(self._verdict[i, j])
+        if v < 0:
+            v = int(entries_in_engagement_zone(
+                self._entries[i], self._entries[j], self._engagement_zone, self._metric,
+                self._vertical_zone,
+            ))
+            self._verdict[i, j] = self._verdict[j, i] = v
+        return v == 1
+
+    def _require_index(self, unit_id: str) -> int:
+        idx = self._index.get(str(unit_id))
+        if idx is None:
+            raise ValueError(
+                f"EngagementMatrix: escouade {unit_id!r} absente des entrées posées de units_cache"
+            )
+        return idx
+
+    def pair_engaged(self, unit_id: str, other_id: str) -> bool:
+        """Les deux escouades sont-elles engagées l'une avec l'autre ?"""
+        return self._measure(self._require_index(unit_id), self._require_index(other_id))
+
+    def enemies_engaging(self, unit_id: str, player: int) -> List[str]:
+        """Ids des escouades ennemies de ``player`` engagées avec ``unit_id``, dans l'ordre du cache."""
+        import numpy as np
+
+        i = self._require_index(unit_id)
+        return [
+            self.ids[j]
+            for j in np.flatnonzero((self._verdict[i] != 0) & (self.players != int(player))).tolist()
+            if j != i and self._measure(i, j)
+        ]
+
+    def is_engaged(self, unit_id: str, player: int) -> bool:
+        """``unit_id`` est-elle engagée avec au moins un ennemi de ``player`` ?"""
+        import numpy as np
+
+        i = self._require_index(unit_id)
+        candidates = np.flatnonzero((self._verdict[i] != 0) & (self.players != int(player)))
+        # Les verdicts déjà connus d'abord : un 1 mémorisé évite toute mesure.
+        if (self._verdict[i, candidates] == 1).any():
+            return True
+        return any(j != i and self._measure(i, j) for j in candidates.tolist())
+
+    def anchor_engaged(
+        self, candidate_entry: Dict[str, Any], player: int, *, exclude_id: Optional[str] = None,
+    ) -> bool:
+        """Une entrée SYNTHÉTIQUE (ancre candidate) tombe-t-elle dans l'EZ d'un ennemi de ``player`` ?
+
+        Même broad-phase contre toutes les escouades, puis la primitive sur les seules survivantes,
+        avec ``memoise=False`` : une cellule candidate ne sera jamais redemandée (cf.
+        ``move_anchor_violates_engagement_clearance``).
+        """
+        import numpy as np
+
+        if not self.ids:
+            return False
+        near = self._near(self._bounds([candidate_entry]), self._bounds(self._entries))[0]
+        near &= self.players != int(player)
+        if exclude_id is not None and str(exclude_id) in self._index:
+            near[self._index[str(exclude_id)]] = False
+        for j in np.flatnonzero(near).tolist():
+            if entries_in_engagement_zone(
+                candidate_entry, self._entries[j], self._engagement_zone, self._metric,
+                self._vertical_zone, memoise=False,
+            ):
+                return True
+        return False
+
+
+def engagement_matrix(game_state: Dict[str, Any], engagement_zone: int) -> EngagementMatrix:
+    """Matrice d'engagement de l'état courant, reconstruite seulement si la géométrie a changé.
+
+    Métrique et seuil vertical sont résolus comme le fait ``unit_entries_within_engagement_zone``
+    sans épinglage (``engagement_distance_metric(game_state)``, ``get_engagement_zone_vertical()``)
+    et entrent dans la clé. Mémoïsée dans ``game_state["_engagement_matrix_cache"]``, une matrice
+    par zone d'engagement.
+    """
+    units_cache = require_key(game_state, "units_cache")
+    metric = engagement_distance_metric(game_state)
+    items = list(entries_on_battlefield(units_cache))
+    for _uid, entry in items:
+        # Garde de `entries_in_engagement_zone`, appliquée à TOUTES les entrées : la broad-phase
+        # écarte des paires sans les mesurer, une escouade corrompue ne doit pas y échapper.
+        _require_measurable_entry(entry)
+    n_vertical = sum(1 for _uid, entry in items if entry_has_vertical_data(entry))
+    vertical = get_engagement_zone_vertical() if n_vertical >= 2 else None
+    signature = (
+        metric,
+        vertical,
+        tuple(
+            (uid, int(require_key(entry, "player")), _engagement_entry_fingerprint(entry))
+            for uid, entry in items
+        ),
+    )
+    store = game_state.get("_engagement_matrix_cache")  # get allowed (absent au 1er appel)
+    if store is None:
+        store = {}
+        game_state["_engagement_matrix_cache"] = store
+    cached = store.get(int(engagement_zone))
+    if cached is not None and cached[0] == signature:
+        matrix = cached[1]
+        # Mêmes géométries, objets peut-être remplacés : la mesure lit les entrées vivantes.
+        matrix._entries = [entry for _uid, entry in items]
+        return matrix
+    matrix = EngagementMatrix(items, engagement_zone, metric, vertical)
+    store[int(engagement_zone)] = (signature, matrix)
+    return matrix
+
+
 def unit_entries_within_engagement_zone(
     first_entry: Dict[str, Any],
     second_entry: Dict[str, Any],
@@ -819,6 +1072,11 @@ def unit_within_engagement_zone_footprints(
     if not entry_is_on_battlefield(unit_entry):
         return False
     unit_player = int(require_key(unit, "player"))
+    if vertical_zone_inches is None:
+        # Forme normale : réponse lue dans la matrice d'engagement de l'état (broad-phase NumPy sur
+        # toutes les escouades, verdicts exacts mémorisés). Seul l'épinglage du seuil vertical
+        # garde la boucle par ennemi ci-dessous.
+        return engagement_matrix(game_state, engagement_zone).is_engaged(unit_id_str, unit_player)
     for _enemy_id, cache_entry in enemy_entries_on_battlefield(
         units_cache, unit_player, exclude_id=unit_id_str
     ):
@@ -883,6 +1141,13 @@ def move_anchor_violates_engagement_clearance(
     }
     if enemy_cache_items is not None:
         enemy_iter: Any = enemy_cache_items
+    elif vertical_zone_inches is None and units_cache is require_key(game_state, "units_cache"):
+        # Ancre isolée (revalidation au commit, éligibilité, fuite) : broad-phase de la matrice
+        # d'engagement contre toutes les escouades. Les pools, eux, passent leurs ennemis
+        # pré-filtrés ci-dessus et ne paient pas la clé de la matrice à chaque cellule.
+        return engagement_matrix(game_state, engagement_zone_ez).anchor_engaged(
+            mover_entry, mover_player, exclude_id=mover_id
+        )
     else:
         enemy_iter = enemy_entries_on_battlefield(
             units_cache, mover_player, exclude_id=mover_id
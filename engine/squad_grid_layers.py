@@ -0,0 +1,217 @@
+"""
+squad_grid_layers.py - Couches de la grille égocentrique réutilisées d'une décision à l'autre.
+
+`ObservationBuilder.build_squad_grid` re-rastérisait ses neuf canaux à CHAQUE décision : murs,
+objectifs (sur le board x5, ~10 500 hexes de zones), couvert et étages projetés hexe par hexe,
+puis occupation et EZ. Or quatre canaux ne dépendent que du PLATEAU, et les quatre canaux
+d'unités ne bougent qu'avec les positions — entre deux activations consécutives, et a fortiori
+entre deux décisions de la même activation (cible de tir, choix de charge), ni l'un ni l'autre
+n'a changé.
+
+Deux niveaux, tenus par `SquadGridLayers` (un par `game_state`) :
+
+- COUCHES STATIQUES du plateau (murs, objectifs, couvert AVANT dilatation, niveau d'étage) en
+  raster dense (canal, col, row), construites une fois par épisode (et de nouveau si la mémo
+  `_grid_static_hex_arrays` dont elles sont tirées est remplacée). La grille d'une ancre en est
+  un RECUEIL FENÊTRÉ : la boîte englobante de `window_bounds` (celle de `iter_window_hexes`),
+  réduite aux hexes non nuls, projetée par `hex_arrays_to_cells` — la même projection que la
+  peinture d'avant, appliquée aux mêmes hexes, donc les mêmes cellules. Le recueil est mémoïsé
+  par (ancre, demi-étendue) : une escouade qui n'a pas bougé le relit tel quel.
+- SURCOUCHE DYNAMIQUE (self, alliés, ennemis, EZ ennemie) par escouade active, reconstruite dès
+  que sa CLÉ change. La clé porte la géométrie elle-même — hexes des figurines de chaque canal et
+  identité de l'ensemble EZ lu — et non `_unit_move_version` seul : une écriture de position qui
+  ne passerait pas par `_touch_unit_los` servirait sinon une occupation périmée (la leçon de
+  `spatial_relations`, §0.18). Les hexes sont collectés à chaque appel, comme avant ; ce qui
+  n'est plus refait, c'est leur projection, et surtout celle de l'EZ (des milliers d'hexes).
+
+La dilatation du couvert (socle de l'escouade active) et le coût du pool de move restent
+calculés à chaque appel : ils dépendent de l'escouade et de l'activation, et sont bon marché.
+
+Durée de vie : `game_state` (purgé au reset d'épisode, cf. w40k_core) ; une COPIE d'état repart
+vide (`__deepcopy__`), comme `TargetPoolCache`.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine.spatial_grid import (
+    GRID_CH_ALLY,
+    GRID_CH_COVER,
+    GRID_CH_ENEMY,
+    GRID_CH_EZ,
+    GRID_CH_LEVEL,
+    GRID_CH_OBJECTIVE,
+    GRID_CH_SELF,
+    GRID_CH_WALL,
+    GRID_SIZE,
+    hex_arrays_to_cells,
+    window_bounds,
+)
+from engine.target_pool_cache import _LRUStore
+
+#: Clé du holder dans `game_state`.
+SQUAD_GRID_LAYERS_KEY = "_grid_layers"
+#: Canaux portés par les couches statiques, dans l'ordre du raster.
+STATIC_CHANNELS = (GRID_CH_WALL, GRID_CH_OBJECTIVE, GRID_CH_COVER, GRID_CH_LEVEL)
+#: Canaux de la surcouche dynamique, dans l'ordre de son tableau.
+DYNAMIC_CHANNELS = (GRID_CH_SELF, GRID_CH_ALLY, GRID_CH_ENEMY, GRID_CH_EZ)
+#: Fenêtres statiques gardées : une par (ancre, demi-étendue) récente — quelques escouades par
+#: camp, chacune à sa position courante.
+STATIC_WINDOW_CACHE_MAX = 64
+#: Surcouches gardées : une par (escouade, géométrie) récente — la géométrie courante de chaque
+#: escouade, et les précédentes jusqu'à éviction.
+DYNAMIC_OVERLAY_CACHE_MAX = 32
+
+HexArrays = Tuple[np.ndarray, np.ndarray]
+
+
+def _paint(
+    out: np.ndarray,
+    cols: np.ndarray,
+    rows: np.ndarray,
+    values: np.ndarray,
+    anchor_col: int,
+    anchor_row: int,
+    half_extent: int,
+) -> None:
+    """Peint un lot d'hexes sur `out` (GRID_SIZE, GRID_SIZE) par maximum. Hors grille écarté.
+
+    `values` : une valeur float32 par hexe (même longueur que `cols`).
+    """
+    if cols.size == 0:
+        return
+    gx, gy, valid = hex_arrays_to_cells(cols, rows, anchor_col, anchor_row, half_extent)
+    if not valid.any():
+        return
+    np.maximum.at(out, (gy[valid], gx[valid]), values[valid])
+
+
+def _hex_arrays(hexes: Sequence[Tuple[int, int]]) -> HexArrays:
+    cols = np.fromiter((h[0] for h in hexes), dtype=np.int64, count=len(hexes))
+    rows = np.fromiter((h[1] for h in hexes), dtype=np.int64, count=len(hexes))
+    return cols, rows
+
+
+class StaticLayerStack:
+    """Couches statiques du plateau en raster dense, et leurs fenêtres déjà recueillies."""
+
+    __slots__ = ("layers", "board_cols", "board_rows", "off_board", "windows")
+
+    def __init__(
+        self,
+        board_cols: int,
+        board_rows: int,
+        channel_hexes: Sequence[Tuple[HexArrays, Any]],
+    ) -> None:
+        """`channel_hexes[k]` = ((cols, rows), valeur(s)) du canal `STATIC_CHANNELS[k]`."""
+        self.board_cols = int(board_cols)
+        self.board_rows = int(board_rows)
+        self.layers = np.zeros((len(STATIC_CHANNELS), self.board_cols, self.board_rows), dtype=np.float32)
+        # Hexes hors plateau d'un canal statique : aucun raster ne les porte, ils sont peints
+        # un à un comme avant. Vide sur tout scénario valide ; garder le chemin évite qu'un
+        # terrain débordant ne perde ses cases de bord en silence.
+        self.off_board: list = []
+        for k, ((cols, rows), values) in enumerate(channel_hexes):
+            vals = np.broadcast_to(np.asarray(values, dtype=np.float32), cols.shape)
+            on = (cols >= 0) & (cols < self.board_cols) & (rows >= 0) & (rows < self.board_rows)
+            np.maximum.at(self.layers[k], (cols[on], rows[on]), vals[on])
+            if not on.all():
+                self.off_board.append((k, cols[~on], rows[~on], np.array(vals[~on])))
+        self.windows = _LRUStore(STATIC_WINDOW_CACHE_MAX)
+
+    def window(self, anchor_col: int, anchor_row: int, half_extent: int) -> np.ndarray:
+        """Canaux statiques (len(STATIC_CHANNELS), GRID_SIZE, GRID_SIZE) vus depuis l'ancre.
+
+        Tableau du cache : l'appelant le COPIE dans sa grille et ne le mute jamais.
+        """
+        key = (int(anchor_col), int(anchor_row), int(half_extent))
+        hit = self.windows.get(key)
+        if hit is not None:
+            return hit
+        out = np.zeros((len(STATIC_CHANNELS), GRID_SIZE, GRID_SIZE), dtype=np.float32)
+        col_lo, col_hi, row_lo, row_hi = window_bounds(
+            anchor_col, anchor_row, half_extent, self.board_cols, self.board_rows
+        )
+        if col_lo <= col_hi and row_lo <= row_hi:
+            sub = self.layers[:, col_lo:col_hi + 1, row_lo:row_hi + 1]
+            lc, lr = np.nonzero(sub.any(axis=0))
+            if lc.size:
+                cols, rows = lc + col_lo, lr + row_lo
+                gx, gy, valid = hex_arrays_to_cells(cols, rows, anchor_col, anchor_row, half_extent)
+                if valid.any():
+                    for k in range(len(STATIC_CHANNELS)):
+                        np.maximum.at(out[k], (gy[valid], gx[valid]), sub[k, lc[valid], lr[valid]])
+        for k, cols, rows, vals in self.off_board:
+            _paint(out[k], cols, rows, vals, anchor_col, anchor_row, half_extent)
+        self.windows.put(key, out)
+        return out
+
+
+class SquadGridLayers:
+    """Holder par `game_state` : couches statiques du plateau + surcouches dynamiques."""
+
+    __slots__ = ("static", "static_source", "overlays")
+
+    def __init__(self) -> None:
+        self.static: Optional[StaticLayerStack] = None
+        # Dictionnaire `_grid_static_hex_arrays` dont `static` est tire : le raster suit CET
+        # objet, donc toute invalidation de la memo des statiques invalide aussi le raster.
+        self.static_source: Optional[Dict[str, Any]] = None
+        self.overlays = _LRUStore(DYNAMIC_OVERLAY_CACHE_MAX)
+
+    def overlay(
+        self,
+        squad_id: str,
+        anchor_col: int,
+        anchor_row: int,
+        half_extent: int,
+        channel_hexes: Sequence[Sequence[Tuple[int, int]]],
+        ez_hexes: Iterable[Tuple[int, int]],
+    ) -> np.ndarray:
+        """Canaux dynamiques (len(DYNAMIC_CHANNELS), GRID_SIZE, GRID_SIZE) de l'escouade active.
+
+        `channel_hexes` = hexes des figurines (self, alliés, ennemis) ; `ez_hexes` = l'ensemble
+        EZ lu par l'appelant. Reconstruit dès que la géométrie ou l'ensemble EZ change (cf.
+        module). Tableau du cache : l'appelant le COPIE et ne le mute jamais.
+        """
+        key: Hashable = (
+            str(squad_id), int(anchor_col), int(anchor_row), int(half_extent),
+            tuple(tuple(hexes) for hexes in channel_hexes),
+            # L'ensemble EZ est un cache moteur reconstruit (objet NEUF) à chaque changement :
+            # son identité, plus sa taille, suffit à le reconnaître sans le hacher.
+            id(ez_hexes), len(ez_hexes),  # type: ignore[arg-type]
+        )
+        entry = self.overlays.get(key)
+        if entry is not None:
+            return entry[0]
+        out = np.zeros((len(DYNAMIC_CHANNELS), GRID_SIZE, GRID_SIZE), dtype=np.float32)
+        for k, hexes in enumerate((*channel_hexes, list(ez_hexes))):
+            if hexes:
+                cols, rows = _hex_arrays(hexes)
+                _paint(out[k], cols, rows, np.ones(cols.shape, dtype=np.float32),
+                       anchor_col, anchor_row, half_extent)
+        # L'ensemble EZ est gardé EN VIE par l'entrée : son `id` ne peut pas être recyclé par un
+        # nouvel ensemble tant que la clé qui le cite existe.
+        self.overlays.put(key, (out, ez_hexes))
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "static_windows": self.static.windows.stats() if self.static is not None else None,
+            "overlays": self.overlays.stats(),
+        }
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "SquadGridLayers":
+        fresh = SquadGridLayers()
+        memo[id(self)] = fresh
+        return fresh
+
+
+def squad_grid_layers(game_state: Dict[str, Any]) -> SquadGridLayers:
+    """Holder du moteur propriétaire de `game_state`, créé au premier appel."""
+    layers = game_state.get(SQUAD_GRID_LAYERS_KEY)  # get allowed (absent au 1er appel)
+    if layers is None:
+        layers = SquadGridLayers()
+        game_state[SQUAD_GRID_LAYERS_KEY] = layers
+    return layers
@@ -0,0 +1,129 @@
+"""
+target_pool_cache.py - Cache par moteur des pools de cibles de tir et des apercus LoS du move.
+
+Remplace les deux dicts globaux de module de `shooting_handlers` (`_target_pool_cache`,
+`_move_los_preview_cache`). Trois defauts les condamnaient :
+
+1. PARTAGE ENTRE MOTEURS. Un processus qui heberge plusieurs moteurs (serveur API, pools
+   d'evaluation des bots) melangeait leurs entrees dans le meme dict ; seule la cle
+   (`os.getpid()`, `_cache_instance_id`) les separait, et un oubli dans la cle suffisait a
+   servir le pool d'une partie a une autre. Ici le cache VIT dans `game_state` : deux moteurs
+   n'ont aucun objet en commun, la cle n'a plus a porter l'identite du moteur.
+2. BORNE PAR VIDAGE EN BLOC. Au-dela de 100 entrees, tout etait jete — y compris l'entree qu'on
+   venait d'ecrire et celles de l'activation en cours. Ici chaque espace est un LRU borne :
+   on evince la plus ancienne, une a la fois.
+3. CLES PAR EMPREINTE. L'apercu LoS hachait `units_cache` entier (positions, PV, cases occupees
+   triees) et les ensembles `units_advanced` / `units_fled` tries en chaines, a CHAQUE appel ;
+   le pool hachait les positions ennemies et les murs. Les deux lisent desormais
+   `_unit_move_version`, l'entier que `_touch_unit_los` incremente a toute ecriture de position
+   (c'est deja sur lui que repose `_los_cache_version` de chaque unite).
+
+Une COPIE de `game_state` (apercu du move, snapshots de rewind, verification de masque) repart
+d'un cache VIDE (`__deepcopy__`) : sa propre histoire de positions fait avancer son propre
+`_unit_move_version`, et une entree ecrite sous la version 12 de la copie n'a rien a voir avec la
+version 12 de l'etat reel.
+
+Metriques : `stats()` rend, par espace, hits / misses / evictions / taille / taux de hit. Les
+compteurs survivent a `clear()` — un vidage est une invalidation, pas une remise a zero de la mesure.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+#: Pools de cibles : une entree par (tireur, position, contexte, version). Une activation en
+#: consomme quelques-unes ; la borne couvre largement une phase de tir.
+TARGET_POOL_CACHE_MAX = 256
+#: Apercus LoS du move : chaque entree est une copie profonde du payload (cellules d'attaque,
+#: ratios par case, cellules visibles par cible), bien plus lourde qu'un pool.
+MOVE_LOS_PREVIEW_CACHE_MAX = 64
+
+
+class _LRUStore:
+    """Dict borne a eviction LRU, avec compteurs de hits / misses / evictions."""
+
+    __slots__ = ("max_entries", "_entries", "hits", "misses", "evictions")
+
+    def __init__(self, max_entries: int) -> None:
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be > 0, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Valeur sous `key` (promue en tete de LRU), ou None. Compte un hit ou un miss."""
+        value = self._entries.get(key)  # get allowed (absence = miss, comptee)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Ecrit `value` sous `key` ; evince les entrees les moins recemment lues au-dela de la borne."""
+        if value is None:
+            raise ValueError("None cannot be cached: it is the miss sentinel of get()")
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> int:
+        """Vide les entrees (pas les compteurs). Retourne le nombre d'entrees jetees."""
+        n = len(self._entries)
+        self._entries.clear()
+        return n
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+class TargetPoolCache:
+    """Cache par moteur : `pools` (pools de cibles de tir) et `previews` (apercus LoS du move)."""
+
+    __slots__ = ("pools", "previews")
+
+    def __init__(
+        self,
+        pool_max_entries: int = TARGET_POOL_CACHE_MAX,
+        preview_max_entries: int = MOVE_LOS_PREVIEW_CACHE_MAX,
+    ) -> None:
+        self.pools = _LRUStore(pool_max_entries)
+        self.previews = _LRUStore(preview_max_entries)
+
+    def clear(self) -> Dict[str, int]:
+        """Vide les deux espaces. Retourne le nombre d'entrees jetees par espace."""
+        return {"pools": self.pools.clear(), "previews": self.previews.clear()}
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {"pools": self.pools.stats(), "previews": self.previews.stats()}
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "TargetPoolCache":
+        # Une copie d'etat a sa propre histoire de versions : elle repart vide (cf. module).
+        fresh = TargetPoolCache(self.pools.max_entries, self.previews.max_entries)
+        memo[id(self)] = fresh
+        return fresh
+
+
+def target_pool_cache(game_state: Dict[str, Any]) -> TargetPoolCache:
+    """Cache du moteur proprietaire de `game_state`, cree au premier appel."""
+    cache = game_state.get("_target_pool_cache")  # get allowed (absent au 1er appel)
+    if cache is None:
+        cache = TargetPoolCache()
+        game_state["_target_pool_cache"] = cache
+    return cache
@@ -24,6 +24,9 @@ from shared.data_validation import (
 from engine.constants import DRAW_WINNER
 from engine.combat_utils import calculate_hex_distance, normalize_coordinates, resolve_dice_value, set_unit_coordinates
 from engine.hex_utils import phantom_bottom_hexes
+from engine.deployment_erosion import DEPLOYMENT_EROSION_CACHE_KEY
+from engine.entity_encoding_cache import ENTITY_ENCODING_CACHE_KEY
+from engine.squad_grid_layers import SQUAD_GRID_LAYERS_KEY
 from engine.weapon_damage_cache import load_weapon_damage_table, stamp_weapon_keys, build_best_weapon_cache
 from engine.utils.weapon_helpers import melee_weapons, ranged_weapons
 
@@ -981,11 +984,15 @@ class W40KEngine(gym.Env):
         self.game_state.pop("_wall_set_cache", None)
         self.game_state.pop("_dense_wall_set_cache", None)
         self.game_state.pop("_socle_wall_blocked_cache", None)
+        self.game_state.pop(DEPLOYMENT_EROSION_CACHE_KEY, None)
         self.game_state.pop("_obscuring_area_sets_cache", None)
         self.game_state.pop("_obscuring_hex_to_area_cache", None)
         # Grilles de blocage de la LoS vectorisee : DERIVEES des deux caches ci-dessus, donc
         # purgees AVEC eux — survivantes, elles porteraient les murs du terrain precedent.
         self.game_state.pop("_los_blocking_grids_cache", None)
+        # Champ de degagement : derive des grilles, meme duree de vie (le champ lui-meme reste
+        # en cache de module / sur disque, clefe par le terrain).
+        self.game_state.pop("_los_clearance_field_cache", None)
         self.game_state.pop("_unit_los_pair_cache", None)
 
         self.game_state["weapon_damage_table"] = load_weapon_damage_table()
@@ -1507,6 +1514,12 @@ class W40KEngine(gym.Env):
         # Grille spatiale (T1) : tableaux memoises de murs/objectifs. Sans purge, l'agent
         # observerait le terrain de l'episode precedent (corruption silencieuse de l'obs).
         self.game_state.pop("_grid_static_hex_arrays", None)
+        # Raster statique et surcouches de la grille qui en derivent (`engine/squad_grid_layers`) :
+        # meme terrain, meme raison.
+        self.game_state.pop(SQUAD_GRID_LAYERS_KEY, None)
+        # Part intrinseque des entites (`engine/entity_encoding_cache`) : ses revisions comptent
+        # les ecritures de l'episode, et les unites du suivant reprennent les memes ids.
+        self.game_state.pop(ENTITY_ENCODING_CACHE_KEY, None)
         # Hexes d'objectif par slot (distances/directions du contexte global). Meme raison que
         # ci-dessus : un scenario recharge change les zones, pas les cles du cache.
         # (Le cache des profils d'armes, lui, tombe dans `build_units_cache` — il est indexe par
@@ -1533,6 +1546,9 @@ class W40KEngine(gym.Env):
         # PRECEDENT. Trouve le 2026-07-29 en verifiant §0.40 point 3, qui LIT ce cache pour
         # decrire les candidats a l'agent : la corruption y serait devenue une observation.
         self.game_state.pop(ActionDecoder.DEPLOYMENT_SCORING_CACHE_KEY, None)
+        # Zones de deploiement erodees par socle (`engine.deployment_erosion`) : derivees des
+        # pools du joueur, que la nouvelle partie peut redessiner sans rotation de scenario.
+        self.game_state.pop(DEPLOYMENT_EROSION_CACHE_KEY, None)
         # Zones de terrain contenant un mur DENSE (Solid 13.11), memoisees par
         # `_squad_terrain_flags` pour le drapeau « gone to ground pret » (13.5). Elles derivent
         # de `terrain_areas` ET de `dense_wall_hexes`, que `_reload_scenario` remplace : sans
@@ -1861,10 +1877,11 @@ class W40KEngine(gym.Env):
         }
 
         # Cache indexe PAR FIGURINE depuis le 2026-08-12 : `models_cache`/`squad_models` sont
-        # donc exiges ici. Ils viennent d'etre poses par `build_units_cache` ci-dessus.
+        # donc exiges ici. Ils viennent d'etre poses par `build_units_cache` ci-dessus. Les
+        # degats esperes viennent de `damage_distribution` (memoisee par processus), plus de la
+        # table `weapon_damage_table`, qui ne connaissait aucune regle d'arme.
         self.game_state["_best_weapon_cache"] = build_best_weapon_cache(
             self.game_state["units"],
-            require_key(self.game_state, "weapon_damage_table"),
             uc,
             require_key(self.game_state, "models_cache"),
             require_key(self.game_state, "squad_models"),
@@ -8611,7 +8628,7 @@ class W40KEngine(gym.Env):
 
         # Clear target pool cache on scenario rotation (defense in depth)
         from engine.phase_handlers import shooting_handlers
-        shooting_handlers.clear_target_pool_cache()
+        shooting_handlers.clear_target_pool_cache(self.game_state)
 
         # Objectifs : source UNIQUE = terrains "objective": true (résolus en {id, hexes}).
         self._scenario_objectives = require_key(scenario_result, "objectives")
@@ -8679,10 +8696,12 @@ class W40KEngine(gym.Env):
         self.game_state.pop("_obscuring_area_sets_cache", None)
         self.game_state.pop("_obscuring_hex_to_area_cache", None)
         self.game_state.pop("_los_blocking_grids_cache", None)
+        self.game_state.pop("_los_clearance_field_cache", None)
         self.game_state.pop("_unit_los_pair_cache", None)
         self.game_state.pop("_wall_set_cache", None)
         self.game_state.pop("_dense_wall_set_cache", None)
         self.game_state.pop("_socle_wall_blocked_cache", None)
+        self.game_state.pop(DEPLOYMENT_EROSION_CACHE_KEY, None)
         self.game_state.pop("_hex_los_state_cache", None)
         objectives = require_key(self.game_state, "objectives")
         self.game_state["macro_target_objective_index"] = 0 if objectives else None
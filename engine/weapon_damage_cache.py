@@ -7,16 +7,34 @@ Architecture (Option B — per-episode cache):
 3. At episode reset: build best_weapon_cache for all (attacker_id, is_ranged, target_id) pairs
 4. Hot path: single dict lookup with integer keys → O(1)
 
+Depuis le 2026-10-16, l'etape 3 ne lit plus la table JSON : elle lit `damage_distribution`,
+distribution COMPLETE des degats d'une activation d'arme, memoisee par cle canonique
+(`DamageKey` : profil de regles d'arme + defenseur + modificateurs). La table ne connaissait
+que `(ATK, STR, NB, DMG, AP) x (T, SV, INV)` ; relances, Feel No Pain, couvert, regles d'arme
+et Waaagh! n'y avaient aucune place.
+
 Generated by: scripts/weapon_damage_builder.py
 Loaded by: engine/w40k_core.py at game init
 Used by: engine/observation_builder.py
 """
 
 import json
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional, List
 
-from engine.combat_utils import expected_dice_value
+import numpy as np
+
+from engine.combat_utils import DiceValue, expected_dice_value
+from engine.phase_handlers.attack_sequence import (
+    NATURAL_FAIL_ROLL,
+    RerollProfile,
+    WeaponAttackProfile,
+    _evaluate_roll,
+    build_weapon_attack_profile,
+    lethal_hits_auto_wound_is_better,
+)
 from shared.data_validation import require_key
 
 NestedTable = Dict[Tuple, Dict[Tuple, float]]
@@ -99,9 +117,238 @@ def stamp_weapon_keys(unit: Dict[str, Any]) -> None:
         weapon["_wdc_off_key"] = weapon_off_key(weapon)
 
 
+# ============================================================================
+# DISTRIBUTIONS DE DEGATS (cle canonique, memoisees)
+# ============================================================================
+
+#: Entrees gardees par `damage_distribution`, par processus. Une cle est un profil RESOLU : sur
+#: une partie, quelques dizaines de profils d'arme x une dizaine de defenseurs x les rares
+#: combinaisons de modificateurs (couvert, Waaagh!, relances) — 4096 ne se remplit pas, la borne
+#: ne protege que d'un appelant qui ferait varier un seuil sans fin.
+DAMAGE_DISTRIBUTION_CACHE_SIZE = 4096
+
+#: Seuil de critique d'un jet qui n'en a pas (la sauvegarde) : aucune face ne l'atteint.
+_NO_CRITICAL_ROLL = 7
+
+
+@dataclass(frozen=True)
+class DamageKey:
+    """Cle canonique d'une distribution : TOUT ce qui decide des degats d'une activation d'arme.
+
+    Les modificateurs de situation y entrent deja RESOLUS par `weapon_damage_key` : le couvert
+    dans `hit_target`, le Waaagh! de l'attaquant dans `wound_target` (+1 F) et `attacks_bonus`
+    (+1 A), celui du defenseur dans `save_threshold_value` (invulnerable 5+). Deux situations qui
+    jouent les memes des partagent donc la meme entree, quelle que soit la regle qui les y mene.
+    `n_attacks` et `damage` restent des expressions de des ("D6", "2D6", 3) : c'est leur LOI qui
+    compte ici, pas leur esperance.
+    """
+
+    profile: WeaponAttackProfile
+    rerolls: RerollProfile
+    n_attacks: DiceValue
+    damage: DiceValue
+    hit_target: int
+    wound_target: int
+    save_threshold_value: int
+    fnp_threshold: Optional[int] = None
+    attacks_bonus: int = 0
+    hit_fail_below: int = NATURAL_FAIL_ROLL + 1
+
+
+@dataclass(frozen=True)
+class DamageDistribution:
+    """Loi des degats INFLIGES par une activation d'arme : `pmf[k]` = P(degats == k).
+
+    Degats apres sauvegarde et Feel No Pain, AVANT allocation : le surplus perdu quand une
+    figurine meurt sous une blessure a plusieurs degats n'y est pas retire — il depend de l'ordre
+    d'allocation, que l'estimation ne connait pas.
+    """
+
+    pmf: Tuple[float, ...]
+    mean: float
+
+    def kill_probability(self, hp: int) -> float:
+        """P(degats >= hp). Exact pour une cible d'UNE figurine ; borne haute au-dela (surplus)."""
+        if hp <= 0:
+            return 1.0
+        return float(sum(self.pmf[int(hp):]))
+
+
+def _dice_pmf(value: DiceValue, roll_context: str) -> np.ndarray:
+    """Loi d'une expression de des, indexee par la valeur. Memes expressions, meme tirage que
+    `combat_utils.resolve_dice_value` (D3 = demi-D6 arrondi au-dessus)."""
+    if isinstance(value, int):
+        pmf = np.zeros(value + 1)
+        pmf[value] = 1.0
+        return pmf
+    if not isinstance(value, str):
+        raise TypeError(f"Invalid dice value type for {roll_context}: {type(value).__name__}")
+    d6 = np.array([0.0] + [1.0 / 6.0] * 6)
+    if value == "D3":
+        return np.array([0.0] + [1.0 / 3.0] * 3)
+    if value == "D6":
+        return d6
+    if value == "2D6":
+        return np.convolve(d6, d6)
+    if value in ("D6+1", "D6+2", "D6+3"):
+        return np.concatenate([np.zeros(int(value[-1])), d6])
+    raise ValueError(f"Unsupported dice expression for {roll_context}: {value}")
+
+
+def _leg_probabilities(
+    crit_on: int, target: int, fail_below: int, reroll_1: bool, reroll_fail: bool,
+) -> Tuple[float, float]:
+    """`(P(critique), P(reussite))` d'UN de, relance comprise : `_evaluate_roll` face par face.
+
+    Meme predicat de relance que `roll_attack_pool` (un echec seulement, un 1 si `reroll_1`,
+    tout echec si `reroll_fail`), et un seul reroll par de (01 Core, Re-rolls).
+    """
+    p_crit = p_ok = 0.0
+    for face in range(1, 7):
+        crit, ok = _evaluate_roll(face, crit_on, target, fail_below)
+        if not ok and ((face == NATURAL_FAIL_ROLL and reroll_1) or reroll_fail):
+            for face2 in range(1, 7):
+                crit2, ok2 = _evaluate_roll(face2, crit_on, target, fail_below)
+                p_crit += crit2 / 36.0
+                p_ok += ok2 / 36.0
+        else:
+            p_crit += crit / 6.0
+            p_ok += ok / 6.0
+    return p_crit, p_ok
+
+
+def _power_pmfs(base: np.ndarray, n_max: int) -> List[np.ndarray]:
+    """`[base^*0, base^*1, ..., base^*n_max]` : convolutions successives d'une loi par elle-meme."""
+    out = [np.ones(1)]
+    for _ in range(n_max):
+        out.append(np.convolve(out[-1], base))
+    return out
+
+
+def _mix(weights: np.ndarray, pmfs: List[np.ndarray]) -> np.ndarray:
+    """Melange `sum_k weights[k] * pmfs[k]`, sur la longueur de la plus longue."""
+    out = np.zeros(max(len(p) for p in pmfs))
+    for w, pmf in zip(weights, pmfs):
+        if w:
+            out[: len(pmf)] += w * pmf
+    return out
+
+
+@lru_cache(maxsize=DAMAGE_DISTRIBUTION_CACHE_SIZE)
+def damage_distribution(key: DamageKey) -> DamageDistribution:
+    """Distribution COMPLETE des degats d'une activation d'arme, memoisee par cle canonique.
+
+    Meme sequence que `attack_sequence.roll_attack_pool`, en probabilites exactes : touche
+    ([TORRENT], critique, [SUSTAINED HITS], [LETHAL HITS] avec l'arbitrage de
+    `lethal_hits_auto_wound_is_better`), blessure ([TWIN-LINKED] et relances d'unite, [ANTI-X]
+    via `profile.crit_wound_on`, [DEVASTATING WOUNDS] sans sauvegarde), sauvegarde (relance des
+    1), puis degats `key.damage` par blessure et Feel No Pain par point de degat (24.12).
+
+    Son esperance remplace la table `(ATK, STR, NB, DMG, AP) x (T, SV, INV)` partout ou elle
+    etait lue : la table ignorait le 1 qui rate toujours, toutes les regles d'arme, les relances
+    et le FNP. La loi complete, elle, rend aussi les probabilites de tuer (`kill_probability`)
+    que la moyenne ne peut pas donner — un D6 degats a 3,5 de moyenne tue une figurine a 3 PV une
+    fois sur deux seulement.
+
+    Le calcul passe par des convolutions (nombre de blessures par attaque -> degats par attaque
+    -> degats du pool) : quelques centaines de microsecondes a froid, un acces dict ensuite.
+    """
+    profile = key.profile
+    rerolls = key.rerolls
+    _, p_save = _leg_probabilities(
+        _NO_CRITICAL_ROLL, key.save_threshold_value, NATURAL_FAIL_ROLL + 1, rerolls.save_1, False
+    )
+    p_fail_save = 1.0 - p_save
+    p_crit_w, p_ok_w = _leg_probabilities(
+        profile.crit_wound_on, key.wound_target, NATURAL_FAIL_ROLL + 1,
+        rerolls.wound_1, rerolls.wound_any_fail or profile.twin_linked,
+    )
+    # P(une touche devient des degats) : critique [DEVASTATING] = non sauvegardable.
+    q = p_crit_w * (1.0 if profile.devastating else p_fail_save) + (p_ok_w - p_crit_w) * p_fail_save
+    one_hit = np.array([1.0 - q, q])
+
+    if profile.torrent:
+        wounds_per_attack = one_hit
+    else:
+        p_crit_h, p_ok_h = _leg_probabilities(
+            profile.crit_hit_on, key.hit_target, key.hit_fail_below,
+            rerolls.hit_1, rerolls.hit_any_fail,
+        )
+        q_first = q
+        if profile.lethal_hits and lethal_hits_auto_wound_is_better(
+            profile, key.wound_target, key.save_threshold_value
+        ):
+            q_first = p_fail_save
+        crit_branch = np.array([1.0 - q_first, q_first])
+        for _ in range(profile.sustained_hits):
+            crit_branch = np.convolve(crit_branch, one_hit)
+        wounds_per_attack = _mix(
+            np.array([1.0 - p_ok_h, p_ok_h - p_crit_h, p_crit_h]),
+            [np.ones(1), one_hit, crit_branch],
+        )
+
+    dmg_pmf = _dice_pmf(key.damage, "damage_distribution_dmg")
+    if key.fnp_threshold is not None:
+        # 24.12 : un D6 par point de degat, ignore sur `threshold`+. Chaque point passe donc avec
+        # P(jet < seuil) : loi binomiale du nombre de points qui restent, par valeur du de.
+        p_keep = sum(1 for f in range(1, 7) if f < key.fnp_threshold) / 6.0
+        dmg_pmf = _mix(dmg_pmf, _power_pmfs(np.array([1.0 - p_keep, p_keep]), len(dmg_pmf) - 1))
+
+    attack_pmf = _mix(wounds_per_attack, _power_pmfs(dmg_pmf, len(wounds_per_attack) - 1))
+    n_pmf = _dice_pmf(key.n_attacks, "damage_distribution_nb")
+    if key.attacks_bonus:
+        n_pmf = np.concatenate([np.zeros(int(key.attacks_bonus)), n_pmf])
+    pool_pmf = _mix(n_pmf, _power_pmfs(attack_pmf, len(n_pmf) - 1))
+    return DamageDistribution(
+        pmf=tuple(float(p) for p in pool_pmf),
+        mean=float(np.dot(np.arange(len(pool_pmf)), pool_pmf)),
+    )
+
+
+def weapon_damage_key(
+    weapon: Dict[str, Any],
+    target_unit: Optional[Dict[str, Any]],
+    *,
+    toughness: int,
+    armor_save: int,
+    invul_save: int,
+    fnp_threshold: Optional[int] = None,
+    rerolls: RerollProfile = RerollProfile(),
+    cover: bool = False,
+    melee_bonus: int = 0,
+) -> DamageKey:
+    """`DamageKey` d'une arme contre un defenseur, modificateurs resolus par les regles du moteur.
+
+    `target_unit` ne sert qu'aux KEYWORDS ([ANTI-X], via `build_weapon_attack_profile`) ; les
+    caracteristiques defensives sont passees a part parce qu'elles vivent sur la FIGURINE.
+    `invul_save` est l'invulnerable EFFECTIVE (Waaagh! du defenseur deja applique par
+    `effective_invul_save`), `melee_bonus` le `waaagh_melee_bonus` de l'attaquant (0 au tir), et
+    `cover` le couvert de la cible : [IGNORES COVER], [PSYCHIC] et le clamp a 6 sont appliques par
+    `apply_cover_to_hit_target`, le code meme de la resolution.
+    """
+    # Cycle : shared_utils importe (indirectement) ce module.
+    from engine.phase_handlers.shared_utils import (
+        apply_cover_to_hit_target,
+        save_threshold,
+        wound_threshold,
+    )
+
+    hit_target, _ = apply_cover_to_hit_target(int(require_key(weapon, "ATK")), weapon, cover)
+    return DamageKey(
+        profile=build_weapon_attack_profile(weapon, target_unit),
+        rerolls=rerolls,
+        n_attacks=require_key(weapon, "NB"),
+        damage=require_key(weapon, "DMG"),
+        hit_target=hit_target,
+        wound_target=wound_threshold(int(require_key(weapon, "STR")) + int(melee_bonus), toughness),
+        save_threshold_value=save_threshold(armor_save, invul_save, int(require_key(weapon, "AP"))),
+        fnp_threshold=fnp_threshold,
+        attacks_bonus=int(melee_bonus),
+    )
+
+
 def build_best_weapon_cache(
     units: List[Dict[str, Any]],
-    table: NestedTable,
     units_cache: Dict[str, Any],
     models_cache: Dict[str, Any],
     squad_models: Dict[str, Any],
@@ -127,25 +374,49 @@ def build_best_weapon_cache(
     Le moteur, lui, resout toujours par figurine (`engine/utils/weapon_helpers.py` : profils
     « portes par une unite OU une figurine »), donc l'estimation mentait sur le combat reel.
 
-    Les armes des figurines ne sont PAS tamponnees (`stamp_weapon_keys` ne voit que les
-    objets `unit`) : leur cle est calculee ici par `weapon_off_key`, la meme fonction. C'est
-    une fois par episode, sur quelques dizaines de profils — mesurable, mais sans commune
-    mesure avec le cout d'un second tamponnage a maintenir en phase avec `models_cache`,
-    qui est reconstruit en cours de partie.
+    LE DEGAT ESPERE EST CELUI DE `damage_distribution` (2026-10-16), plus celui de la table
+    JSON : regles d'arme ([ANTI-X] contre les keywords de la cible compris), 1 qui rate toujours
+    et Feel No Pain du defenseur. Seuls les modificateurs STABLES sur l'episode y entrent ; le
+    couvert, le Waaagh! et les relances d'abilite dependent de la position et du tour, et restent
+    a l'appelant qui les connait (`weapon_damage_key(..., cover=, melee_bonus=, rerolls=)`).
+    Les figurines d'une escouade partagent presque toutes le meme profil : la moyenne est donc
+    memoisee ici par `profile_identity` (l'identite canonique des profils de l'observation) et
+    par cible, et la distribution par `DamageKey` dans tout le processus.
 
     L'INDEX rendu est celui de la liste d'armes de LA FIGURINE, pas de l'escouade. Aucun
     appelant ne s'en sert aujourd'hui — `squad_expected_damage` ne lit que le degat — mais le
     rendre reste juste et ne coute rien.
     """
+    # Cycle : shared_utils importe (indirectement) ce module.
+    from engine.phase_handlers.shared_utils import _get_feel_no_pain_threshold
+    from engine.observation_weapon_profiles import profile_identity
+
     cache: BestWeaponCache = {}
 
     alive_units = [u for u in units if str(u["id"]) in units_cache]
-    targets_by_player: Dict[Any, List[Tuple[str, Tuple]]] = {}
+    targets_by_player: Dict[Any, List[Tuple[str, Dict[str, Any], Optional[int]]]] = {}
     for target in alive_units:
         targets_by_player.setdefault(target["player"], []).append(
-            (str(target["id"]), target["_wdc_def_key"])
+            (str(target["id"]), target, _get_feel_no_pain_threshold(target))
         )
 
+    # (identite du profil, cible) -> degat espere d'une activation. Meme arme, meme cible =
+    # meme nombre, quelle que soit la figurine qui la porte.
+    mean_by_profile: Dict[Tuple, float] = {}
+
+    def _mean(weapon: Dict[str, Any], identity: Tuple, tgt_id: str, target: Dict[str, Any],
+              fnp: Optional[int]) -> float:
+        memo_key = (identity, tgt_id)
+        mean = mean_by_profile.get(memo_key)  # get allowed : None = pas encore calcule
+        if mean is None:
+            toughness, armor_save, invul_save = target["_wdc_def_key"]
+            mean = damage_distribution(weapon_damage_key(
+                weapon, target, toughness=toughness, armor_save=armor_save,
+                invul_save=invul_save, fnp_threshold=fnp,
+            )).mean
+            mean_by_profile[memo_key] = mean
+        return mean
+
     for attacker in alive_units:
         att_squad_id = str(attacker["id"])
         att_player = attacker["player"]
@@ -167,15 +438,13 @@ def build_best_weapon_cache(
             model = models_cache[model_id]
             for is_ranged_int, weapons_key in ((1, "RNG_WEAPONS"), (0, "CC_WEAPONS")):
                 weapons = require_key(model, weapons_key)
-                # Cle offensive calculee UNE fois par arme, pas une fois par cible.
-                off_subtables = [table.get(weapon_off_key(w)) for w in weapons]
-                for tgt_id, def_key in enemies:
+                # Identite calculee UNE fois par arme, pas une fois par cible.
+                identities = [profile_identity(w) for w in weapons]
+                for tgt_id, target, fnp in enemies:
                     best_idx = -1
                     best_dmg = 0.0
-                    for idx, off_subtable in enumerate(off_subtables):
-                        if off_subtable is None:
-                            continue
-                        exp_dmg = off_subtable.get(def_key, 0.0)
+                    for idx, (weapon, identity) in enumerate(zip(weapons, identities)):
+                        exp_dmg = _mean(weapon, identity, tgt_id, target, fnp)
                         if exp_dmg > best_dmg:
                             best_dmg = exp_dmg
                             best_idx = idx
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Compare les backends ``python`` et ``compiled`` de ``geodesic_field`` sur le plateau 360x312.
+
+Usage (depuis la racine du dépôt)::
+
+    python scripts/bench_geodesic_backend.py
+    python scripts/bench_geodesic_backend.py --budget 180 --clearance 2.4 --starts 8
+
+Chaque champ est calculé par les deux backends et COMPARÉ (égalité stricte, ordre compris) avant
+d'être chronométré : un écart lève, il ne se lit pas dans un tableau. La compilation numba (premier
+appel du processus, ou cache ``__pycache__`` absent) est faite avant la mesure et affichée à part.
+Résultat JSON sur stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from engine.hex_utils import expand_wall_group_to_hex_list, geodesic_field, obstacles_touching_disc
+
+
+def _load_walls(path: str) -> Set[Tuple[int, int]]:
+    with open(path, encoding="utf-8") as f:
+        groups = json.load(f)["walls"]
+    walls: Set[Tuple[int, int]] = set()
+    for gi, group in enumerate(groups):
+        walls.update(
+            (int(c), int(r)) for c, r in expand_wall_group_to_hex_list(group, path_hint=f"walls[{gi}]")
+        )
+    return walls
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Bench python vs compiled geodesic_field (360x312).")
+    p.add_argument("--walls", default="config/board/44x60x10/walls/walls-11.json")
+    p.add_argument("--board-cols", type=int, default=360)
+    p.add_argument("--board-rows", type=int, default=312)
+    p.add_argument("--budget", type=float, default=90.0, help="Budget en unités-norme (6\" à x10 = 90).")
+    p.add_argument("--clearance", type=float, default=2.4, help="Rayon de socle en unités-norme.")
+    p.add_argument("--starts", type=int, default=6)
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    walls = _load_walls(os.path.join(_ROOT, args.walls))
+    cols, rows = args.board_cols, args.board_rows
+    rng = random.Random(args.seed)
+    starts: List[Tuple[int, int]] = []
+    while len(starts) < args.starts:
+        cell = (rng.randrange(cols), rng.randrange(rows))
+        if cell not in walls:
+            starts.append(cell)
+
+    t0 = time.perf_counter()
+    geodesic_field(starts[0], cols, rows, set(), 3.0, backend="compiled")
+    compile_s = time.perf_counter() - t0
+
+    totals: Dict[str, float] = {"python": 0.0, "compiled": 0.0}
+    cells = 0
+    for start in starts:
+        contact = obstacles_touching_disc(walls, start, args.clearance) if args.clearance else None
+        fields = {}
+        for backend in ("python", "compiled"):
+            t0 = time.perf_counter()
+            fields[backend] = geodesic_field(
+                start, cols, rows, walls, args.budget, args.clearance,
+                contact_obstacles=contact, backend=backend,
+            )
+            totals[backend] += time.perf_counter() - t0
+        if fields["compiled"] != fields["python"] or list(fields["compiled"]) != list(fields["python"]):
+            raise AssertionError(f"champ compilé différent de la référence depuis {start}")
+        cells += len(fields["python"])
+
+    print(json.dumps({
+        "board": f"{cols}x{rows}",
+        "walls": len(walls),
+        "budget": args.budget,
+        "clearance": args.clearance,
+        "starts": len(starts),
+        "mean_cells": cells / len(starts),
+        "compile_s": round(compile_s, 3),
+        "python_ms": round(1000.0 * totals["python"] / len(starts), 2),
+        "compiled_ms": round(1000.0 * totals["compiled"] / len(starts), 2),
+        "speedup": round(totals["python"] / totals["compiled"], 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
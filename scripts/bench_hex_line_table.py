@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compare ``hex_line`` (table de tracés relatifs) au cube-lerp recalculé à chaque rayon.
+
+Usage (depuis la racine du dépôt)::
+
+    python scripts/bench_hex_line_table.py
+    python scripts/bench_hex_line_table.py --workload random --pairs 6000 --rounds 3
+
+Deux charges de travail :
+  - ``preview`` (défaut) : les rayons d'une preview de tir — chaque cellule de l'empreinte du
+    tireur (socle rond ``--base``) vers chaque cellule d'une fenêtre cible ``--window`` x
+    ``--window`` posée à ``--distance`` cases. Les déplacements s'y répètent d'une cellule
+    source à l'autre : c'est le cas que la table sert ;
+  - ``random`` : ``--pairs`` paires tirées sur tout le plateau, le pire cas (presque aucun
+    déplacement répété) — ce que coûte un défaut de table.
+
+La référence « par appel » est le remplisseur de la table, ``_hex_line_table.__wrapped__``,
+traduit en absolu : exactement le calcul d'avant la table. Chaque ligne est COMPARÉE (égalité
+stricte, ordre compris) avant d'être chronométrée : un écart lève, il ne se lit pas dans un
+tableau. Résultat JSON sur stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import List, Tuple
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from engine.hex_utils import _hex_line_table, compute_occupied_hexes, hex_line
+
+Pair = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+def _per_call_line(c1: int, r1: int, c2: int, r2: int) -> List[Tuple[int, int]]:
+    dcols, drows = _hex_line_table.__wrapped__(c2 - c1, r2 - r1, c1 & 1)
+    return [(c1 + dc, r1 + dr) for dc, dr in zip(dcols, drows)]
+
+
+def _preview_pairs(args: argparse.Namespace, rng: random.Random) -> List[Pair]:
+    sc, sr = args.board_cols // 3, args.board_rows // 2
+    sources = sorted(compute_occupied_hexes(sc, sr, "round", args.base, 0))
+    tc, tr = sc + args.distance, sr + rng.randint(-args.distance // 2, args.distance // 2)
+    targets = [(tc + dc, tr + dr) for dc in range(args.window) for dr in range(args.window)]
+    return [(s, t) for s in sources for t in targets]
+
+
+def _random_pairs(args: argparse.Namespace, rng: random.Random) -> List[Pair]:
+    cols, rows = args.board_cols, args.board_rows
+    return [
+        ((rng.randrange(cols), rng.randrange(rows)), (rng.randrange(cols), rng.randrange(rows)))
+        for _ in range(args.pairs)
+    ]
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Bench table de tracés hex vs cube-lerp par appel.")
+    p.add_argument("--workload", choices=("preview", "random"), default="preview")
+    p.add_argument("--board-cols", type=int, default=360)
+    p.add_argument("--board-rows", type=int, default=312)
+    p.add_argument("--base", type=int, default=7, help="Taille du socle rond du tireur (preview).")
+    p.add_argument("--window", type=int, default=20, help="Côté de la fenêtre cible (preview).")
+    p.add_argument("--distance", type=int, default=120, help="Distance tireur -> cible (preview).")
+    p.add_argument("--pairs", type=int, default=6000, help="Nombre de paires (random).")
+    p.add_argument("--rounds", type=int, default=3)
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    rng = random.Random(args.seed)
+    pairs = _preview_pairs(args, rng) if args.workload == "preview" else _random_pairs(args, rng)
+
+    _hex_line_table.cache_clear()
+    cells = 0
+    for (c1, r1), (c2, r2) in pairs:
+        line = hex_line(c1, r1, c2, r2)
+        if line != _per_call_line(c1, r1, c2, r2):
+            raise AssertionError(f"tracé de table différent de la référence : {(c1, r1)} -> {(c2, r2)}")
+        cells += len(line)
+    _hex_line_table.cache_clear()
+
+    totals = {"per_call": 0.0, "table": 0.0}
+    for _round in range(args.rounds):
+        t0 = time.perf_counter()
+        for (c1, r1), (c2, r2) in pairs:
+            _per_call_line(c1, r1, c2, r2)
+        totals["per_call"] += time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for (c1, r1), (c2, r2) in pairs:
+            hex_line(c1, r1, c2, r2)
+        totals["table"] += time.perf_counter() - t0
+    info = _hex_line_table.cache_info()
+
+    n_lines = len(pairs) * args.rounds
+    print(json.dumps({
+        "workload": args.workload,
+        "board": f"{args.board_cols}x{args.board_rows}",
+        "pairs": len(pairs),
+        "rounds": args.rounds,
+        "mean_cells": round(cells / len(pairs), 1),
+        "table_entries": info.currsize,
+        "table_hit_rate": round(info.hits / max(1, info.hits + info.misses), 3),
+        "per_call_us": round(1e6 * totals["per_call"] / n_lines, 2),
+        "table_us": round(1e6 * totals["table"] / n_lines, 2),
+        "speedup": round(totals["per_call"] / totals["table"], 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
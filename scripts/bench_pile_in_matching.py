@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Compare le couplage B2B du pile-in (affectation hongroise) à l'ancien Kuhn récursif.
+
+Usage (depuis la racine du dépôt)::
+
+    python scripts/bench_pile_in_matching.py
+    python scripts/bench_pile_in_matching.py --sizes 5 10 20 30 --density 0.4 --rounds 20
+
+Charge de travail : pour une escouade de N figurines, une horde ennemie de N figurines en ligne
+(``--board-cols`` x ``--board-rows``) ; les cellules B2B sont les voisines libres de ses cases,
+chaque paire (figurine, cellule) est atteignable avec probabilité ``--density`` (le prédicat de
+portée réel coûte un champ geodésique : il est hors de ce qui est mesuré ici, la matrice
+d'atteignabilité est évaluée une fois dans les deux variantes).
+
+La référence est le Kuhn d'avant (`_kuhn_reference`, recopié tel quel). Chaque tirage est
+COMPARÉ : même cardinalité exigée (les deux sont maximaux), trajet total du hongrois <= celui de
+Kuhn. Un écart lève. Résultat JSON sur stdout.
+
+Ce banc ne mesure que le solveur. L'autre gain du changement est en amont : l'ancien point fixe
+réévaluait le prédicat de portée pour chaque paire (figurine, cellule) à CHAQUE tour ; la matrice
+est désormais évaluée une fois.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Set, Tuple
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+import numpy as np
+
+from engine.hex_utils import get_neighbors
+from engine.phase_handlers.shared_utils import _hex_travel_matrix, _max_b2b_matching
+
+Cell = Tuple[int, int]
+
+
+def _kuhn_reference(candidates: Dict[str, List[Cell]]) -> Dict[str, Cell]:
+    match_cell: Dict[Cell, str] = {}
+
+    def _augment(mid: str, visited: Set[Cell]) -> bool:
+        for cell in candidates[mid]:
+            if cell in visited:
+                continue
+            visited.add(cell)
+            holder = match_cell.get(cell)
+            if holder is None or _augment(holder, visited):
+                match_cell[cell] = mid
+                return True
+        return False
+
+    for mid in candidates:
+        _augment(mid, set())
+    return {mid: cell for cell, mid in match_cell.items()}
+
+
+def _instance(n: int, args: argparse.Namespace, rng: random.Random):
+    row = args.board_rows // 2
+    enemy = [(args.board_cols // 2 + 2 * k, row) for k in range(n)]
+    occupied = set(enemy)
+    cells = sorted({nb for c, r in enemy for nb in get_neighbors(c, r) if nb not in occupied})
+    movers = [f"m{k}" for k in range(n)]
+    origins = [(args.board_cols // 2 + 2 * k + rng.randint(-4, 4), row - 6 - rng.randint(0, 4))
+               for k in range(n)]
+    usable = np.array(
+        [[rng.random() < args.density for _ in cells] for _ in movers], dtype=bool,
+    )
+    return movers, origins, cells, usable
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Bench couplage B2B pile-in : hongrois vs Kuhn.")
+    p.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 20, 30])
+    p.add_argument("--density", type=float, default=0.5)
+    p.add_argument("--rounds", type=int, default=20)
+    p.add_argument("--board-cols", type=int, default=200)
+    p.add_argument("--board-rows", type=int, default=100)
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    rng = random.Random(args.seed)
+    # Échauffement : import paresseux de scipy et premier appel hors chronomètre.
+    movers, origins, cells, usable = _instance(3, args, random.Random(-1))
+    _max_b2b_matching(movers, cells, usable, _hex_travel_matrix(origins, cells))
+    results = []
+    for n in args.sizes:
+        instances = [_instance(n, args, rng) for _ in range(args.rounds)]
+        travel_gain = 0
+        totals = {"kuhn": 0.0, "hungarian": 0.0}
+        for movers, origins, cells, usable in instances:
+            travel = _hex_travel_matrix(origins, cells)
+            candidates = {
+                mid: [cells[j] for j in np.flatnonzero(usable[i])] for i, mid in enumerate(movers)
+            }
+            t0 = time.perf_counter()
+            kuhn = _kuhn_reference(candidates)
+            totals["kuhn"] += time.perf_counter() - t0
+            t0 = time.perf_counter()
+            hung = _max_b2b_matching(movers, cells, usable, travel)
+            totals["hungarian"] += time.perf_counter() - t0
+
+            if len(hung) != len(kuhn):
+                raise AssertionError(f"cardinalité différente (n={n}) : {len(hung)} vs Kuhn {len(kuhn)}")
+            col = {cell: j for j, cell in enumerate(cells)}
+            row = {mid: i for i, mid in enumerate(movers)}
+            t_k = sum(int(travel[row[m], col[c]]) for m, c in kuhn.items())
+            t_h = sum(int(travel[row[m], col[c]]) for m, c in hung.items())
+            if t_h > t_k:
+                raise AssertionError(f"trajet hongrois {t_h} > Kuhn {t_k} (n={n})")
+            travel_gain += t_k - t_h
+        results.append({
+            "models": n,
+            "b2b_cells": len(instances[0][2]),
+            "kuhn_us": round(1e6 * totals["kuhn"] / args.rounds, 1),
+            "hungarian_us": round(1e6 * totals["hungarian"] / args.rounds, 1),
+            "speedup": round(totals["kuhn"] / totals["hungarian"], 2),
+            "mean_travel_saved": round(travel_gain / args.rounds, 2),
+        })
+    print(json.dumps({"density": args.density, "rounds": args.rounds, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,12 @@ Macro:
 Micro:
   - Executes one valid action from the action mask (random policy).
 
+Side observations (--compare-side-observations):
+  - Each step outside the move phase, builds the current player's observations squad by squad,
+    then batched (`ObservationBuilder.build_side_observations`), checks they match and reports
+    the speedup.
+    The gap grows with army size: run it on 10+ squad scenarios.
+
 This script is intended for load testing and capacity planning.
 """
 
@@ -23,6 +29,8 @@ import time
 import tracemalloc
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
 if project_root not in sys.path:
@@ -165,14 +173,68 @@ def _select_random_action(mask) -> int:
     return random.choice(valid_indices)
 
 
+def _compare_side_observations(engine: W40KEngine, stats: Dict[str, float]) -> None:
+    """
+    Time the observations of every squad of the current player, built squad by squad
+    (`build_squad_observation` + `build_squad_grid`) then in one batch
+    (`build_side_observations`), and accumulate both timings into `stats`.
+
+    The two paths must produce the SAME arrays: a mismatch raises, since a speedup measured
+    against a different observation would be meaningless.
+
+    Move-phase steps are skipped: the grid reads the cell map the mask memoises for the active
+    squad only, so the other squads have no grid to build.
+    """
+    game_state = engine.game_state
+    if str(require_key(game_state, "phase")).lower() == "move":
+        return
+    builder = engine.obs_builder
+    player = int(require_key(game_state, "current_player"))
+    squad_ids = [
+        str(sid)
+        for sid, entry in require_key(game_state, "units_cache").items()
+        if int(require_key(entry, "player")) == player
+    ]
+    if not squad_ids:
+        return
+    start = time.perf_counter()
+    per_squad = {}
+    for sid in squad_ids:
+        obs = builder.build_squad_observation(game_state, sid)
+        obs = {key: value.copy() for key, value in obs.items()}
+        obs["grid"] = builder.build_squad_grid(game_state, sid).copy()
+        per_squad[sid] = obs
+    mid = time.perf_counter()
+    batched = builder.build_side_observations(game_state, player)
+    end = time.perf_counter()
+    for sid, expected in per_squad.items():
+        for key, array in expected.items():
+            if not np.array_equal(batched[sid][key], array):
+                raise RuntimeError(
+                    f"build_side_observations diverges from build_squad_observation: "
+                    f"squad {sid}, key {key!r}"
+                )
+    stats["calls"] += 1
+    stats["squads"] += len(squad_ids)
+    stats["max_squads"] = max(stats["max_squads"], len(squad_ids))
+    stats["per_squad_sec"] += mid - start
+    stats["batched_sec"] += end - mid
+
+
 def run_episode(
     engine: W40KEngine,
     macro_player: int,
     macro_every_steps: int,
     max_steps_per_turn: Optional[int],
     macro_both: bool,
+    side_obs_stats: Optional[Dict[str, float]] = None,
 ) -> int:
-    """Run a single episode and return the step count."""
+    """
+    Run a single episode and return the step count.
+
+    `side_obs_stats` : when given, each step also compares per-squad and batched observation
+    building for the current player (see _compare_side_observations).
+    """
     engine.reset()
     # Budget explicite de l'operateur (on ecourte volontairement la charge) VS garde
     # anti-runaway derivee du moteur : les deux se comptent par tour, mais un depassement
@@ -241,6 +303,8 @@ def run_episode(
                 else:
                     raise ValueError(f"Unsupported phase: {phase}")
 
+        if side_obs_stats is not None:
+            _compare_side_observations(engine, side_obs_stats)
         mask = engine.get_action_mask()
         action = _select_random_action(mask)
         _, _, terminated, truncated, _ = engine.step(action)
@@ -274,6 +338,15 @@ def parse_args() -> argparse.Namespace:
             "overhead — the reported CPU time then includes the tracing itself."
         ),
     )
+    parser.add_argument(
+        "--compare-side-observations",
+        action="store_true",
+        help=(
+            "At each step outside the move phase, time the current player's observations built "
+            "squad by squad vs batched (build_side_observations). Adds both to the wall time: "
+            "the speedup is the metric, not steps/sec."
+        ),
+    )
     parser.add_argument("--metrics-out", help="Write metrics summary to JSON file")
     parser.add_argument("--seed", type=int, help="Random seed")
     return parser.parse_args()
@@ -307,6 +380,11 @@ def main() -> None:
     )
 
     total_steps = 0
+    side_obs_stats: Optional[Dict[str, float]] = None
+    if args.compare_side_observations:
+        side_obs_stats = {
+            "calls": 0, "squads": 0, "max_squads": 0, "per_squad_sec": 0.0, "batched_sec": 0.0,
+        }
     # tracemalloc instrumente CHAQUE allocation : mesure ~9.6x le CPU sur ce bench. Il est
     # donc opt-in, sinon la metrique CPU rapportee serait surtout celle de l'instrument.
     if args.trace_python_memory:
@@ -321,6 +399,7 @@ def main() -> None:
             # resolu apres reset), pour exercer la meme borne que la production.
             max_steps_per_turn=args.max_steps_per_turn,
             macro_both=args.macro_both,
+            side_obs_stats=side_obs_stats,
         )
         total_steps += steps
         print(f"[episode {ep}] steps={steps}")
@@ -344,6 +423,21 @@ def main() -> None:
     print(f"Process RSS peak : {process_peak_rss_mb:.2f} Mb (whole process, imports included)")
     print(f"Disk read : {io_read_mb:.2f} Mb")
     print(f"Disk write : {io_write_mb:.2f} Mb")
+    side_obs_summary: Optional[Dict[str, float]] = None
+    if side_obs_stats is not None and side_obs_stats["calls"] > 0:
+        side_obs_summary = dict(side_obs_stats)
+        side_obs_summary["mean_squads"] = side_obs_stats["squads"] / side_obs_stats["calls"]
+        side_obs_summary["speedup"] = (
+            side_obs_stats["per_squad_sec"] / side_obs_stats["batched_sec"]
+            if side_obs_stats["batched_sec"] > 0 else None
+        )
+        print(
+            f"Side observations : {side_obs_stats['calls']} calls, "
+            f"{side_obs_summary['mean_squads']:.1f} squads/call (max {side_obs_stats['max_squads']}), "
+            f"per-squad {side_obs_stats['per_squad_sec']:.2f}s vs batched "
+            f"{side_obs_stats['batched_sec']:.2f}s"
+            + (f" (x{side_obs_summary['speedup']:.2f})" if side_obs_summary["speedup"] else "")
+        )
     if py_peak_kb is not None:
         print(f"Python heap peak : {py_peak_kb / 1024:.2f} Mb (tracemalloc: CPU time inflated)")
     if args.metrics_out:
@@ -356,6 +450,8 @@ def main() -> None:
         # Absent du payload si non mesure : une cle a 0 se lirait comme une mesure.
         if py_peak_kb is not None:
             payload["python_memory_peak_kb"] = py_peak_kb
+        if side_obs_summary is not None:
+            payload["side_observations"] = side_obs_summary
         write_json_atomic(args.metrics_out, payload)
 
 
@@ -8,6 +8,7 @@ Usage (from repo root):
   ./.venv/bin/python scripts/profile_env_step_360x312.py --per-step --top-slow 0
   ./.venv/bin/python scripts/profile_env_step_360x312.py --no-progress   # JSON only (no bar on stderr)
   ./.venv/bin/python scripts/profile_env_step_360x312.py --profile-goulots  # + cProfile replay (2e passe, barre tqdm "cprofile-replay")
+  ./.venv/bin/python scripts/profile_env_step_360x312.py --reuse-obs-buffers  # tampons d'observation préalloués
 
   # JSON dans un fichier tout en gardant les barres tqdm dans le terminal (bash) :
   #   ./.venv/bin/python scripts/profile_env_step_360x312.py ... > profile_result.json 2> >(tee profile_stderr.txt >&2)
@@ -102,6 +103,15 @@ def parse_args() -> argparse.Namespace:
             "Shows a second tqdm bar on stderr (desc=cprofile-replay) unless --no-progress."
         ),
     )
+    parser.add_argument(
+        "--reuse-obs-buffers",
+        action="store_true",
+        help=(
+            "Write observations into the builder's preallocated buffers "
+            "(ObservationBuilder.use_preallocated_buffers). The JSON reports observation "
+            "array allocations per measured step either way."
+        ),
+    )
     parser.add_argument(
         "--goulot-cprofile-top",
         type=int,
@@ -266,7 +276,7 @@ def _build_goulot_detail(
 
 
 def _make_env(args: argparse.Namespace, W40KEngine: Any) -> Any:
-    return W40KEngine(
+    env = W40KEngine(
         rewards_config=args.agent_key,
         training_config_name="default",
         controlled_agent=args.agent_key,
@@ -276,6 +286,10 @@ def _make_env(args: argparse.Namespace, W40KEngine: Any) -> Any:
         gym_training_mode=True,
         training_n_envs=1,  # UN environnement, joue en serie (engine/episode_schedule.py)
     )
+    if args.reuse_obs_buffers:
+        # Sûr ici : chaque observation rendue est jetée avant le step suivant.
+        env.obs_builder.use_preallocated_buffers()
+    return env
 
 
 def _replay_and_profile_goulots(
@@ -377,6 +391,7 @@ def main() -> None:
         step_durations_ms: List[float] = []
         per_step: List[Dict[str, Any]] = []
         resets = 0
+        obs_alloc_start = env.obs_builder.observation_allocation_stats()
         for _ in range(args.measured_steps):
             game_state = require_key(env.__dict__, "game_state")
             phase = require_key(game_state, "phase")
@@ -393,6 +408,8 @@ def main() -> None:
                 obs, _ = env.reset()
             pbar.update(1)
 
+    obs_alloc_end = env.obs_builder.observation_allocation_stats()
+    obs_arrays_allocated = int(obs_alloc_end["arrays_allocated"]) - int(obs_alloc_start["arrays_allocated"])
     arr = np.array(step_durations_ms, dtype=np.float64)
     game_state = require_key(env.__dict__, "game_state")
     board_cols = require_key(game_state, "board_cols")
@@ -442,6 +459,14 @@ def main() -> None:
             "stdev": float(arr.std(ddof=1)) if arr.size > 1 else 0.0,
         },
         "sps_step_only": float(1000.0 / arr.mean()),
+        # Tableaux d'observation (clés squad + grille) alloués pendant la phase measured : 28 par
+        # observation construite en allocation fraîche, 0 avec --reuse-obs-buffers.
+        "observation_allocations": {
+            "preallocated_buffers": bool(args.reuse_obs_buffers),
+            "arrays_allocated": obs_arrays_allocated,
+            "arrays_per_step": float(obs_arrays_allocated / len(step_durations_ms)),
+            "buffer_reuses": int(obs_alloc_end["buffer_reuses"]) - int(obs_alloc_start["buffer_reuses"]),
+        },
         "by_phase_action": buckets,
         "goulot_detail": goulot_detail,
         "goulot_specs": [{"phase": p, "action": a, "label": lbl} for p, a, lbl in GOULOT_SPECS],
@@ -47,6 +47,9 @@ _GS_STATIC_KEYS = frozenset({
     # listées, elles se feraient deepcopy à CHAQUE capture — 330 Ko de décor immuable par
     # snapshot sur un plateau x5.
     "_los_blocking_grids_cache",
+    # Champ de dégagement de la LoS : dérivé des grilles ci-dessus, souvent un mmap en lecture
+    # seule — le deepcopy d'un snapshot le matérialiserait en copie privée à chaque capture.
+    "_los_clearance_field_cache",
     "_cache_instance_id",
 })
 
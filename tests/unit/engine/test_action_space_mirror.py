@@ -57,6 +57,18 @@ def test_charge_pair_slots_count():
     assert len(seen) == expected_pairs, "collision ou trou dans l'encodage"
 
 
+def test_charge_pair_members_follow_the_encoding():
+    """Les tableaux d'indices dont le masque tire le bloc des paires d'une seule operation :
+    la paire k doit y avoir EXACTEMENT les membres que `charge_pair_encode` lui donne."""
+    from engine.macro_intents import charge_pair_encode, charge_pair_members
+
+    slots_i, slots_j = charge_pair_members()
+    assert slots_i.shape == slots_j.shape == (mi.CHARGE_PAIR_SLOT_COUNT,)
+    for pair_idx, (i, j) in enumerate(zip(slots_i.tolist(), slots_j.tolist())):
+        assert charge_pair_encode(i, j) == pair_idx
+    assert not slots_i.flags.writeable and not slots_j.flags.writeable
+
+
 def test_fight_slots_mirror_the_enemy_slot_mapping():
     """V11 §9 P3-1 : une action de combat = un slot ennemi, le MEME que le tir (invariant D1).
 
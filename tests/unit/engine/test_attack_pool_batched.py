@@ -0,0 +1,92 @@
+"""Le roller par tableaux (`roll_attack_pool_batched`) rend-il le MEME verdict par de que le
+roller unitaire (`roll_attack_pool`) ?
+
+Les deux tirent leurs des dans un ordre different (par jambe / par attaque) : on ne peut donc pas
+comparer deux tirages de meme graine. On relit plutot, dans les records du roller par tableaux,
+chaque de qu il a jete, on les remet dans l ordre DOCUMENTE du roller unitaire (par attaque :
+touche, relance, blessure, relance, sauvegarde, relance), et on rejoue ce script dans le roller
+unitaire : records, blessures en attente et compteurs doivent etre identiques, cle pour cle.
+Une regle appliquee de travers par un masque (cause de relance, touche SUSTAINED, arbitrage
+LETHAL, sauvegarde faite contre une DEVASTATING) casse l egalite ou epuise le script.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from engine.phase_handlers.attack_sequence import (
+    RerollProfile,
+    WeaponAttackProfile,
+    roll_attack_pool,
+    roll_attack_pool_batched,
+)
+
+_PROFILES = [
+    WeaponAttackProfile(),
+    WeaponAttackProfile(torrent=True),
+    WeaponAttackProfile(sustained_hits=2, lethal_hits=True),
+    WeaponAttackProfile(lethal_hits=True, devastating=True, crit_wound_on=4,
+                        anti_keyword="INFANTRY", anti_threshold=4),
+    WeaponAttackProfile(twin_linked=True, sustained_hits=1, devastating=True),
+]
+_REROLLS = [
+    RerollProfile(),
+    RerollProfile(hit_1=True, wound_1=True, save_1=True),
+    RerollProfile(hit_any_fail=True, wound_any_fail=True),
+]
+
+
+def _documented_dice(records: List[Dict[str, Any]]) -> List[int]:
+    """Des des records, dans l ordre du roller unitaire. Un record sans `sustainedHit` ouvre une
+    attaque (ses des de touche) ; chaque record porte ensuite ses des de blessure et de sauvegarde."""
+    dice: List[int] = []
+    for rec in records:
+        if not rec.get("sustainedHit"):
+            dice += [rec[k] for k in ("attackRollInitial", "attackRoll") if rec.get(k) is not None]
+        for k in ("strengthRollInitial", "strengthRoll", "saveRollInitial", "saveRoll"):
+            if rec.get(k) is not None:
+                dice.append(rec[k])
+    return dice
+
+
+@pytest.mark.parametrize("profile,rerolls", list(itertools.product(_PROFILES, _REROLLS)))
+def test_batched_roller_matches_scalar_roller_die_for_die(
+    profile: WeaponAttackProfile, rerolls: RerollProfile
+) -> None:
+    rng = np.random.default_rng(7)
+    seen_keys = set()
+    for hit_target, wound_target, save_th in ((3, 4, 3), (4, 2, 5), (5, 5, 7)):
+        kwargs = dict(
+            n_attacks=40, hit_target=hit_target, wound_target=wound_target,
+            save_threshold_value=save_th, profile=profile, rerolls=rerolls,
+        )
+        batched = roll_attack_pool_batched(rng=rng, **kwargs).as_pool_result()
+        script = iter(_documented_dice(batched["shot_records"]))
+        scalar = roll_attack_pool(roll_d6=lambda: next(script), **kwargs)
+        assert next(script, None) is None, "des non consommes : l ordre documente a change"
+        assert scalar["shot_records"] == batched["shot_records"]
+        assert scalar["counts"] == batched["counts"]
+        assert [
+            (w["save_roll"], w["devastating"], w["rec"]) for w in scalar["pending_wounds"]
+        ] == [(w["save_roll"], w["devastating"], w["rec"]) for w in batched["pending_wounds"]]
+        for rec in batched["shot_records"]:
+            seen_keys |= set(rec)
+    # CONTRE LE VERT VACANT : les regles du profil ont bien joue au moins une fois.
+    assert ("autoHit" in seen_keys) == profile.torrent
+    if profile.sustained_hits:
+        assert "sustainedHit" in seen_keys
+    if rerolls != RerollProfile() or profile.twin_linked:
+        assert seen_keys & {"hitRerollCause", "woundRerollCause", "saveRollInitial"}
+
+
+def test_empty_pool_has_no_records() -> None:
+    pool = roll_attack_pool_batched(
+        n_attacks=0, hit_target=3, wound_target=4, save_threshold_value=3,
+        profile=WeaponAttackProfile(), rerolls=RerollProfile(), rng=np.random.default_rng(0),
+    )
+    assert pool.counts == {"attacks": 0, "hits": 0, "wounds": 0}
+    assert pool.as_pool_result()["shot_records"] == []
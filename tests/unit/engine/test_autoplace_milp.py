@@ -0,0 +1,76 @@
+"""Le budget des ILP d'auto-placement (`engine/autoplace_milp.py`) est-il lu, borne, et rapporte ?
+
+Un ILP d'empaquetage a relaxation LP fractionnaire (triplets mutuellement exclusifs tires au
+hasard) oblige HiGHS a brancher : avec un budget d'UN nœud, la resolution s'arrete sur son
+incumbent — on verifie qu'il est rendu (pas None), et que `perf_timing.log` dit que le budget a mordu.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+from scipy.optimize import LinearConstraint
+
+import engine.autoplace_milp as am
+from engine.autoplace_milp import (
+    AUTOPLACE_NODE_LIMIT,
+    AUTOPLACE_TIME_LIMIT_S,
+    autoplace_milp_budget,
+    solve_autoplace_milp,
+)
+
+
+def _gs(**rules: Any) -> Dict[str, Any]:
+    return {"config": {"game_rules": dict(rules)}, "perf_timing": True, "episode_number": 1, "turn": 2}
+
+
+def _packing_problem(n: int = 60, n_rows: int = 300) -> tuple:
+    rng = np.random.default_rng(0)
+    A = np.zeros((n_rows, n))
+    for k in range(n_rows):
+        A[k, rng.choice(n, 3, replace=False)] = 1.0
+    cost = -(1.0 + rng.random(n))
+    return cost, [LinearConstraint(A, np.zeros(n_rows), np.ones(n_rows))]
+
+
+@pytest.fixture
+def perf_lines(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    lines: List[str] = []
+    monkeypatch.setattr(am, "append_perf_timing_line", lines.append)
+    return lines
+
+
+def test_budget_defaults_overrides_and_rejects_non_positive() -> None:
+    assert autoplace_milp_budget(_gs()) == {
+        "time_limit": AUTOPLACE_TIME_LIMIT_S, "node_limit": AUTOPLACE_NODE_LIMIT,
+    }
+    assert autoplace_milp_budget(_gs(autoplace_time_limit_s=0.5, autoplace_node_limit=7)) == {
+        "time_limit": 0.5, "node_limit": 7,
+    }
+    with pytest.raises(ValueError, match="autoplace budget must be > 0"):
+        autoplace_milp_budget(_gs(autoplace_node_limit=0))
+
+
+def test_exhausted_budget_returns_best_incumbent_and_reports_it(perf_lines: List[str]) -> None:
+    cost, constraints = _packing_problem()
+    # Budget temps large : la reference doit prouver l'optimum meme sur une machine chargee.
+    best = solve_autoplace_milp(_gs(autoplace_time_limit_s=60.0), "charge", cost, constraints, squad_id="5")
+    capped = solve_autoplace_milp(_gs(autoplace_node_limit=1), "charge", cost, constraints, squad_id="5")
+
+    assert best is not None and capped is not None
+    for x in (best, capped):                               # affectations entieres et realisables
+        assert np.allclose(x, np.round(x))
+        assert (constraints[0].A @ np.round(x) <= 1.0 + 1e-9).all()
+    assert float(cost @ np.round(capped)) >= float(cost @ np.round(best)) - 1e-9
+
+    assert len(perf_lines) == 2 and all(line.startswith("AUTOPLACE_MILP ") for line in perf_lines)
+    assert "budget_exhausted=0" in perf_lines[0] and "found=1" in perf_lines[0]
+    assert "budget_exhausted=1" in perf_lines[1] and "label=charge squad_id=5" in perf_lines[1]
+
+
+def test_infeasible_problem_returns_none(perf_lines: List[str]) -> None:
+    cover = LinearConstraint(np.ones((1, 2)), np.array([3.0]), np.array([4.0]))
+    assert solve_autoplace_milp(_gs(), "charge_cover", np.array([-1.0, -1.0]), [cover], squad_id="1") is None
+    assert "found=0" in perf_lines[0] and "budget_exhausted=0" in perf_lines[0]
@@ -0,0 +1,88 @@
+"""Les actifs de plateau publiés en mémoire partagée sont-ils ceux que le worker aurait calculés ?
+
+`engine.board_assets` remplace, dans un worker, la rasterisation d'un polygone et la construction
+des cartes de distance aux objectifs par une LECTURE du segment publié par le parent. Le contrat
+est strict : même contenu, même ordre, et en lecture seule — une vue partagée modifiée par un
+worker le serait pour tous.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import engine.board_assets as board_assets
+from engine.hex_utils import polygon_to_hex_list
+from engine.objective_distance import _shared_or_built_maps
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+POLYGON = [[3, 2], [30, 4], [26, 27], [5, 22]]
+ZONES = [("obj_a", {(4, 4), (4, 5), (5, 5)}), ("obj_b", {(30, 20), (31, 20)})]
+
+
+@pytest.fixture
+def isolated_assets(monkeypatch):
+    """État de module vierge, segments détruits à la fin quoi qu'il arrive."""
+    monkeypatch.setattr(board_assets, "_SHARED", {})
+    monkeypatch.setattr(board_assets, "_SEGMENTS", {})
+    monkeypatch.setattr(board_assets, "_OWNED", [])
+    yield
+    board_assets.release_board_assets()
+
+
+def test_published_assets_match_local_computation(isolated_assets):
+    expected_hexes = polygon_to_hex_list(POLYGON, 40, 30)
+    expected_maps = _shared_or_built_maps(ZONES, 40, 30)
+    with board_assets.collect_board_assets() as assets:
+        polygon_to_hex_list(POLYGON, 40, 30)
+        _shared_or_built_maps(ZONES, 40, 30)
+    assert len(assets) == 2, "un raster et un jeu de cartes devaient être collectés"
+    board_assets.publish_board_assets(assets)
+
+    assert polygon_to_hex_list(POLYGON, 40, 30) == expected_hexes
+    maps = _shared_or_built_maps(ZONES, 40, 30)
+    for got, expected in zip(maps, expected_maps):
+        assert np.array_equal(got, expected)
+        assert not got.flags.writeable
+        # La carte servie EST la vue partagée, pas une copie locale.
+        assert np.shares_memory(got, next(a for a in board_assets._SHARED.values() if a.ndim == 3))
+
+
+def test_other_process_reads_published_raster(isolated_assets):
+    with board_assets.collect_board_assets() as assets:
+        expected = polygon_to_hex_list(POLYGON, 40, 30)
+    manifest = board_assets.publish_board_assets(assets)
+    child = (
+        "import json, sys\n"
+        "import engine.board_assets as ba\n"
+        "ba.attach_board_assets(json.loads(sys.argv[1]))\n"
+        "(view,) = ba._SHARED.values()\n"
+        "print(json.dumps({'writeable': bool(view.flags.writeable), 'hexes': view.tolist()}))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", child, json.dumps(manifest)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    seen = json.loads(out.stdout.strip().splitlines()[-1])
+    assert seen["hexes"] == expected
+    assert seen["writeable"] is False
+
+
+def test_collect_outside_block_records_nothing(isolated_assets):
+    polygon_to_hex_list(POLYGON, 40, 30)
+    with board_assets.collect_board_assets() as assets:
+        pass
+    assert assets == {}
+    with board_assets.collect_board_assets():
+        with pytest.raises(RuntimeError):
+            with board_assets.collect_board_assets():
+                pass
@@ -0,0 +1,89 @@
+"""Les champs par ennemi de la phase de charge (`engine/charge_enemy_fields.py`) rendent-ils
+exactement ce que calculaient les dilatations et le BFS multi-source qu'ils remplacent ?
+
+Deux references : `dilate_hex_set_unbounded` pour `within`, et un BFS multi-source depuis l'UNION
+des empreintes (le `_dist_field` du contexte de plan) pour `distance_field`. On verifie aussi
+l'extension a la demande (rayon croissant puis decroissant) et l'invalidation par version.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Dict, Set, Tuple
+
+from engine.charge_enemy_fields import (
+    ChargeEnemyFields,
+    charge_enemy_fields,
+    reset_charge_enemy_fields,
+)
+from engine.hex_utils import dilate_hex_set_unbounded, get_neighbors
+
+Cell = Tuple[int, int]
+
+_COLS, _ROWS = 24, 20
+_ENEMIES = {
+    "7": {(5, 5), (5, 6), (6, 5)},
+    "8": {(15, 12), (16, 12)},
+    "9": {(0, 19), (1, 19)},           # contre le bord : graines et voisins hors plateau filtres
+}
+_WALLS = {(8, r) for r in range(2, 15)} | {(12, 10), (12, 11), (13, 11)}
+
+
+def _union_bfs(seeds: Set[Cell], max_steps: int, walls: Set[Cell]) -> Dict[Cell, int]:
+    dist = {s: 0 for s in seeds if 0 <= s[0] < _COLS and 0 <= s[1] < _ROWS}
+    frontier = list(dist)
+    step = 0
+    while frontier and step < max_steps:
+        step += 1
+        nxt = []
+        for c, r in frontier:
+            for cell in get_neighbors(c, r):
+                if not (0 <= cell[0] < _COLS and 0 <= cell[1] < _ROWS):
+                    continue
+                if cell in dist or cell in walls:
+                    continue
+                dist[cell] = step
+                nxt.append(cell)
+        frontier = nxt
+    return dist
+
+
+def test_within_matches_unbounded_dilation_for_any_radius_order() -> None:
+    fields = ChargeEnemyFields(version=0)
+    for radius in (3, 1, 6, 0, 6):
+        for eid, fp in _ENEMIES.items():
+            assert fields.within(eid, fp, radius) == dilate_hex_set_unbounded(fp, radius)
+    assert fields.stats()["misses"] == len(_ENEMIES)
+
+
+def test_union_field_matches_multi_source_bfs_with_and_without_walls() -> None:
+    fields = ChargeEnemyFields(version=0)
+    for ids, steps in ((("7", "8"), 4), (("7", "8", "9"), 9), (("8",), 2), (("7", "9"), 9)):
+        sources = [(eid, _ENEMIES[eid]) for eid in ids]
+        union = set().union(*(_ENEMIES[eid] for eid in ids))
+        for walls_block in (True, False):
+            got = fields.distance_field(sources, steps, _COLS, _ROWS, _WALLS, walls_block=walls_block)
+            assert got == _union_bfs(union, steps, _WALLS if walls_block else set())
+    # Le dict rendu appartient a l'appelant : le muter ne corrompt pas le champ partage.
+    got.clear()
+    again = fields.distance_field([("7", _ENEMIES["7"])], 9, _COLS, _ROWS, _WALLS, walls_block=False)
+    assert again == _union_bfs(_ENEMIES["7"], 9, set())
+
+
+def test_fields_are_dropped_when_models_move() -> None:
+    gs = {"_unit_move_version": 3}
+    fields = charge_enemy_fields(gs)
+    fields.within("7", _ENEMIES["7"], 2)
+    assert charge_enemy_fields(gs) is fields
+    # Une copie d'etat repart vide, a la meme version.
+    copied = copy.deepcopy(gs)["_charge_enemy_fields"]
+    assert copied is not fields and copied.version == 3 and not copied.rings
+
+    gs["_unit_move_version"] += 1                # une figurine a bouge (charge commitee, perte)
+    moved = charge_enemy_fields(gs)
+    assert moved is not fields and not moved.rings
+    # L'empreinte n'est relue qu'a la construction : apres invalidation, la nouvelle est servie.
+    assert moved.within("7", {(10, 10)}, 1) == dilate_hex_set_unbounded({(10, 10)}, 1)
+
+    reset_charge_enemy_fields(gs)                # ouverture de phase de charge
+    assert charge_enemy_fields(gs) is not moved
@@ -0,0 +1,138 @@
+"""La distribution memoisee (`damage_distribution`) dit-elle ce que le moteur jouera ?
+
+Deux verrous independants :
+
+1. son ESPERANCE, sans relance d'abilite ni FNP ni des, doit tomber exactement sur
+   `expected_damage_per_attack` x NB — la source unique de l'esperance « consciente des regles »,
+   ecrite face par face et non par convolution ; une erreur de branche (SUSTAINED, LETHAL,
+   DEVASTATING, TWIN-LINKED) ne peut pas passer les deux ;
+2. sa LOI, avec relances, des d'attaques et de degats et FNP, doit coller a la frequence
+   empirique du roller vif (`roll_attack_pool`, puis sauvegarde, degats et FNP tires comme le
+   fait l'allocation).
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+from engine.phase_handlers.attack_sequence import (
+    RerollProfile,
+    WeaponAttackProfile,
+    expected_damage_per_attack,
+    roll_attack_pool,
+)
+from engine.weapon_damage_cache import (
+    DamageKey,
+    damage_distribution,
+    weapon_damage_key,
+)
+
+_PROFILES = [
+    WeaponAttackProfile(),
+    WeaponAttackProfile(torrent=True),
+    WeaponAttackProfile(sustained_hits=2, lethal_hits=True),
+    WeaponAttackProfile(lethal_hits=True, devastating=True, crit_wound_on=4,
+                        anti_keyword="INFANTRY", anti_threshold=4),
+    WeaponAttackProfile(twin_linked=True, sustained_hits=1, devastating=True),
+]
+
+
+@pytest.mark.parametrize("profile", _PROFILES)
+def test_mean_matches_the_rule_aware_expectation(profile: WeaponAttackProfile) -> None:
+    for hit, wound, save, dmg in itertools.product((2, 4, 6), (2, 4, 6), (2, 4, 7), (1, 3)):
+        key = DamageKey(
+            profile=profile, rerolls=RerollProfile(), n_attacks=4, damage=dmg,
+            hit_target=hit, wound_target=wound, save_threshold_value=save,
+        )
+        dist = damage_distribution(key)
+        assert sum(dist.pmf) == pytest.approx(1.0)
+        assert dist.mean == pytest.approx(4 * expected_damage_per_attack(
+            profile, hit_target=hit, wound_target=wound, save_threshold_value=save, damage=dmg,
+        ))
+
+
+def _roll_dice(value: Any, rng: random.Random) -> int:
+    if isinstance(value, int):
+        return value
+    return {"D3": lambda: (rng.randint(1, 6) + 1) // 2, "D6": lambda: rng.randint(1, 6)}[value]()
+
+
+def _simulate(key: DamageKey, rng: random.Random) -> int:
+    """Une activation tiree comme le moteur : pool, sauvegarde, degats, FNP par point."""
+    rolled = roll_attack_pool(
+        n_attacks=_roll_dice(key.n_attacks, rng) + key.attacks_bonus,
+        hit_target=key.hit_target, wound_target=key.wound_target,
+        save_threshold_value=key.save_threshold_value, profile=key.profile,
+        rerolls=key.rerolls, roll_d6=lambda: rng.randint(1, 6),
+    )
+    total = 0
+    for wound in rolled["pending_wounds"]:
+        roll = wound["save_roll"]
+        if not wound["devastating"] and roll != 1 and roll >= key.save_threshold_value:
+            continue
+        for _ in range(_roll_dice(key.damage, rng)):
+            if key.fnp_threshold is None or rng.randint(1, 6) < key.fnp_threshold:
+                total += 1
+    return total
+
+
+@pytest.mark.parametrize("profile,rerolls", [
+    (WeaponAttackProfile(sustained_hits=1, lethal_hits=True),
+     RerollProfile(hit_1=True, wound_any_fail=True, save_1=True)),
+    (WeaponAttackProfile(devastating=True, twin_linked=True), RerollProfile(hit_any_fail=True)),
+])
+def test_distribution_matches_the_live_roller(
+    profile: WeaponAttackProfile, rerolls: RerollProfile
+) -> None:
+    key = DamageKey(
+        profile=profile, rerolls=rerolls, n_attacks="D6", damage="D3", hit_target=3,
+        wound_target=4, save_threshold_value=4, fnp_threshold=5, attacks_bonus=1,
+    )
+    dist = damage_distribution(key)
+    rng = random.Random(11)
+    n = 20000
+    counts: Dict[int, int] = {}
+    for _ in range(n):
+        dmg = _simulate(key, rng)
+        counts[dmg] = counts.get(dmg, 0) + 1
+    empirical: List[float] = [counts.get(k, 0) / n for k in range(len(dist.pmf))]
+    assert sum(counts.values()) == n and max(counts) < len(dist.pmf)
+    # Ecart L1 d'une loi empirique a 20 000 tirages sur ~20 valeurs : ~0,03 attendu.
+    assert sum(abs(a - b) for a, b in zip(empirical, dist.pmf)) < 0.06
+    assert sum(k * p for k, p in enumerate(empirical)) == pytest.approx(dist.mean, rel=0.03)
+
+
+def _weapon(**overrides: Any) -> Dict[str, Any]:
+    weapon: Dict[str, Any] = {
+        "ATK": 3, "STR": 4, "AP": -1, "NB": 2, "DMG": 1, "RNG": 24, "WEAPON_RULES": [],
+    }
+    weapon.update(overrides)
+    return weapon
+
+
+def test_key_resolves_cover_and_waaagh_through_engine_rules() -> None:
+    defender = dict(toughness=4, armor_save=3, invul_save=7)
+    plain = weapon_damage_key(_weapon(), None, **defender)
+    assert (plain.hit_target, plain.wound_target, plain.save_threshold_value) == (3, 4, 4)
+    assert weapon_damage_key(_weapon(), None, cover=True, **defender).hit_target == 4
+    # [IGNORES COVER] : meme cle que sans couvert, donc meme entree memoisee.
+    ignores = _weapon(WEAPON_RULES=["IGNORES_COVER"])
+    assert weapon_damage_key(ignores, None, cover=True, **defender).hit_target == 3
+    waaagh = weapon_damage_key(_weapon(), None, melee_bonus=1, **defender)
+    assert (waaagh.wound_target, waaagh.attacks_bonus) == (3, 1)
+    assert damage_distribution(plain) is damage_distribution(weapon_damage_key(_weapon(), None, **defender))
+
+
+def test_kill_probability_reads_the_tail() -> None:
+    dist = damage_distribution(DamageKey(
+        profile=WeaponAttackProfile(torrent=True), rerolls=RerollProfile(), n_attacks=1,
+        damage="D6", hit_target=3, wound_target=2, save_threshold_value=7,
+    ))
+    # Touche automatique, blessure sur 2+, aucune sauvegarde : 5/6 x P(D6 >= 3).
+    assert dist.kill_probability(3) == pytest.approx(5 / 6 * 4 / 6)
+    assert dist.kill_probability(0) == 1.0
+    assert dist.kill_probability(7) == 0.0
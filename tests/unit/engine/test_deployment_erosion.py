@@ -0,0 +1,57 @@
+"""Le cache d'erosion partage du deploiement (`engine/deployment_erosion.py`) : noyaux par parite,
+construction unique, copie d'etat.
+
+L'equivalence de l'erosion elle-meme (zone erodee moins ancres touchant un obstacle == calcul
+direct) est verrouillee par `test_deployment_footprint_erosion.py`.
+"""
+
+from __future__ import annotations
+
+import copy
+
+from engine.deployment_erosion import (
+    DEPLOYMENT_EROSION_CACHE_KEY,
+    deployment_erosion_cache,
+    kernel_cache_key,
+    parity_kernels_from_cube,
+)
+from engine.hex_utils import cube_to_offset, offset_to_cube, precompute_footprint_offsets
+
+
+def test_parity_kernels_reproduce_the_cube_translation_at_every_anchor() -> None:
+    off_e, off_o = precompute_footprint_offsets("oval", [4, 2], 1)
+    # Empreinte en offsets CUBE relevee a une ancre impaire, comme le pool par-figurine la releve.
+    rx, ry, rz = offset_to_cube(7, 3)
+    cube = [
+        (x - rx, y - ry, z - rz)
+        for x, y, z in (offset_to_cube(7 + dc, 3 + dr) for dc, dr in off_o)
+    ]
+    kernels = parity_kernels_from_cube(cube)
+    for col, row in ((0, 0), (1, 0), (10, 5), (13, 8), (2, 17)):
+        ax, ay, az = offset_to_cube(col, row)
+        expected = {cube_to_offset(ax + ox, ay + oy, az + oz) for ox, oy, oz in cube}
+        got = {(col + int(dc), row + int(dr)) for dc, dr in kernels[col % 2].tolist()}
+        assert got == expected
+    # Meme noyau que la geometrie precalculee, a l'ordre des offsets pres.
+    assert kernel_cache_key(kernels) == (tuple(sorted(off_e)), tuple(sorted(off_o)))
+
+
+def test_entries_are_built_once_and_copies_start_empty() -> None:
+    gs: dict = {}
+    calls = []
+
+    def _build() -> frozenset:
+        calls.append(1)
+        return frozenset({(1, 1)})
+
+    cache = deployment_erosion_cache(gs)
+    assert cache.eroded(("zone", 1), _build) == cache.eroded(("zone", 1), _build)
+    # Une zone erodee VIDE est une reponse, pas un miss : elle n'est pas reconstruite.
+    assert cache.eroded(("zone", 2), frozenset) == frozenset()
+    assert cache.eroded(("zone", 2), lambda: calls.append(2) or frozenset()) == frozenset()
+    assert calls == [1]
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 2
+
+    copied = copy.deepcopy(gs)[DEPLOYMENT_EROSION_CACHE_KEY]
+    assert copied is not cache and len(copied.store) == 0
+    assert deployment_erosion_cache(gs) is cache
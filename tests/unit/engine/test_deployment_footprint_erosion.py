@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-"""Equivalence STRICTE entre l'erosion morphologique de `_get_valid_deployment_hexes` et le
-calcul direct (Nk, M, 2) d'origine.
+"""Equivalence STRICTE entre l'erosion morphologique de `_get_valid_deployment_hexes` (et du
+pool par-figurine, via `engine.deployment_erosion`) et le calcul direct (Nk, M, 2) d'origine.
 
 Le masque de deploiement doit designer exactement les memes hexes que `deploy_unit` accepte :
 un hex propose puis refuse par le commit produit un deadlock `deploy_footprint_occupied`. Les
@@ -35,7 +35,11 @@ def _reference_direct(pool_np, off_e_np, off_o_np, even_mask_np, pool_grid, obst
 
 def _erosion(pool_np, off_e_np, off_o_np, even_mask_np, pool_grid, obstacle_grid,
              board_cols, board_rows):
-    """Erosion telle que `engine/action_decoder.py` la fait : par `hex_utils.erode_by_kernel`.
+    """Erosion telle que la production la fait : `engine.deployment_erosion`, en DEUX termes.
+
+    La zone erodee seule (ce que le cache partage garde), puis les ancres dont l'empreinte
+    touche un obstacle retranchees par dilatation — c'est la decomposition dont depend le pool
+    par-figurine, verifiee ici contre le calcul direct a obstacles inclus.
 
     Le calcul de bornes N'EST PAS recopie ici. Il l'a ete, et c'etait un piege : cette fonction
     devenait un jumeau FIGE du code de production, si bien qu'un bug de bornes corrige dans la
@@ -43,21 +47,14 @@ def _erosion(pool_np, off_e_np, off_o_np, even_mask_np, pool_grid, obstacle_grid
     que la mutualisation des 6 copies (V11 §0.22 T1) ferme. La reference reste `_reference_direct`
     ci-dessus, qui est un calcul INDEPENDANT (indexation directe), pas une copie.
     """
-    from engine.hex_utils import erode_by_kernel
-
-    grid_cols, grid_rows = pool_grid.shape
-    in_board = np.zeros_like(pool_grid)
-    in_board[:board_cols, :board_rows] = True
-    ok_grid = pool_grid & ~obstacle_grid & in_board
-
-    valid_mask = np.zeros(len(pool_np), dtype=bool)
-    for mask, off_arr in ((even_mask_np, off_e_np), (~even_mask_np, off_o_np)):
-        if not np.any(mask):
-            continue
-        acc = erode_by_kernel(ok_grid, off_arr, grid_cols, grid_rows)
-        anchors = pool_np[mask]
-        valid_mask[mask] = acc[anchors[:, 0], anchors[:, 1]]
-    return valid_mask
+    from engine.deployment_erosion import erode_anchors, footprint_hit_anchors
+
+    anchors = {(int(c), int(r)) for c, r in pool_np.tolist()}
+    kernels = (off_e_np, off_o_np)
+    kept = erode_anchors(anchors, anchors, kernels, board_cols, board_rows)
+    obstacles = {(int(c), int(r)) for c, r in np.argwhere(obstacle_grid).tolist()}
+    kept -= footprint_hit_anchors(obstacles, kernels, board_cols, board_rows)
+    return np.array([(int(c), int(r)) in kept for c, r in pool_np.tolist()], dtype=bool)
 
 
 def _make_case(rng, board_cols, board_rows, n_pool, m_off, wall_ratio, off_span=7):
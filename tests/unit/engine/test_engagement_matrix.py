@@ -0,0 +1,107 @@
+"""La matrice d'engagement (`spatial_relations.EngagementMatrix`) rend-elle EXACTEMENT les verdicts
+de la primitive par paire ?
+
+Sa broad-phase écarte des paires sans les mesurer : un minorant trop optimiste — orientation
+par-figurine oubliée dans la boîte hex, rayon englobant d'un socle ovale sous-estimé — et une
+escouade engagée est déclarée libre, donc tire, charge ou se désengage sans que rien ne lève.
+On compare donc chaque requête à la boucle par ennemi qu'elle remplace, sur des états tirés au
+hasard où des paires tombent des deux côtés du seuil.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from engine import spatial_relations as sr
+from engine.hex_utils import ORIENTATION_STEP_COUNT, compute_occupied_hexes
+
+_SOCLES: List[Tuple[str, Any]] = [("round", 1), ("round", 3), ("round", 5), ("oval", [5, 3])]
+
+
+def _squad(rng: random.Random, uid: str, player: int, vertical: bool) -> Dict[str, Any]:
+    """Entrée `units_cache` d'une escouade de 1 à 4 figurines, orientation PAR FIGURINE."""
+    shape, size = rng.choice(_SOCLES)
+    col, row = rng.randint(3, 36), rng.randint(3, 36)
+    by_model: Dict[str, Tuple[int, int]] = {}
+    occupied = set()
+    for k in range(rng.randint(1, 4)):
+        c, r = col + rng.randint(-3, 3), row + rng.randint(-3, 3)
+        by_model[f"{uid}m{k}"] = (c, r)
+        occupied |= compute_occupied_hexes(c, r, shape, size, rng.randrange(ORIENTATION_STEP_COUNT))
+    entry: Dict[str, Any] = {
+        "id": uid, "player": player, "col": col, "row": row,
+        "occupied_hexes": occupied,
+        "BASE_SHAPE": shape, "BASE_SIZE": size, "orientation": rng.randrange(ORIENTATION_STEP_COUNT),
+    }
+    if vertical:
+        entry["occupied_hexes_by_model"] = by_model
+        entry["floor_height_by_model"] = {m: rng.choice((0.0, 3.0, 9.0)) for m in by_model}
+        entry["MODEL_HEIGHT"] = 2.5
+    return entry
+
+
+@pytest.mark.parametrize("metric", ["hex", "euclidean"])
+@pytest.mark.parametrize("vertical", [False, True])
+def test_matrix_matches_pairwise_primitive(metric: str, vertical: bool) -> None:
+    rng = random.Random(7)
+    engaged_seen = pruned_seen = 0
+    for _trial in range(25):
+        items = [(str(i), _squad(rng, str(i), i % 2 + 1, vertical)) for i in range(8)]
+        ez = rng.choice((1, 2, 4))
+        matrix = sr.EngagementMatrix(items, ez, metric, 5.0 if vertical else None)
+        pruned_seen += int((matrix._verdict == 0).sum())
+        for uid, entry in items:
+            player = int(entry["player"])
+            expected = [
+                eid for eid, other in items
+                if eid != uid and int(other["player"]) != player
+                and sr.entries_in_engagement_zone(entry, other, ez, metric, 5.0 if vertical else None)
+            ]
+            engaged_seen += len(expected)
+            assert matrix.enemies_engaging(uid, player) == expected
+            assert matrix.is_engaged(uid, player) == bool(expected)
+            for eid in expected:
+                assert matrix.pair_engaged(uid, eid)
+    # CONTRE LE VERT VACANT : des paires engagées ET des paires écartées sans mesure.
+    assert engaged_seen > 0 and pruned_seen > 0
+
+
+@pytest.mark.parametrize("metric", ["hex", "euclidean"])
+def test_anchor_query_matches_enemy_loop(metric: str) -> None:
+    rng = random.Random(11)
+    hits = 0
+    items = [(str(i), _squad(rng, str(i), i % 2 + 1, False)) for i in range(10)]
+    matrix = sr.EngagementMatrix(items, 2, metric, None)
+    for _probe in range(200):
+        c, r = rng.randint(0, 40), rng.randint(0, 40)
+        candidate = {
+            "BASE_SHAPE": "round", "BASE_SIZE": 3, "col": c, "row": r, "orientation": 0,
+            "occupied_hexes": compute_occupied_hexes(c, r, "round", 3, 0),
+        }
+        expected = any(
+            sr.entries_in_engagement_zone(candidate, e, 2, metric, memoise=False)
+            for uid, e in items if int(e["player"]) != 1 and uid != "1"
+        )
+        hits += expected
+        assert matrix.anchor_engaged(candidate, 1, exclude_id="1") == expected
+    assert hits > 0
+
+
+def test_matrix_is_rebuilt_when_a_model_moves_in_place() -> None:
+    """Clé = géométrie : la mutation EN PLACE d'une entrée (celle que pratique le moteur) doit
+    reconstruire la matrice, et un état inchangé doit la resservir telle quelle."""
+    a = {"id": "a", "player": 1, "col": 10, "row": 10, "occupied_hexes": {(10, 10)},
+         "BASE_SHAPE": "round", "BASE_SIZE": 1}
+    b = {"id": "b", "player": 2, "col": 11, "row": 10, "occupied_hexes": {(11, 10)},
+         "BASE_SHAPE": "round", "BASE_SIZE": 1}
+    gs: Dict[str, Any] = {"inches_to_subhex": 1, "units_cache": {"a": a, "b": b}}
+    first = sr.engagement_matrix(gs, 2)
+    assert first.is_engaged("a", 1) and sr.engagement_matrix(gs, 2) is first
+
+    b["col"], b["occupied_hexes"] = 30, {(30, 10)}
+    rebuilt = sr.engagement_matrix(gs, 2)
+    assert rebuilt is not first and not rebuilt.is_engaged("a", 1)
+    assert rebuilt.enemies_engaging("b", 2) == []
@@ -0,0 +1,106 @@
+"""Part intrinsèque des entités mémoïsée par unité (`engine/entity_encoding_cache.py`).
+
+Quatre garanties : une observation reconstruite sans changement relit le cache et rend EXACTEMENT
+l'observation non mémoïsée ; un écrivain d'état d'unité (PV) invalide la ligne de CETTE unité ;
+un profil écrit directement dans `models_cache` est vu par la clé ; le mode vérification
+(niveau 1 de `engine.mask_verification`) lève sur une capacité retouchée en place sans bumper la
+révision.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from engine.entity_encoding_cache import ENTITY_ENCODING_CACHE_KEY, bump_unit_revision
+from engine.game_utils import get_unit_by_id
+from engine.observation_entities import unit_cont_index
+from engine.phase_handlers.shared_utils import update_units_cache_hp
+from engine.w40k_core import W40KEngine
+from tests.unit.engine._config_helpers import build_engine_config
+from tests.unit.engine.test_squad_grid_observation import _config
+
+
+def _engine() -> W40KEngine:
+    objectives = [{"id": "obj1", "name": "Alpha", "hexes": [[22, 22]]}]
+    with patch("engine.w40k_core.load_weapon_damage_table", return_value={}), \
+         patch.object(W40KEngine, "_build_reward_configs_for_current_units", return_value={}):
+        eng = W40KEngine(config=build_engine_config(_config([[24, 20]], objectives)))
+    eng.reset()
+    return eng
+
+
+def _observe(eng: W40KEngine) -> dict:
+    obs = eng.obs_builder.build_squad_observation(eng.game_state, "1")
+    return {key: array.copy() for key, array in obs.items()}
+
+
+def _uncached(eng: W40KEngine) -> dict:
+    """Reference : la meme observation construite sans aucune entree memoisee."""
+    cache = eng.game_state.pop(ENTITY_ENCODING_CACHE_KEY)
+    try:
+        return _observe(eng)
+    finally:
+        eng.game_state[ENTITY_ENCODING_CACHE_KEY] = cache
+
+
+def _assert_same(obs: dict, expected: dict) -> None:
+    assert obs.keys() == expected.keys()
+    for key, array in expected.items():
+        np.testing.assert_array_equal(obs[key], array, err_msg=key)
+
+
+def test_unchanged_units_are_read_back_from_the_cache() -> None:
+    eng = _engine()
+    first = _observe(eng)
+    cache = eng.game_state[ENTITY_ENCODING_CACHE_KEY]
+    misses, hits = cache.misses, cache.hits
+    second = _observe(eng)
+    # Une ligne alliee (l'active) + une ligne ennemie : toutes deux relues.
+    assert (cache.misses, cache.hits) == (misses, hits + 2)
+    _assert_same(second, first)
+    _assert_same(second, _uncached(eng))
+
+
+def test_hp_write_reencodes_only_that_unit() -> None:
+    eng = _engine()
+    gs = eng.game_state
+    _observe(eng)
+    cache = gs[ENTITY_ENCODING_CACHE_KEY]
+    hp = int(gs["units_cache"]["2"]["HP_CUR"])
+    update_units_cache_hp(gs, "2", hp - 1)
+    misses = cache.misses
+    obs = _observe(eng)
+    assert cache.misses == misses + 1
+    assert obs["enemies_cont"][0][unit_cont_index("hp_total")] == hp - 1
+    _assert_same(obs, _uncached(eng))
+
+
+def test_verify_mode_catches_a_write_that_does_not_bump_the_revision() -> None:
+    eng = _engine()
+    gs = eng.game_state
+    rules = get_unit_by_id(gs, "2")["UNIT_RULES"]
+    rules.append({"ruleId": "charge_after_flee"})
+    _observe(eng)
+    # Entree retouchee EN PLACE, hors `recompute_unit_rules_in_effect` : meme liste, meme
+    # longueur, aucune revision bumpee — seul le mode verification la voit.
+    rules[-1] = {"ruleId": "charge_after_advance"}
+    gs["mask_verification"] = 1
+    with pytest.raises(RuntimeError, match="entity_encoding_cache.*unite 2"):
+        _observe(eng)
+
+    bump_unit_revision(gs, "2")
+    obs = _observe(eng)
+    assert gs[ENTITY_ENCODING_CACHE_KEY].verified > 0
+    _assert_same(obs, _uncached(eng))
+
+
+def test_direct_profile_write_is_seen_without_a_revision_bump() -> None:
+    eng = _engine()
+    gs = eng.game_state
+    _observe(eng)
+    (enemy_model,) = gs["squad_models"]["2"]
+    gs["models_cache"][enemy_model]["T"] += 1   # profil pose directement, sans ecrivain
+    _assert_same(_observe(eng), _uncached(eng))
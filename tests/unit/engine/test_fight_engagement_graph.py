@@ -0,0 +1,99 @@
+"""Le graphe d'engagement de la phase de combat (`engine/fight_engagement_graph.py`) rend-il les
+memes verdicts que la mesure directe, et ne remesure-t-il que ce qui a bouge ?
+
+Reference : le meme predicat lu SANS graphe (graphe ferme), c'est-a-dire `engagement_matrix`
+revalidee sur la signature de toutes les escouades. Plateau single-hex (engagement_zone=1).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from engine.fight_engagement_graph import (
+    active_fight_engagement_graph,
+    close_fight_engagement_graph,
+    fight_engagement_graph_after_move,
+    fight_engagement_graph_drop_unit,
+)
+from engine.phase_handlers.fight_handlers import (
+    _fight_units_engaged_with,
+    fight_compute_engaged_snapshot,
+    fight_v11_start,
+)
+from engine.spatial_relations import engagement_matrix
+from tests._state_invariants import turn_state_invariants
+
+
+def _entry(uid: str, player: int, col: int, row: int) -> Dict[str, Any]:
+    return {
+        "col": col, "row": row, "player": player,
+        "BASE_SIZE": 1, "MODEL_HEIGHT": 2.5, "BASE_SHAPE": "round", "orientation": 0, "HP_CUR": 1,
+        "occupied_hexes_by_model": {f"{uid}#0": (col, row)},
+        "floor_height_by_model": {f"{uid}#0": 0.0},
+    }
+
+
+def _make_gs(units: List[tuple]) -> Dict[str, Any]:
+    return {**turn_state_invariants(),
+        "inches_to_subhex": 1, "board_cols": 40, "board_rows": 40,
+        "config": {"game_rules": {"engagement_zone": 1, "engagement_zone_vertical": 5,
+                                  "consolidation_trigger_range": 3}},
+        "units": [{"id": uid, "player": p, "col": c, "row": r, "HP_CUR": 1} for uid, p, c, r in units],
+        "units_cache": {uid: _entry(uid, p, c, r) for uid, p, c, r in units},
+        "wall_hexes": set(), "current_player": 1, "units_charged": set(),
+    }
+
+
+def _without_graph(gs: Dict[str, Any]) -> Dict[str, bool]:
+    graph = gs.pop("_fight_engagement_graph")
+    try:
+        return fight_compute_engaged_snapshot(gs)
+    finally:
+        gs["_fight_engagement_graph"] = graph
+
+
+def _move(gs: Dict[str, Any], uid: str, col: int, row: int) -> None:
+    player = gs["units_cache"][uid]["player"]
+    gs["units_cache"][uid] = _entry(uid, player, col, row)
+    gs["_unit_move_version"] += 1                    # le bump du choke-point `_touch_unit_los`
+    fight_engagement_graph_after_move(gs, [uid])
+
+
+def test_graph_matches_direct_measure_through_moves_and_deaths() -> None:
+    gs = _make_gs([
+        ("a", 1, 5, 5), ("b", 1, 6, 5), ("far", 1, 20, 20),
+        ("x", 2, 5, 4), ("y", 2, 7, 5), ("z", 2, 30, 30),
+    ])
+    fight_v11_start(gs)
+    assert fight_compute_engaged_snapshot(gs) == _without_graph(gs)
+    for uid in ("a", "b", "x"):
+        assert _fight_units_engaged_with(gs, {"id": uid}) == (
+            engagement_matrix(gs, 1).enemies_engaging(uid, gs["units_cache"][uid]["player"])
+        )
+    graph = active_fight_engagement_graph(gs)
+    assert graph is not None and graph.stats()["rebuilds"] == 1
+
+    _move(gs, "z", 20, 21)                           # pile-in de z au contact de far
+    assert fight_compute_engaged_snapshot(gs)["far"] is True
+    assert fight_compute_engaged_snapshot(gs) == _without_graph(gs)
+    assert graph.stats() == {"nodes": 6, "edges": 4, "rebuilds": 1, "row_updates": 1}
+
+    gs["units_cache"].pop("x")                       # x detruite : a n'est plus engagee
+    fight_engagement_graph_drop_unit(gs, "x")
+    assert fight_compute_engaged_snapshot(gs)["a"] is False
+    assert fight_compute_engaged_snapshot(gs) == _without_graph(gs)
+    assert graph.stats()["rebuilds"] == 1
+
+
+def test_missed_version_bump_rebuilds_instead_of_serving_stale_edges() -> None:
+    gs = _make_gs([("a", 1, 5, 5), ("x", 2, 5, 4)])
+    fight_v11_start(gs)
+    assert fight_compute_engaged_snapshot(gs)["a"] is True
+    gs["units_cache"]["x"] = _entry("x", 2, 15, 15)
+    gs["_unit_move_version"] += 1                    # ecriture hors choke-point : aucun hook
+    assert fight_compute_engaged_snapshot(gs)["a"] is False
+    assert active_fight_engagement_graph(gs).stats()["rebuilds"] == 2
+
+    close_fight_engagement_graph(gs)                 # hors phase : mesure directe
+    assert active_fight_engagement_graph(gs) is None
+    assert fight_compute_engaged_snapshot(gs) == {"a": False, "x": False}
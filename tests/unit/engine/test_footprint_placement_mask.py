@@ -0,0 +1,71 @@
+"""Le masque de placement par lot (`footprint_placement_valid_mask`) rend-il le verdict unitaire ?
+
+Il remplace, sur les zones de buts de charge, un appel à ``is_footprint_placement_valid`` par
+ancre. Une erreur de signe dans le noyau dilaté, une parité de colonne intervertie, une borne lue
+sur le mauvais extrême — et une ancre illégale est proposée, ou une légale disparaît, sans que
+rien ne lève. On compare donc chaque ancre d'une grille (bords et hors plateau compris) au chemin
+unitaire, sur des plateaux tirés au hasard.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict
+
+import pytest
+
+from engine.hex_utils import ORIENTATION_STEP_COUNT, precompute_footprint_offsets
+from engine.phase_handlers.shared_utils import (
+    footprint_placement_valid_mask,
+    is_footprint_placement_valid,
+)
+
+_COLS, _ROWS = 30, 24
+
+
+def _state(rng: random.Random, scale: int) -> Dict[str, Any]:
+    return {
+        "board_cols": _COLS,
+        "board_rows": _ROWS,
+        "inches_to_subhex": scale,
+        "wall_hexes": {(rng.randrange(_COLS), rng.randrange(_ROWS)) for _ in range(25)},
+    }
+
+
+@pytest.mark.parametrize("scale", [1, 5])
+@pytest.mark.parametrize("socle", [
+    {"BASE_SHAPE": "round", "BASE_SIZE": 1},
+    {"BASE_SHAPE": "round", "BASE_SIZE": 3},
+    {"BASE_SHAPE": "oval", "BASE_SIZE": [5, 3], "orientation": 2},
+    {"BASE_SHAPE": "square", "BASE_SIZE": 2, "orientation": 1},
+])
+def test_mask_matches_scalar_placement(scale: int, socle: Dict[str, Any]) -> None:
+    rng = random.Random(13 * scale + len(str(socle)))
+    gs = _state(rng, scale)
+    orient = socle.get("orientation", 0) % ORIENTATION_STEP_COUNT
+    offsets = precompute_footprint_offsets(socle["BASE_SHAPE"], socle["BASE_SIZE"], orient)
+    occupied = {(rng.randrange(-2, _COLS + 2), rng.randrange(-2, _ROWS + 2)) for _ in range(60)}
+    ez = {(rng.randrange(_COLS), rng.randrange(_ROWS)) for _ in range(40)}
+    anchors = [(c, r) for c in range(-2, _COLS + 2) for r in range(-2, _ROWS + 2)]
+
+    for enemy_adjacent in (None, ez):
+        mask = footprint_placement_valid_mask(
+            anchors, gs, occupied, enemy_adjacent, offsets=offsets, socle=socle
+        ).tolist()
+        expected = [
+            is_footprint_placement_valid(
+                {(c + dc, r + dr) for dc, dr in offsets[c & 1]}, gs, occupied, enemy_adjacent,
+                anchor=(c, r), socle=socle,
+            )
+            for c, r in anchors
+        ]
+        assert mask == expected
+        # CONTRE LE VERT VACANT : des ancres acceptées ET refusées.
+        assert any(mask) and not all(mask)
+
+
+def test_empty_batch_is_an_empty_mask() -> None:
+    gs = _state(random.Random(0), 5)
+    offsets = precompute_footprint_offsets("round", 3, 0)
+    socle = {"BASE_SHAPE": "round", "BASE_SIZE": 3}
+    assert footprint_placement_valid_mask([], gs, set(), offsets=offsets, socle=socle).shape == (0,)
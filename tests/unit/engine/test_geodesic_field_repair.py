@@ -0,0 +1,70 @@
+"""La RÉPARATION d'un champ géodésique rend-elle exactement le BFS refait de zéro ?
+
+`geodesic_field_for_origin` ne recalcule plus le champ d'une origine quand une figurine bouge :
+il répare l'ancien (`repair_geodesic_move_reach`) à partir de l'écart de transit. Le contrat est
+la bit-identité avec `geodesic_move_reach` sous le NOUVEAU transit — une case de trop et le masque
+propose un move que la validation refuse, une case de moins et il en cache un légal.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, Set, Tuple
+
+import engine.phase_handlers.shared_utils as shared_utils
+from engine.phase_handlers.shared_utils import (
+    geodesic_field_for_origin,
+    geodesic_move_reach,
+    repair_geodesic_move_reach,
+)
+
+COLS, ROWS = 40, 32
+START = (20, 16)
+BUDGET = 14
+
+
+def _blob(rng: random.Random, n: int) -> Set[Tuple[int, int]]:
+    """Un « socle » : quelques cases contiguës autour d'un centre tiré au hasard."""
+    c, r = rng.randrange(COLS), rng.randrange(ROWS)
+    return {(min(COLS - 1, c + dc), min(ROWS - 1, r + dr)) for dc in range(n) for dr in range(n)}
+
+
+def test_repair_matches_fresh_bfs_over_successive_moves():
+    rng = random.Random(3)
+    walls = {(c, 10) for c in range(8, 30)} | {(12, r) for r in range(12, 28)}
+    units = [_blob(rng, 3) for _ in range(8)]
+    transit = (walls | set().union(*units)) - {START}
+    field = geodesic_move_reach(*START, BUDGET, transit, COLS, ROWS)
+    repaired_any = 0
+    for _step in range(60):
+        # Une escouade se déplace : ses anciennes cases se libèrent, les nouvelles se bloquent.
+        units[rng.randrange(len(units))] = _blob(rng, 3)
+        new_transit = (walls | set().union(*units)) - {START}
+        field, affected = repair_geodesic_move_reach(
+            field, START, BUDGET, new_transit - transit, transit - new_transit, new_transit,
+            COLS, ROWS,
+        )
+        assert field == geodesic_move_reach(*START, BUDGET, new_transit, COLS, ROWS)
+        repaired_any += affected
+        transit = new_transit
+    # CONTRE LE VERT VACANT : des hausses ont réellement été propagées, pas seulement des baisses.
+    assert repaired_any > 0
+
+
+def test_field_for_origin_repairs_after_fingerprint_change(monkeypatch):
+    holders: Dict[str, Any] = {"geo": {}}
+    transit: Dict[str, Set[Tuple[int, int]]] = {"cur": {(21, 16), (22, 16), (21, 17)}}
+    monkeypatch.setattr(shared_utils, "_move_spatial_cache", lambda gs: holders)
+    monkeypatch.setattr(
+        shared_utils, "build_move_transit_blocked", lambda gs, sid, player, level: transit["cur"]
+    )
+    gs: Dict[str, Any] = {"board_cols": COLS, "board_rows": ROWS}
+
+    first = geodesic_field_for_origin(gs, "1", 1, START, 0, BUDGET)
+    assert geodesic_field_for_origin(gs, "1", 1, START, 0, BUDGET) is first
+    # Une figurine bouge : nouveau fingerprint (cache du move vidé), nouveau transit.
+    holders["geo"] = {}
+    transit["cur"] = {(21, 16), (18, 15), (18, 16)}
+    second = geodesic_field_for_origin(gs, "1", 1, START, 0, BUDGET)
+    assert second == geodesic_move_reach(*START, BUDGET, transit["cur"], COLS, ROWS)
+    assert gs["_geodesic_field_cache"]["stats"] == {"hit": 1, "repair": 1, "miss": 1}
@@ -0,0 +1,114 @@
+"""Le backend COMPILÉ du champ géodésique rend-il EXACTEMENT le champ de référence ?
+
+`move.geodesic_backend = "compiled"` remplace `geodesic_field` / `geodesic_field_multi_source` par
+leur transcription en tableaux (`engine.geodesic_kernel`). Le contrat n'est pas « à epsilon près » :
+même ensemble de cellules, mêmes distances au bit près, même ordre d'insertion. Un ulp d'écart au
+bord du budget, et le masque propose une destination que l'autre backend refuse.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from typing import Set, Tuple
+
+import pytest
+
+import engine.phase_handlers.geodesic_move as geodesic_move
+from engine.hex_utils import (
+    expand_wall_group_to_hex_list,
+    geodesic_field,
+    geodesic_field_multi_source,
+    obstacles_touching_disc,
+)
+
+
+def _walls(path: str) -> Set[Tuple[int, int]]:
+    walls: Set[Tuple[int, int]] = set()
+    for gi, group in enumerate(json.load(open(path))["walls"]):
+        walls.update(
+            (int(col), int(row))
+            for col, row in expand_wall_group_to_hex_list(group, path_hint=f"walls[{gi}]")
+        )
+    return walls
+
+
+def _same(reference, compiled) -> None:
+    assert compiled == reference
+    assert list(compiled) == list(reference), "ordre d'insertion différent"
+
+
+@pytest.mark.parametrize(
+    "walls_path, cols, rows",
+    [
+        ("config/board/44x60x5/terrain/terrain-mc1.json", 220, 300),
+        ("config/board/44x60x10/walls/walls-11.json", 360, 312),
+    ],
+)
+def test_compiled_matches_reference_on_real_walls(walls_path, cols, rows):
+    walls = _walls(walls_path)
+    assert len(walls) > 900, "le fixture doit vraiment porter des murs (pas de vert vacant)"
+    rng = random.Random(11)
+    starts = []
+    # Départs collés aux murs : c'est là que la capsule, l'exception de contact et la DDA travaillent.
+    for col, row in rng.sample(sorted(walls), 40):
+        cand = (col + rng.choice((-3, 3)), row + rng.choice((-3, 3)))
+        if 0 <= cand[0] < cols and 0 <= cand[1] < rows and cand not in walls:
+            starts.append(cand)
+        if len(starts) == 4:
+            break
+    for start in starts:
+        for clearance in (0.0, 2.4):
+            contact = obstacles_touching_disc(walls, start, clearance) if clearance else None
+            _same(
+                geodesic_field(start, cols, rows, walls, 45.0, clearance, contact_obstacles=contact),
+                geodesic_field(
+                    start, cols, rows, walls, 45.0, clearance,
+                    contact_obstacles=contact, backend="compiled",
+                ),
+            )
+
+
+def test_compiled_matches_reference_on_random_obstacles():
+    rng = random.Random(5)
+    contact_exercised = 0
+    for _trial in range(40):
+        cols, rows = rng.randint(20, 50), rng.randint(20, 50)
+        obstacles = {(rng.randrange(cols), rng.randrange(rows)) for _ in range(cols * rows // 6)}
+        start = (rng.randrange(cols), rng.randrange(rows))
+        obstacles.discard(start)
+        clearance = rng.choice((0.0, 0.8, 1.6, 3.1))
+        budget = rng.uniform(5.0, 40.0)
+        contact = obstacles_touching_disc(obstacles, start, clearance) if clearance else None
+        contact_exercised += bool(contact)
+        _same(
+            geodesic_field(start, cols, rows, obstacles, budget, clearance, contact_obstacles=contact),
+            geodesic_field(
+                start, cols, rows, obstacles, budget, clearance,
+                contact_obstacles=contact, backend="compiled",
+            ),
+        )
+        seeds = {start: 0.0}
+        seeds.update({(rng.randrange(cols), rng.randrange(rows)): rng.uniform(0.0, 4.0) for _ in range(3)})
+        kwargs = {"contact_obstacles": contact, "contact_start": start if contact else None}
+        _same(
+            geodesic_field_multi_source(seeds, cols, rows, obstacles, budget, clearance, **kwargs),
+            geodesic_field_multi_source(
+                seeds, cols, rows, obstacles, budget, clearance, backend="compiled", **kwargs
+            ),
+        )
+    # CONTRE LE VERT VACANT : l'exception de contact a bien été traversée.
+    assert contact_exercised > 0
+
+
+def test_unknown_backend_is_refused(monkeypatch):
+    with pytest.raises(ValueError, match="geodesic backend"):
+        geodesic_field((1, 1), 5, 5, set(), 3.0, backend="numba")
+
+    class _Loader:
+        def get_game_config(self):
+            return {"move": {"geodesic_backend": "cython"}}
+
+    monkeypatch.setattr("config_loader.get_config_loader", lambda: _Loader())
+    with pytest.raises(ValueError, match="geodesic_backend"):
+        geodesic_move.geodesic_backend()
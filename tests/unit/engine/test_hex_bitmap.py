@@ -0,0 +1,67 @@
+"""Le `HexBitmap` rendu par les constructeurs d'occupation est-il EXACTEMENT le set d'avant ?
+
+`build_wall_set`, `build_occupied_positions_set`, `build_enemy_occupied_positions_set` et le cache
+`enemy_adjacent_hexes_player_N` rendent désormais un bitmap du plateau au lieu d'un set de tuples.
+Les appelants n'ont pas changé : `in`, itération, `len`, `==`, unions mixtes avec des sets. Une
+cellule perdue (débord de plateau) ou une dilatation décalée d'un pas, et un move traverse un socle.
+"""
+
+from __future__ import annotations
+
+import copy
+import pickle
+import random
+
+import numpy as np
+
+from engine.hex_utils import HexBitmap, build_wall_set, dilate_hex_set
+
+
+def test_set_contract_and_vectorized_ops_match_plain_sets():
+    rng = random.Random(2)
+    outside_seen = 0
+    for _trial in range(150):
+        cols, rows = rng.randint(1, 30), rng.randint(1, 30)
+        # Cellules volontairement HORS grille aussi : empreinte d'un socle qui déborde du bord.
+        cells = {(rng.randint(-3, cols + 2), rng.randint(-3, rows + 2)) for _ in range(rng.randint(0, 40))}
+        other = {(rng.randrange(cols), rng.randrange(rows)) for _ in range(20)}
+        bm, obm = HexBitmap(cols, rows, cells), HexBitmap(cols, rows, other)
+        outside_seen += len(bm.outside)
+
+        assert bm == cells and cells == bm and len(bm) == len(cells) and set(bm) == cells
+        assert bm | obm == cells | other and bm & obm == cells & other and bm - obm == cells - other
+        # Opérations mixtes : le résultat est un set ordinaire, jamais un bitmap tronqué.
+        assert type(bm | other) is set and bm | other == cells | other
+        assert other - bm == other - cells and other | bm == cells | other
+        radius = rng.randint(0, 5)
+        assert bm.dilate(radius) == dilate_hex_set(cells, radius, cols, rows)
+        probe_c = np.array([c for c, _ in other] + [-1, cols])
+        probe_r = np.array([r for _, r in other] + [0, 0])
+        assert bm.contains_many(probe_c, probe_r).tolist() == [
+            (c, r) in cells for c, r in zip(probe_c.tolist(), probe_r.tolist())
+        ]
+        assert pickle.loads(pickle.dumps(bm)) == cells and copy.deepcopy(bm) == cells
+    # CONTRE LE VERT VACANT : le stockage annexe hors grille a réellement servi.
+    assert outside_seen > 0
+
+
+def test_mutation_keeps_len_and_grid_in_sync():
+    bm = HexBitmap(4, 4, [(0, 0), (9, 9)])
+    bm.add((1, 1))
+    bm.add((1, 1))
+    bm.discard((0, 0))
+    bm.discard((9, 9))
+    bm |= {(3, 3), (-1, 2)}
+    assert bm == {(1, 1), (3, 3), (-1, 2)} and len(bm) == 3
+    assert bm.grid[1, 1] and bm.grid[3, 3] and not bm.grid[0, 0]
+    clone = copy.deepcopy(bm)
+    clone.add((2, 2))
+    assert (2, 2) not in bm, "la copie partage le tampon de l'original"
+
+
+def test_wall_builder_uses_board_dimensions():
+    gs = {"board_cols": 10, "board_rows": 8, "wall_hexes": [[1, 2], (3, 4)]}
+    walls = build_wall_set(gs)
+    assert isinstance(walls, HexBitmap) and walls.shape == (10, 8)
+    assert walls == {(1, 2), (3, 4)}
+    assert build_wall_set({"board_cols": 10, "board_rows": 8}) == set()
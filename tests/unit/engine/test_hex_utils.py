@@ -15,6 +15,7 @@ from engine.hex_utils import (
     normalize_coordinate,
     normalize_coordinates,
     hex_line,
+    hex_line_iter_t,
     compute_los_visibility,
     compute_los_state,
     build_wall_set,
@@ -199,6 +200,22 @@ class TestHexLine:
             line = hex_line(5, 5, nc, nr)
             assert len(line) == 2
 
+    def test_translation_invariant(self):
+        """Le tracé ne dépend que de (dcol, drow, parité) : c'est ce qui autorise la table relative.
+        (0, 0) -> (-3, 6) a une égalité exacte x/y à mi-ligne ; posée en (168, 69), le bruit
+        d'arrondi des coordonnées absolues la départageait autrement avant le repère relatif."""
+        for (c1, r1), (c2, r2) in (((0, 0), (-3, 6)), ((5, 2), (12, 40)), ((1, 7), (30, 3))):
+            base = hex_line(c1, r1, c2, r2)
+            for sc, sr in ((168, 69), (42, 3), (200, 150)):
+                assert hex_line(c1 + sc, r1 + sr, c2 + sc, r2 + sr) == [
+                    (c + sc, r + sr) for c, r in base
+                ]
+
+    def test_iter_t_matches_line(self):
+        cells_t = list(hex_line_iter_t(3, 4, 40, 21))
+        assert [cell for cell, _t in cells_t] == hex_line(3, 4, 40, 21)
+        assert cells_t[0][1] == 0.0 and cells_t[-1][1] == 1.0
+
 
 class TestLoSVisibility:
     def test_no_walls_full_visibility(self):
@@ -0,0 +1,83 @@
+"""Le champ de dégagement LoS (`engine.los_clearance`) mesure-t-il la VRAIE distance au bloqueur ?
+
+Le raccourci ``n <= clearance[source]`` n'est exact que si le champ ne SURESTIME jamais la
+distance : une case notée 5 alors qu'un mur est à 3 déclarerait visibles des lignes bloquées.
+On compare donc le BFS par dilatations à la distance hexagonale brute, puis on vérifie que le
+raccourci ne tranche que des paires que le tracé déclare dégagées.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+import engine.los_clearance as los_clearance
+from engine.hex_utils import (
+    batch_los_visibility,
+    hex_distance,
+    get_neighbors,
+    hex_neighbor_dilate,
+    hex_set_to_grid,
+)
+
+
+def _random_walls(seed: int, cols: int, rows: int, n: int):
+    rng = np.random.default_rng(seed)
+    return {(int(c), int(r)) for c, r in rng.integers(0, [cols, rows], size=(n, 2))}
+
+
+def test_hex_neighbor_dilate_matches_get_neighbors():
+    cols, rows = 17, 13
+    walls = _random_walls(3, cols, rows, 20)
+    grown = hex_neighbor_dilate(hex_set_to_grid(walls, cols, rows))
+    expected = set(walls)
+    for c, r in walls:
+        expected |= {(nc, nr) for nc, nr in get_neighbors(c, r) if 0 <= nc < cols and 0 <= nr < rows}
+    assert {(int(c), int(r)) for c, r in zip(*np.nonzero(grown))} == expected
+
+
+def test_build_blocker_clearance_is_exact_distance():
+    cols, rows = 23, 19
+    walls = _random_walls(11, cols, rows, 6)
+    field = los_clearance.build_blocker_clearance(hex_set_to_grid(walls, cols, rows))
+    for c in range(cols):
+        for r in range(rows):
+            expected = min(hex_distance(c, r, wc, wr) for wc, wr in walls)
+            assert int(field[c, r]) == expected, (c, r)
+    empty = los_clearance.build_blocker_clearance(np.zeros((4, 4), dtype=bool))
+    assert (empty == los_clearance._CLEARANCE_CAP).all(), "sans bloqueur, tout est saturé"
+
+
+def test_clear_by_clearance_never_contradicts_trace():
+    cols, rows = 40, 30
+    walls = _random_walls(7, cols, rows, 25)
+    wall_grid = hex_set_to_grid(walls, cols, rows)
+    field = los_clearance.build_blocker_clearance(wall_grid)
+    rng = np.random.default_rng(5)
+    src = rng.integers(0, [cols, rows], size=(600, 2))
+    tgt = rng.integers(0, [cols, rows], size=(600, 2))
+    settled = los_clearance.clear_by_clearance(field, src, tgt)
+    traced = batch_los_visibility(src, tgt, wall_grid)
+    assert traced[settled].all()
+    # CONTRE LE VERT VACANT : le raccourci tranche des paires, et en laisse d'autres au tracé.
+    assert settled.any() and not settled.all()
+
+
+def test_blocker_clearance_for_disk_roundtrip(tmp_path, monkeypatch):
+    cols, rows = 12, 10
+    wall_grid = hex_set_to_grid(_random_walls(1, cols, rows, 5), cols, rows)
+    area_grid = np.full((cols, rows), -1, dtype=np.int32)
+    area_grid[0, 0] = 0
+    signature = ("test", cols, rows, "roundtrip")
+    monkeypatch.setattr(los_clearance, "_CLEARANCE_CACHE", {})
+    monkeypatch.setattr(
+        los_clearance, "_cache_file_path", lambda sig: str(tmp_path / "clearance.npy")
+    )
+    built = los_clearance.blocker_clearance_for(signature, wall_grid, area_grid)
+    assert int(built[0, 0]) == 0, "les areas obscurantes comptent comme bloqueurs"
+    assert not built.flags.writeable
+    # Processus « neuf » : le cache mémoire est vide, le champ doit revenir du disque, en mmap.
+    monkeypatch.setattr(los_clearance, "_CLEARANCE_CACHE", {})
+    reloaded = los_clearance.blocker_clearance_for(signature, wall_grid, area_grid)
+    assert isinstance(reloaded, np.memmap)
+    assert not reloaded.flags.writeable
+    assert np.array_equal(np.asarray(reloaded), built)
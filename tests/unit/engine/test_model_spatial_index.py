@@ -0,0 +1,109 @@
+"""L'index spatial des figurines (`model_spatial_index`) rend-il EXACTEMENT la mesure par paire ?
+
+Sa grille écarte des figurines sans les mesurer : un seau oublié au bord du disque de recherche,
+un rayon englobant d'ovale sous-estimé, une figurine déplacée que l'index croit encore à son
+ancienne case — et une escouade à portée de charge est déclarée hors d'atteinte sans que rien ne
+lève. On compare donc chaque requête à la boucle brute qu'elle remplace, sur des plateaux tirés
+au hasard, avant ET après des déplacements et des destructions notifiés.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from engine.combat_utils import ranged_in_range, socle_from_cache_entry
+from engine.hex_utils import ENGAGEMENT_NORM_HEX_WIDTH, ORIENTATION_STEP_COUNT, Socle, euclidean_edge_distance
+from engine import model_spatial_index as msi
+
+_SOCLES: List[Tuple[str, Any]] = [("round", 1), ("round", 3), ("round", 5), ("oval", [5, 3]), ("square", 2)]
+
+
+def _state(rng: random.Random, n_squads: int) -> Dict[str, Any]:
+    models: Dict[str, Any] = {}
+    units: Dict[str, Any] = {}
+    for s in range(n_squads):
+        sid = f"u{s}"
+        shape, size = rng.choice(_SOCLES)
+        col, row = rng.randint(0, 70), rng.randint(0, 50)
+        by_model = {}
+        for k in range(rng.randint(1, 5)):
+            mid = f"{sid}#{k}"
+            c, r = col + rng.randint(-3, 3), row + rng.randint(-3, 3)
+            models[mid] = {
+                "squad_id": sid, "player": s % 2 + 1, "col": c, "row": r,
+                "BASE_SHAPE": shape, "BASE_SIZE": size, "orientation": rng.randrange(ORIENTATION_STEP_COUNT),
+            }
+            by_model[mid] = (c, r)
+        units[sid] = {
+            "id": sid, "player": s % 2 + 1, "col": col, "row": row, "BASE_SHAPE": shape,
+            "BASE_SIZE": size, "orientation": 0, "occupied_hexes": set(), "occupied_hexes_by_model": by_model,
+        }
+    return {"models_cache": models, "units_cache": units}
+
+
+def _probe(rng: random.Random) -> Socle:
+    shape, size = rng.choice(_SOCLES)
+    return Socle(shape, size, rng.randint(0, 70), rng.randint(0, 50), None, None, rng.randrange(ORIENTATION_STEP_COUNT))
+
+
+def _model_socle(model: Dict[str, Any]) -> Socle:
+    return Socle(model["BASE_SHAPE"], model["BASE_SIZE"], model["col"], model["row"], None, None, model["orientation"])
+
+
+def _assert_matches_brute_force(gs: Dict[str, Any], rng: random.Random) -> None:
+    index = msi.model_spatial_index(gs)
+    models = gs["models_cache"]
+    for _probe_i in range(30):
+        probe = _probe(rng)
+        distance = rng.choice((0.0, 3.0, 9.0, 18.0))
+        dists = {mid: euclidean_edge_distance(probe, _model_socle(m)) for mid, m in models.items()}
+        assert index.within(probe, distance) == sorted(mid for mid, d in dists.items() if d <= distance)
+        k = rng.randint(1, 6)
+        got = index.nearest(probe, k)
+        want = sorted((d, mid) for mid, d in dists.items())[:k]
+        assert [mid for _d, mid in got] == [mid for _d, mid in want]
+        # Broad-phase d'escouade : sur-ensemble de la primitive de portée, jamais moins.
+        rng_subhex = rng.choice((1, 6, 12))
+        reach = index.squads_within_reach(probe, rng_subhex * ENGAGEMENT_NORM_HEX_WIDTH)
+        for sid, entry in gs["units_cache"].items():
+            if ranged_in_range(probe, socle_from_cache_entry(entry), rng_subhex, "euclidean"):
+                assert sid in reach
+
+
+@pytest.mark.parametrize("seed", [3, 17])
+def test_index_matches_brute_force_across_moves_and_deaths(seed: int) -> None:
+    rng = random.Random(seed)
+    gs = _state(rng, 14)
+    _assert_matches_brute_force(gs, rng)
+    first = msi.model_spatial_index(gs)
+
+    for _step in range(40):
+        mid = rng.choice(sorted(gs["models_cache"]))
+        model = gs["models_cache"][mid]
+        # Miroir des écrivains du moteur : `models_cache` ET la carte par-figurine de l'escouade.
+        by_model = gs["units_cache"][model["squad_id"]]["occupied_hexes_by_model"]
+        if rng.random() < 0.2 and len(by_model) > 1:
+            del gs["models_cache"][mid], by_model[mid]
+            msi.note_model_removed(gs, mid)
+        else:
+            model["col"], model["row"] = rng.randint(0, 70), rng.randint(0, 50)
+            by_model[mid] = (model["col"], model["row"])
+            msi.note_model_moved(gs, mid)
+    # Tenu à jour en place : le même objet, pas une reconstruction silencieuse.
+    assert msi.model_spatial_index(gs) is first
+    _assert_matches_brute_force(gs, rng)
+
+
+def test_off_table_models_are_at_no_distance_and_rebuild_on_new_cache() -> None:
+    rng = random.Random(5)
+    gs = _state(rng, 4)
+    reserve = next(iter(gs["models_cache"]))
+    gs["models_cache"][reserve]["col"] = gs["models_cache"][reserve]["row"] = -1
+    index = msi.model_spatial_index(gs)
+    assert reserve in index and reserve not in index.within(Socle("round", 1, 0, 0), 1e6)
+
+    gs["models_cache"] = dict(gs["models_cache"])
+    assert msi.model_spatial_index(gs) is not index
@@ -24,6 +24,8 @@ from ai.unit_registry import UnitRegistry
 from engine.observation_builder import ObservationBuilder
 from engine.action_decoder import DEPLOY_SLOT_CANDIDATES_CACHE_KEY, ActionDecoder
 from engine.observation_entities import WEAPON_PROFILE_CACHE_KEY
+from engine.entity_encoding_cache import ENTITY_ENCODING_CACHE_KEY
+from engine.squad_grid_layers import SQUAD_GRID_LAYERS_KEY
 from engine.w40k_core import W40KEngine
 
 PROJECT_ROOT = os.path.dirname(
@@ -40,6 +42,8 @@ OBS_CACHE_KEYS = {
     WEAPON_PROFILE_CACHE_KEY: "profils d'armes par (escouade, figurines vivantes)",
     ObservationBuilder.OBJECTIVE_HEX_ARRAYS_KEY: "hexes de chaque objectif (distances/directions)",
     "_grid_static_hex_arrays": "murs / objectifs / couvert rasterises pour la grille",
+    SQUAD_GRID_LAYERS_KEY: "raster statique et surcouches d'unites de la grille par ancre",
+    ENTITY_ENCODING_CACHE_KEY: "part intrinseque des entites, par unite et revision",
     "_grid_deployment_zone_anchor": "ancre de grille des escouades pas encore posees (§0.40)",
     "_obs_solid_terrain_areas": "zones contenant un mur dense (Solid 13.11, gone to ground)",
     "_unit_los_pair_cache": "LoS et couvert par paire (tireur, cible)",
@@ -0,0 +1,68 @@
+"""Les tampons d'observation préalloués (`engine/observation_buffers.py`) rendent-ils EXACTEMENT
+l'observation allouée fraîche, sans rien allouer par step ?
+
+Même plateau minimal que la grille égocentrique (`test_squad_grid_observation`).
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+
+from engine.w40k_core import W40KEngine
+from tests.unit.engine._config_helpers import build_engine_config
+from tests.unit.engine.test_squad_grid_observation import _config
+
+
+def _engine() -> W40KEngine:
+    walls = [[24, 20], [60, 60]]
+    objectives = [{"id": "obj1", "name": "Alpha", "hexes": [[22, 22]]}]
+    with patch("engine.w40k_core.load_weapon_damage_table", return_value={}), \
+         patch.object(W40KEngine, "_build_reward_configs_for_current_units", return_value={}):
+        eng = W40KEngine(config=build_engine_config(_config(walls, objectives)))
+    eng.reset()
+    # Hors phase de move : la grille de l'escouade 2 exigerait sinon une carte de cellules que
+    # seul le masque de l'escouade ACTIVE mémoïse (cf. `test_squad_grid_observation`).
+    eng.game_state["phase"] = "shoot"
+    return eng
+
+
+def _build(eng: W40KEngine, squad_id: str) -> dict:
+    obs = eng.obs_builder.build_squad_observation(eng.game_state, squad_id)
+    obs["grid"] = eng.obs_builder.build_squad_grid(eng.game_state, squad_id)
+    return obs
+
+
+def test_buffered_observation_equals_fresh_one_and_allocates_nothing_per_step() -> None:
+    eng = _engine()
+    builder = eng.obs_builder
+    fresh = {sid: {k: v.copy() for k, v in _build(eng, sid).items()} for sid in ("1", "2")}
+
+    builder.use_preallocated_buffers()
+    allocated = builder.observation_allocation_stats()["arrays_allocated"]
+    for _ in range(2):
+        for sid in ("1", "2"):
+            # Escouade 2 APRÈS l'escouade 1 : un reste de la construction précédente se verrait.
+            obs = _build(eng, sid)
+            assert obs.keys() == fresh[sid].keys()
+            for key, expected in fresh[sid].items():
+                assert obs[key].dtype == np.float32
+                np.testing.assert_array_equal(obs[key], expected, err_msg=f"{sid}:{key}")
+    stats = builder.observation_allocation_stats()
+    assert stats["arrays_allocated"] == allocated
+    assert stats["buffer_reuses"] == 4
+
+
+def test_buffers_alias_until_the_next_build_and_can_be_turned_off() -> None:
+    eng = _engine()
+    builder = eng.obs_builder
+    builder.use_preallocated_buffers()
+    first = builder.build_squad_observation(eng.game_state, "1")
+    second = builder.build_squad_observation(eng.game_state, "2")
+    # Contrat d'alias : la construction suivante réécrit les MÊMES tableaux.
+    assert first["allies_cont"] is second["allies_cont"]
+
+    builder.use_preallocated_buffers(False)
+    third = builder.build_squad_observation(eng.game_state, "1")
+    assert third["allies_cont"] is not second["allies_cont"]
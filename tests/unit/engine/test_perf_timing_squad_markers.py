@@ -21,6 +21,7 @@ import pytest
 from engine import perf_timing
 from engine.observation_builder import ObservationBuilder
 from engine.phase_handlers.shared_utils import (
+    SQUAD_ACTION_MASK_FAMILIES,
     build_squad_action_mask,
     build_squad_move_cell_map,
 )
@@ -149,6 +150,11 @@ def test_masque_emet_sa_ligne(engine: W40KEngine, perf_log) -> None:
     # `ones_n` doit decrire le masque rendu, pas un compteur interne desynchronise.
     assert int(row["ones_n"]) == sum(mask)
     assert float(row["total_s"]) > 0.0
+    # Une duree par famille, toujours emise : celles de l'autre phase valent 0.
+    assert float(row["move_cells_s"]) > 0.0
+    for family in SQUAD_ACTION_MASK_FAMILIES:
+        if family != "move_cells":
+            assert float(row[f"{family}_s"]) == 0.0
 
 
 def test_masque_squad_absent_emet_quand_meme(engine: W40KEngine, perf_log) -> None:
@@ -0,0 +1,49 @@
+"""Le couplage B2B du pile-in (`_max_b2b_matching`) est-il maximal, puis de trajet minimal ?
+
+12.03 WHILE MOVING « engaged with it if possible » + encart « maximise the number of models that
+are engaged » : la cardinalite prime, toujours. A cardinalite egale, l'affectation hongroise
+choisit le trajet total le plus court — la ou l'ancien Kuhn rendait le premier couplage trouve
+dans l'ordre des index.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from engine.hex_utils import hex_distance
+from engine.phase_handlers.shared_utils import _hex_travel_matrix, _max_b2b_matching
+
+
+def test_travel_matrix_matches_scalar_hex_distance() -> None:
+    origins = [(0, 0), (3, 5), (7, 2), (-2, 4)]
+    cells = [(1, 1), (4, 4), (10, 0), (0, -3), (5, 5)]
+    travel = _hex_travel_matrix(origins, cells)
+    assert travel.shape == (4, 5)
+    for i, (oc, orow) in enumerate(origins):
+        for j, (cc, cr) in enumerate(cells):
+            assert travel[i, j] == hex_distance(oc, orow, cc, cr)
+
+
+def test_cardinality_wins_over_travel() -> None:
+    # "a" peut prendre X (proche) ou Y (loin) ; "b" n'a que X. Le trajet minimal pour "a" seul
+    # serait X, mais deux figurines engagees valent mieux qu'un trajet court.
+    movers, cells = ["a", "b"], [(0, 0), (9, 9)]
+    usable = np.array([[True, True], [True, False]])
+    travel = np.array([[1, 50], [1, 1]])
+    assert _max_b2b_matching(movers, cells, usable, travel) == {"a": (9, 9), "b": (0, 0)}
+
+
+def test_ties_in_cardinality_pick_the_shortest_total_travel() -> None:
+    movers, cells = ["a", "b"], [(0, 0), (5, 5)]
+    usable = np.ones((2, 2), dtype=bool)
+    travel = np.array([[9, 1], [1, 9]])                     # Kuhn (ordre des index) : a->X, b->Y
+    assert _max_b2b_matching(movers, cells, usable, travel) == {"a": (5, 5), "b": (0, 0)}
+
+
+def test_unusable_pairs_are_never_assigned() -> None:
+    movers, cells = ["a", "b", "c"], [(0, 0), (1, 0)]
+    usable = np.array([[False, False], [False, True], [False, False]])
+    travel = np.zeros((3, 2), dtype=np.int64)
+    assert _max_b2b_matching(movers, cells, usable, travel) == {"b": (1, 0)}
+    assert _max_b2b_matching(movers, cells, np.zeros((3, 2), dtype=bool), travel) == {}
+    assert _max_b2b_matching([], [], np.zeros((0, 0), dtype=bool), np.zeros((0, 0))) == {}
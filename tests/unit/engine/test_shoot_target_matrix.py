@@ -0,0 +1,96 @@
+"""La matrice tireur x ennemi de la phase de tir (`engine/shoot_target_matrix.py`) sert-elle le
+meme precalcul que le recalcul direct, apres mouvements et morts ?
+
+Invariant verifie par `assert_shoot_target_matrix_consistent` apres chaque operation : pour chaque
+tireur du joueur actif, la liste servie par la matrice == `_build_weapon_availability_enemy_precheck`.
+Comme pour le pair-cache LoS, on PEUPLE d'abord la matrice a l'etat courant, puis on mute, puis on
+verifie : une cellule survivante d'un mouvement qui aurait du l'oublier produit une divergence.
+
+CONTROLE DE DENTS (`test_missed_invalidation_is_detected`) : l'oubli cible est desactive (la
+version avance quand meme, sans quoi la lecture se resynchroniserait d'elle-meme) et on verifie que
+le garde-fou DETECTE la cellule perimee.
+"""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+import engine.phase_handlers.shared_utils as su
+from engine.phase_handlers.shared_utils import destroy_model, translate_squad_to_destination
+from engine.phase_handlers.shooting_handlers import (
+    _weapon_availability_enemy_precheck,
+    assert_shoot_target_matrix_consistent,
+    shooting_phase_start,
+)
+from engine.shoot_target_matrix import ShootTargetMatrix, active_shoot_target_matrix
+from tests.unit.engine.test_target_pool_cache import _engine
+
+
+def _shoot_phase():
+    engine = _engine()
+    gs = engine.game_state
+    assert gs["current_player"] == 1
+    shooting_phase_start(gs)
+    matrix = active_shoot_target_matrix(gs)
+    assert matrix is not None
+    return gs, matrix
+
+
+def test_matrix_stays_consistent_across_moves_and_deaths() -> None:
+    gs, matrix = _shoot_phase()
+    assert assert_shoot_target_matrix_consistent(gs) == 4      # 2 tireurs x 2 ennemis
+    assert matrix.stats()["misses"] == 4
+
+    # Mouvement d'un ennemi au contact du tireur 1 : seules SES cellules sont oubliees.
+    translate_squad_to_destination(gs, "3", 6, 6)
+    assert "3" not in matrix.rows["1"] and matrix.rows["1"]["4"] == (4, False)
+    assert not any("3" in pair for pair in matrix.engaged_pairs)
+    assert assert_shoot_target_matrix_consistent(gs) == 4
+    assert matrix.rows["1"]["3"][1] is True                     # engage avec le tireur 1
+    # Tireur 2 : cible engagee avec un ami (le tireur 1) -> tir bloque.
+    shooter = su.get_unit_by_id(gs, "2")
+    served = {
+        r["enemy_id_str"]: r
+        for r in _weapon_availability_enemy_precheck(gs, shooter, shooter["RNG_WEAPONS"])
+    }
+    assert served["3"]["friendly_blocks"] and not served["4"]["friendly_blocks"]
+
+    # Mort d'une escouade : sa colonne et ses paires disparaissent.
+    for model_id in list(gs["squad_models"]["4"]):
+        destroy_model(gs, model_id, reason="combat")
+    assert "4" not in gs["units_cache"]
+    assert all("4" not in cells for cells in matrix.rows.values())
+    assert not any("4" in pair for pair in matrix.engaged_pairs)
+    assert assert_shoot_target_matrix_consistent(gs) == 2
+    assert matrix.stats()["hits"] > 0
+
+
+def test_missed_invalidation_is_detected(monkeypatch: pytest.MonkeyPatch) -> None:
+    gs, matrix = _shoot_phase()
+
+    def _advance_only(game_state, unit_ids):
+        matrix.version = game_state["_unit_move_version"]
+
+    monkeypatch.setattr(su, "shoot_target_matrix_after_move", _advance_only)
+    assert_shoot_target_matrix_consistent(gs)                   # peuple a la position d'avant
+    translate_squad_to_destination(gs, "3", 6, 6)
+    with pytest.raises(AssertionError, match="shoot target matrix stale"):
+        assert_shoot_target_matrix_consistent(gs)
+
+
+def test_matrix_is_scoped_to_its_phase_and_state() -> None:
+    gs, matrix = _shoot_phase()
+    assert_shoot_target_matrix_consistent(gs)
+    # Une copie d'etat repart d'une matrice vide, exacte pour ses propres positions.
+    copied = copy.deepcopy(gs)
+    assert isinstance(copied["_shoot_target_matrix"], ShootTargetMatrix)
+    assert copied["_shoot_target_matrix"].rows == {} and matrix.rows
+    # Une version qui avance hors choke-point vide la matrice a la lecture suivante.
+    gs["_unit_move_version"] += 1
+    assert active_shoot_target_matrix(gs).rows == {}
+    # Hors phase de tir, rien n'est servi.
+    gs["phase"] = "charge"
+    assert active_shoot_target_matrix(gs) is None
+    assert assert_shoot_target_matrix_consistent(gs) == 0
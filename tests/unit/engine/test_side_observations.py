@@ -0,0 +1,60 @@
+"""`ObservationBuilder.build_side_observations` rend-il, escouade par escouade, EXACTEMENT
+l'observation de `build_squad_observation` + `build_squad_grid` ?
+
+Plateau de `test_squad_grid_observation`, avec trois escouades par camp dont deux au contact :
+la passe d'engagement partagée doit marquer les mêmes escouades que la passe par escouade.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+
+from engine.w40k_core import W40KEngine
+from tests.unit.engine._config_helpers import build_engine_config
+from tests.unit.engine.test_squad_grid_observation import _config, _unit_cfg
+
+
+def _engine() -> W40KEngine:
+    config = _config([[24, 20]], [{"id": "obj1", "name": "Alpha", "hexes": [[22, 22]]}])
+    config["units"] += [
+        _unit_cfg(3, 1, 16, 24),
+        _unit_cfg(4, 2, 21, 20),   # au contact de l'escouade 1
+        _unit_cfg(5, 2, 40, 30),
+        _unit_cfg(6, 1, 30, 12),
+    ]
+    with patch("engine.w40k_core.load_weapon_damage_table", return_value={}), \
+         patch.object(W40KEngine, "_build_reward_configs_for_current_units", return_value={}):
+        eng = W40KEngine(config=build_engine_config(config))
+    eng.reset()
+    # Hors phase de move : la grille d'une escouade non active exigerait sinon une carte de
+    # cellules que seul le masque de l'escouade ACTIVE mémoïse (cf. `test_squad_grid_observation`).
+    eng.game_state["phase"] = "shoot"
+    return eng
+
+
+def test_side_observations_equal_per_squad_observations() -> None:
+    eng = _engine()
+    builder = eng.obs_builder
+    for player, squads in ((1, ["1", "3", "6"]), (2, ["2", "4", "5"])):
+        batched = builder.build_side_observations(eng.game_state, player)
+        assert sorted(batched) == sorted(squads)
+        for sid in squads:
+            expected = builder.build_squad_observation(eng.game_state, sid)
+            expected["grid"] = builder.build_squad_grid(eng.game_state, sid)
+            assert batched[sid].keys() == expected.keys()
+            for key, array in expected.items():
+                np.testing.assert_array_equal(batched[sid][key], array, err_msg=f"{sid}:{key}")
+
+
+def test_side_observations_do_not_alias_the_preallocated_buffers() -> None:
+    eng = _engine()
+    builder = eng.obs_builder
+    builder.use_preallocated_buffers()
+    batched = builder.build_side_observations(eng.game_state, 1)
+    assert batched["1"]["allies_cont"] is not batched["3"]["allies_cont"]
+    assert batched["1"]["grid"] is not batched["3"]["grid"]
+    # Les tampons restent en service pour les appels escouade par escouade.
+    first = builder.build_squad_observation(eng.game_state, "1")
+    assert first["allies_cont"] is builder.build_squad_observation(eng.game_state, "3")["allies_cont"]
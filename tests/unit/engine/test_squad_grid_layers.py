@@ -0,0 +1,86 @@
+"""Couches reutilisees de la grille egocentrique (`engine/squad_grid_layers.py`).
+
+Deux garanties : le recueil fenetre du raster statique peint EXACTEMENT les cellules de la
+peinture hexe par hexe, et la surcouche dynamique suit la geometrie — y compris une ecriture de
+position qui ne bumpe pas `_unit_move_version`.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from engine.spatial_grid import GRID_CH_ENEMY, GRID_SIZE, hex_arrays_to_cells
+from engine.squad_grid_layers import SQUAD_GRID_LAYERS_KEY, STATIC_CHANNELS, StaticLayerStack
+from engine.w40k_core import W40KEngine
+from tests.unit.engine._config_helpers import build_engine_config
+from tests.unit.engine.test_squad_grid_observation import _config
+
+
+@pytest.mark.parametrize("half_extent", [3, 12, 40])
+def test_window_gather_matches_sparse_paint(half_extent: int) -> None:
+    rng = np.random.default_rng(half_extent)
+    cols_n, rows_n = 70, 55
+    channels = []
+    for _ in STATIC_CHANNELS:
+        n = int(rng.integers(50, 400))
+        cols = rng.integers(0, cols_n, n)
+        rows = rng.integers(0, rows_n, n)
+        channels.append(((cols, rows), rng.random(n).astype(np.float32)))
+    stack = StaticLayerStack(cols_n, rows_n, channels)
+
+    # Ancres au centre, aux bords et aux coins : la boite `window_bounds` y est tronquee.
+    for anchor in [(35, 27), (0, 0), (69, 54), (2, 50), (68, 1)]:
+        expected = np.zeros((len(STATIC_CHANNELS), GRID_SIZE, GRID_SIZE), dtype=np.float32)
+        for k, ((cols, rows), values) in enumerate(channels):
+            gx, gy, valid = hex_arrays_to_cells(cols, rows, anchor[0], anchor[1], half_extent)
+            np.maximum.at(expected[k], (gy[valid], gx[valid]), values[valid])
+        np.testing.assert_array_equal(stack.window(*anchor, half_extent), expected, err_msg=str(anchor))
+    assert stack.window(35, 27, half_extent) is stack.window(35, 27, half_extent)
+
+
+def _engine() -> W40KEngine:
+    objectives = [{"id": "obj1", "name": "Alpha", "hexes": [[22, 22]]}]
+    with patch("engine.w40k_core.load_weapon_damage_table", return_value={}), \
+         patch.object(W40KEngine, "_build_reward_configs_for_current_units", return_value={}):
+        eng = W40KEngine(config=build_engine_config(_config([[24, 20]], objectives)))
+    eng.reset()
+    return eng
+
+
+def _fresh_grid(eng: W40KEngine) -> np.ndarray:
+    """Reference : la meme grille construite sans aucune couche memoisee."""
+    layers = eng.game_state.pop(SQUAD_GRID_LAYERS_KEY)
+    try:
+        return eng.obs_builder.build_squad_grid(eng.game_state, "1").copy()
+    finally:
+        eng.game_state[SQUAD_GRID_LAYERS_KEY] = layers
+
+
+def test_overlay_follows_geometry_without_a_version_bump() -> None:
+    eng = _engine()
+    gs = eng.game_state
+    builder = eng.obs_builder
+    first = builder.build_squad_grid(gs, "1").copy()
+    assert first[GRID_CH_ENEMY].sum() == 0.0           # ennemi en (40,20), hors fenetre
+    overlay_hits = gs[SQUAD_GRID_LAYERS_KEY].overlays.stats()["hits"]
+    np.testing.assert_array_equal(builder.build_squad_grid(gs, "1"), first)
+    assert gs[SQUAD_GRID_LAYERS_KEY].overlays.stats()["hits"] == overlay_hits + 1
+
+    # Ecriture DIRECTE de position (aucun `_touch_unit_los`, version inchangee).
+    version = gs["_unit_move_version"]
+    (enemy_model,) = gs["squad_models"]["2"]
+    gs["models_cache"][enemy_model]["col"] = 23
+    gs["models_cache"][enemy_model]["row"] = 21
+    assert gs["_unit_move_version"] == version
+    moved = builder.build_squad_grid(gs, "1").copy()
+    assert moved[GRID_CH_ENEMY].sum() == 1.0
+    np.testing.assert_array_equal(moved, _fresh_grid(eng))
+
+    # Mort de la figurine : le canal ennemi se vide.
+    gs["models_cache"].pop(enemy_model)
+    dead = builder.build_squad_grid(gs, "1")
+    assert dead[GRID_CH_ENEMY].sum() == 0.0
+    np.testing.assert_array_equal(dead, _fresh_grid(eng))
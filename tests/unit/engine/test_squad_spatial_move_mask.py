@@ -246,3 +246,19 @@ def test_pure_rule_boundaries(engine):
     # Engagee : le cout n'entre plus en jeu, seul le Fall Back existe (09.05).
     assert classify_squad_move_type(True, 30, 1.0) == "fall_back"
     assert classify_squad_move_type(True, 30, 999.0) == "fall_back"
+
+
+def test_array_rule_matches_the_pure_rule():
+    """Le masque classe toutes ses cellules d'une operation : la forme tableau doit rendre, cout
+    par cout, le verdict `== "normal"` de la regle scalaire — bornes incluses."""
+    import numpy as np
+
+    from engine.phase_handlers.shared_utils import (
+        classify_squad_move_type,
+        squad_move_costs_are_normal,
+    )
+
+    costs = np.array([0.0, 0.5, 29.0, 30.0, 30.0001, 31.0, 999.0])
+    for in_er in (False, True):
+        expected = [classify_squad_move_type(in_er, 30, float(c)) == "normal" for c in costs]
+        assert squad_move_costs_are_normal(in_er, 30, costs).tolist() == expected
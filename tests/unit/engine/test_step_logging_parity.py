@@ -0,0 +1,136 @@
+"""A/B : une partie machine contre machine finit-elle IDENTIQUE avec et sans step.log ?
+
+C'est l'invariant qu'exige toute resolution « sans ecriture » des attaques : la journalisation ne
+tire aucun de et ne touche pas l'etat. Si elle le faisait, deux runs de meme graine divergeraient
+selon `--step`, et un entrainement ne serait plus rejouable par son propre journal.
+
+Chaque graine est jouee deux fois, actions tirees du meme generateur, `random` reensemence a
+l'identique : une fois sans StepLogger (chemin d'entrainement), une fois avec un StepLogger actif
+(chemin `--step` / evaluation des bots). On exige a la fin le MEME etat de plateau, le MEME
+`action_logs` et le MEME etat du generateur global — le dernier prouve que le flux de des est
+reste aligne jusqu'au bout, pas seulement que les survivants coincident.
+
+POURQUOI PAS DE SECOND RESOLVEUR « HEADLESS » — mesure du 2026-10-16, cProfile sur deux parties
+gym completes (`reserves_full_episode_fixture1`, graines 0 et 1, 391 steps, 520 s de `step`) :
+toute la machinerie d'allocation et de journal du tir et de la melee (`_build_manual_allocation`,
+`_manual_allocation_step`, `_build_alloc_groups`, `_resolve_one_manual_wound`,
+`_emit_squad_shoot_log`) pese 0,15 s, moins de 0,03 %. Et `action_logs` n'est pas un journal
+d'affichage : recompenses et compteurs tactiques le lisent. Un chemin qui sauterait l'allocation
+pour ecrire des deltas de PV devrait re-implementer 05.03/05.04 pour un gain non mesurable ; la
+seule partie propre a step.log (`_flush_squad_action_logs_to_step_logger`) est deja gardee par
+`step_logger.enabled`. Ce fichier verrouille donc ce qui est vrai : journaliser ou non ne change
+pas la partie.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from ai.step_logger import StepLogger
+from engine.observation_builder import ObservationBuilder
+from engine.phase_handlers.shared_utils import SQUAD_ACTION_WAIT
+from engine.reward_calculator import RewardCalculator
+from engine.w40k_core import W40KEngine
+from tests.unit.engine._config_helpers import build_engine_config
+
+
+def _unit(uid: int, player: int, col: int, row: int) -> Dict[str, Any]:
+    weapon = {"ATK": 3, "STR": 4, "AP": -1, "DMG": 1, "NB": 2, "WEAPON_RULES": []}
+    return {
+        "id": uid, "player": player, "col": col, "row": row,
+        "unitType": "TestUnit", "DISPLAY_NAME": f"Unit {uid}",
+        "HP_CUR": 4, "HP_MAX": 4, "MOVE": 6, "T": 4, "ARMOR_SAVE": 4, "INVUL_SAVE": 0,
+        "RNG_WEAPONS": [{**weapon, "RNG": 24, "display_name": "Test Bolter"}],
+        "CC_WEAPONS": [{**weapon, "RNG": 1, "display_name": "Test Blade"}],
+        "UNIT_RULES": [], "UNIT_KEYWORDS": [], "LD": 7, "OC": 1, "VALUE": 100,
+        "ICON": "test", "ICON_SCALE": 1.0, "ILLUSTRATION_RATIO": 1.0,
+        "BASE_SHAPE": "round", "BASE_SIZE": 1, "MODEL_HEIGHT": 2.5,
+    }
+
+
+def _config() -> Dict[str, Any]:
+    obs_params = {"obs_size": ObservationBuilder.SQUAD_OBS_SIZE_TARGET}
+    return {
+        "board": {"default": {
+            "cols": 15, "rows": 13, "hex_radius": 1.0, "margin": 0.0, "wall_hexes": [],
+            "objectives": [{"id": "obj1", "name": "Alpha", "hexes": [[7, 6]]}],
+            "inches_to_subhex": 1,
+        }},
+        "game_rules": {
+            "engagement_zone": 1, "engagement_zone_vertical": 5, "max_base_size_hex": 35,
+            "max_turns": 5, "max_actions_per_model_per_turn": 7, "step_limit_margin": 1.5,
+            "pile_in_target_range": 5, "consolidation_trigger_range": 3,
+        },
+        "move": {
+            "can_move_through_enemy_engagement_zone": True,
+            "can_move_through_enemy_model": False,
+            "can_move_through_friendly_model": True,
+        },
+        "charge": {"charge_max_distance": 12},
+        "pve_mode": False,
+        "controlled_player": 1,
+        "observation_params": obs_params,
+        "training_config": {"observation_params": obs_params},
+        "units": [_unit(1, 1, 5, 6), _unit(2, 1, 5, 7), _unit(3, 2, 9, 6), _unit(4, 2, 9, 7)],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _stub_rewards(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Les recompenses exigent une config d'agent ; elles ne tirent aucun de."""
+    monkeypatch.setattr(RewardCalculator, "calculate_reward", lambda self, *a, **kw: 0.0)
+    monkeypatch.setattr(
+        W40KEngine, "_build_observation",
+        lambda self, *_a, **_k: np.zeros(ObservationBuilder.SQUAD_OBS_SIZE_TARGET),
+    )
+
+
+def _play(seed: int, step_logger: Optional[StepLogger]) -> Tuple[W40KEngine, Any]:
+    random.seed(seed)
+    with patch("engine.w40k_core.load_weapon_damage_table", return_value={}), \
+         patch.object(W40KEngine, "_build_reward_configs_for_current_units", return_value={}):
+        engine = W40KEngine(config=build_engine_config(_config()), gym_training_mode=True, quiet=True)
+    engine.step_logger = step_logger
+    engine.reset()
+    picks = np.random.default_rng(seed)
+    for _ in range(4000):
+        legal = np.flatnonzero(engine.get_action_mask())
+        action = int(picks.choice(legal)) if legal.size else SQUAD_ACTION_WAIT
+        _obs, _reward, terminated, truncated, _info = engine.step(action)
+        if terminated or truncated:
+            break
+    return engine, random.getstate()
+
+
+def _board(engine: W40KEngine) -> Dict[str, Any]:
+    gs = engine.game_state
+    return {
+        "units": {sid: (e["col"], e["row"], e["HP_CUR"]) for sid, e in gs["units_cache"].items()},
+        "models": {mid: (m["col"], m["row"], m["HP_CUR"]) for mid, m in gs["models_cache"].items()},
+        "turn": gs["turn"],
+        "phase": gs["phase"],
+    }
+
+
+def _attack_logs(engine: W40KEngine) -> List[Dict[str, Any]]:
+    return [lg for lg in engine.game_state["action_logs"] if lg.get("type") in ("shoot", "combat")]
+
+
+@pytest.mark.parametrize("seed", [7, 11, 23])
+def test_step_logging_does_not_perturb_the_game(seed: int, tmp_path: Path) -> None:
+    headless, rng_headless = _play(seed, None)
+    logger = StepLogger(str(tmp_path / "step.log"), enabled=True, buffer_size=1)
+    logged, rng_logged = _play(seed, logger)
+
+    assert _board(logged) == _board(headless)
+    assert logged.game_state["action_logs"] == headless.game_state["action_logs"]
+    assert rng_logged == rng_headless
+    # CONTRE LE VERT VACANT : des attaques ont bien ete resolues, et journalisees d'un cote.
+    assert _attack_logs(headless)
+    assert logger.action_count > 0
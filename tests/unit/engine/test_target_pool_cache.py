@@ -0,0 +1,116 @@
+"""Le cache de pools / apercus (`engine/target_pool_cache.py`) est-il borne, propre a chaque
+moteur, et invalide par `_unit_move_version` ?
+
+Les anciens dicts globaux de `shooting_handlers` etaient partages par tous les moteurs d'un
+processus (serveur API, pools d'evaluation) et vides en bloc a 100 entrees. On verrouille ici les
+trois proprietes qui les remplacent : isolation entre moteurs (et entre un etat et sa copie),
+eviction LRU une entree a la fois, et invalidation par la version entiere de positions.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from engine.observation_builder import ObservationBuilder
+from engine.phase_handlers.shooting_handlers import (
+    clear_target_pool_cache,
+    preview_shoot_valid_targets_from_position,
+)
+from engine.target_pool_cache import TargetPoolCache, _LRUStore, target_pool_cache
+from engine.w40k_core import W40KEngine
+from tests.unit.engine._config_helpers import build_engine_config
+
+
+def _unit(uid: int, player: int, col: int, row: int) -> Dict[str, Any]:
+    weapon = {"ATK": 3, "STR": 4, "AP": -1, "DMG": 1, "NB": 2, "WEAPON_RULES": []}
+    return {
+        "id": uid, "player": player, "col": col, "row": row,
+        "unitType": "TestUnit", "DISPLAY_NAME": f"Unit {uid}",
+        "HP_CUR": 4, "HP_MAX": 4, "MOVE": 6, "T": 4, "ARMOR_SAVE": 4, "INVUL_SAVE": 0,
+        "RNG_WEAPONS": [{**weapon, "RNG": 24, "display_name": "Test Bolter"}],
+        "CC_WEAPONS": [{**weapon, "RNG": 1, "display_name": "Test Blade"}],
+        "UNIT_RULES": [], "UNIT_KEYWORDS": [], "LD": 7, "OC": 1, "VALUE": 100,
+        "ICON": "test", "ICON_SCALE": 1.0, "ILLUSTRATION_RATIO": 1.0,
+        "BASE_SHAPE": "round", "BASE_SIZE": 1, "MODEL_HEIGHT": 2.5,
+    }
+
+
+def _engine() -> W40KEngine:
+    obs_params = {"obs_size": ObservationBuilder.SQUAD_OBS_SIZE_TARGET}
+    config = {
+        "board": {"default": {
+            "cols": 15, "rows": 13, "hex_radius": 1.0, "margin": 0.0, "wall_hexes": [],
+            "objectives": [{"id": "obj1", "name": "Alpha", "hexes": [[7, 6]]}],
+            "inches_to_subhex": 1,
+        }},
+        "game_rules": {
+            "engagement_zone": 1, "engagement_zone_vertical": 5, "max_base_size_hex": 35,
+            "max_turns": 5, "max_actions_per_model_per_turn": 7, "step_limit_margin": 1.5,
+            "pile_in_target_range": 5, "consolidation_trigger_range": 3,
+        },
+        "move": {
+            "can_move_through_enemy_engagement_zone": True,
+            "can_move_through_enemy_model": False,
+            "can_move_through_friendly_model": True,
+        },
+        "charge": {"charge_max_distance": 12},
+        "pve_mode": False,
+        "controlled_player": 1,
+        "observation_params": obs_params,
+        "training_config": {"observation_params": obs_params},
+        "units": [_unit(1, 1, 5, 6), _unit(2, 1, 5, 7), _unit(3, 2, 9, 6), _unit(4, 2, 9, 7)],
+    }
+    with patch("engine.w40k_core.load_weapon_damage_table", return_value={}), \
+         patch.object(W40KEngine, "_build_reward_configs_for_current_units", return_value={}):
+        engine = W40KEngine(config=build_engine_config(config), gym_training_mode=True, quiet=True)
+        engine.reset()
+    return engine
+
+
+def test_lru_evicts_one_entry_at_a_time_and_counts() -> None:
+    store = _LRUStore(2)
+    store.put("a", [1])
+    store.put("b", [2])
+    assert store.get("a") == [1]          # "a" redevient le plus recent
+    store.put("c", [3])                   # evince "b", pas tout le cache
+    assert store.get("b") is None
+    assert store.get("a") == [1] and store.get("c") == [3]
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (3, 1, 1, 2)
+    assert stats["hit_rate"] == pytest.approx(0.75)
+    # Un vidage invalide les entrees, pas la mesure.
+    assert store.clear() == 2 and store.stats()["hits"] == 3
+
+
+def test_copy_of_state_starts_with_an_empty_cache() -> None:
+    gs: Dict[str, Any] = {}
+    cache = target_pool_cache(gs)
+    cache.pools.put(("k",), ["3"])
+    copied = copy.deepcopy(gs)
+    assert isinstance(copied["_target_pool_cache"], TargetPoolCache)
+    assert copied["_target_pool_cache"] is not cache
+    assert len(copied["_target_pool_cache"].pools) == 0
+    assert target_pool_cache(gs) is cache and len(cache.pools) == 1
+
+
+def test_preview_cache_is_per_engine_and_keyed_by_move_version() -> None:
+    first, second = _engine(), _engine()
+    gs = first.game_state
+    preview = preview_shoot_valid_targets_from_position(gs, "1", 5, 6, include_los_cells=False)
+    again = preview_shoot_valid_targets_from_position(gs, "1", 5, 6, include_los_cells=False)
+    assert again == preview and again is not preview
+    assert target_pool_cache(gs).previews.stats()["hits"] == 1
+    # Le second moteur du meme processus ne voit rien du premier.
+    assert target_pool_cache(second.game_state).previews.stats()["size"] == 0
+
+    gs["_unit_move_version"] += 1
+    preview_shoot_valid_targets_from_position(gs, "1", 5, 6, include_los_cells=False)
+    stats = target_pool_cache(gs).previews.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+    clear_target_pool_cache(gs)
+    assert target_pool_cache(gs).stats()["previews"]["size"] == 0
@@ -0,0 +1,132 @@
+"""La LoS unité→unité VECTORISÉE rend-elle EXACTEMENT ce que rend le tracé scalaire ?
+
+`_compute_unit_los_uncached` (et donc `compute_unit_los`, `build_visible_cells_by_target`) trace
+désormais toutes les cases cibles d'un tireur en un passage (`_target_models_visible_cells_batch`,
+sur `hex_utils.batch_pair_hex_line_steps`). La règle scalaire — `_target_model_visible_cells`,
+figurine par figurine, case par case — reste en place : c'est elle la référence, et ce test compare
+les deux, case par case, sur toutes les paires inter-camps d'un vrai plateau (murs + areas
+obscurantes, empreintes multi-hex hors gym).
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from engine.hex_utils import batch_los_visibility, compute_los_visibility, hex_set_to_grid
+from engine.phase_handlers.shooting_handlers import (
+    _compute_units_los_uncached,
+    _excluded_obscuring_areas,
+    _get_obscuring_area_sets,
+    _get_obscuring_hex_to_area,
+    _get_wall_set,
+    _resolve_shooter_models_with_walls,
+    _resolve_target_models_for_los,
+    _target_model_visible_cells,
+    compute_units_los,
+)
+
+SCENARIO = "config/board/44x60x5/scenario/scenario_pvp_test.json"
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+@pytest.fixture(scope="module")
+def game_state():
+    """Plateau 44x60x5 HORS gym : empreintes par figurine, donc vantages latéraux exercés."""
+    from ai.training_utils import setup_imports
+    from ai.unit_registry import UnitRegistry
+    from services.api_server import get_agents_from_scenario
+
+    previous = os.environ.get("W40K_BOARD_PATH")
+    os.environ["W40K_BOARD_PATH"] = "board/44x60x5"
+    try:
+        W40KEngine, _ = setup_imports()
+        ur = UnitRegistry()
+        sf = os.path.join(PROJECT_ROOT, SCENARIO)
+        env = W40KEngine(
+            rewards_config="default",
+            training_config_name="x1",
+            controlled_agent=sorted(get_agents_from_scenario(sf, ur))[0],
+            scenario_file=sf,
+            unit_registry=ur,
+            quiet=True,
+            gym_training_mode=False,
+        )
+        env.reset(seed=42)
+        yield env.game_state
+    finally:
+        if previous is None:
+            os.environ.pop("W40K_BOARD_PATH", None)
+        else:
+            os.environ["W40K_BOARD_PATH"] = previous
+
+
+def _scalar_visible_cells(gs, shooter, target):
+    """La RÈGLE scalaire, telle que `_compute_unit_los_uncached` l'appliquait avant le batch."""
+    shooter_models, shooter_hexes_all = _resolve_shooter_models_with_walls(gs, shooter, False)
+    footprints, _c, _s, _z, _o, _levels = _resolve_target_models_for_los(gs, target, False)
+    obscuring_by_hex = _get_obscuring_hex_to_area(gs)
+    excluded_base = _excluded_obscuring_areas(obscuring_by_hex, shooter_hexes_all)
+    seen = set()
+    for model_hexes in footprints:
+        excluded = excluded_base | _excluded_obscuring_areas(obscuring_by_hex, model_hexes)
+        seen |= _target_model_visible_cells(shooter_models, model_hexes, obscuring_by_hex, excluded)
+    return sorted(seen)
+
+
+def test_unit_los_batch_parity(game_state):
+    gs = game_state
+    assert _get_wall_set(gs), "plateau sans mur : rien ne bloque, la comparaison est creuse"
+    assert _get_obscuring_area_sets(gs), "aucune area obscurante : l'exclusion 13.10 n'est pas vue"
+    units = [u for u in gs["units"] if str(u["id"]) in gs["units_cache"]]
+    pairs = 0
+    partial = 0
+    for shooter in units:
+        targets = [t for t in units if int(t["player"]) != int(shooter["player"])]
+        batch = _compute_units_los_uncached(gs, shooter, targets)
+        for target, los in zip(targets, batch):
+            expected = _scalar_visible_cells(gs, shooter, target)
+            assert los["visible_cells"] == expected, (
+                f"{shooter['id']} -> {target['id']} : batch {len(los['visible_cells'])} cases, "
+                f"scalaire {len(expected)}"
+            )
+            pairs += 1
+            if 0 < los["visible"] < los["total"]:
+                partial += 1
+    assert pairs > 0
+    # CONTRE LE VERT VACANT : des paires partiellement masquées prouvent que des lignes ont été
+    # bloquées ET d'autres non, dans la même comparaison.
+    assert partial > 0, "aucune paire partiellement masquée : la comparaison ne voit aucun blocage"
+
+
+def test_compute_units_los_fills_pair_cache(game_state):
+    gs = game_state
+    units = [u for u in gs["units"] if str(u["id"]) in gs["units_cache"]]
+    shooter = units[0]
+    targets = [t for t in units if int(t["player"]) != int(shooter["player"])]
+    gs.pop("_unit_los_pair_cache", None)
+    first = compute_units_los(gs, shooter, targets)
+    holder = gs["_unit_los_pair_cache"]
+    for target, los in zip(targets, first):
+        assert holder[(str(shooter["id"]), str(target["id"]))] is los
+    assert compute_units_los(gs, shooter, targets) == first
+
+
+def test_batch_los_visibility_matches_scalar():
+    rng = np.random.default_rng(7)
+    cols, rows = 40, 30
+    walls = {(int(c), int(r)) for c, r in rng.integers(0, [cols, rows], size=(120, 2))}
+    wall_grid = hex_set_to_grid(walls, cols, rows)
+    src = rng.integers(0, [cols, rows], size=(400, 2))
+    # Quelques sources répétées : le regroupement par source est exercé.
+    src[200:] = src[:200]
+    tgt = rng.integers(0, [cols, rows], size=(400, 2))
+    got = batch_los_visibility(src, tgt, wall_grid)
+    expected = np.array([
+        compute_los_visibility(int(a[0]), int(a[1]), int(b[0]), int(b[1]), walls) > 0.0
+        for a, b in zip(src, tgt)
+    ])
+    assert np.array_equal(got, expected)
+    assert expected.any() and not expected.all()